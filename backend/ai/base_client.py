@@ -16,6 +16,9 @@ class BaseAIClient(ABC):
 
     All AI providers must implement this interface to ensure
     consistent behavior across different models.
+
+    Implementations wrap generate() with ai.response_cache.cached_generate
+    so identical prompts are answered from the persistent response cache.
     """
 
     @abstractmethod
@@ -104,3 +107,15 @@ class BaseAIClient(ABC):
             Tuple of (is_healthy, error_message)
         """
         pass
+
+    def cache_identity(self) -> Dict:
+        """
+        Client identity for response cache keys.
+
+        Responses are only shared between calls with the same identity,
+        so it must change whenever the model or its configuration does.
+
+        Returns:
+            JSON-serializable description of the model (default: get_model_info())
+        """
+        return self.get_model_info()
@@ -12,6 +12,7 @@ from typing import Dict, Optional, Tuple
 from datetime import datetime
 
 from ai.base_client import BaseAIClient
+from ai.response_cache import cached_generate
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +77,7 @@ class GeminiClient(BaseAIClient):
 
         logger.info(f"GeminiClient initialized: model={model}, thinking_budget={thinking_budget}")
 
+    @cached_generate
     def generate(
         self,
         prompt: str,
@@ -376,7 +378,8 @@ Ensure probabilities sum to 1.0. Confidence levels: low, medium, high."""
                 prompt="Reply with exactly: OK",
                 temperature=0.1,
                 max_tokens=10,
-                thinking_budget=0
+                thinking_budget=0,
+                use_cache=False
             )
 
             if success and response_text:
@@ -0,0 +1,305 @@
+"""
+LLM Response Cache
+Persistent content-hash cache for BaseAIClient.generate responses
+
+Scenario generation, AI analysis, tactical and rating calls take 60-110s each
+and are fully determined by their prompts. Responses are keyed on a canonical
+hash of the client identity (provider, model, thinking budget, ...) and every
+generate() argument (system prompt, user prompt, temperature, max_tokens, ...),
+so re-running the same fixture skips the LLM entirely.
+
+- Storage: SQLite file (LLM_CACHE_PATH, default data/llm_cache.db), shared
+  between processes and kept across restarts
+- Expiry: entries older than LLM_CACHE_TTL_HOURS (default 168) are ignored
+  and removed
+- Size bound: when the stored responses exceed LLM_CACHE_MAX_MB (default 256),
+  least recently used entries are evicted
+- Only successful responses are stored
+- Per-call metrics: usage_data['cache_hit'] (cost_usd is 0 on hits), plus
+  aggregate counters in LLMResponseCache.stats
+
+Set LLM_CACHE_ENABLED=false to always call the provider.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / 'data' / 'llm_cache.db'
+
+# Evict down to this fraction of max_bytes so every insert does not trigger eviction
+EVICT_TARGET = 0.9
+
+
+@dataclass
+class CachedResponse:
+    """Stored generate() result"""
+    text: str
+    usage: Optional[Dict]
+    created_at: float
+    elapsed_seconds: float
+
+
+@dataclass
+class ResponseCacheStats:
+    """Hit/miss counters (approximate under concurrency)"""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    expired: int = 0
+    evictions: int = 0
+    errors: int = 0
+    saved_seconds: float = 0.0
+    saved_cost_usd: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        stats = asdict(self)
+        stats['hit_ratio'] = round(self.hit_ratio, 4)
+        stats['saved_seconds'] = round(self.saved_seconds, 3)
+        stats['saved_cost_usd'] = round(self.saved_cost_usd, 6)
+        return stats
+
+
+def response_key(identity: Any, params: Dict[str, Any]) -> str:
+    """Canonical SHA-256 of client identity + generate() arguments"""
+    payload = json.dumps(
+        {'identity': identity, 'params': params},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(',', ':'),
+        default=repr
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed response store with TTL and LRU size bound (thread-safe)
+    """
+
+    def __init__(self,
+                 path: Path = DEFAULT_PATH,
+                 ttl_seconds: float = 168 * 3600,
+                 max_bytes: int = 256 * 1024 * 1024,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize response cache
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Entry lifetime
+            max_bytes: Upper bound on stored response + usage bytes
+            clock: Wall clock (entries outlive the process, so not monotonic)
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.stats = ResponseCacheStats()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                ' key TEXT PRIMARY KEY,'
+                ' text TEXT NOT NULL,'
+                ' usage TEXT,'
+                ' size INTEGER NOT NULL,'
+                ' elapsed REAL NOT NULL,'
+                ' created_at REAL NOT NULL,'
+                ' accessed_at REAL NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)')
+
+    @classmethod
+    def from_env(cls) -> 'LLMResponseCache':
+        """Cache configured from LLM_CACHE_PATH / LLM_CACHE_TTL_HOURS / LLM_CACHE_MAX_MB"""
+        return cls(
+            path=Path(os.getenv('LLM_CACHE_PATH', str(DEFAULT_PATH))),
+            ttl_seconds=float(os.getenv('LLM_CACHE_TTL_HOURS', '168')) * 3600,
+            max_bytes=int(float(os.getenv('LLM_CACHE_MAX_MB', '256')) * 1024 * 1024)
+        )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Stored response, or None (missing or expired)"""
+        now = self.clock()
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    'SELECT text, usage, elapsed, created_at FROM responses WHERE key = ?', (key,)
+                ).fetchone()
+                if row is None:
+                    self.stats.misses += 1
+                    return None
+                text, usage, elapsed, created_at = row
+                if created_at + self.ttl_seconds <= now:
+                    self._conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                    self.stats.expired += 1
+                    self.stats.misses += 1
+                    return None
+                self._conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+        except sqlite3.Error as e:
+            self.stats.errors += 1
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+        entry = CachedResponse(
+            text=text,
+            usage=json.loads(usage) if usage else None,
+            created_at=created_at,
+            elapsed_seconds=elapsed
+        )
+        self.stats.hits += 1
+        self.stats.saved_seconds += elapsed
+        self.stats.saved_cost_usd += (entry.usage or {}).get('cost_usd') or 0.0
+        return entry
+
+    def set(self, key: str, text: str, usage: Optional[Dict] = None, elapsed_seconds: float = 0.0):
+        """Store a response and evict least recently used entries beyond max_bytes"""
+        now = self.clock()
+        usage_json = json.dumps(usage, ensure_ascii=False, default=repr) if usage is not None else None
+        size = len(text.encode('utf-8')) + len((usage_json or '').encode('utf-8'))
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO responses (key, text, usage, size, elapsed, created_at, accessed_at)'
+                    ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (key, text, usage_json, size, elapsed_seconds, now, now)
+                )
+                self.stats.stores += 1
+                self._evict(now)
+        except sqlite3.Error as e:
+            self.stats.errors += 1
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def clear(self):
+        """Remove every stored response"""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM responses')
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def _evict(self, now: float):
+        """Drop expired entries, then LRU entries until under EVICT_TARGET * max_bytes (lock held)"""
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        expired = self._conn.execute(
+            'DELETE FROM responses WHERE created_at <= ?', (now - self.ttl_seconds,)
+        ).rowcount
+        self.stats.expired += expired
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+        target = self.max_bytes * EVICT_TARGET
+        victims = []
+        for key, size in self._conn.execute('SELECT key, size FROM responses ORDER BY accessed_at'):
+            if total <= target:
+                break
+            victims.append((key,))
+            total -= size
+        self._conn.executemany('DELETE FROM responses WHERE key = ?', victims)
+        self.stats.evictions += len(victims)
+
+
+# Global cache instance
+_response_cache: Optional[LLMResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """
+    Get global response cache (singleton)
+
+    Returns:
+        LLMResponseCache, or None when LLM_CACHE_ENABLED is false or the store cannot be opened
+    """
+    global _response_cache
+
+    if os.getenv('LLM_CACHE_ENABLED', 'true').lower() in ('0', 'false', 'no'):
+        return None
+
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                try:
+                    _response_cache = LLMResponseCache.from_env()
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning(f"LLM response cache unavailable, calling provider directly: {e}")
+                    return None
+    return _response_cache
+
+
+def reset_response_cache():
+    """Reset global response cache (useful for testing)"""
+    global _response_cache
+    _response_cache = None
+
+
+def cached_generate(generate):
+    """
+    Decorator caching a BaseAIClient.generate implementation
+
+    The key covers the client's cache_identity() and every generate() argument
+    after defaults are applied. Pass use_cache=False to force a provider call
+    (e.g. health checks).
+
+    Usage:
+        class GeminiClient(BaseAIClient):
+            @cached_generate
+            def generate(self, prompt, system_prompt=None, temperature=0.7, max_tokens=4096): ...
+    """
+    signature = inspect.signature(generate)
+
+    @wraps(generate)
+    def wrapper(self, *args, use_cache: bool = True, **kwargs):
+        cache = get_response_cache() if use_cache else None
+        if cache is None:
+            return generate(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        params.pop('self', None)
+        identity = self.cache_identity() if hasattr(self, 'cache_identity') else type(self).__qualname__
+        key = response_key(identity, params)
+
+        entry = cache.get(key)
+        if entry is not None:
+            usage = dict(entry.usage or {}, cache_hit=True, cost_usd=0.0)
+            logger.info(f"LLM cache hit {key[:12]} (saved {entry.elapsed_seconds:.1f}s)")
+            return True, entry.text, usage, None
+
+        started = time.perf_counter()
+        success, response_text, usage, error = generate(self, *args, **kwargs)
+        elapsed = time.perf_counter() - started
+
+        if success and response_text is not None:
+            cache.set(key, response_text, usage, elapsed)
+        if usage is not None:
+            usage = dict(usage, cache_hit=False)
+        return success, response_text, usage, error
+
+    return wrapper
@@ -1,18 +1,18 @@
 """
 관리자 엔드포인트 - 데이터 업데이트
 """
-import json
-import os
 from datetime import datetime
 from flask import jsonify
 import logging
 
+from data.squad_data import save_squad_data
+
 logger = logging.getLogger(__name__)
 
 
 def update_squad_data_endpoint(fetch_fantasy_data_func, cache):
     """
-    Fantasy API에서 최신 선수 데이터를 가져와서 squad_data.py 업데이트
+    Fantasy API에서 최신 선수 데이터를 가져와서 squad_data.json 업데이트
     """
     try:
         logger.info("🚀 Squad data update started")
@@ -69,24 +69,8 @@ def update_squad_data_endpoint(fetch_fantasy_data_func, cache):
                 key=lambda p: (not p['is_starter'], p['number'] if p['number'] else 999)
             )
         
-        # squad_data.py 파일 생성
-        # __file__ 대신 현재 디렉토리 기준으로 경로 설정
-        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        output_path = os.path.join(backend_dir, 'data', 'squad_data.py')
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('"""\n')
-            f.write('EPL 전체 팀 선수 명단\n')
-            f.write(f'자동 생성됨: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n')
-            f.write('데이터 소스: Fantasy Premier League API\n')
-            f.write('"""\n\n')
-            f.write(f'SQUAD_DATA = {json.dumps(squad_data, indent=4, ensure_ascii=False)}\n\n')
-            f.write('def get_squad(team_name):\n')
-            f.write('    """팀 이름으로 선수 명단 가져오기"""\n')
-            f.write('    return SQUAD_DATA.get(team_name, [])\n\n')
-            f.write('def get_all_teams():\n')
-            f.write('    """모든 팀 이름 리스트"""\n')
-            f.write('    return list(SQUAD_DATA.keys())\n')
+        # squad_data.json 저장 (SQUAD_DATA 인덱스도 갱신)
+        save_squad_data(squad_data, source='Fantasy Premier League API')
         
         # 캐시 초기화
         cache.clear()
@@ -4,7 +4,6 @@ Flask API 서버 - EPL 팀 선수 분석 플랫폼
 
 from flask import Flask, jsonify, request
 from flask_cors import CORS
-from flask_caching import Cache
 import sys
 import os
 import logging
@@ -21,7 +20,7 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from data_collection import FBrefScraper
 from data.squad_data import SQUAD_DATA
-from database.player_schema import get_player_session, Player, PlayerRating, Team, PositionAttribute
+from database.player_schema import player_session_scope, Player, PlayerRating, Team, PositionAttribute
 import pandas as pd
 import json
 
@@ -35,14 +34,26 @@ from utils.team_mapping import (
     REVERSE_TEAM_MAPPING,
     TEAM_ALIASES,
     RELEGATED_TEAMS,
-    normalize_team_name,
-    get_team_id_mapping,
-    is_relegated_team
+    get_team_id_mapping
 )
 
 # Injury Service
 from services.injury_service import get_injury_service
 
+# Team data snapshot (팀 JSON 파싱 캐시)
+from services.team_data_snapshot import get_team_data_snapshot
+
+# 외부 피드 공용 HTTP 클라이언트
+from utils.http_client import get_fpl_json, get_http_client
+
+# FPL bootstrap 인덱스
+from services.fpl_snapshot import FPLSnapshot, FPLSnapshotCache, SquadIndex, full_name
+from services.feed_snapshots import build_leaderboard, get_feed_snapshots, start_scheduled_refresh
+
+# 응답 캐시 (프로세스 내 LRU + Redis)
+from infrastructure.cache.tiered_cache import TieredCache
+from infrastructure.cache.view_cache import cached_view
+
 # Position attributes and rating calculation
 from config.position_attributes import calculate_weighted_average, DEFAULT_SUB_POSITION
 
@@ -205,11 +216,8 @@ def handle_exception(error):
         }
     }), 500
 
-# Flask-Caching 설정
-cache = Cache(app, config={
-    'CACHE_TYPE': 'simple',
-    'CACHE_DEFAULT_TIMEOUT': 300
-})
+# 응답 캐시 (프로세스 내 LRU + Redis, 기본 5분)
+cache = TieredCache.from_settings('api', ttl=300, max_entries=512)
 
 # FBref 스크래퍼 초기화
 fbref_scraper = FBrefScraper()
@@ -219,47 +227,56 @@ logger.info("✅ EPL Player Analysis API Server initialized")
 
 # ==================== Helper Functions ====================
 
-@cache.memoize(timeout=3600)  # 1시간 캐싱
 def fetch_fantasy_data():
     """
     Premier League Fantasy API에서 선수 데이터 가져오기
+
+    공용 HTTP 클라이언트 캐시를 사용한다 (다른 서비스와 같은 bootstrap 공유,
+    만료 후에는 캐시를 반환하면서 백그라운드에서 조건부 요청으로 갱신).
+    반환값은 공유 객체이므로 수정하지 않는다.
     """
     try:
-        url = 'https://fantasy.premierleague.com/api/bootstrap-static/'
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = get_fpl_json('bootstrap-static/')
 
-        logger.info(f"✅ Fetched Fantasy API data: {len(data.get('elements', []))} players")
+        logger.debug(f"Fantasy API data: {len(data.get('elements', []))} players")
         return data
     except Exception as e:
         logger.error(f"❌ Error fetching Fantasy API data: {str(e)}")
         return None
 
 
-def normalize_name(name):
-    """
-    선수 이름 정규화 (매칭을 위해)
-    """
-    # 특수 문자 제거, 소문자 변환
-    import re
-    normalized = re.sub(r'[^a-zA-Z\s]', '', name.lower())
-    normalized = ' '.join(normalized.split())  # 공백 정리
-    return normalized
+# bootstrap 응답 인덱스 (fetch_fantasy_data가 새 bootstrap을 반환할 때만 다시 생성)
+fpl_snapshots = FPLSnapshotCache(fetch_fantasy_data)
 
 
-def get_team_matches_played(fantasy_data):
+def get_fpl_snapshot():
     """
-    현재까지 진행된 경기 수 확인
+    현재 FPL bootstrap의 FPLSnapshot (조회 실패 시 None)
+
+    팀/이름 인덱스와 팀별 SQUAD_DATA 매핑, ICT 순위를 요청마다 다시 계산하지 않는다.
     """
+    return fpl_snapshots.get()
+
+
+# 순위표/라운드 매핑/리더보드 등 사전 계산 스냅샷 (핸들러는 읽기만 함)
+feed_snapshots = get_feed_snapshots()
+feed_snapshots.register('leaderboard', lambda: build_leaderboard(get_fpl_snapshot()))
+
+
+def start_feed_refresh():
+    """피드 스냅샷 주기 갱신 시작 (호스트당 한 프로세스만 실제로 실행)"""
     try:
-        events = fantasy_data.get('events', [])
-        # 완료된 gameweek 수 계산
-        completed_gameweeks = sum(1 for event in events if event.get('finished', False))
-        return completed_gameweeks if completed_gameweeks > 0 else 1  # 최소 1경기
+        if start_scheduled_refresh():
+            logger.info("📅 Feed snapshot refresh owned by this process")
     except Exception as e:
-        logger.error(f"Error getting matches played: {str(e)}")
-        return 5  # 기본값: 5경기
+        # 스케줄러 없이도 첫 요청에서 스냅샷을 만들어 게시함
+        logger.warning(f"⚠️ Feed snapshot refresh not scheduled: {e}")
+
+
+# import만으로는 스케줄러를 띄우지 않음 (테스트/스크립트).
+# 서버: __main__ 실행 시 자동, gunicorn은 FEED_REFRESH_ENABLED=true
+if os.getenv('FEED_REFRESH_ENABLED', 'false').lower() == 'true':
+    start_feed_refresh()
 
 
 def calculate_age_from_birthdate(birth_date_str):
@@ -281,6 +298,9 @@ def get_player_stats_from_fantasy(player_name, team_name, fantasy_data):
     """
     Fantasy API에서 선수의 통계 정보 가져오기
 
+    Args:
+        fantasy_data: FPLSnapshot 또는 bootstrap dict
+
     Returns:
         dict: {
             'age': int,
@@ -295,105 +315,66 @@ def get_player_stats_from_fantasy(player_name, team_name, fantasy_data):
         return None
 
     try:
-        elements = fantasy_data.get('elements', [])
-        teams = fantasy_data.get('teams', [])
-
-        # 팀 이름 정규화
-        fantasy_team_name = normalize_team_name(team_name, to_format='fantasy')
-
-        # 팀 ID 찾기
-        team_id = None
-        for team in teams:
-            if team['name'] == fantasy_team_name:
-                team_id = team['id']
-                break
+        snapshot = FPLSnapshot.of(fantasy_data)
 
+        team_id = snapshot.team_id(team_name)
         if not team_id:
             return None
 
+        player = snapshot.find_player(player_name, team_id)
+        if player is None:
+            return None
+
         # 전체 경기 수
-        total_matches = get_team_matches_played(fantasy_data)
+        total_matches = snapshot.matches_played
         max_possible_minutes = total_matches * 90
 
-        # 선수 이름 정규화
-        normalized_player_name = normalize_name(player_name)
-
-        # 해당 팀 선수 찾기
-        for player in elements:
-            if player['team'] != team_id:
-                continue
-
-            fantasy_name = f"{player['first_name']} {player['second_name']}"
-            normalized_fantasy_name = normalize_name(fantasy_name)
-
-            # 이름 매칭
-            if normalized_player_name in normalized_fantasy_name or normalized_fantasy_name in normalized_player_name:
-                starts = player.get('starts', 0)
-                minutes = player.get('minutes', 0)
-
-                # 비율 계산
-                start_ratio = starts / total_matches if total_matches > 0 else 0
-                minutes_ratio = minutes / max_possible_minutes if max_possible_minutes > 0 else 0
-
-                # 주전 여부
-                is_regular_starter = start_ratio >= 0.5 and minutes_ratio >= 0.4
-
-                # 생년월일에서 나이 계산
-                age = calculate_age_from_birthdate(player.get('birth_date'))
-
-                return {
-                    'age': age,
-                    'goals': player.get('goals_scored', 0),
-                    'assists': player.get('assists', 0),
-                    'minutes': minutes,
-                    'starts': starts,
-                    'appearances': starts + player.get('substitute_appearances', 0),  # 선발 + 교체 출전
-                    'is_starter': is_regular_starter,
-                    'matched_name': fantasy_name
-                }
+        starts = player.get('starts', 0)
+        minutes = player.get('minutes', 0)
 
-        return None
+        # 비율 계산
+        start_ratio = starts / total_matches if total_matches > 0 else 0
+        minutes_ratio = minutes / max_possible_minutes if max_possible_minutes > 0 else 0
+
+        # 주전 여부
+        is_regular_starter = start_ratio >= 0.5 and minutes_ratio >= 0.4
+
+        # 생년월일에서 나이 계산
+        age = calculate_age_from_birthdate(player.get('birth_date'))
+
+        return {
+            'age': age,
+            'goals': player.get('goals_scored', 0),
+            'assists': player.get('assists', 0),
+            'minutes': minutes,
+            'starts': starts,
+            'appearances': starts + player.get('substitute_appearances', 0),  # 선발 + 교체 출전
+            'is_starter': is_regular_starter,
+            'matched_name': full_name(player)
+        }
     except Exception as e:
         logger.error(f"Error getting player stats: {str(e)}")
         return None
 
 
-def map_fpl_player_to_squad(fpl_player, team_name):
+def map_fpl_player_to_squad(fpl_player, team_name, snapshot=None):
     """
     FPL 선수를 SQUAD_DATA 선수와 매핑
     데이터 정합성을 위해 SQUAD_DATA의 ID와 이름을 사용
+
+    Args:
+        snapshot: fpl_player가 속한 FPLSnapshot (있으면 매핑 결과를 스냅샷에 캐시)
     """
+    if snapshot is not None:
+        return snapshot.squad_player(fpl_player, team_name)
+
     if team_name not in SQUAD_DATA:
         return None
 
-    squad_players = SQUAD_DATA[team_name]
-    fpl_id = fpl_player['id']
-    fpl_name = f"{fpl_player['first_name']} {fpl_player['second_name']}"
-    fpl_web_name = fpl_player.get('web_name', '')
-
-    # 1. ID 매칭 (가장 정확)
-    for sp in squad_players:
-        if sp['id'] == fpl_id:
-            logger.debug(f"✅ ID 매칭: {sp['name']} (ID: {sp['id']})")
-            return sp
-
-    # 2. 정확한 이름 매칭
-    for sp in squad_players:
-        if sp['name'] == fpl_name or sp['name'] == fpl_web_name:
-            logger.debug(f"✅ 이름 매칭: {sp['name']} (ID: {sp['id']})")
-            return sp
-
-    # 3. 부분 이름 매칭 (성이 같거나 포함)
-    fpl_last_name = fpl_player['second_name'].lower()
-    for sp in squad_players:
-        sp_name_lower = sp['name'].lower()
-        if fpl_last_name in sp_name_lower or fpl_web_name.lower() in sp_name_lower:
-            logger.debug(f"✅ 부분 이름 매칭: {sp['name']} (ID: {sp['id']}) <- FPL: {fpl_name}")
-            return sp
-
-    # 매칭 실패
-    logger.warning(f"❌ 매칭 실패: FPL {fpl_name} (ID: {fpl_id}) in {team_name}")
-    return None
+    squad_player = SquadIndex(SQUAD_DATA[team_name]).match(fpl_player)
+    if squad_player is None:
+        logger.warning(f"❌ 매칭 실패: FPL {full_name(fpl_player)} (ID: {fpl_player['id']}) in {team_name}")
+    return squad_player
 
 
 def get_player_role_by_ict(team_name, fantasy_data):
@@ -405,6 +386,9 @@ def get_player_role_by_ict(team_name, fantasy_data):
     - substitute: 팀 내 ICT Index 16-25위 (후보)
     - other: 나머지 (기타)
 
+    Args:
+        fantasy_data: FPLSnapshot 또는 bootstrap dict (스냅샷이면 팀별 결과 재사용)
+
     Returns:
         dict: {squad_data_player_id: {'role': str, 'ict_index': float, 'rank': int}}
         ⚠️ SQUAD_DATA 선수 ID를 키로 사용 (FPL ID가 아님!)
@@ -413,69 +397,7 @@ def get_player_role_by_ict(team_name, fantasy_data):
         return {}
 
     try:
-        elements = fantasy_data.get('elements', [])
-        teams = fantasy_data.get('teams', [])
-
-        # 팀 이름 정규화
-        fantasy_team_name = normalize_team_name(team_name, to_format='fantasy')
-
-        # 팀 ID 찾기
-        team_id = None
-        for team in teams:
-            if team['name'] == fantasy_team_name:
-                team_id = team['id']
-                break
-
-        if not team_id:
-            logger.warning(f"⚠️ Team not found in Fantasy API: {team_name}")
-            return {}
-
-        # 해당 팀 선수들 필터링 및 ICT Index 기준 정렬
-        team_players = []
-        for player in elements:
-            if player['team'] == team_id:
-                ict_index = float(player.get('ict_index', '0.0'))
-
-                # FPL 선수를 SQUAD_DATA 선수와 매핑
-                squad_player = map_fpl_player_to_squad(player, team_name)
-
-                if squad_player:
-                    team_players.append({
-                        'squad_id': squad_player['id'],  # SQUAD_DATA ID 사용
-                        'fpl_id': player['id'],
-                        'name': squad_player['name'],  # SQUAD_DATA 이름 사용
-                        'ict_index': ict_index
-                    })
-
-        # ICT Index 내림차순 정렬
-        team_players.sort(key=lambda x: x['ict_index'], reverse=True)
-
-        # 역할 할당 (SQUAD_DATA ID를 키로 사용)
-        player_roles = {}
-        for rank, player in enumerate(team_players, start=1):
-            if rank <= 15:
-                role = 'starter'
-            elif rank <= 25:
-                role = 'substitute'
-            else:
-                role = 'other'
-
-            player_roles[player['squad_id']] = {  # SQUAD_DATA ID를 키로 사용
-                'role': role,
-                'ict_index': player['ict_index'],
-                'rank': rank
-            }
-
-        logger.info(
-            f"📊 {team_name} ICT Index 역할 할당: "
-            f"주전 {sum(1 for p in player_roles.values() if p['role'] == 'starter')}명, "
-            f"후보 {sum(1 for p in player_roles.values() if p['role'] == 'substitute')}명, "
-            f"기타 {sum(1 for p in player_roles.values() if p['role'] == 'other')}명 "
-            f"(매핑된 선수 {len(team_players)}명)"
-        )
-
-        return player_roles
-
+        return FPLSnapshot.of(fantasy_data).player_roles(team_name)
     except Exception as e:
         logger.error(f"Error calculating player roles for {team_name}: {str(e)}")
         return {}
@@ -488,33 +410,31 @@ def is_starter(player_name, team_name, fantasy_data):
     주전 기준:
     - 팀 내 ICT Index 상위 15명
     """
-    player_roles = get_player_role_by_ict(team_name, fantasy_data)
-
-    if not player_roles:
+    if not fantasy_data:
         return False
 
-    # 선수 매칭
-    elements = fantasy_data.get('elements', [])
-    normalized_player_name = normalize_name(player_name)
+    snapshot = FPLSnapshot.of(fantasy_data)
+    player_roles = get_player_role_by_ict(team_name, snapshot)
 
-    for player in elements:
-        fantasy_name = f"{player['first_name']} {player['second_name']}"
-        normalized_fantasy_name = normalize_name(fantasy_name)
+    if not player_roles:
+        return False
 
-        if normalized_player_name in normalized_fantasy_name or normalized_fantasy_name in normalized_player_name:
-            player_id = player['id']
-            role_info = player_roles.get(player_id, {})
-            is_regular_starter = role_info.get('role') == 'starter'
+    # 선수 매칭 (해당 팀 FPL 선수 → SQUAD_DATA 선수 → 역할)
+    player = snapshot.find_player(player_name, snapshot.team_id(team_name))
+    if player is not None:
+        squad_player = snapshot.squad_player(player, team_name)
+        role_info = player_roles.get(squad_player['id'], {}) if squad_player else {}
+        is_regular_starter = role_info.get('role') == 'starter'
 
-            logger.info(
-                f"✅ ICT Matched: {player_name} → {fantasy_name} | "
-                f"ICT Index: {role_info.get('ict_index', 0):.1f} | "
-                f"Rank: {role_info.get('rank', 'N/A')} | "
-                f"Role: {role_info.get('role', 'unknown')} | "
-                f"Starter: {is_regular_starter}"
-            )
+        logger.info(
+            f"✅ ICT Matched: {player_name} → {full_name(player)} | "
+            f"ICT Index: {role_info.get('ict_index', 0):.1f} | "
+            f"Rank: {role_info.get('rank', 'N/A')} | "
+            f"Role: {role_info.get('role', 'unknown')} | "
+            f"Starter: {is_regular_starter}"
+        )
 
-            return is_regular_starter
+        return is_regular_starter
 
     logger.warning(f"⚠️ Player not matched in Fantasy API: {player_name} (team: {team_name})")
     return False
@@ -589,7 +509,7 @@ def health_check():
 
 
 @app.route('/api/teams', methods=['GET'])
-@cache.cached(timeout=3600)
+@cached_view(cache, ttl=3600)
 def get_teams():
     """
     EPL 전체 팀 목록 가져오기 (엠블럼 포함)
@@ -650,7 +570,7 @@ def get_teams():
 
 
 @app.route('/api/squad/<team_name>', methods=['GET'])
-@cache.cached(timeout=1800, query_string=True)
+@cached_view(cache, ttl=1800, query_string=True)
 def get_squad(team_name):
     """
     특정 팀의 선수 명단 가져오기 (ICT Index 기반 주전/후보/기타 정보 + 평점 계산 포함)
@@ -663,15 +583,14 @@ def get_squad(team_name):
         logger.info(f"🔍 Fetching squad for team: {team_name}")
         logger.info(f"📋 Retrieved {len(players)} players")
 
-        # FPL API에서 ICT Index 기반 역할 정보 가져오기
-        fantasy_data = fetch_fantasy_data()
-        player_roles = get_player_role_by_ict(team_name, fantasy_data) if fantasy_data else {}
+        # FPL API에서 ICT Index 기반 역할 정보 가져오기 (스냅샷에 팀별로 캐시)
+        fpl_snapshot = get_fpl_snapshot()
+        player_roles = get_player_role_by_ict(team_name, fpl_snapshot) if fpl_snapshot else {}
 
         # 데이터베이스에서 모든 선수의 평점 가져오기
         ratings_by_player = {}
         try:
-            session = get_player_session()
-            try:
+            with player_session_scope() as session:
                 # 모든 선수 ID 수집
                 player_ids = [p.get('id') for p in players if p.get('id')]
 
@@ -686,8 +605,6 @@ def get_squad(team_name):
                     if rating.player_id not in ratings_by_player:
                         ratings_by_player[rating.player_id] = {}
                     ratings_by_player[rating.player_id][rating.attribute_name] = rating.rating
-            finally:
-                session.close()
         except Exception as db_error:
             # 데이터베이스가 없거나 테이블이 없는 경우 빈 평점으로 진행
             logger.warning(f"⚠️ Could not fetch player ratings from database: {db_error}")
@@ -784,12 +701,11 @@ def get_player(player_id):
     특정 선수 정보 가져오기
     """
     try:
-        # 모든 팀에서 선수 찾기
-        for team_name, players in SQUAD_DATA.items():
-            for player in players:
-                if player.get('id') == player_id:
-                    player_with_team = {**player, 'team': team_name}
-                    return jsonify(player_with_team)
+        # 선수 ID 인덱스로 조회
+        player = SQUAD_DATA.get_player(player_id)
+        if player is not None:
+            player_with_team = {**player, 'team': SQUAD_DATA.team_of(player_id)}
+            return jsonify(player_with_team)
 
         raise NotFoundError(f"Player with ID {player_id} not found")
     except NotFoundError:
@@ -800,7 +716,7 @@ def get_player(player_id):
 
 
 @app.route('/api/fixtures', methods=['GET'])
-@cache.cached(timeout=300, query_string=True)
+@cached_view(cache, ttl=300, query_string=True)
 def get_fixtures():
     """
     경기 일정 가져오기 (선택적 - 향후 제거 가능)
@@ -823,7 +739,7 @@ def get_fixtures():
 
 
 @app.route('/api/player-photo/<photo_code>', methods=['GET'])
-@cache.cached(timeout=86400, query_string=True)  # 24시간 캐시
+@cached_view(cache, ttl=86400, query_string=True)  # 24시간 캐시
 def get_player_photo(photo_code):
     """
     선수 사진 프록시 (CORS 우회)
@@ -845,7 +761,8 @@ def get_player_photo(photo_code):
             'Referer': 'https://www.premierleague.com/'
         }
 
-        response = requests.get(photo_url, headers=headers, timeout=10)
+        # 공용 세션 (keep-alive), 응답 캐시는 cached_view가 담당
+        response = get_http_client().session.get(photo_url, headers=headers, timeout=10)
         response.raise_for_status()
 
         # 이미지 반환
@@ -1133,6 +1050,7 @@ def save_team_overall_score(team_name):
 
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(score_data, f, indent=2, ensure_ascii=False)
+        get_team_data_snapshot().invalidate(file_path)
 
         logger.info(f"✅ Saved overall score for {team_name}: {data['overallScore']:.1f}/100")
 
@@ -1166,8 +1084,9 @@ def get_team_overall_score(team_name):
     """
     try:
         file_path = os.path.join(OVERALL_SCORES_DIR, f"{team_name}.json")
+        score_data = get_team_data_snapshot().read_json(file_path)
 
-        if not os.path.exists(file_path):
+        if score_data is None:
             # Return default values instead of 404 to prevent console errors
             return jsonify({
                 'success': True,
@@ -1182,9 +1101,6 @@ def get_team_overall_score(team_name):
                 }
             }), 200
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            score_data = json.load(f)
-
         return jsonify({
             'success': True,
             'data': score_data
@@ -1268,6 +1184,7 @@ def save_team_formation(team_name):
 
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(formation_data, f, indent=2, ensure_ascii=False)
+        get_team_data_snapshot().invalidate(file_path)
 
         logger.info(f"✅ Saved formation for {team_name}: {formation}")
 
@@ -1298,16 +1215,14 @@ def get_team_formation(team_name):
     """
     try:
         file_path = os.path.join(FORMATIONS_DIR, f"{team_name}.json")
+        formation_data = get_team_data_snapshot().read_json(file_path)
 
-        if not os.path.exists(file_path):
+        if formation_data is None:
             return jsonify({
                 'success': False,
                 'message': f"No formation found for {team_name}"
             }), 404
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            formation_data = json.load(f)
-
         return jsonify({
             'success': True,
             'data': formation_data
@@ -1369,6 +1284,7 @@ def save_team_lineup(team_name):
 
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(lineup_data, f, indent=2, ensure_ascii=False)
+        get_team_data_snapshot().invalidate(file_path)
 
         logger.info(f"✅ Saved lineup for {team_name}: {len(lineup)} players")
 
@@ -1399,16 +1315,14 @@ def get_team_lineup(team_name):
     """
     try:
         file_path = os.path.join(LINEUPS_DIR, f"{team_name}.json")
+        lineup_data = get_team_data_snapshot().read_json(file_path)
 
-        if not os.path.exists(file_path):
+        if lineup_data is None:
             return jsonify({
                 'success': False,
                 'message': f"No lineup found for {team_name}"
             }), 404
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lineup_data = json.load(f)
-
         return jsonify({
             'success': True,
             'data': lineup_data
@@ -1471,6 +1385,7 @@ def save_team_tactics(team_name):
 
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(tactics_data, f, indent=2, ensure_ascii=False)
+        get_team_data_snapshot().invalidate(file_path)
 
         logger.info(f"✅ Saved tactics for {team_name}")
 
@@ -1502,16 +1417,14 @@ def get_team_tactics(team_name):
     """
     try:
         file_path = os.path.join(TACTICS_DIR, f"{team_name}.json")
+        tactics_data = get_team_data_snapshot().read_json(file_path)
 
-        if not os.path.exists(file_path):
+        if tactics_data is None:
             return jsonify({
                 'success': False,
                 'message': f"No tactics found for {team_name}"
             }), 404
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            tactics_data = json.load(f)
-
         return jsonify({
             'success': True,
             'data': tactics_data
@@ -1563,6 +1476,7 @@ def save_team_strength(team_name):
 
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(strength_data, f, indent=2, ensure_ascii=False)
+        get_team_data_snapshot().invalidate(file_path)
 
         logger.info(f"✅ Saved team strength for {team_name}: {len(ratings)} attributes")
 
@@ -1593,16 +1507,14 @@ def get_team_strength(team_name):
     """
     try:
         file_path = os.path.join(TEAM_STRENGTH_DIR, f"{team_name}.json")
+        strength_data = get_team_data_snapshot().read_json(file_path)
 
-        if not os.path.exists(file_path):
+        if strength_data is None:
             return jsonify({
                 'success': False,
                 'message': f"No team strength data found for {team_name}"
             }), 404
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            strength_data = json.load(f)
-
         return jsonify({
             'success': True,
             'data': strength_data
@@ -1821,29 +1733,27 @@ def get_player_ratings(player_id):
     """
     특정 선수의 능력치 조회
     """
-    session = None
     try:
         user_id = request.args.get('user_id', 'default')
-        session = get_player_session(DB_PATH)
-
-        # 선수 정보 조회
-        player = session.query(Player).filter_by(id=player_id).first()
-        if not player:
-            raise NotFoundError(f"Player with ID {player_id} not found")
-
-        # 능력치 조회
-        ratings = session.query(PlayerRating).filter_by(
-            player_id=player_id,
-            user_id=user_id
-        ).all()
-
-        ratings_dict = {}
-        for rating in ratings:
-            ratings_dict[rating.attribute_name] = {
-                'rating': rating.rating,
-                'notes': rating.notes,
-                'updated_at': rating.updated_at.isoformat() if rating.updated_at else None
-            }
+        with player_session_scope(DB_PATH) as session:
+            # 선수 정보 조회
+            player = session.query(Player).filter_by(id=player_id).first()
+            if not player:
+                raise NotFoundError(f"Player with ID {player_id} not found")
+
+            # 능력치 조회
+            ratings = session.query(PlayerRating).filter_by(
+                player_id=player_id,
+                user_id=user_id
+            ).all()
+
+            ratings_dict = {}
+            for rating in ratings:
+                ratings_dict[rating.attribute_name] = {
+                    'rating': rating.rating,
+                    'notes': rating.notes,
+                    'updated_at': rating.updated_at.isoformat() if rating.updated_at else None
+                }
 
         return jsonify({
             'player_id': player_id,
@@ -1857,9 +1767,6 @@ def get_player_ratings(player_id):
     except Exception as e:
         logger.error(f"Error fetching ratings: {str(e)}", exc_info=True)
         raise APIError(f"Failed to fetch ratings: {str(e)}", status_code=500)
-    finally:
-        if session:
-            session.close()
 
 
 @app.route('/api/ratings', methods=['POST'])
@@ -1877,7 +1784,6 @@ def save_player_ratings():
         }
     }
     """
-    session = None
     try:
         data = request.json or {}
         player_id = data.get('player_id')
@@ -1890,80 +1796,78 @@ def save_player_ratings():
         if not ratings:
             raise ValidationError("Missing ratings data")
 
-        session = get_player_session(DB_PATH)
+        with player_session_scope(DB_PATH) as session:
+            # 선수 존재 확인
+            player = session.query(Player).filter_by(id=player_id).first()
+            if not player:
+                raise NotFoundError(f"Player with ID {player_id} not found")
+
+            # 각 능력치 저장/업데이트
+            saved_count = 0
+            for attribute_name, rating_value in ratings.items():
+                # _comment와 _subPosition은 문자열로 notes 컬럼에 저장 (메타데이터)
+                if attribute_name in ['_comment', '_subPosition']:
+                    # notes 컬럼에 문자열 값 저장 (rating은 0으로 설정)
+                    existing = session.query(PlayerRating).filter_by(
+                        player_id=player_id,
+                        user_id=user_id,
+                        attribute_name=attribute_name
+                    ).first()
 
-        # 선수 존재 확인
-        player = session.query(Player).filter_by(id=player_id).first()
-        if not player:
-            raise NotFoundError(f"Player with ID {player_id} not found")
+                    string_value = str(rating_value) if not isinstance(rating_value, str) else rating_value
 
-        # 각 능력치 저장/업데이트
-        saved_count = 0
-        for attribute_name, rating_value in ratings.items():
-            # _comment와 _subPosition은 문자열로 notes 컬럼에 저장 (메타데이터)
-            if attribute_name in ['_comment', '_subPosition']:
-                # notes 컬럼에 문자열 값 저장 (rating은 0으로 설정)
+                    if existing:
+                        existing.rating = 0  # Placeholder
+                        existing.notes = string_value
+                        existing.updated_at = datetime.now()
+                    else:
+                        new_rating = PlayerRating(
+                            player_id=player_id,
+                            user_id=user_id,
+                            attribute_name=attribute_name,
+                            rating=0,  # Placeholder
+                            notes=string_value
+                        )
+                        session.add(new_rating)
+                    saved_count += 1
+                    continue
+
+                # 다른 특수 필드 (_, 로 시작)는 건너뛰기
+                if attribute_name.startswith('_'):
+                    continue
+
+                # 값 검증 (0.0 ~ 5.0, 0.25 단위)
+                if not isinstance(rating_value, (int, float)):
+                    continue
+                if rating_value < 0.0 or rating_value > 5.0:
+                    continue
+                # 0.25 단위 체크
+                if round(rating_value * 4) != rating_value * 4:
+                    continue
+
+                # 기존 레코드 확인
                 existing = session.query(PlayerRating).filter_by(
                     player_id=player_id,
                     user_id=user_id,
                     attribute_name=attribute_name
                 ).first()
 
-                string_value = str(rating_value) if not isinstance(rating_value, str) else rating_value
-
                 if existing:
-                    existing.rating = 0  # Placeholder
-                    existing.notes = string_value
+                    # 업데이트
+                    existing.rating = rating_value
                     existing.updated_at = datetime.now()
                 else:
+                    # 신규 생성
                     new_rating = PlayerRating(
                         player_id=player_id,
                         user_id=user_id,
                         attribute_name=attribute_name,
-                        rating=0,  # Placeholder
-                        notes=string_value
+                        rating=rating_value
                     )
                     session.add(new_rating)
-                saved_count += 1
-                continue
-
-            # 다른 특수 필드 (_, 로 시작)는 건너뛰기
-            if attribute_name.startswith('_'):
-                continue
 
-            # 값 검증 (0.0 ~ 5.0, 0.25 단위)
-            if not isinstance(rating_value, (int, float)):
-                continue
-            if rating_value < 0.0 or rating_value > 5.0:
-                continue
-            # 0.25 단위 체크
-            if round(rating_value * 4) != rating_value * 4:
-                continue
-
-            # 기존 레코드 확인
-            existing = session.query(PlayerRating).filter_by(
-                player_id=player_id,
-                user_id=user_id,
-                attribute_name=attribute_name
-            ).first()
-
-            if existing:
-                # 업데이트
-                existing.rating = rating_value
-                existing.updated_at = datetime.now()
-            else:
-                # 신규 생성
-                new_rating = PlayerRating(
-                    player_id=player_id,
-                    user_id=user_id,
-                    attribute_name=attribute_name,
-                    rating=rating_value
-                )
-                session.add(new_rating)
-
-            saved_count += 1
+                saved_count += 1
 
-        session.commit()
         logger.info(f"✅ Saved {saved_count} ratings for player {player_id}")
 
         return jsonify({
@@ -1973,17 +1877,10 @@ def save_player_ratings():
         })
 
     except (ValidationError, NotFoundError) as e:
-        if session:
-            session.rollback()
         raise
     except Exception as e:
-        if session:
-            session.rollback()
         logger.error(f"Error saving ratings: {str(e)}", exc_info=True)
         raise APIError(f"Failed to save ratings: {str(e)}", status_code=500)
-    finally:
-        if session:
-            session.close()
 
 
 @app.route('/api/ratings/<int:player_id>/<attribute_name>', methods=['PUT'])
@@ -1997,7 +1894,6 @@ def update_single_rating(player_id, attribute_name):
         "user_id": "default"
     }
     """
-    session = None
     try:
         data = request.json or {}
         rating_value = data.get('rating')
@@ -2011,30 +1907,27 @@ def update_single_rating(player_id, attribute_name):
         if rating_value < 0.0 or rating_value > 5.0:
             raise ValidationError("Rating must be between 0.0 and 5.0")
 
-        session = get_player_session(DB_PATH)
-
-        # 기존 레코드 확인
-        existing = session.query(PlayerRating).filter_by(
-            player_id=player_id,
-            user_id=user_id,
-            attribute_name=attribute_name
-        ).first()
-
-        if existing:
-            existing.rating = rating_value
-            existing.notes = notes
-            existing.updated_at = datetime.now()
-        else:
-            new_rating = PlayerRating(
+        with player_session_scope(DB_PATH) as session:
+            # 기존 레코드 확인
+            existing = session.query(PlayerRating).filter_by(
                 player_id=player_id,
                 user_id=user_id,
-                attribute_name=attribute_name,
-                rating=rating_value,
-                notes=notes
-            )
-            session.add(new_rating)
+                attribute_name=attribute_name
+            ).first()
 
-        session.commit()
+            if existing:
+                existing.rating = rating_value
+                existing.notes = notes
+                existing.updated_at = datetime.now()
+            else:
+                new_rating = PlayerRating(
+                    player_id=player_id,
+                    user_id=user_id,
+                    attribute_name=attribute_name,
+                    rating=rating_value,
+                    notes=notes
+                )
+                session.add(new_rating)
 
         return jsonify({
             'success': True,
@@ -2044,112 +1937,37 @@ def update_single_rating(player_id, attribute_name):
         })
 
     except (ValidationError, NotFoundError) as e:
-        if session:
-            session.rollback()
         raise
     except Exception as e:
-        if session:
-            session.rollback()
         logger.error(f"Error updating rating: {str(e)}", exc_info=True)
         raise APIError(f"Failed to update rating: {str(e)}", status_code=500)
-    finally:
-        if session:
-            session.close()
 
 
 # ============================================================================
 # EPL 공식 데이터 API (Fantasy Premier League)
 # ============================================================================
 
+def snapshot_response(name, payload_key=None):
+    """
+    사전 계산된 피드 스냅샷 응답 (X-Snapshot-Version 헤더 포함)
+
+    Args:
+        name: 스냅샷 이름
+        payload_key: 지정하면 {payload_key: data} 형태로 감쌈
+    """
+    snapshot = feed_snapshots.get(name)
+    response = jsonify({payload_key: snapshot.data} if payload_key else snapshot.data)
+    response.headers['X-Snapshot-Version'] = str(snapshot.version)
+    return response
+
+
 @app.route('/api/epl/standings', methods=['GET'])
-@cache.cached(timeout=1800)  # 30분 캐시
 def get_epl_standings():
     """
-    EPL 리그 순위표 가져오기
+    EPL 리그 순위표 가져오기 (피드 스냅샷)
     """
     try:
-        # Bootstrap 데이터와 Fixtures 데이터 가져오기
-        fantasy_data = fetch_fantasy_data()
-        fixtures_response = requests.get('https://fantasy.premierleague.com/api/fixtures/', timeout=10)
-        fixtures_response.raise_for_status()
-        fixtures = fixtures_response.json()
-
-        teams = fantasy_data.get('teams', [])
-
-        # 팀별 통계 계산 (EPL 팀만)
-        standings = {}
-        for team in teams:
-            # 강등팀 제외
-            if is_relegated_team(team['name']):
-                continue
-
-            team_id = team['id']
-            standings[team_id] = {
-                'id': team_id,
-                'name': team['name'],
-                'short_name': team['short_name'],
-                'played': 0,
-                'won': 0,
-                'drawn': 0,
-                'lost': 0,
-                'goals_for': 0,
-                'goals_against': 0,
-                'goal_difference': 0,
-                'points': 0,
-                'position': team.get('position', 0)
-            }
-
-        # Fixtures에서 완료된 경기만 처리
-        for fixture in fixtures:
-            if fixture.get('finished') and fixture.get('team_h_score') is not None:
-                home_id = fixture['team_h']
-                away_id = fixture['team_a']
-                home_score = fixture['team_h_score']
-                away_score = fixture['team_a_score']
-
-                # 홈 팀 통계
-                if home_id in standings:
-                    standings[home_id]['played'] += 1
-                    standings[home_id]['goals_for'] += home_score
-                    standings[home_id]['goals_against'] += away_score
-
-                    if home_score > away_score:
-                        standings[home_id]['won'] += 1
-                        standings[home_id]['points'] += 3
-                    elif home_score == away_score:
-                        standings[home_id]['drawn'] += 1
-                        standings[home_id]['points'] += 1
-                    else:
-                        standings[home_id]['lost'] += 1
-
-                # 원정 팀 통계
-                if away_id in standings:
-                    standings[away_id]['played'] += 1
-                    standings[away_id]['goals_for'] += away_score
-                    standings[away_id]['goals_against'] += home_score
-
-                    if away_score > home_score:
-                        standings[away_id]['won'] += 1
-                        standings[away_id]['points'] += 3
-                    elif away_score == home_score:
-                        standings[away_id]['drawn'] += 1
-                        standings[away_id]['points'] += 1
-                    else:
-                        standings[away_id]['lost'] += 1
-
-        # 득실차 계산 및 정렬
-        standings_list = list(standings.values())
-        for team in standings_list:
-            team['goal_difference'] = team['goals_for'] - team['goals_against']
-
-        # 승점 > 득실차 > 득점 순으로 정렬
-        standings_list.sort(key=lambda x: (x['points'], x['goal_difference'], x['goals_for']), reverse=True)
-
-        # 순위 업데이트
-        for idx, team in enumerate(standings_list):
-            team['position'] = idx + 1
-
-        return jsonify({'standings': standings_list})
+        return snapshot_response('standings', payload_key='standings')
 
     except Exception as e:
         logger.error(f"Error fetching standings: {str(e)}", exc_info=True)
@@ -2157,7 +1975,7 @@ def get_epl_standings():
 
 
 @app.route('/api/epl/fixtures', methods=['GET'])
-@cache.cached(timeout=600, query_string=True)  # 10분 캐시
+@cached_view(cache, ttl=600, query_string=True)  # 10분 캐시
 def get_epl_fixtures():
     """
     EPL 경기 일정 및 결과 가져오기
@@ -2170,9 +1988,7 @@ def get_epl_fixtures():
         team_id = request.args.get('team')
 
         # Fixtures 및 Bootstrap 데이터 가져오기
-        fixtures_response = requests.get('https://fantasy.premierleague.com/api/fixtures/', timeout=10)
-        fixtures_response.raise_for_status()
-        fixtures = fixtures_response.json()
+        fixtures = get_fpl_json('fixtures/')
 
         fantasy_data = fetch_fantasy_data()
         teams_dict = {team['id']: team for team in fantasy_data.get('teams', [])}
@@ -2207,84 +2023,13 @@ def get_epl_fixtures():
 
 
 @app.route('/api/epl/leaderboard', methods=['GET'])
-@cache.cached(timeout=1800)  # 30분 캐시
 def get_epl_leaderboard():
     """
     EPL 리더보드 (득점왕, 도움왕, 클린시트 등)
-    SQUAD_DATA와 매핑하여 데이터 정합성 보장
+    SQUAD_DATA와 매핑하여 데이터 정합성 보장 (피드 스냅샷)
     """
     try:
-        fantasy_data = fetch_fantasy_data()
-        players = fantasy_data.get('elements', [])
-        teams_dict = {team['id']: team for team in fantasy_data.get('teams', [])}
-
-        # 선수 데이터 가공 (EPL 팀만 + SQUAD_DATA 매핑)
-        enriched_players = []
-        mapped_count = 0
-        unmapped_count = 0
-
-        for player in players:
-            team = teams_dict.get(player['team'], {})
-            team_name = team.get('name', 'Unknown')
-
-            # 강등팀 제외
-            if is_relegated_team(team_name):
-                continue
-
-            # SQUAD_DATA와 매핑
-            squad_player = map_fpl_player_to_squad(player, team_name)
-
-            if squad_player:
-                # SQUAD_DATA 선수 정보 사용 (데이터 정합성 보장)
-                mapped_count += 1
-                enriched_players.append({
-                    'id': squad_player['id'],  # SQUAD_DATA ID 사용
-                    'code': player.get('code'),  # 선수 사진 URL용 코드 (FPL)
-                    'name': squad_player['name'],  # SQUAD_DATA 이름 사용
-                    'team': team_name,
-                    'team_short': team.get('short_name', 'UNK'),
-                    'position': squad_player['position'],  # SQUAD_DATA position 사용
-                    'goals': player.get('goals_scored', 0),  # FPL 통계
-                    'assists': player.get('assists', 0),  # FPL 통계
-                    'clean_sheets': player.get('clean_sheets', 0),  # FPL 통계
-                    'total_points': player.get('total_points', 0),  # FPL 통계
-                    'form': float(player.get('form', 0)),  # FPL 통계
-                    'minutes': player.get('minutes', 0)  # FPL 통계
-                })
-            else:
-                # 매핑 실패 시 FPL 데이터 그대로 사용 (fallback)
-                unmapped_count += 1
-                player_full_name = f"{player['first_name']} {player['second_name']}"
-                enriched_players.append({
-                    'id': player['id'],
-                    'code': player.get('code'),
-                    'name': player['web_name'],
-                    'team': team_name,
-                    'team_short': team.get('short_name', 'UNK'),
-                    'position': ['GK', 'DEF', 'MID', 'FWD'][player['element_type'] - 1],
-                    'goals': player.get('goals_scored', 0),
-                    'assists': player.get('assists', 0),
-                    'clean_sheets': player.get('clean_sheets', 0),
-                    'total_points': player.get('total_points', 0),
-                    'form': float(player.get('form', 0)),
-                    'minutes': player.get('minutes', 0)
-                })
-
-        logger.info(f"📊 리더보드 매핑 결과: 성공 {mapped_count}명, 실패 {unmapped_count}명")
-
-        # 리더보드 생성
-        leaderboard = {
-            'top_scorers': sorted([p for p in enriched_players if p['goals'] > 0],
-                                 key=lambda x: x['goals'], reverse=True)[:20],
-            'top_assists': sorted([p for p in enriched_players if p['assists'] > 0],
-                                 key=lambda x: x['assists'], reverse=True)[:20],
-            'top_clean_sheets': sorted([p for p in enriched_players if p['clean_sheets'] > 0],
-                                      key=lambda x: x['clean_sheets'], reverse=True)[:20],
-            'top_points': sorted(enriched_players,
-                               key=lambda x: x['total_points'], reverse=True)[:20]
-        }
-
-        return jsonify(leaderboard)
+        return snapshot_response('leaderboard')
 
     except Exception as e:
         logger.error(f"Error fetching leaderboard: {str(e)}", exc_info=True)
@@ -2361,15 +2106,9 @@ def get_value_bets():
             raw_data = odds_client.get_epl_odds()
             all_matches = odds_client.parse_odds_data(raw_data)
 
-        # 모든 경기 분석
-        all_value_bets = []
-
-        for match in all_matches:
-            analysis = odds_aggregator.analyze_match_odds(match)
-            analysis['bookmakers_raw'] = match['bookmakers']
-
-            value_bets = detector.detect_value_bets(analysis)
-            all_value_bets.extend(value_bets)
+        # 모든 경기를 한 번에 스캔
+        scan = odds_aggregator.scan_markets(all_matches)
+        all_value_bets = detector.detect_in_scan(scan)
 
         # 요약 통계
         summary = detector.summarize_value_bets(all_value_bets)
@@ -2412,39 +2151,11 @@ def get_match_predictions():
             raw_data = odds_client.get_epl_odds()
             all_matches = odds_client.parse_odds_data(raw_data)
 
-        # 2. FPL API에서 라운드 정보 가져오기
+        # 2. 라운드 정보 (피드 스냅샷)
         try:
-            bootstrap_response = requests.get('https://fantasy.premierleague.com/api/bootstrap-static/', timeout=10)
-            bootstrap_response.raise_for_status()
-            bootstrap_data = bootstrap_response.json()
-
-            fixtures_response = requests.get('https://fantasy.premierleague.com/api/fixtures/', timeout=10)
-            fixtures_response.raise_for_status()
-            fixtures_data = fixtures_response.json()
-
-            # 팀 ID -> 팀 이름 매핑
-            teams = {team['id']: team['name'] for team in bootstrap_data.get('teams', [])}
-
-            # 현재 라운드 찾기
-            events = bootstrap_data.get('events', [])
-            current_event = next((e for e in events if e.get('is_current', False)), None)
-            next_event = next((e for e in events if e.get('is_next', False)), None)
-            current_round = (next_event or current_event or {}).get('id', 1)
-
-            # 팀 이름으로 라운드 매핑 생성 (미래 경기만)
-            round_mapping = {}
-            for fixture in fixtures_data:
-                if not fixture.get('finished', False):
-                    home_team = teams.get(fixture.get('team_h'))
-                    away_team = teams.get(fixture.get('team_a'))
-                    event_round = fixture.get('event', current_round)
-
-                    if home_team and away_team:
-                        # 팀 이름 정규화
-                        key = f"{home_team}_{away_team}"
-                        round_mapping[key] = event_round
-
-            logger.info(f"✅ Loaded round info for {len(round_mapping)} upcoming matches (Current round: {current_round})")
+            fixture_rounds = feed_snapshots.get('fixture_rounds').data
+            round_mapping = fixture_rounds['round_mapping']
+            current_round = fixture_rounds['current_round']
         except Exception as e:
             logger.warning(f"⚠️ Failed to load FPL round info: {e}")
             round_mapping = {}
@@ -2547,6 +2258,37 @@ def get_match_predictions():
         return jsonify({'error': str(e)}), 500
 
 
+def build_dashboard(all_matches):
+    """배당률 → 대시보드 데이터 (경기별 분석 + Value Bets)"""
+    # 1. 모든 경기 분석 (배당률 텐서 한 번으로 스캔)
+    scan = odds_aggregator.scan_markets(all_matches)
+    analyzed_matches = odds_aggregator.analyze_scan(scan)
+    for match, analysis in zip(scan.tensor.matches, analyzed_matches):
+        analysis['match_id'] = match.get('match_id')  # match_id 추가
+        analysis['bookmakers_raw'] = match['bookmakers']
+
+    # 2. Value Bets 탐지
+    all_value_bets = value_detector.detect_in_scan(scan)
+    value_summary = value_detector.summarize_value_bets(all_value_bets)
+
+    return {
+        'matches': analyzed_matches,
+        'value_bets': {
+            'opportunities': all_value_bets,
+            'summary': value_summary
+        }
+    }
+
+
+def build_demo_dashboard():
+    """데모 배당률 대시보드 (피드 스냅샷 빌더)"""
+    from odds_collection.odds_api_client import get_demo_odds
+    return build_dashboard(get_demo_odds())
+
+
+feed_snapshots.register('dashboard_demo', build_demo_dashboard)
+
+
 @app.route('/api/dashboard', methods=['GET'])
 def get_dashboard_data():
     """
@@ -2560,40 +2302,23 @@ def get_dashboard_data():
     try:
         use_demo = request.args.get('use_demo', 'true').lower() == 'true'
 
-        # 1. 배당률 가져오기
         if use_demo:
-            from odds_collection.odds_api_client import get_demo_odds
-            all_matches = get_demo_odds()
+            # 데모 배당률 분석은 피드 스냅샷으로 미리 계산됨
+            snapshot = feed_snapshots.get('dashboard_demo')
+            dashboard = snapshot.data
         else:
             raw_data = odds_client.get_epl_odds()
-            all_matches = odds_client.parse_odds_data(raw_data)
-
-        # 2. 모든 경기 분석
-        analyzed_matches = []
-        for match in all_matches:
-            analysis = odds_aggregator.analyze_match_odds(match)
-            analysis['match_id'] = match.get('match_id')  # match_id 추가
-            analysis['bookmakers_raw'] = match['bookmakers']
-            analyzed_matches.append(analysis)
-
-        # 3. Value Bets 탐지
-        all_value_bets = []
-        for analysis in analyzed_matches:
-            value_bets = value_detector.detect_value_bets(analysis)
-            all_value_bets.extend(value_bets)
+            dashboard = build_dashboard(odds_client.parse_odds_data(raw_data))
 
-        value_summary = value_detector.summarize_value_bets(all_value_bets)
-
-        return jsonify({
+        response = jsonify({
             'success': True,
-            'matches': analyzed_matches,
-            'value_bets': {
-                'opportunities': all_value_bets,
-                'summary': value_summary
-            },
+            **dashboard,
             'source': 'demo' if use_demo else 'live_api',
             'timestamp': datetime.now().isoformat()
         })
+        if use_demo:
+            response.headers['X-Snapshot-Version'] = str(snapshot.version)
+        return response
 
     except Exception as e:
         logger.error(f"Error generating dashboard: {e}")
@@ -2694,4 +2419,6 @@ def serve_react(path):
 
 
 if __name__ == '__main__':
+    if os.getenv('FEED_REFRESH_ENABLED', 'true').lower() == 'true':
+        start_feed_refresh()
     app.run(host='0.0.0.0', port=5001, debug=True, threaded=True)
@@ -213,15 +213,9 @@ def get_value_bets():
             raw_data = odds_client.get_epl_odds()
             all_matches = odds_client.parse_odds_data(raw_data)
         
-        # 모든 경기 분석
-        all_value_bets = []
-        
-        for match in all_matches:
-            analysis = odds_aggregator.analyze_match_odds(match)
-            analysis['bookmakers_raw'] = match['bookmakers']
-            
-            value_bets = detector.detect_value_bets(analysis)
-            all_value_bets.extend(value_bets)
+        # 모든 경기를 한 번에 스캔
+        scan = odds_aggregator.scan_markets(all_matches)
+        all_value_bets = detector.detect_in_scan(scan)
         
         # 요약 통계
         summary = detector.summarize_value_bets(all_value_bets)
@@ -273,14 +267,9 @@ def get_arbitrage_opportunities():
             raw_data = odds_client.get_epl_odds()
             all_matches = odds_client.parse_odds_data(raw_data)
         
-        # 모든 경기 분석
-        analyzed_matches = []
-        for match in all_matches:
-            analysis = odds_aggregator.analyze_match_odds(match)
-            analyzed_matches.append(analysis)
-        
-        # 아비트라지 탐색
-        opportunities = finder.find_arbitrage_opportunities(analyzed_matches)
+        # 모든 경기를 한 번에 스캔 후 아비트라지 탐색
+        scan = odds_aggregator.scan_markets(all_matches)
+        opportunities = finder.find_in_scan(scan)
         
         return jsonify({
             'success': True,
@@ -447,23 +436,18 @@ def get_dashboard_data():
             raw_data = odds_client.get_epl_odds()
             all_matches = odds_client.parse_odds_data(raw_data)
         
-        # 2. 모든 경기 분석
-        analyzed_matches = []
-        for match in all_matches:
-            analysis = odds_aggregator.analyze_match_odds(match)
+        # 2. 모든 경기 분석 (배당률 텐서 한 번으로 스캔)
+        scan = odds_aggregator.scan_markets(all_matches)
+        analyzed_matches = odds_aggregator.analyze_scan(scan)
+        for match, analysis in zip(scan.tensor.matches, analyzed_matches):
             analysis['bookmakers_raw'] = match['bookmakers']
-            analyzed_matches.append(analysis)
         
         # 3. Value Bets 탐지
-        all_value_bets = []
-        for analysis in analyzed_matches:
-            value_bets = value_detector.detect_value_bets(analysis)
-            all_value_bets.extend(value_bets)
-        
+        all_value_bets = value_detector.detect_in_scan(scan)
         value_summary = value_detector.summarize_value_bets(all_value_bets)
         
         # 4. Arbitrage 탐색
-        arb_opportunities = arbitrage_finder.find_arbitrage_opportunities(analyzed_matches)
+        arb_opportunities = arbitrage_finder.find_in_scan(scan)
         
         return jsonify({
             'success': True,
@@ -13,6 +13,7 @@ from api.v1.router import api_router
 from api.middleware.logging_middleware import LoggingMiddleware
 from config.settings import get_settings
 from shared.exceptions.base import AppException
+from services.simulation_stream import StreamLimits, get_stream_manager, reset_stream_manager
 
 # Logging
 logger = logging.getLogger(__name__)
@@ -104,13 +105,20 @@ def register_event_handlers(app: FastAPI):
         logger.info("🚀 EPL Match Predictor API starting...")
         logger.info(f"Environment: {settings.environment}")
         logger.info(f"Debug mode: {settings.api.debug}")
+        get_stream_manager(StreamLimits(
+            max_concurrent=settings.api.stream_max_concurrent,
+            channel_size=settings.api.stream_channel_size,
+            heartbeat_seconds=settings.api.stream_heartbeat_seconds,
+            max_duration_seconds=settings.api.stream_max_duration_seconds
+        ))
         logger.info("✅ Application started successfully")
 
     @app.on_event("shutdown")
     async def shutdown_event():
         """애플리케이션 종료 시"""
         logger.info("🛑 EPL Match Predictor API shutting down...")
-        # 리소스 정리
+        # 리소스 정리 (진행 중인 시뮬레이션 스트림 취소)
+        reset_stream_manager()
         logger.info("✅ Application shut down successfully")
 
 
@@ -4,35 +4,28 @@ Database Dependencies
 """
 from typing import Generator
 from sqlalchemy.orm import Session
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 from config.settings import get_settings
+from database.engine_registry import get_engine, get_sessionmaker, session_scope
 
 # Settings
 settings = get_settings()
 
-# Engine
-engine = create_engine(
+# Engine (database.engine_registry에서 URL별로 공유)
+engine = get_engine(
     settings.database.url,
     pool_size=settings.database.pool_size,
     max_overflow=settings.database.max_overflow,
-    pool_pre_ping=True
+    pool_recycle=settings.database.pool_recycle,
+    echo=settings.database.echo
 )
 
-# Session Factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Session Factory (기존 sessionmaker(autocommit=False, autoflush=False) 동작 유지)
+SESSION_OPTIONS = {'autoflush': False, 'expire_on_commit': True}
+SessionLocal = get_sessionmaker(settings.database.url, **SESSION_OPTIONS)
 
 
 def get_db() -> Generator[Session, None, None]:
     """데이터베이스 세션 의존성"""
-    session = SessionLocal()
-
-    try:
+    with session_scope(settings.database.url, **SESSION_OPTIONS) as session:
         yield session
-        session.commit()
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
@@ -0,0 +1,51 @@
+"""
+Simulation API Endpoints
+시뮬레이션 스트리밍 API (SSE)
+"""
+from fastapi import APIRouter, Body, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from api.v1.schemas.simulation import SimulationStreamRequest
+from services.simulation_stream import get_stream_manager
+
+router = APIRouter()
+
+
+@router.post(
+    "/enriched/stream",
+    summary="Enriched V2 시뮬레이션 스트리밍",
+    description="V2 Pipeline 진행 이벤트를 SSE로 전송합니다. 연결이 끊기면 시뮬레이션도 중단됩니다.",
+    responses={
+        200: {"description": "text/event-stream", "content": {"text/event-stream": {}}},
+        429: {"description": "동시 시뮬레이션 한도 초과"}
+    }
+)
+async def stream_enriched_simulation(
+    request: Request,
+    body: SimulationStreamRequest = Body(..., description="시뮬레이션 요청")
+) -> StreamingResponse:
+    """Enriched V2 시뮬레이션 스트리밍"""
+    manager = get_stream_manager()
+    if not manager.has_capacity():
+        raise HTTPException(status_code=429, detail="Too many concurrent simulations")
+
+    def work(emit, cancel_token):
+        # 서비스 생성(AI client 초기화 포함)도 워커 스레드에서
+        from services.enriched_simulation_service import get_enriched_simulation_service
+
+        get_enriched_simulation_service().run_v2_pipeline(
+            body.home_team,
+            body.away_team,
+            body.match_context,
+            emit,
+            cancel_token
+        )
+
+    return StreamingResponse(
+        manager.stream(work, is_disconnected=request.is_disconnected),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
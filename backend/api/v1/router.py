@@ -4,7 +4,7 @@ API v1 Router
 """
 from fastapi import APIRouter
 
-from api.v1.endpoints import players, ratings
+from api.v1.endpoints import players, ratings, simulation
 
 api_router = APIRouter()
 
@@ -20,3 +20,9 @@ api_router.include_router(
     prefix="/ratings",
     tags=["Ratings"]
 )
+
+api_router.include_router(
+    simulation.router,
+    prefix="/simulation",
+    tags=["Simulation"]
+)
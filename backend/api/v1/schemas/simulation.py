@@ -0,0 +1,22 @@
+"""
+Simulation API Schemas
+시뮬레이션 관련 요청 스키마
+"""
+from pydantic import BaseModel, Field
+from typing import Any, Dict, Optional
+
+
+class SimulationStreamRequest(BaseModel):
+    """Enriched 시뮬레이션 스트리밍 요청"""
+    home_team: str = Field(..., min_length=1, description="홈팀 이름")
+    away_team: str = Field(..., min_length=1, description="원정팀 이름")
+    match_context: Optional[Dict[str, Any]] = Field(None, description="경기 컨텍스트 (venue, importance 등)")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "home_team": "Arsenal",
+                "away_team": "Liverpool",
+                "match_context": {"venue": "Emirates Stadium", "importance": "top_clash"}
+            }
+        }
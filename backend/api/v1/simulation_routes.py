@@ -6,17 +6,81 @@ AI Match Simulation v3.0
 from flask import Blueprint, request, jsonify, g, Response, stream_with_context
 import logging
 
-from services.simulation_service import get_simulation_service
 from services.enriched_simulation_service import get_enriched_simulation_service
+from services.simulation_jobs import SUCCEEDED, get_job_store, job_fingerprint
 from middleware.auth_middleware import require_auth, require_tier
 from middleware.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
 simulation_bp = Blueprint('simulation', __name__, url_prefix='/api/v1/simulation')
-simulation_service = get_simulation_service()
 rate_limiter = get_rate_limiter()
 
+# /simulate?wait=true waits at most this long for its job before answering 202
+# (short, so even opted-in clients cannot hold web workers for a whole simulation)
+SIMULATE_MAX_WAIT_SECONDS = 5
+
+SSE_HEADERS = {
+    'Cache-Control': 'no-cache',
+    'X-Accel-Buffering': 'no',
+    'Connection': 'keep-alive',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization, Last-Event-ID',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS'
+}
+
+
+def _submit_job(kind, payload, dedup_inputs=None, user_id=None):
+    """
+    Queue a simulation job (or join the identical in-flight one)
+
+    Args:
+        kind: Runner kind (services.simulation_job_runners.DEFAULT_RUNNERS)
+        payload: Runner payload
+        dedup_inputs: Inputs that identify the fixture request (default: payload)
+        user_id: Requesting user, attached to the job so they can read/cancel it
+    """
+    store = get_job_store()
+    fingerprint = job_fingerprint(kind, dedup_inputs if dedup_inputs is not None else payload)
+    job, created = store.submit(kind, payload, fingerprint, user_id=user_id)
+    if not created:
+        logger.info(f"Joined in-flight simulation job {job.id} ({kind})")
+    return job
+
+
+def _attached_job(job_id):
+    """Job if the current user is attached to it, else None (unknown and foreign jobs look the same)"""
+    store = get_job_store()
+    if not store.is_attached(job_id, g.user_id):
+        return None
+    return store.get(job_id)
+
+
+def _job_event_stream(job, after_seq=0):
+    """SSE response tailing a job's event log"""
+    store = get_job_store()
+    return Response(
+        stream_with_context(store.follow(job.id, after_seq=after_seq)),
+        mimetype='text/event-stream',
+        headers={**SSE_HEADERS, 'X-Job-Id': job.id}
+    )
+
+
+def _last_event_id():
+    try:
+        return int(request.headers.get('Last-Event-ID') or request.args.get('after', 0))
+    except ValueError:
+        return 0
+
+
+def _job_accepted(job):
+    return jsonify({
+        'success': True,
+        'job': job.to_dict(include_result=False),
+        'status_url': f"{simulation_bp.url_prefix}/jobs/{job.id}",
+        'events_url': f"{simulation_bp.url_prefix}/jobs/{job.id}/events"
+    }), 202
+
 
 @simulation_bp.route('/simulate', methods=['POST'])
 @require_auth
@@ -56,21 +120,32 @@ def simulate_match():
                 if not (0 <= value <= 1):
                     return jsonify({'error': f'{key} weight must be between 0 and 1'}), 400
 
-        # Run simulation (with optional weights)
-        success, result, error = simulation_service.simulate_match(
-            home_team=home_team,
-            away_team=away_team,
-            user_id=g.user_id,
-            tier=g.user_tier,
-            weights=weights
+        # Run simulation (with optional weights) on a job worker
+        job = _submit_job(
+            'ai_simulation',
+            {
+                'home_team': home_team,
+                'away_team': away_team,
+                'user_id': g.user_id,
+                'tier': g.user_tier,
+                'weights': weights
+            },
+            dedup_inputs={'home_team': home_team, 'away_team': away_team, 'tier': g.user_tier, 'weights': weights},
+            user_id=g.user_id
         )
 
-        if not success:
-            return jsonify({'error': 'Simulation failed', 'message': error}), 500
+        # 202 with the job right away; ?wait=true briefly waits for a fast (e.g. cached) result
+        if request.args.get('wait', 'false').lower() == 'true':
+            job = get_job_store().wait(job.id, timeout=SIMULATE_MAX_WAIT_SECONDS)
+        if not job.terminal:
+            return _job_accepted(job)
+
+        if job.status != SUCCEEDED:
+            return jsonify({'error': 'Simulation failed', 'message': job.error}), 500
 
         return jsonify({
             'success': True,
-            'result': result,
+            'result': job.result,
             'tier': g.user_tier
         }), 200
 
@@ -234,10 +309,6 @@ def simulate_match_v3_stream():
     - completed: Simulation completed with final result
     - error: Error occurred
     """
-    from utils.simulation_events import SimulationEvent
-    import json
-    import time
-
     # Optional authentication
     user_id = None
     user_tier = 'BASIC'
@@ -285,190 +356,111 @@ def simulate_match_v3_stream():
     except Exception as e:
         return jsonify({'error': 'Invalid request format', 'message': str(e)}), 400
 
-    def generate():
-        """Generator function for SSE streaming"""
-        try:
-            from services.enriched_data_loader import EnrichedDomainDataLoader
-            from simulation.v3.pipeline import SimulationPipelineV3, PipelineConfig
-
-            start_time = time.time()
-
-            user_info = f"user: {user_id}, tier: {user_tier}" if user_id else "unauthenticated"
-            logger.info(f"SSE streaming simulation (V3 Pipeline): {home_team} vs {away_team} ({user_info})")
-
-            # Send started event
-            yield SimulationEvent.info(
-                f"V3 Pipeline started: {home_team} vs {away_team}",
-                "started"
-            ).to_sse_format()
-
-            # Phase 0: Load team data
-            yield SimulationEvent.info("Loading team data...", "loading_teams").to_sse_format()
-
-            loader = EnrichedDomainDataLoader()
-            home_data = loader.load_team_data(home_team)
-            away_data = loader.load_team_data(away_team)
-
-            yield SimulationEvent.info(
-                f"Teams loaded: {home_team} (Attack: {home_data.derived_strengths.attack_strength:.1f}), "
-                f"{away_team} (Attack: {away_data.derived_strengths.attack_strength:.1f})",
-                "teams_loaded"
-            ).to_sse_format()
-
-            # Create pipeline config
-            config = PipelineConfig(
-                validation_runs=3000,  # Production setting
-                log_level="INFO"
-            )
-
-            pipeline = SimulationPipelineV3(config=config)
-
-            # ========================================
-            # Phase 1: Mathematical Models (Ensemble)
-            # ========================================
-            yield SimulationEvent.info(
-                "Phase 1/4: Running Mathematical Models (Poisson, Zone, Player)...",
-                "phase1_started"
-            ).to_sse_format()
-
-            ensemble_result = pipeline._run_phase1_ensemble(home_data, away_data)
-
-            yield SimulationEvent.info(
-                f"Phase 1 Complete: Ensemble probabilities calculated",
-                "phase1_complete",
-                {
-                    "probabilities": ensemble_result.ensemble_probabilities,
-                    "home_win": ensemble_result.ensemble_probabilities['home_win'],
-                    "draw": ensemble_result.ensemble_probabilities['draw'],
-                    "away_win": ensemble_result.ensemble_probabilities['away_win']
-                }
-            ).to_sse_format()
-
-            # ========================================
-            # Phase 2: AI Scenario Generation
-            # ========================================
-            yield SimulationEvent.info(
-                "Phase 2/4: Generating AI scenarios (NO Templates)...",
-                "phase2_started"
-            ).to_sse_format()
-
-            generated_scenarios = pipeline._run_phase2_scenarios(home_data, away_data, ensemble_result)
-
-            yield SimulationEvent.info(
-                f"Phase 2 Complete: {generated_scenarios.scenario_count} scenarios generated",
-                "phase2_complete",
-                {
-                    "scenario_count": generated_scenarios.scenario_count,
-                    "scenarios": [
-                        {
-                            "id": sc.id,
-                            "name": sc.name,
-                            "probability": sc.expected_probability
-                        }
-                        for sc in generated_scenarios.scenarios
-                    ]
-                }
-            ).to_sse_format()
-
-            # ========================================
-            # Phase 3: Monte Carlo Validation
-            # ========================================
-            yield SimulationEvent.info(
-                f"Phase 3/4: Running {generated_scenarios.scenario_count * config.validation_runs:,} simulations...",
-                "phase3_started",
-                {
-                    "total_runs": generated_scenarios.scenario_count * config.validation_runs,
-                    "runs_per_scenario": config.validation_runs
-                }
-            ).to_sse_format()
-
-            validation_result = pipeline._run_phase3_validation(
-                generated_scenarios.scenarios,
-                home_data,
-                away_data,
-                ensemble_result
-            )
-
-            yield SimulationEvent.info(
-                f"Phase 3 Complete: {validation_result.total_runs:,} simulations completed",
-                "phase3_complete",
-                {
-                    "total_runs": validation_result.total_runs,
-                    "convergence": validation_result.final_probabilities
-                }
-            ).to_sse_format()
-
-            # Prepare final result
-            execution_time = time.time() - start_time
-
-            final_result = {
-                "match": {
-                    "home_team": home_team,
-                    "away_team": away_team
-                },
-                "probabilities": {
-                    "home_win": validation_result.final_probabilities['home_win'],
-                    "draw": validation_result.final_probabilities['draw'],
-                    "away_win": validation_result.final_probabilities['away_win']
-                },
-                "scenarios": [
-                    {
-                        "id": sc.id,
-                        "name": sc.name,
-                        "expected_probability": sc.expected_probability,
-                        "events_count": len(sc.events)
-                    }
-                    for sc in generated_scenarios.scenarios
-                ],
-                "validation": {
-                    "total_scenarios": validation_result.total_scenarios,
-                    "total_runs": validation_result.total_runs,
-                    "scenario_results": [
-                        {
-                            "scenario_id": sr.scenario_id,
-                            "scenario_name": sr.scenario_name,
-                            "convergence_probability": sr.convergence_probability,
-                            "avg_score": sr.avg_score
-                        }
-                        for sr in validation_result.scenario_results
-                    ]
-                },
-                "execution_time": execution_time,
-                "pipeline": "v3",
-                "timestamp": time.time()
-            }
+    # Runs on a job worker; identical in-flight requests share one job
+    try:
+        job = _submit_job('v3', {'home_team': home_team, 'away_team': away_team, 'validation_runs': 3000},
+                          user_id=user_id)
+    except Exception as e:
+        logger.error(f"V3 job submission error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
 
-            # Send completed event
-            yield SimulationEvent.success(
-                f"V3 Pipeline completed in {execution_time:.1f}s",
-                "completed",
-                final_result
-            ).to_sse_format()
+    user_info = f"user: {user_id}, tier: {user_tier}" if user_id else "unauthenticated"
+    logger.info(f"SSE streaming simulation (V3 Pipeline): {home_team} vs {away_team} ({user_info}, job {job.id})")
 
-            logger.info(f"SSE stream completed (V3 Pipeline): {home_team} vs {away_team} ({execution_time:.1f}s)")
+    return _job_event_stream(job, after_seq=_last_event_id())
 
-        except Exception as e:
-            logger.error(f"V3 Pipeline error: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            error_event = SimulationEvent.error(f'V3 Pipeline error: {str(e)}', 'pipeline_error')
-            yield error_event.to_sse_format()
 
-    return Response(
-        stream_with_context(generate()),
-        mimetype='text/event-stream',
-        headers={
-            'Cache-Control': 'no-cache',
-            'X-Accel-Buffering': 'no',
-            'Connection': 'keep-alive',
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Content-Type, Authorization',
-            'Access-Control-Allow-Methods': 'POST, OPTIONS'
-        }
-    )
+@simulation_bp.route('/jobs', methods=['POST'])
+@require_auth
+def submit_simulation_job():
+    """
+    Queue a pipeline simulation job
+
+    Request Body:
+    {
+        "kind": "v3" | "v2_enriched",
+        "home_team": "Arsenal",
+        "away_team": "Liverpool",
+        "match_context": {...}       # v2_enriched only (optional)
+    }
+
+    Response (202): job record + status/events URLs
+    """
+    allowed = rate_limiter.check_limit(g.user_id, g.user_tier, 'simulation')
+    if not allowed['allowed']:
+        return jsonify({'error': 'Rate limit exceeded', 'reset_at': allowed['reset_at']}), 429
+
+    data = request.get_json(silent=True) or {}
+    kind = data.get('kind', 'v3')
+    home_team = data.get('home_team')
+    away_team = data.get('away_team')
+
+    if kind not in ('v3', 'v2_enriched'):
+        return jsonify({'error': f'Unknown job kind: {kind}'}), 400
+    if not home_team or not away_team:
+        return jsonify({'error': 'Missing home_team or away_team'}), 400
+    if home_team == away_team:
+        return jsonify({'error': 'home_team and away_team cannot be the same'}), 400
+
+    payload = {'home_team': home_team, 'away_team': away_team}
+    if kind == 'v2_enriched':
+        payload['match_context'] = data.get('match_context')
+    else:
+        payload['validation_runs'] = 3000
+
+    try:
+        job = _submit_job(kind, payload, user_id=g.user_id)
+    except Exception as e:
+        logger.error(f"Job submission error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+    return _job_accepted(job)
+
+
+@simulation_bp.route('/jobs/<job_id>', methods=['GET'])
+@require_auth
+def get_simulation_job(job_id):
+    """Job status (and result once succeeded)"""
+    job = _attached_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job.to_dict()}), 200
+
+
+@simulation_bp.route('/jobs/<job_id>/events', methods=['GET'])
+@require_auth
+def stream_simulation_job(job_id):
+    """
+    Job progress as Server-Sent Events
+
+    Replays the event log from the start (or after Last-Event-ID / ?after=N)
+    and follows it until the job finishes.
+    """
+    job = _attached_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return _job_event_stream(job, after_seq=_last_event_id())
+
+
+@simulation_bp.route('/jobs/<job_id>', methods=['DELETE'])
+@require_auth
+def cancel_simulation_job(job_id):
+    """
+    Leave a job; the job is cancelled once no other user is attached to it
+
+    Response: job record + "cancelled" (false when other users still wait on it)
+    """
+    job, cancelled = get_job_store().release(job_id, g.user_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'cancelled': cancelled, 'job': job.to_dict(include_result=False)}), 200
 
 
 def register_simulation_routes(app):
     """Register simulation routes with Flask app."""
+    from services.simulation_job_worker import start_embedded_workers
+
     app.register_blueprint(simulation_bp)
+    pool = start_embedded_workers()
+    if pool is not None:
+        logger.info(f"Simulation job workers started ({pool.num_workers})")
     logger.info("Simulation routes registered")
@@ -5,12 +5,20 @@ Hawkes Process Parameter Calibration
 Method: Maximum Likelihood Estimation (MLE)
 - Negative log-likelihood를 최소화
 - scipy.optimize.minimize 사용
+
+HawkesDataset / HawkesCalibrator:
+- 전체 경기를 한 번만 padded NumPy 배열로 전처리
+- 지수 커널 재귀식으로 intensity 합을 O(n)에 계산, 해석적 gradient 제공
+- 공통 / home·away / 팀별 parameter set, 병렬 bootstrap refit
+- 초 단위 득점 시각 지원 (time_scale=60)
 """
 
 import sys
 import os
 import numpy as np
-from typing import List, Tuple, Dict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple, Dict
 from scipy.optimize import minimize
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -31,7 +39,8 @@ class MatchData:
         away_team: str,
         home_goals: int,
         away_goals: int,
-        goal_times: List[Tuple[int, str]]  # [(minute, 'home'/'away'), ...]
+        goal_times: List[Tuple[int, str]],  # [(minute, 'home'/'away'), ...]
+        duration: Optional[float] = None     # 실제 경기 시간 (추가시간 포함, goal_times와 같은 단위)
     ):
         self.match_id = match_id
         self.home_team = home_team
@@ -39,6 +48,7 @@ class MatchData:
         self.home_goals = home_goals
         self.away_goals = away_goals
         self.goal_times = sorted(goal_times)  # Sort by time
+        self.duration = duration
 
 
 # ==========================================================================
@@ -129,6 +139,330 @@ def negative_log_likelihood(params: np.ndarray, matches: List[MatchData]) -> flo
     return total_nll
 
 
+# ==========================================================================
+# Vectorized Calibration Engine
+# ==========================================================================
+
+# (low, high) bounds for (μ, α, β), per minute
+DEFAULT_BOUNDS = ((0.01, 0.1), (0.01, 0.5), (0.1, 1.0))
+
+PARAM_SETS = ('shared', 'home_away', 'team')
+
+
+@dataclass
+class HawkesDataset:
+    """
+    전처리된 득점 시퀀스 (경기당 home, away 2행, 시간은 분 단위)
+
+    경기 수 × 팀당 최대 득점 수 크기의 padded 배열이라 optimizer가
+    likelihood를 평가할 때마다 Python 객체를 다시 만들지 않는다.
+    """
+    times: np.ndarray        # (S, K) 득점 시각 (패딩 0)
+    mask: np.ndarray         # (S, K) 실제 득점 여부
+    gaps: np.ndarray         # (S, K) 직전 득점과의 간격 (첫 득점 0)
+    ties: np.ndarray         # (S, K) 같은 시각에 앞서 기록된 득점 수
+    tails: np.ndarray        # (S, K) 경기 종료까지 남은 시간 (패딩 0)
+    durations: np.ndarray    # (S,) 경기 시간
+    is_home: np.ndarray      # (S,) home 시퀀스 여부
+    teams: np.ndarray        # (S,) 득점 팀 index
+    team_names: List[str]
+
+    @classmethod
+    def from_matches(
+        cls,
+        matches: Sequence[MatchData],
+        total_time: Optional[float] = None,
+        time_scale: float = 1.0
+    ) -> 'HawkesDataset':
+        """
+        경기 리스트 → padded 배열
+
+        Args:
+            matches: 경기 데이터 리스트
+            total_time: MatchData.duration이 없을 때의 경기 시간 (입력 단위, 기본 90분)
+            time_scale: 1분당 입력 시간 단위 수 (분 단위 1, 초 단위 60)
+
+        Returns:
+            HawkesDataset (parameter는 분 단위로 추정됨)
+        """
+        if total_time is None:
+            total_time = 90.0 * time_scale
+
+        team_names = sorted({m.home_team for m in matches} | {m.away_team for m in matches})
+        team_index = {name: i for i, name in enumerate(team_names)}
+
+        sequences, durations, teams = [], [], []
+        for match in matches:
+            duration = (match.duration if match.duration is not None else total_time) / time_scale
+            for side, team in (('home', match.home_team), ('away', match.away_team)):
+                sequences.append([min(t / time_scale, duration) for t, scorer in match.goal_times if scorer == side])
+                durations.append(duration)
+                teams.append(team_index[team])
+
+        n_rows = len(sequences)
+        width = max([len(seq) for seq in sequences] + [1])
+        times = np.zeros((n_rows, width))
+        mask = np.zeros((n_rows, width), dtype=bool)
+        ties = np.zeros((n_rows, width))
+        for row, seq in enumerate(sequences):
+            times[row, :len(seq)] = seq
+            mask[row, :len(seq)] = True
+            for k in range(1, len(seq)):
+                if seq[k] == seq[k - 1]:
+                    ties[row, k] = ties[row, k - 1] + 1
+
+        durations = np.array(durations, dtype=float)
+        gaps = np.where(mask, np.diff(times, axis=1, prepend=0.0), 0.0)
+        gaps[:, 0] = 0.0
+
+        return cls(
+            times=times,
+            mask=mask,
+            gaps=gaps,
+            ties=ties,
+            tails=np.where(mask, durations[:, None] - times, 0.0),
+            durations=durations,
+            is_home=np.tile([True, False], len(matches)),
+            teams=np.array(teams, dtype=int),
+            team_names=team_names
+        )
+
+    @property
+    def n_matches(self) -> int:
+        return len(self.durations) // 2
+
+    def subset(self, match_indices: np.ndarray) -> 'HawkesDataset':
+        """경기 index로 행 선택 (중복 허용, bootstrap resample용)"""
+        rows = (2 * np.asarray(match_indices)[:, None] + np.array([0, 1])).ravel()
+        return HawkesDataset(
+            times=self.times[rows],
+            mask=self.mask[rows],
+            gaps=self.gaps[rows],
+            ties=self.ties[rows],
+            tails=self.tails[rows],
+            durations=self.durations[rows],
+            is_home=self.is_home[rows],
+            teams=self.teams[rows],
+            team_names=self.team_names
+        )
+
+    def groups(self, param_sets: str) -> Tuple[np.ndarray, List[str]]:
+        """
+        행별 parameter set index
+
+        Args:
+            param_sets: 'shared' (공통) / 'home_away' / 'team' (득점 팀별)
+
+        Returns:
+            Tuple of (group index per row, group names)
+        """
+        if param_sets == 'shared':
+            return np.zeros(len(self.durations), dtype=int), ['all']
+        if param_sets == 'home_away':
+            return np.where(self.is_home, 0, 1), ['home', 'away']
+        if param_sets == 'team':
+            return self.teams, list(self.team_names)
+        raise ValueError(f"Unknown param_sets: {param_sets} (expected one of {PARAM_SETS})")
+
+
+def hawkes_nll_and_grad(
+    params: np.ndarray,
+    data: HawkesDataset,
+    groups: np.ndarray,
+    n_groups: int
+) -> Tuple[float, np.ndarray]:
+    """
+    Negative log-likelihood와 해석적 gradient (전체 시퀀스 벡터화)
+
+    A_i = Σ_{tj<ti} e^(-β(ti-tj)) 를 재귀식
+        R_i = e^(-βΔ_i)·R_{i-1} + 1,  A_i = e^(-βΔ_i)·R_{i-1} - (동시각 앞선 득점 수)
+    로 계산하므로 시퀀스 길이에 선형이다. dA_i/dβ = -B_i,
+    B_i = Σ (ti-tj)·e^(-β(ti-tj)) 도 같은 방식으로 누적한다.
+    득점이 없는 시퀀스도 compensator(-μT) 항으로 likelihood에 포함된다.
+
+    Args:
+        params: (n_groups * 3,) [μ, α, β] 반복
+        data: 전처리된 데이터
+        groups: 행별 parameter set index
+        n_groups: parameter set 수
+
+    Returns:
+        Tuple of (NLL, gradient)
+    """
+    theta = np.asarray(params, dtype=float).reshape(n_groups, 3)
+    mu, alpha, beta = theta[groups].T
+
+    n_rows, width = data.times.shape
+    excitation = np.zeros((n_rows, width))          # A
+    weighted = np.zeros((n_rows, width))            # B
+    running = data.mask[:, 0].astype(float)         # R (첫 득점 포함)
+    running_weighted = np.zeros(n_rows)             # B_{i-1}
+    for k in range(1, width):
+        gap = data.gaps[:, k]
+        decay = np.exp(-beta * gap)
+        running_weighted = decay * (running_weighted + gap * running)
+        decayed = decay * running
+        excitation[:, k] = np.maximum(decayed - data.ties[:, k], 0.0)
+        weighted[:, k] = running_weighted
+        running = decayed + 1.0
+
+    intensity = np.where(data.mask, mu[:, None] + alpha[:, None] * excitation, 1.0)
+    inverse = np.where(data.mask, 1.0 / intensity, 0.0)
+
+    # ∫ λ(t) dt = μT + (α/β) Σ (1 - e^(-β(T-ti)))  (패딩은 tail 0 → 항 0)
+    tail_decay = np.exp(-beta[:, None] * data.tails)
+    settled = (1.0 - tail_decay).sum(axis=1)
+    tail_weighted = (data.tails * tail_decay).sum(axis=1)
+
+    log_likelihood = np.log(intensity).sum(axis=1) - mu * data.durations - alpha / beta * settled
+
+    d_mu = inverse.sum(axis=1) - data.durations
+    d_alpha = (excitation * inverse).sum(axis=1) - settled / beta
+    d_beta = (-alpha * (weighted * inverse).sum(axis=1)
+              + alpha / beta ** 2 * settled
+              - alpha / beta * tail_weighted)
+
+    gradient = np.stack([
+        np.bincount(groups, weights=d, minlength=n_groups) for d in (d_mu, d_alpha, d_beta)
+    ], axis=1)
+
+    return -log_likelihood.sum(), -gradient.ravel()
+
+
+@dataclass
+class HawkesFit:
+    """Calibration 결과 (parameter는 분 단위)"""
+    params: np.ndarray          # (n_groups, 3) [μ, α, β]
+    group_names: List[str]
+    nll: float
+    success: bool
+    n_matches: int
+    n_iterations: int
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {'mu': float(mu), 'alpha': float(alpha), 'beta': float(beta)}
+            for name, (mu, alpha, beta) in zip(self.group_names, self.params)
+        }
+
+
+@dataclass
+class HawkesBootstrap:
+    """Bootstrap refit 결과"""
+    fit: HawkesFit
+    samples: np.ndarray         # (n_resamples, n_groups, 3)
+
+    def std_error(self) -> np.ndarray:
+        return self.samples.std(axis=0, ddof=1)
+
+    def interval(self, level: float = 0.95) -> Tuple[np.ndarray, np.ndarray]:
+        """Percentile 신뢰구간 (lower, upper), 각각 (n_groups, 3)"""
+        tail = (1.0 - level) / 2 * 100
+        return (np.percentile(self.samples, tail, axis=0),
+                np.percentile(self.samples, 100 - tail, axis=0))
+
+
+class HawkesCalibrator:
+    """
+    L-BFGS-B + 해석적 gradient 기반 Hawkes MLE
+
+    Usage:
+        data = HawkesDataset.from_matches(matches, time_scale=60)  # 초 단위
+        calibrator = HawkesCalibrator(param_sets='home_away')
+        fit = calibrator.fit(data)
+        boot = calibrator.bootstrap(data, n_resamples=200, seed=42)
+    """
+
+    def __init__(
+        self,
+        param_sets: str = 'shared',
+        initial_guess: Tuple[float, float, float] = (0.03, 0.1, 0.3),
+        bounds: Sequence[Tuple[float, float]] = DEFAULT_BOUNDS
+    ):
+        """
+        Args:
+            param_sets: 'shared' / 'home_away' / 'team'
+            initial_guess: 초기값 (μ, α, β), 모든 parameter set에 공통
+            bounds: (μ, α, β) 범위
+        """
+        if param_sets not in PARAM_SETS:
+            raise ValueError(f"Unknown param_sets: {param_sets} (expected one of {PARAM_SETS})")
+        self.param_sets = param_sets
+        self.initial_guess = tuple(initial_guess)
+        self.bounds = tuple(tuple(b) for b in bounds)
+
+    def fit(self, data: HawkesDataset, x0: Optional[np.ndarray] = None) -> HawkesFit:
+        """
+        MLE
+
+        Args:
+            data: 전처리된 데이터
+            x0: 초기 parameter (n_groups, 3), 없으면 initial_guess
+        """
+        groups, names = data.groups(self.param_sets)
+        n_groups = len(names)
+        if x0 is None:
+            x0 = np.tile(self.initial_guess, (n_groups, 1))
+
+        result = minimize(
+            hawkes_nll_and_grad,
+            x0=np.asarray(x0, dtype=float).ravel(),
+            args=(data, groups, n_groups),
+            jac=True,
+            method='L-BFGS-B',
+            bounds=list(self.bounds) * n_groups
+        )
+
+        return HawkesFit(
+            params=result.x.reshape(n_groups, 3),
+            group_names=names,
+            nll=float(result.fun),
+            success=bool(result.success),
+            n_matches=data.n_matches,
+            n_iterations=int(result.nit)
+        )
+
+    def bootstrap(
+        self,
+        data: HawkesDataset,
+        n_resamples: int = 200,
+        seed: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> HawkesBootstrap:
+        """
+        경기 단위 resample refit (프로세스 병렬)
+
+        resample마다 독립 SeedSequence를 쓰므로 같은 seed면 워커 수와
+        무관하게 결과가 같다. 각 refit은 전체 fit 값에서 시작한다.
+
+        Args:
+            data: 전처리된 데이터
+            n_resamples: resample 수
+            seed: master seed
+            max_workers: 프로세스 수 (None = os.cpu_count(), 1 = 현재 프로세스)
+        """
+        fit = self.fit(data)
+        seeds = np.random.SeedSequence(seed).spawn(n_resamples)
+        tasks = [(self, data, s, fit.params) for s in seeds]
+
+        workers = max_workers or os.cpu_count() or 1
+        if workers == 1:
+            samples = [_bootstrap_refit(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                samples = list(pool.map(_bootstrap_refit, tasks, chunksize=max(1, n_resamples // (4 * workers))))
+
+        return HawkesBootstrap(fit=fit, samples=np.stack(samples))
+
+
+def _bootstrap_refit(task) -> np.ndarray:
+    """Bootstrap resample 하나 refit (프로세스 풀 작업)"""
+    calibrator, data, seed_sequence, x0 = task
+    rng = np.random.default_rng(seed_sequence)
+    indices = rng.integers(0, data.n_matches, size=data.n_matches)
+    return calibrator.fit(data.subset(indices), x0=x0).params
+
+
 # ==========================================================================
 # Calibration Functions
 # ==========================================================================
@@ -159,32 +493,26 @@ def calibrate_hawkes_parameters(
     print(f"  Initial guess: μ={initial_guess[0]:.4f}, α={initial_guess[1]:.4f}, β={initial_guess[2]:.4f}")
 
     # Bounds: μ ∈ (0.01, 0.1), α ∈ (0.01, 0.5), β ∈ (0.1, 1.0)
-    bounds = [(0.01, 0.1), (0.01, 0.5), (0.1, 1.0)]
-
-    # Optimize
-    result = minimize(
-        negative_log_likelihood,
-        x0=initial_guess,
-        args=(matches,),
-        method='L-BFGS-B',
-        bounds=bounds
-    )
+    calibrator = HawkesCalibrator(initial_guess=initial_guess, bounds=DEFAULT_BOUNDS)
+
+    # Optimize (analytic gradient)
+    result = calibrator.fit(HawkesDataset.from_matches(matches))
 
-    mu_opt, alpha_opt, beta_opt = result.x
+    mu_opt, alpha_opt, beta_opt = result.params[0]
 
     print(f"\n✅ Calibration {'successful' if result.success else 'FAILED'}!")
     print(f"  Optimized parameters:")
     print(f"    μ (baseline):   {mu_opt:.4f} → {mu_opt * 90:.2f} goals/90min")
     print(f"    α (excitement): {alpha_opt:.4f}")
     print(f"    β (decay):      {beta_opt:.4f} → half-life {np.log(2)/beta_opt:.2f} min")
-    print(f"  Negative log-likelihood: {result.fun:.2f}")
+    print(f"  Negative log-likelihood: {result.nll:.2f}")
 
     return {
         'mu': mu_opt,
         'alpha': alpha_opt,
         'beta': beta_opt,
         'success': result.success,
-        'nll': result.fun,
+        'nll': result.nll,
         'n_matches': len(matches),
         'half_life_minutes': np.log(2) / beta_opt
     }
@@ -280,16 +608,18 @@ def validate_calibration(params: Dict, test_matches: List[MatchData]):
     print(f"  Test matches: {len(test_matches)}")
 
     mu, alpha, beta = params['mu'], params['alpha'], params['beta']
+    data = HawkesDataset.from_matches(test_matches)
+    groups, _ = data.groups('shared')
 
     # Test set에 대한 negative log-likelihood
-    test_nll = negative_log_likelihood([mu, alpha, beta], test_matches)
+    test_nll, _ = hawkes_nll_and_grad([mu, alpha, beta], data, groups, 1)
     avg_nll = test_nll / len(test_matches)
 
     print(f"  Test NLL: {test_nll:.2f}")
     print(f"  Avg NLL per match: {avg_nll:.2f}")
 
     # Baseline (μ만 사용)과 비교
-    baseline_nll = negative_log_likelihood([mu, 0.0001, 1.0], test_matches)
+    baseline_nll, _ = hawkes_nll_and_grad([mu, 0.0001, 1.0], data, groups, 1)
 
     print(f"\n  Comparison:")
     print(f"    Hawkes NLL:   {test_nll:.2f}")
@@ -341,6 +671,15 @@ def main():
     print(f"\n" + "=" * 70)
     validate_calibration(result, test_matches)
 
+    # 4-1. Bootstrap 표준오차 (home/away parameter set)
+    print(f"\n" + "=" * 70)
+    print(f"🔁 Bootstrap (home/away, 100 resamples)...")
+    boot = HawkesCalibrator(param_sets='home_away').bootstrap(
+        HawkesDataset.from_matches(train_matches), n_resamples=100, seed=42
+    )
+    for name, fitted, se in zip(boot.fit.group_names, boot.fit.params, boot.std_error()):
+        print(f"  {name:5s} μ={fitted[0]:.4f}±{se[0]:.4f}, α={fitted[1]:.4f}±{se[1]:.4f}, β={fitted[2]:.4f}±{se[2]:.4f}")
+
     # 5. 결과 저장 (실제로는 config file에 저장)
     print(f"\n" + "=" * 70)
     print(f"💾 Calibrated Parameters:")
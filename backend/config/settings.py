@@ -101,6 +101,12 @@ class APISettings(BaseSettings):
     rate_limit_enabled: bool = Field(default=True, env='API_RATE_LIMIT_ENABLED')
     rate_limit_per_minute: int = Field(default=60, env='API_RATE_LIMIT_PER_MINUTE')
 
+    # Simulation SSE streams
+    stream_max_concurrent: int = Field(default=4, env='API_STREAM_MAX_CONCURRENT')
+    stream_channel_size: int = Field(default=64, env='API_STREAM_CHANNEL_SIZE')
+    stream_heartbeat_seconds: float = Field(default=15.0, env='API_STREAM_HEARTBEAT_SECONDS')
+    stream_max_duration_seconds: float = Field(default=900.0, env='API_STREAM_MAX_DURATION_SECONDS')
+
 
 class ExternalAPISettings(BaseSettings):
     """External API configuration"""
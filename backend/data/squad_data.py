@@ -1,16897 +1,188 @@
 """
 EPL 전체 팀 선수 명단
-자동 생성됨: 2025-10-09 11:08:17
-시즌: 2025-26
-데이터 소스: Premier League API + FPL API (정합성 매칭)
+데이터: squad_data.json (자동 생성, 이 모듈은 로더)
+
+SQUAD_DATA는 처음 접근할 때 JSON을 한 번 읽고 다음 인덱스를 만든다.
+- 팀 이름 → 선수 리스트 (기존 SQUAD_DATA[team] 인터페이스)
+- 선수 ID → 선수
+- 정규화된 이름 → 선수 리스트
+
+import만으로는 파일을 읽지 않으므로 워커 시작 비용이 없고,
+선수 ID 조회는 전체 명단을 순회하지 않는다.
+갱신 스크립트는 save_squad_data로 JSON을 쓰고 인덱스를 다시 만든다.
 """
 
-SQUAD_DATA = {
-    "Arsenal": [
-        {
-            "id": 7975,
-            "name": "David Raya",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 30,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "154561",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 66204,
-            "name": "William Saliba",
-            "position": "Centre Central Defender",
-            "number": 2,
-            "age": 24,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "462424",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 409,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 14548,
-            "name": "Ben White",
-            "position": "Centre/Right Central Defender",
-            "number": 4,
-            "age": 28,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "198869",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 70,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 50234,
-            "name": "Gabriel Magalhães",
-            "position": "Centre Central Defender",
-            "number": 6,
-            "age": 27,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "226597",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 49481,
-            "name": "Bukayo Saka",
-            "position": "Left Winger",
-            "number": 7,
-            "age": 24,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "223340",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 346,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 11419,
-            "name": "Martin Ødegaard",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 8,
-            "age": 26,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "184029",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 201,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 19680,
-            "name": "Gabriel Jesus",
-            "position": "Second Striker",
-            "number": 9,
-            "age": 28,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 21584,
-            "name": "Eberechi Eze",
-            "position": "Centre Attacking Midfielder",
-            "number": 10,
-            "age": 27,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "232413",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 394,
-                "goals": 0,
-                "assists": 3,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 66104,
-            "name": "Gabriel Martinelli",
-            "position": "Left Winger",
-            "number": 11,
-            "age": 24,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "444145",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 181,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 67776,
-            "name": "Jurriën Timber",
-            "position": "Central Defender",
-            "number": 12,
-            "age": 24,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "445122",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 521,
-                "goals": 2,
-                "assists": 2,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 11373,
-            "name": "Kepa Arrizabalaga",
-            "position": "Goalkeeper",
-            "number": 13,
-            "age": 31,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "109745",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 32728,
-            "name": "Viktor Gyökeres",
-            "position": "Striker",
-            "number": 14,
-            "age": 27,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "224117",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 576,
-                "goals": 3,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 42331,
-            "name": "Christian Nørgaard",
-            "position": "Defensive Midfielder",
-            "number": 16,
-            "age": 31,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "128295",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 20486,
-            "name": "Leandro Trossard",
-            "position": "Left Winger",
-            "number": 19,
-            "age": 30,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "116216",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 292,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 67407,
-            "name": "Noni Madueke",
-            "position": "Right Winger",
-            "number": 20,
-            "age": 23,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "248857",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 304,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 114566,
-            "name": "Ethan Nwaneri",
-            "position": "Left/Centre Attacking Midfielder",
-            "number": 22,
-            "age": 18,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "499175",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 145,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 19778,
-            "name": "Mikel Merino",
-            "position": "Centre Central Midfielder",
-            "number": 23,
-            "age": 29,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "195384",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 242,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 20810,
-            "name": "Kai Havertz",
-            "position": "Left/Centre/Right Second Striker",
-            "number": 29,
-            "age": 26,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "219847",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 30,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 69914,
-            "name": "Riccardo Calafiori",
-            "position": "Left Full Back",
-            "number": 33,
-            "age": 23,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "466075",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 524,
-                "goals": 1,
-                "assists": 2,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 119036,
-            "name": "Tommy Setford",
-            "position": "Goalkeeper",
-            "number": 35,
-            "age": 19,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "551221",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 64523,
-            "name": "Martín Zubimendi",
-            "position": "Defensive Midfielder",
-            "number": 36,
-            "age": 26,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "481655",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 591,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 15202,
-            "name": "Declan Rice",
-            "position": "Centre Central Midfielder",
-            "number": 41,
-            "age": 26,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "204480",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 542,
-                "goals": 1,
-                "assists": 3,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 114564,
-            "name": "Myles Lewis-Skelly",
-            "position": "Left Full Back",
-            "number": 49,
-            "age": 19,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "499169",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 83,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 141181,
-            "name": "Max Dowman",
-            "position": "Attacking Midfielder",
-            "number": 56,
-            "age": 15,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "616077",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 27,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 145412,
-            "name": "Andre Harriman-Annous",
-            "position": "Striker",
-            "number": 71,
-            "age": 17,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "646243",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000003,
-            "name": "Karl Hein",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "463748",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000009,
-            "name": "Jakub Kiwior",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "440854",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000013,
-            "name": "Brayden Clarke",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "563324",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000014,
-            "name": "Maldini Kacurri",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "588793",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000015,
-            "name": "Josh Nichols",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "499167",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000023,
-            "name": "Fábio Ferreira Vieira",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "438098",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000028,
-            "name": "Ismeal Kabia",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "588796",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000029,
-            "name": "Albert Sambi Lokonga",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "437742",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000031,
-            "name": "Gabriel Fernando de Jesus",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "205651",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000662,
-            "name": "Cristhian Mosquera",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "500040",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 247,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000725,
-            "name": "Piero Hincapié",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 1,
-            "team_name": "Arsenal",
-            "nationality": "",
-            "photo": "448104",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Aston Villa": [
-        {
-            "id": 13344,
-            "name": "Matty Cash",
-            "position": "Right Full Back",
-            "number": 2,
-            "age": 28,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "199796",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 606,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 5066,
-            "name": "Victor Lindelöf",
-            "position": "Centre Central Defender",
-            "number": 3,
-            "age": 31,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "184667",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 21,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 13274,
-            "name": "Ezri Konsa",
-            "position": "Centre Central Defender",
-            "number": 4,
-            "age": 27,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "199798",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 515,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 8900,
-            "name": "Tyrone Mings",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 32,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "149484",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 481,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 4115,
-            "name": "Ross Barkley",
-            "position": "Centre Central Midfielder",
-            "number": 6,
-            "age": 31,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "88894",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 6,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 51423,
-            "name": "John McGinn",
-            "position": "Centre Central Midfielder",
-            "number": 7,
-            "age": 30,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "122806",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 546,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 5865,
-            "name": "Youri Tielemans",
-            "position": "Centre Central Midfielder",
-            "number": 8,
-            "age": 28,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "166989",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 315,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 26408,
-            "name": "Emiliano Buendía",
-            "position": "Left/Right Attacking Midfielder",
-            "number": 10,
-            "age": 28,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "195546",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 308,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 8658,
-            "name": "Ollie Watkins",
-            "position": "Left/Centre/Right Second Striker",
-            "number": 11,
-            "age": 29,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "178301",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 598,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 5758,
-            "name": "Lucas Digne",
-            "position": "Left Full Back",
-            "number": 12,
-            "age": 32,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "101188",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 487,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 21529,
-            "name": "Pau Torres",
-            "position": "Central Defender",
-            "number": 14,
-            "age": 28,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "244954",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 254,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 133169,
-            "name": "Andrés García",
-            "position": "Right Full Back",
-            "number": 16,
-            "age": 22,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "606798",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 14456,
-            "name": "Donyell Malen",
-            "position": "Left/Centre Striker",
-            "number": 17,
-            "age": 26,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "204646",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 228,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 124181,
-            "name": "Jamaldeen Jimoh-Aloba",
-            "position": "Central Midfielder",
-            "number": 20,
-            "age": 19,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "559962",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 51223,
-            "name": "Ian Maatsen",
-            "position": "Left Full Back",
-            "number": 22,
-            "age": 23,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "441302",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 142,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 4245,
-            "name": "Emiliano Martínez",
-            "position": "Goalkeeper",
-            "number": 23,
-            "age": 33,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "98980",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 450,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 108096,
-            "name": "Amadou Onana",
-            "position": "Centre Defensive Midfielder",
-            "number": 24,
-            "age": 24,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "449871",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 154,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 107846,
-            "name": "Lamare Bogarde",
-            "position": "Centre Central Defender",
-            "number": 26,
-            "age": 21,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "515597",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 282,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 23968,
-            "name": "Morgan Rogers",
-            "position": "Left Winger",
-            "number": 27,
-            "age": 23,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "244850",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 621,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 72265,
-            "name": "Evann Guessand",
-            "position": "Striker",
-            "number": 29,
-            "age": 24,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "485337",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 282,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 20473,
-            "name": "Marco Bizot",
-            "position": "Goalkeeper",
-            "number": 40,
-            "age": 34,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "72147",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 180,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 25067,
-            "name": "Boubacar Kamara",
-            "position": "Centre Defensive Midfielder",
-            "number": 44,
-            "age": 25,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "226944",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 294,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 130670,
-            "name": "Sam Proctor",
-            "position": "Goalkeeper",
-            "number": 52,
-            "age": 18,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "564505",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 138560,
-            "name": "Aidan Borland",
-            "position": "Midfielder",
-            "number": 54,
-            "age": 18,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 114058,
-            "name": "Travis Patterson",
-            "position": "Defender",
-            "number": 55,
-            "age": 20,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "534836",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 107844,
-            "name": "Tommi O'Reilly",
-            "position": "Left/Right Winger",
-            "number": 58,
-            "age": 21,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 127888,
-            "name": "Ben Broggio",
-            "position": "Left/Centre Attacking Midfielder",
-            "number": 62,
-            "age": 18,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "577731",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 69397,
-            "name": "James Wright",
-            "position": "Goalkeeper",
-            "number": 64,
-            "age": 20,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "481283",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 144213,
-            "name": "Bradley Burrowes",
-            "position": "Forward",
-            "number": 83,
-            "age": 17,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "645618",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 16,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 143561,
-            "name": "Rhys Oakley",
-            "position": "Goalkeeper",
-            "number": 95,
-            "age": 17,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 98315,
-            "name": "Lino Sousa",
-            "position": "Left Full Back",
-            "number": 0,
-            "age": 20,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "514315",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000034,
-            "name": "Joe Gauci",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "462492",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000035,
-            "name": "Filip Marschall",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "462381",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000043,
-            "name": "Álex Moreno Lopera",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "106468",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000046,
-            "name": "Yasin Özcan",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "587178",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000049,
-            "name": "Leon Bailey",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "215711",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000051,
-            "name": "Samuel Iling-Junior",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "469247",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000056,
-            "name": "Enzo Barrenechea",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "491287",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000057,
-            "name": "Lewis Dobbin",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "461421",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000061,
-            "name": "Leander Dendoncker",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "151589",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000063,
-            "name": "Kadan Young",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "537403",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000065,
-            "name": "Zépiqueno Redmond",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "576756",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000389,
-            "name": "Harvey Elliott",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "444884",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 97,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000456,
-            "name": "Jadon Sancho",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "209243",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 8,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000701,
-            "name": "Triston Rowe",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 2,
-            "team_name": "Aston Villa",
-            "nationality": "",
-            "photo": "569577",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Bournemouth": [
-        {
-            "id": 134403,
-            "name": "Djordje Petrovic",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 26,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 64370,
-            "name": "Julián Araujo",
-            "position": "Right Full Back",
-            "number": 2,
-            "age": 24,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 74965,
-            "name": "Adrien Truffert",
-            "position": "Left Full Back",
-            "number": 3,
-            "age": 23,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "494521",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 10766,
-            "name": "Lewis Cook",
-            "position": "Centre Central Midfielder",
-            "number": 4,
-            "age": 28,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "155408",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 4,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 54989,
-            "name": "Marcos Senesi",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 28,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "221466",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 617,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 302305,
-            "name": "Julio Soler",
-            "position": "Left Full Back",
-            "number": 6,
-            "age": 20,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "575901",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 1,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 13706,
-            "name": "David Brooks",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 7,
-            "age": 28,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "111317",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 454,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 74976,
-            "name": "Alex Scott",
-            "position": "Central Midfielder",
-            "number": 8,
-            "age": 22,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "503139",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 448,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 33032,
-            "name": "Evanilson",
-            "position": "Centre Striker",
-            "number": 9,
-            "age": 26,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 15572,
-            "name": "Ryan Christie",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 10,
-            "age": 30,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "158499",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 149,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 121972,
-            "name": "Ben Gannon-Doak",
-            "position": "Left/Right Winger",
-            "number": 11,
-            "age": 19,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "496208",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 29,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 42894,
-            "name": "Tyler Adams",
-            "position": "Midfielder",
-            "number": 12,
-            "age": 26,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "200785",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 604,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 3512,
-            "name": "Adam Smith",
-            "position": "Right Full Back",
-            "number": 15,
-            "age": 34,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "54469",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 204,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 14846,
-            "name": "Marcus Tavernier",
-            "position": "Left Winger",
-            "number": 16,
-            "age": 26,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "201658",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 496,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 132285,
-            "name": "Bafodé Diakité",
-            "position": "Centre Central Defender",
-            "number": 18,
-            "age": 24,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "242882",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 540,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 21519,
-            "name": "Justin Kluivert",
-            "position": "Left/Right Winger",
-            "number": 19,
-            "age": 26,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "222683",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 159,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 118080,
-            "name": "Amine Adli",
-            "position": "Forward",
-            "number": 21,
-            "age": 25,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "489888",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 147,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 51942,
-            "name": "James Hill",
-            "position": "Centre Central Defender",
-            "number": 23,
-            "age": 23,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "463981",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 258,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 25474,
-            "name": "Antoine Semenyo",
-            "position": "Centre Striker",
-            "number": 24,
-            "age": 25,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "437730",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 6,
-                "assists": 3,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 16582,
-            "name": "Enes Ünal",
-            "position": "Centre Striker",
-            "number": 26,
-            "age": 28,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "168636",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117800,
-            "name": "Owen Bevan",
-            "position": "Centre Central Defender",
-            "number": 35,
-            "age": 21,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "518906",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 53093,
-            "name": "Will Dennis",
-            "position": "Goalkeeper",
-            "number": 40,
-            "age": 25,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "444172",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 140546,
-            "name": "Veljko Milosavljevic",
-            "position": "Centre Central Defender",
-            "number": 44,
-            "age": 18,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "620487",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 95,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 129849,
-            "name": "Matai Akinmboni",
-            "position": "Centre Central Defender",
-            "number": 45,
-            "age": 18,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "541462",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 144899,
-            "name": "Callan McKenna",
-            "position": "Goalkeeper",
-            "number": 46,
-            "age": 18,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "568791",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 133124,
-            "name": "Remy Rees-Dottin",
-            "position": "Forward",
-            "number": 50,
-            "age": 19,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "606774",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 133124,
-            "name": "Remy Rees-Dottin",
-            "position": "Forward",
-            "number": 51,
-            "age": 19,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "606774",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000066,
-            "name": "Norberto Murara Neto",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "69752",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000067,
-            "name": "Đorđe Petrović",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "457569",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 10000000070,
-            "name": "Alex Paulsen",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "495145",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000071,
-            "name": "Illia Zabarnyi",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "477580",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000078,
-            "name": "Julián Araujo Zúñiga",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "436893",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000079,
-            "name": "Chris Mepham",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "223911",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000089,
-            "name": "Philip Billing",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "168991",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000091,
-            "name": "Luis Sinisterra Lucumí",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "224995",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000092,
-            "name": "Romain Faivre",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "441240",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000093,
-            "name": "Hamed Traorè",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "424044",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 16,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000094,
-            "name": "Dominic Sadi",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "550596",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000095,
-            "name": "Zain Silcott-Duberry",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "530121",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000096,
-            "name": "Ben Winterburn",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "606775",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 6,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000097,
-            "name": "Francisco Evanilson de Lima Barbosa",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "444102",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 617,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 10000000099,
-            "name": "Daniel Adu-Adjei",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "590760",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000100,
-            "name": "Eli Junior Kroupi",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "560262",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 21,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000713,
-            "name": "Álex Jiménez Sánchez",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 127,
-            "team_name": "Bournemouth",
-            "nationality": "",
-            "photo": "551483",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 149,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Brentford": [
-        {
-            "id": 14723,
-            "name": "Caoimhín Kelleher",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 26,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "200720",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 115166,
-            "name": "Aaron Hickey",
-            "position": "Left Full Back",
-            "number": 2,
-            "age": 23,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "472713",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 184,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10947,
-            "name": "Rico Henry",
-            "position": "Left Full Back",
-            "number": 3,
-            "age": 28,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "194010",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 168,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 65987,
-            "name": "Sepp van den Berg",
-            "position": "Centre Central Defender",
-            "number": 4,
-            "age": 23,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "444765",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 22043,
-            "name": "Ethan Pinnock",
-            "position": "Left/Centre Central Defender",
-            "number": 5,
-            "age": 32,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "231065",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 155,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 144265,
-            "name": "Yunus Konak",
-            "position": "Centre Defensive Midfielder",
-            "number": 6,
-            "age": 19,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "628204",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 3712,
-            "name": "Jordan Henderson",
-            "position": "Centre Central Midfielder",
-            "number": 6,
-            "age": 35,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "56979",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 475,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 127594,
-            "name": "Kevin Schade",
-            "position": "Left/Right Winger",
-            "number": 7,
-            "age": 23,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "513418",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 572,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 133097,
-            "name": "Romelle Donovan",
-            "position": "Winger",
-            "number": 7,
-            "age": 18,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "606689",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 49726,
-            "name": "Mathias Jensen",
-            "position": "Centre Central Midfielder",
-            "number": 8,
-            "age": 29,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "207283",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 174,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 124052,
-            "name": "Igor Thiago",
-            "position": "Striker",
-            "number": 9,
-            "age": 24,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 4,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 49494,
-            "name": "Myles Peart-Harris",
-            "position": "Centre Winger",
-            "number": 9,
-            "age": 23,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "450539",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 144788,
-            "name": "Hákon Valdimarsson",
-            "position": "Goalkeeper",
-            "number": 12,
-            "age": 23,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "507433",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 98258,
-            "name": "Matthew Cox",
-            "position": "Goalkeeper",
-            "number": 13,
-            "age": 22,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "503300",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 32289,
-            "name": "Fábio Carvalho",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 14,
-            "age": 23,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 0,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 108612,
-            "name": "Frank Onyeka",
-            "position": "Centre Central Midfielder",
-            "number": 15,
-            "age": 27,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "428580",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 87,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 115336,
-            "name": "Antoni Milambo",
-            "position": "Attacking Midfielder",
-            "number": 17,
-            "age": 20,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "543295",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 45,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 128891,
-            "name": "Yehor Yarmoliuk",
-            "position": "Centre Attacking Midfielder",
-            "number": 18,
-            "age": 21,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "508395",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 600,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 133890,
-            "name": "Dango Ouattara",
-            "position": "Left/Right Winger",
-            "number": 19,
-            "age": 23,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "533463",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 311,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 20113,
-            "name": "Kristoffer Ajer",
-            "position": "Centre Central Defender",
-            "number": 20,
-            "age": 27,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "191866",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 118,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 24659,
-            "name": "Nathan Collins",
-            "position": "Centre Central Defender",
-            "number": 22,
-            "age": 24,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "432830",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 24369,
-            "name": "Keane Lewis-Potter",
-            "position": "Striker",
-            "number": 23,
-            "age": 24,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "249231",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 398,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 49731,
-            "name": "Mikkel Damsgaard",
-            "position": "Left/Centre Attacking Midfielder",
-            "number": 24,
-            "age": 25,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "440089",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 413,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 23194,
-            "name": "Vitaly Janelt",
-            "position": "Centre Defensive Midfielder",
-            "number": 27,
-            "age": 27,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "204580",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 41,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 21317,
-            "name": "Ellery Balcombe",
-            "position": "Goalkeeper",
-            "number": 31,
-            "age": 25,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "235448",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 23946,
-            "name": "Paris Maghoma",
-            "position": "Centre Central Midfielder",
-            "number": 32,
-            "age": 24,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "220695",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 133460,
-            "name": "Michael Kayode",
-            "position": "Right Full Back",
-            "number": 33,
-            "age": 21,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "607464",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 616,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 148162,
-            "name": "Gustavo Nunes",
-            "position": "Left Winger",
-            "number": 39,
-            "age": 19,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 147792,
-            "name": "Julian Eyestone",
-            "position": "Goalkeeper",
-            "number": 41,
-            "age": 19,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "535017",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 138109,
-            "name": "Benjamin Arthur",
-            "position": "Central Defender",
-            "number": 43,
-            "age": 20,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "622536",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000027,
-            "name": "Reiss Nelson",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "200641",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000112,
-            "name": "Mads Roerslev Rasmussen",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "226956",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000115,
-            "name": "Benjamin Fredrick",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "612534",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000117,
-            "name": "Kim Ji-soo",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "570241",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000118,
-            "name": "Jayden Meghoma",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "499717",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000123,
-            "name": "Fábio Freitas Gouveia Carvalho",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "244858",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 96,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000127,
-            "name": "Gustavo Nunes Fernandes Gomes",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "626464",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000134,
-            "name": "Ryan Trevitt",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "591357",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000136,
-            "name": "Igor Thiago Nascimento Rodrigues",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "502500",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 561,
-                "goals": 4,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000137,
-            "name": "Iwan Morgan",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 130,
-            "team_name": "Brentford",
-            "nationality": "",
-            "photo": "533710",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Brighton": [
-        {
-            "id": 75709,
-            "name": "Bart Verbruggen",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 23,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "489639",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 9426,
-            "name": "Adam Webster",
-            "position": "Centre Central Defender",
-            "number": 4,
-            "age": 30,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "110735",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 8163,
-            "name": "Lewis Dunk",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 33,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "83299",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 76090,
-            "name": "Jan Paul van Hecke",
-            "position": "Centre Central Defender",
-            "number": 6,
-            "age": 25,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "469142",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 8171,
-            "name": "Solly March",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 7,
-            "age": 31,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "109345",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 134176,
-            "name": "Brajan Gruda",
-            "position": "Centre/Right Attacking Midfielder",
-            "number": 8,
-            "age": 21,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "513433",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 218,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 51830,
-            "name": "Georginio Rutter",
-            "position": "Centre Striker",
-            "number": 10,
-            "age": 23,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "463067",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 366,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 136175,
-            "name": "Yankuba Minteh",
-            "position": "Left/Centre/Right Winger",
-            "number": 11,
-            "age": 21,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "592031",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 593,
-                "goals": 1,
-                "assists": 2,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 112739,
-            "name": "Jack Hinshelwood",
-            "position": "Centre Defensive Midfielder",
-            "number": 13,
-            "age": 20,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "532529",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 107,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117758,
-            "name": "Tom Watson",
-            "position": "Left Winger",
-            "number": 14,
-            "age": 19,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "549074",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 124396,
-            "name": "Carlos Baleba",
-            "position": "Centre Central Midfielder",
-            "number": 17,
-            "age": 21,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "535301",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 352,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 3452,
-            "name": "Danny Welbeck",
-            "position": "Centre Striker",
-            "number": 18,
-            "age": 34,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "50175",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 365,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 145043,
-            "name": "Charalampos Kostoulas",
-            "position": "Striker",
-            "number": 19,
-            "age": 18,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "647850",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 2100,
-            "name": "James Milner",
-            "position": "Left/Centre/Right Central Midfielder",
-            "number": 20,
-            "age": 39,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "15157",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 137,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 20505,
-            "name": "Olivier Boscagli",
-            "position": "Central Defender",
-            "number": 21,
-            "age": 27,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "204120",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117732,
-            "name": "Kaoru Mitoma",
-            "position": "Left Winger",
-            "number": 22,
-            "age": 28,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 0,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 3457,
-            "name": "Jason Steele",
-            "position": "Goalkeeper",
-            "number": 23,
-            "age": 35,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "49262",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 50727,
-            "name": "Ferdi Kadioglu",
-            "position": "Left Wing Back",
-            "number": 24,
-            "age": 26,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "231416",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 374,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 143240,
-            "name": "Diego Gómez",
-            "position": "Central Midfielder",
-            "number": 25,
-            "age": 22,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 134333,
-            "name": "Yasin Ayari",
-            "position": "Left/Centre/Right Central Midfielder",
-            "number": 26,
-            "age": 22,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "509416",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 542,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 72239,
-            "name": "Mats Wieffer",
-            "position": "Centre Defensive Midfielder",
-            "number": 27,
-            "age": 25,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "467779",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 283,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 67928,
-            "name": "Maxim De Cuyper",
-            "position": "Left Full Back",
-            "number": 29,
-            "age": 24,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "465730",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 294,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 4874,
-            "name": "Joël Veltman",
-            "position": "Centre/Right Full Back",
-            "number": 34,
-            "age": 33,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "111478",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 324,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 20961,
-            "name": "Tom McGill",
-            "position": "Goalkeeper",
-            "number": 38,
-            "age": 25,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "209288",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 303860,
-            "name": "Diego Coppola",
-            "position": "Centre Central Defender",
-            "number": 42,
-            "age": 21,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "550090",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 16,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 122944,
-            "name": "Joe Knight",
-            "position": "Midfielder",
-            "number": 49,
-            "age": 20,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "567121",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117644,
-            "name": "Charlie Tasker",
-            "position": "Full Back",
-            "number": 51,
-            "age": 19,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "547720",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 129952,
-            "name": "Harry Howell",
-            "position": "Midfielder",
-            "number": 53,
-            "age": 17,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 129952,
-            "name": "Harry Howell",
-            "position": "Midfielder",
-            "number": 53,
-            "age": 17,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000141,
-            "name": "Carl Rushworth",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "472739",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000142,
-            "name": "Kjell Scherpen",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "240514",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000147,
-            "name": "Pervis Estupiñán Tenorio",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "204214",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000150,
-            "name": "Tariq Lamptey",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "232792",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000154,
-            "name": "Eiran Cashin",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "439135",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000155,
-            "name": "Jacob Slater",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "589100",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000157,
-            "name": "Mitoma Kaoru",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "451340",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 508,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000161,
-            "name": "Julio Enciso Espínola",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "474120",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000164,
-            "name": "Matt O'Riley",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "219249",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 177,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000165,
-            "name": "Abdallah Sima",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "516211",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000169,
-            "name": "Diego Gómez Amarilla",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "514254",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 309,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000171,
-            "name": "Jeremy Sarmiento Morante",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "441192",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000174,
-            "name": "Malick Yalcouyé",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "611695",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000176,
-            "name": "Adrian Mazilu",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "550141",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000177,
-            "name": "Andrew Moran",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "513834",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000179,
-            "name": "Evan Ferguson",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "487117",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000180,
-            "name": "Stefanos Tzimas",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 131,
-            "team_name": "Brighton",
-            "nationality": "",
-            "photo": "608181",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 48,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Burnley": [
-        {
-            "id": 6451,
-            "name": "Martin Dúbravka",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 36,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "67089",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 3955,
-            "name": "Kyle Walker",
-            "position": "Right Full Back",
-            "number": 2,
-            "age": 35,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "58621",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 127393,
-            "name": "Quilindschy Hartman",
-            "position": "Left Full Back",
-            "number": 3,
-            "age": 23,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "494960",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 627,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 13622,
-            "name": "Joe Worrall",
-            "position": "Centre Central Defender",
-            "number": 4,
-            "age": 28,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "208912",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 19,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 124531,
-            "name": "Maxime Estève",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 23,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "477717",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 622,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 13559,
-            "name": "Axel Tuanzebe",
-            "position": "Right Full Back",
-            "number": 6,
-            "age": 27,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "180804",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 90,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 19831,
-            "name": "Jacob Bruun Larsen",
-            "position": "Left Winger",
-            "number": 7,
-            "age": 27,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "179458",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 235,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 74960,
-            "name": "Lesley Ugochukwu",
-            "position": "Centre Defensive Midfielder",
-            "number": 8,
-            "age": 21,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "503714",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 285,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 64282,
-            "name": "Lyle Foster",
-            "position": "Centre Striker",
-            "number": 9,
-            "age": 25,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "435973",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 565,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 15139,
-            "name": "Marcus Edwards",
-            "position": "Right Winger",
-            "number": 10,
-            "age": 26,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "174592",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 5,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 50460,
-            "name": "Jaidon Anthony",
-            "position": "Left Winger",
-            "number": 11,
-            "age": 25,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "444180",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 587,
-                "goals": 4,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 51498,
-            "name": "Bashir Humphreys",
-            "position": "Centre Central Defender",
-            "number": 12,
-            "age": 22,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "461188",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 2,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 122056,
-            "name": "Max Weiss",
-            "position": "Goalkeeper",
-            "number": 13,
-            "age": 21,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "518030",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 13917,
-            "name": "Connor Roberts",
-            "position": "Right Full Back",
-            "number": 14,
-            "age": 30,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "192290",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 74964,
-            "name": "Loum Tchaouna",
-            "position": "Left/Right Winger",
-            "number": 17,
-            "age": 22,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "469272",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 309,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 128456,
-            "name": "Hjalmar Ekdal",
-            "position": "Centre Central Defender",
-            "number": 18,
-            "age": 26,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "478969",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 532,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 75735,
-            "name": "Zian Flemming",
-            "position": "Centre Attacking Midfielder",
-            "number": 19,
-            "age": 27,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "431639",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 32,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 128643,
-            "name": "Oliver Sonne",
-            "position": "Right Full Back",
-            "number": 22,
-            "age": 24,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "519895",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 102,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 137462,
-            "name": "Lucas Pires",
-            "position": "Left Full Back",
-            "number": 23,
-            "age": 24,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "549329",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10539,
-            "name": "Josh Cullen",
-            "position": "Centre Central Midfielder",
-            "number": 24,
-            "age": 29,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "172567",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 590,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 128449,
-            "name": "Zeki Amdouni",
-            "position": "Forward",
-            "number": 25,
-            "age": 24,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "492831",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 31442,
-            "name": "Armando Broja",
-            "position": "Striker",
-            "number": 27,
-            "age": 24,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "440323",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 42,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 68593,
-            "name": "Hannibal Mejbri",
-            "position": "Left/Centre/Right Central Midfielder",
-            "number": 28,
-            "age": 22,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "465527",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 246,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 8127,
-            "name": "Josh Laurent",
-            "position": "Central Midfielder",
-            "number": 29,
-            "age": 30,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "167887",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 448,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 75883,
-            "name": "Mike Trésor",
-            "position": "Left Winger",
-            "number": 31,
-            "age": 26,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 16169,
-            "name": "Václav Hladky",
-            "position": "Goalkeeper",
-            "number": 32,
-            "age": 34,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "51943",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 119059,
-            "name": "Jaydon Banel",
-            "position": "Left Winger",
-            "number": 34,
-            "age": 20,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "551206",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 8246,
-            "name": "Ashley Barnes",
-            "position": "Striker",
-            "number": 35,
-            "age": 35,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "44699",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 35699,
-            "name": "Jordan Beyer",
-            "position": "Centre Central Defender",
-            "number": 36,
-            "age": 25,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "241231",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 304995,
-            "name": "George Brierley",
-            "position": "Midfielder",
-            "number": 41,
-            "age": 17,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 140368,
-            "name": "Murray Campbell",
-            "position": "Defender",
-            "number": 43,
-            "age": 19,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 21785,
-            "name": "Hannes Delcroix",
-            "position": "Central Defender",
-            "number": 44,
-            "age": 26,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "247245",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 142629,
-            "name": "Brandon Pouani",
-            "position": "Forward",
-            "number": 45,
-            "age": 17,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 310972,
-            "name": "Ellis Clark",
-            "position": "Midfielder",
-            "number": 47,
-            "age": 18,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 305212,
-            "name": "Ellis Clark",
-            "position": "Midfielder",
-            "number": 47,
-            "age": 18,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 134487,
-            "name": "Enock Agyei",
-            "position": "Left Winger",
-            "number": 48,
-            "age": 20,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "578614",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 254590,
-            "name": "Marley Leuluai",
-            "position": "Midfielder",
-            "number": 53,
-            "age": 18,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 145134,
-            "name": "Oliver Pimlott",
-            "position": "Midfielder",
-            "number": 54,
-            "age": 18,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000184,
-            "name": "Etienne Green",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "489571",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000189,
-            "name": "Owen Dodgson",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "461567",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000196,
-            "name": "Shurandy Sambo",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "450072",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000201,
-            "name": "Manuel Benson Hedilazio",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "183751",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000204,
-            "name": "Darko Churlinov",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "250735",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000208,
-            "name": "Luca Koleosho",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "487702",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000211,
-            "name": "Aaron Ramsey",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "447715",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000212,
-            "name": "Oluwaseun Adewumi",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "576323",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000214,
-            "name": "Mike Trésor Ndayishimiye",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "437748",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000219,
-            "name": "Michael Obafemi",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "220598",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000722,
-            "name": "Florentino Ibrain Morris Luís",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 43,
-            "team_name": "Burnley",
-            "nationality": "",
-            "photo": "216055",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 297,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Chelsea": [
-        {
-            "id": 14538,
-            "name": "Robert Sánchez",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 27,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "215059",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 544,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 27277,
-            "name": "Marc Cucurella",
-            "position": "Left Wing Back",
-            "number": 3,
-            "age": 27,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "179268",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 536,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 13549,
-            "name": "Tosin Adarabioyo",
-            "position": "Centre Central Defender",
-            "number": 4,
-            "age": 28,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "109646",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 353,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 53612,
-            "name": "Benoît Badiashile",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 24,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 51229,
-            "name": "Levi Colwill",
-            "position": "Centre Central Defender",
-            "number": 6,
-            "age": 22,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "460028",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 21998,
-            "name": "Pedro Neto",
-            "position": "Left/Right Winger",
-            "number": 7,
-            "age": 25,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "247632",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 508,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 63741,
-            "name": "Enzo Fernández",
-            "position": "Midfielder",
-            "number": 8,
-            "age": 24,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "448047",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 618,
-                "goals": 3,
-                "assists": 2,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 51813,
-            "name": "Liam Delap",
-            "position": "Centre Striker",
-            "number": 9,
-            "age": 22,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "463034",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 91,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 53991,
-            "name": "Mykhailo Mudryk",
-            "position": "Left Winger",
-            "number": 10,
-            "age": 24,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "465920",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 49293,
-            "name": "Cole Palmer",
-            "position": "Attacking Midfielder",
-            "number": 10,
-            "age": 23,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "244851",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 144,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 68583,
-            "name": "Jamie Gittens",
-            "position": "Left Winger",
-            "number": 11,
-            "age": 21,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "463936",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 158,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 75989,
-            "name": "Filip Jörgensen",
-            "position": "Goalkeeper",
-            "number": 12,
-            "age": 23,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "508479",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 84,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 115151,
-            "name": "Dário Essugo",
-            "position": "Centre Central Midfielder",
-            "number": 14,
-            "age": 20,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "491007",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 133245,
-            "name": "Andrey Santos",
-            "position": "Centre Central Midfielder",
-            "number": 17,
-            "age": 21,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 72371,
-            "name": "João Pedro",
-            "position": "Centre Striker",
-            "number": 20,
-            "age": 24,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 2,
-                "assists": 3,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 119041,
-            "name": "Jorrel Hato",
-            "position": "Left Full Back",
-            "number": 21,
-            "age": 19,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "551210",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 166,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 14575,
-            "name": "Trevoh Chalobah",
-            "position": "Centre Central Defender",
-            "number": 23,
-            "age": 26,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "180736",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 480,
-                "goals": 2,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 14571,
-            "name": "Reece James",
-            "position": "Right Full Back",
-            "number": 24,
-            "age": 25,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "225796",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 423,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 112203,
-            "name": "Moisés Caicedo",
-            "position": "Centre Defensive Midfielder",
-            "number": 25,
-            "age": 23,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "486672",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 3,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 68827,
-            "name": "Malo Gusto",
-            "position": "Right Full Back",
-            "number": 27,
-            "age": 22,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "482609",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 312,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 66284,
-            "name": "Wesley Fofana",
-            "position": "Centre Central Defender",
-            "number": 29,
-            "age": 24,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "444463",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 129,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 118442,
-            "name": "Tyrique George",
-            "position": "Left/Centre/Right Winger",
-            "number": 32,
-            "age": 19,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "550615",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 137,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 125075,
-            "name": "Josh Acheampong",
-            "position": "Right Full Back",
-            "number": 34,
-            "age": 19,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "577016",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 193,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 112377,
-            "name": "Ted Curd",
-            "position": "Goalkeeper",
-            "number": 35,
-            "age": 19,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 130068,
-            "name": "Marc Guiu",
-            "position": "Centre Striker",
-            "number": 38,
-            "age": 19,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "499309",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 29,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 304474,
-            "name": "Estêvão",
-            "position": "Right Winger",
-            "number": 41,
-            "age": 18,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 0,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 64328,
-            "name": "Gaga Slonina",
-            "position": "Goalkeeper",
-            "number": 44,
-            "age": 21,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 99282,
-            "name": "Roméo Lavia",
-            "position": "Centre Defensive Midfielder",
-            "number": 45,
-            "age": 21,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "514356",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 46,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 134792,
-            "name": "Reggie Walsh",
-            "position": "Midfielder",
-            "number": 46,
-            "age": 16,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 68987,
-            "name": "Alejandro Garnacho",
-            "position": "Left/Right Winger",
-            "number": 49,
-            "age": 21,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "493105",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 85,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 109707,
-            "name": "Max Merrick",
-            "position": "Goalkeeper",
-            "number": 50,
-            "age": 19,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 134782,
-            "name": "Landon Emenalo",
-            "position": "Midfielder",
-            "number": 56,
-            "age": 17,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "611912",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 130153,
-            "name": "Ollie Harrison",
-            "position": "Centre Defensive Midfielder",
-            "number": 58,
-            "age": 18,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 122945,
-            "name": "Shumaira Mheuka",
-            "position": "Centre Striker",
-            "number": 62,
-            "age": 17,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000168,
-            "name": "Facundo Buonanotte",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "536916",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 45,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000222,
-            "name": "Mike Penders",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "549939",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000223,
-            "name": "Gabriel Słonina",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "471798",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000229,
-            "name": "Benoît Badiashile Mukinayi",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "242880",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 65,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000231,
-            "name": "Mamadou Sarr",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "574458",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000234,
-            "name": "Aarón Anselmino",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "622758",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000238,
-            "name": "Estêvão Almeida de Oliveira Gonçalves",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "624773",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 262,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10000000240,
-            "name": "Christopher Nkunku",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "213198",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000246,
-            "name": "Andrey Nascimento dos Santos",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "532605",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 170,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000248,
-            "name": "Kendry Páez Andrade",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "611134",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000249,
-            "name": "João Pedro Junqueira de Jesus",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "475168",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 583,
-                "goals": 2,
-                "assists": 3,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10000000251,
-            "name": "Nicolas Jackson",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 4,
-            "team_name": "Chelsea",
-            "nationality": "",
-            "photo": "517052",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Crystal Palace": [
-        {
-            "id": 13988,
-            "name": "Dean Henderson",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 28,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "172649",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 76353,
-            "name": "Daniel Muñoz",
-            "position": "Right Full Back",
-            "number": 2,
-            "age": 29,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "247348",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 24334,
-            "name": "Tyrick Mitchell",
-            "position": "Left Full Back",
-            "number": 3,
-            "age": 26,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "244723",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 76104,
-            "name": "Maxence Lacroix",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 25,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "437499",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 14569,
-            "name": "Marc Guéhi",
-            "position": "Centre Central Defender",
-            "number": 6,
-            "age": 25,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "209036",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 1,
-                "assists": 2,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 49796,
-            "name": "Ismaïla Sarr",
-            "position": "Right Winger",
-            "number": 7,
-            "age": 27,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "232185",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 432,
-                "goals": 3,
-                "assists": 1,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 37776,
-            "name": "Jefferson Lerma",
-            "position": "Centre Central Midfielder",
-            "number": 8,
-            "age": 30,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "152551",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 179,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 14451,
-            "name": "Eddie Nketiah",
-            "position": "Centre Striker",
-            "number": 9,
-            "age": 26,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "205533",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 50,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 109117,
-            "name": "Yéremy Pino",
-            "position": "Right Winger",
-            "number": 10,
-            "age": 22,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 20874,
-            "name": "Jean-Philippe Mateta",
-            "position": "Centre Striker",
-            "number": 14,
-            "age": 28,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "231747",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 600,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 4604,
-            "name": "Nathaniel Clyne",
-            "position": "Right Full Back",
-            "number": 17,
-            "age": 34,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "57328",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 4,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 49759,
-            "name": "Daichi Kamada",
-            "position": "Centre Attacking Midfielder",
-            "number": 18,
-            "age": 29,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "209400",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 436,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 8589,
-            "name": "Will Hughes",
-            "position": "Centre Central Midfielder",
-            "number": 19,
-            "age": 30,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "108413",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 411,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 69595,
-            "name": "Adam Wharton",
-            "position": "Central Midfielder",
-            "number": 20,
-            "age": 21,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "496221",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 451,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 133297,
-            "name": "Romain Esse",
-            "position": "Centre/Right Winger",
-            "number": 21,
-            "age": 20,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "606921",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 24,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 147312,
-            "name": "Jaydee Canvot",
-            "position": "Centre Central Defender",
-            "number": 23,
-            "age": 19,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "651426",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 20118,
-            "name": "Borna Sosa",
-            "position": "Left Full Back",
-            "number": 24,
-            "age": 27,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "218364",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 50842,
-            "name": "Chris Richards",
-            "position": "Centre Central Defender",
-            "number": 26,
-            "age": 25,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "427623",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 126670,
-            "name": "Cheick Doucouré",
-            "position": "Centre Defensive Midfielder",
-            "number": 28,
-            "age": 25,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "438464",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 68086,
-            "name": "Naouirou Ahamada",
-            "position": "Centre Central Midfielder",
-            "number": 29,
-            "age": 23,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "466117",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10827,
-            "name": "Remi Matthews",
-            "position": "Goalkeeper",
-            "number": 31,
-            "age": 31,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "169593",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 110549,
-            "name": "Chadi Riad",
-            "position": "Centre Central Defender",
-            "number": 34,
-            "age": 22,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "515621",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 127828,
-            "name": "Caleb Kporha",
-            "position": "Right Full Back",
-            "number": 38,
-            "age": 19,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "590012",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 112449,
-            "name": "Kaden Rodney",
-            "position": "Centre Defensive Midfielder",
-            "number": 42,
-            "age": 21,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "530318",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 20497,
-            "name": "Walter Benítez",
-            "position": "Goalkeeper",
-            "number": 44,
-            "age": 32,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "121709",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 138981,
-            "name": "Justin Devenny",
-            "position": "Left Winger",
-            "number": 55,
-            "age": 21,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "489706",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 145,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 127826,
-            "name": "Rio Cardines",
-            "position": "Midfielder",
-            "number": 59,
-            "age": 19,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "590014",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 124846,
-            "name": "Zach Marsh",
-            "position": "Centre Striker",
-            "number": 63,
-            "age": 20,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "576980",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 125106,
-            "name": "Asher Agbinone",
-            "position": "Left Winger",
-            "number": 64,
-            "age": 20,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "579075",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000264,
-            "name": "Rob Holding",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "156074",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000277,
-            "name": "Malcolm Ebiowei",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "450535",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000278,
-            "name": "Jesurun Rak-Sakyi",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "450542",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000279,
-            "name": "Matheus França de Oliveira",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "536694",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000280,
-            "name": "David Ozoh",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "531989",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000282,
-            "name": "Franco Umeh-Chibueze",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "574398",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000285,
-            "name": "Odsonne Édouard",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "199670",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 2,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000712,
-            "name": "Yéremy Pino Santos",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "488024",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 307,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10000000732,
-            "name": "Christantus Uche",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 6,
-            "team_name": "Crystal Palace",
-            "nationality": "",
-            "photo": "660392",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 7,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Everton": [
-        {
-            "id": 4640,
-            "name": "Jordan Pickford",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 31,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "111234",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 74585,
-            "name": "Nathan Patterson",
-            "position": "Right Full Back",
-            "number": 2,
-            "age": 23,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "243571",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 4333,
-            "name": "Michael Keane",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 32,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "106611",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 604,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 8143,
-            "name": "James Tarkowski",
-            "position": "Centre Central Defender",
-            "number": 6,
-            "age": 32,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "17761",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 24797,
-            "name": "Dwight McNeil",
-            "position": "Left Winger",
-            "number": 7,
-            "age": 25,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "433154",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 19,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 126789,
-            "name": "Beto",
-            "position": "Centre Striker",
-            "number": 9,
-            "age": 27,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 31936,
-            "name": "Iliman Ndiaye",
-            "position": "Left Winger",
-            "number": 10,
-            "age": 25,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "440993",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 588,
-                "goals": 3,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 143922,
-            "name": "Thierno Barry",
-            "position": "Centre Striker",
-            "number": 11,
-            "age": 22,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "586309",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 207,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 50453,
-            "name": "Mark Travers",
-            "position": "Goalkeeper",
-            "number": 12,
-            "age": 26,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "229600",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 112589,
-            "name": "Jake O'Brien",
-            "position": "Centre Central Defender",
-            "number": 15,
-            "age": 24,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "512462",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 24983,
-            "name": "Vitalii Mykolenko",
-            "position": "Left Full Back",
-            "number": 16,
-            "age": 26,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "224967",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 355,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 112917,
-            "name": "Tyler Dibling",
-            "position": "Midfielder",
-            "number": 20,
-            "age": 19,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "496661",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 58,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 14706,
-            "name": "Kiernan Dewsbury-Hall",
-            "position": "Central Midfielder",
-            "number": 22,
-            "age": 27,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "215413",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 540,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 3600,
-            "name": "Séamus Coleman",
-            "position": "Right Full Back",
-            "number": 23,
-            "age": 36,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "59949",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 2,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 133612,
-            "name": "Charly Alcaraz",
-            "position": "Central Midfielder",
-            "number": 24,
-            "age": 22,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "502697",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 162,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 12582,
-            "name": "Idrissa Gueye",
-            "position": "Centre Defensive Midfielder",
-            "number": 27,
-            "age": 36,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "80801",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 615,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10801,
-            "name": "Tom King",
-            "position": "Goalkeeper",
-            "number": 31,
-            "age": 30,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "138001",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 66318,
-            "name": "Jarrad Branthwaite",
-            "position": "Centre Central Defender",
-            "number": 32,
-            "age": 23,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "480455",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 23841,
-            "name": "James Garner",
-            "position": "Centre Central Midfielder",
-            "number": 37,
-            "age": 24,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "232928",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 140024,
-            "name": "Adam Aznou",
-            "position": "Left Full Back",
-            "number": 39,
-            "age": 19,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "499300",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 66538,
-            "name": "Tim Iroegbunam",
-            "position": "Centre Central Midfielder",
-            "number": 42,
-            "age": 22,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "490094",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 244,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 43940,
-            "name": "Harry Tyrer",
-            "position": "Goalkeeper",
-            "number": 53,
-            "age": 23,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "447325",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 127754,
-            "name": "Bradley Moonan",
-            "position": "Defender",
-            "number": 72,
-            "age": 19,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 75105,
-            "name": "Elijah Campbell",
-            "position": "Defender",
-            "number": 73,
-            "age": 21,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "491745",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000297,
-            "name": "Roman Dixon",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "496178",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000298,
-            "name": "Reece Welch",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "474907",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000305,
-            "name": "Harrison Armstrong",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "609873",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 1,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000306,
-            "name": "Callum Bates",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "547801",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000307,
-            "name": "Coby Ebere",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "504296",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000308,
-            "name": "Isaac Heath",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "496279",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000309,
-            "name": "Jenson Metcalfe",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "491557",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000311,
-            "name": "Norberto Bercique Gomes Betuncal",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "486385",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 423,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000312,
-            "name": "Youssef Ramalho Chermiti",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "491012",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000313,
-            "name": "Martin Sherif",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "536241",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000419,
-            "name": "Jack Grealish",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "114283",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 556,
-                "goals": 1,
-                "assists": 4,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10000000704,
-            "name": "Tyler Onyango",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "461446",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000728,
-            "name": "Merlin Röhl",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 7,
-            "team_name": "Everton",
-            "nationality": "",
-            "photo": "513466",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 24,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Fulham": [
-        {
-            "id": 4985,
-            "name": "Bernd Leno",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 33,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "80201",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 4880,
-            "name": "Kenny Tete",
-            "position": "Right Full Back",
-            "number": 2,
-            "age": 30,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "167074",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 450,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 23793,
-            "name": "Calvin Bassey",
-            "position": "Left Full Back",
-            "number": 3,
-            "age": 25,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "232892",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 26151,
-            "name": "Joachim Andersen",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 29,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "174874",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 4818,
-            "name": "Harrison Reed",
-            "position": "Centre Central Midfielder",
-            "number": 6,
-            "age": 30,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "153366",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 11071,
-            "name": "Raúl Jiménez",
-            "position": "Striker",
-            "number": 7,
-            "age": 34,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "102057",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 141,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 13961,
-            "name": "Harry Wilson",
-            "position": "Left/Right Winger",
-            "number": 8,
-            "age": 28,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "153682",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 437,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 117763,
-            "name": "Rodrigo Muniz",
-            "position": "Centre Striker",
-            "number": 9,
-            "age": 24,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "244042",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 314,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 3894,
-            "name": "Tom Cairney",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 10,
-            "age": 34,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "76357",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 110,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 4979,
-            "name": "Adama Traoré",
-            "position": "Right Winger",
-            "number": 11,
-            "age": 29,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "159533",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 143,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 35752,
-            "name": "Jorge Cuenca",
-            "position": "Central Defender",
-            "number": 15,
-            "age": 25,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 21614,
-            "name": "Sander Berge",
-            "position": "Centre Central Midfielder",
-            "number": 16,
-            "age": 27,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "207189",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 598,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 4717,
-            "name": "Alex Iwobi",
-            "position": "Left/Centre/Right Second Striker",
-            "number": 17,
-            "age": 29,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "153133",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 541,
-                "goals": 1,
-                "assists": 2,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 16044,
-            "name": "Sasa Lukic",
-            "position": "Central Midfielder",
-            "number": 20,
-            "age": 29,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 6712,
-            "name": "Timothy Castagne",
-            "position": "Right Full Back",
-            "number": 21,
-            "age": 29,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "166477",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 306,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 121610,
-            "name": "Kevin",
-            "position": "Left/Right Winger",
-            "number": 22,
-            "age": 22,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117286,
-            "name": "Benjamin Lecomte",
-            "position": "Goalkeeper",
-            "number": 23,
-            "age": 34,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "86873",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 128976,
-            "name": "Josh King",
-            "position": "Centre Central Midfielder",
-            "number": 24,
-            "age": 18,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "577725",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 467,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 14656,
-            "name": "Ryan Sessegnon",
-            "position": "Left/Right Winger",
-            "number": 30,
-            "age": 25,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "184349",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 476,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 49884,
-            "name": "Issa Diop",
-            "position": "Centre Central Defender",
-            "number": 31,
-            "age": 28,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "219924",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 85,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 14445,
-            "name": "Emile Smith Rowe",
-            "position": "Centre Attacking Midfielder",
-            "number": 32,
-            "age": 25,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "209289",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 124,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 14624,
-            "name": "Antonee Robinson",
-            "position": "Left Full Back",
-            "number": 33,
-            "age": 28,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "169528",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 61,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000315,
-            "name": "Steven Benda",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "428971",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000321,
-            "name": "Jorge Cuenca Barreno",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "246301",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 87,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000323,
-            "name": "Samuel Amissah",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "591385",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000327,
-            "name": "Andreas Hoelgebaum Pereira",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "156689",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000332,
-            "name": "Saša Lukić",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "212314",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 548,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000333,
-            "name": "Martial Godo",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "573062",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000334,
-            "name": "Luke Harris",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "515024",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000727,
-            "name": "Samuel Chukwueze",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "218328",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 33,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000731,
-            "name": "Kevin Santos Lopes de Macedo",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "560552",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 85,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000737,
-            "name": "Jonah Kusi-Asare",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 34,
-            "team_name": "Fulham",
-            "nationality": "",
-            "photo": "631786",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Leeds": [
-        {
-            "id": 63634,
-            "name": "Lucas Perri",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 27,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "201595",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 270,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 14608,
-            "name": "Jayden Bogle",
-            "position": "Right Full Back",
-            "number": 2,
-            "age": 25,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "226182",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 612,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 75543,
-            "name": "Gabriel Gudmundsson",
-            "position": "Left Full Back",
-            "number": 3,
-            "age": 26,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "243526",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 607,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 19731,
-            "name": "Ethan Ampadu",
-            "position": "Central Defender",
-            "number": 4,
-            "age": 25,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "199598",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 437,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 33124,
-            "name": "Pascal Struijk",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 26,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "222694",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 13796,
-            "name": "Joe Rodon",
-            "position": "Central Defender",
-            "number": 6,
-            "age": 27,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "214225",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 13797,
-            "name": "Daniel James",
-            "position": "Left/Right Winger",
-            "number": 7,
-            "age": 27,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "200617",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 212,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 14897,
-            "name": "Sean Longstaff",
-            "position": "Central Midfielder",
-            "number": 8,
-            "age": 27,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "180135",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 475,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 9576,
-            "name": "Dominic Calvert-Lewin",
-            "position": "Striker",
-            "number": 9,
-            "age": 28,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "177815",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 358,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 50643,
-            "name": "Joël Piroe",
-            "position": "Centre Striker",
-            "number": 10,
-            "age": 26,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "235826",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 145,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 63289,
-            "name": "Brenden Aaronson",
-            "position": "Centre Attacking Midfielder",
-            "number": 11,
-            "age": 24,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "427637",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 395,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 14807,
-            "name": "Lukas Nmecha",
-            "position": "Striker",
-            "number": 14,
-            "age": 26,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "174594",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 147,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 50151,
-            "name": "Jaka Bijol",
-            "position": "Central Defender",
-            "number": 15,
-            "age": 26,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "434752",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 66378,
-            "name": "Illan Meslier",
-            "position": "Goalkeeper",
-            "number": 16,
-            "age": 25,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "437495",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 116888,
-            "name": "Anton Stach",
-            "position": "Centre Defensive Midfielder",
-            "number": 18,
-            "age": 26,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "466525",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 606,
-                "goals": 1,
-                "assists": 2,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 33162,
-            "name": "Noah Okafor",
-            "position": "Winger",
-            "number": 19,
-            "age": 25,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "435997",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 304,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 33135,
-            "name": "Jack Harrison",
-            "position": "Left Winger",
-            "number": 20,
-            "age": 28,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "221399",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 130,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 8938,
-            "name": "Alex Cairns",
-            "position": "Goalkeeper",
-            "number": 21,
-            "age": 32,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "97846",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 126426,
-            "name": "Ao Tanaka",
-            "position": "Midfielder",
-            "number": 22,
-            "age": 27,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 35718,
-            "name": "Sebastiaan Bornauw",
-            "position": "Central Defender",
-            "number": 23,
-            "age": 26,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "437738",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 13515,
-            "name": "James Justin",
-            "position": "Defender",
-            "number": 24,
-            "age": 27,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "220627",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 18,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 8945,
-            "name": "Sam Byram",
-            "position": "Right Full Back",
-            "number": 25,
-            "age": 32,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "113564",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 7,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 9251,
-            "name": "Karl Darlow",
-            "position": "Goalkeeper",
-            "number": 26,
-            "age": 35,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "59735",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 360,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 68676,
-            "name": "Wilfried Gnonto",
-            "position": "Attacking Midfielder",
-            "number": 29,
-            "age": 21,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "492859",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 191,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 122289,
-            "name": "Sam Chambers",
-            "position": "Centre Attacking Midfielder",
-            "number": 42,
-            "age": 18,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 115255,
-            "name": "Ilia Gruev",
-            "position": "Centre Defensive Midfielder",
-            "number": 44,
-            "age": 25,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "486520",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 193,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 134789,
-            "name": "Harry Gray",
-            "position": "Forward",
-            "number": 45,
-            "age": 17,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "600882",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000349,
-            "name": "Isaac Schmidt",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "492368",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000355,
-            "name": "Sam Greenwood",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "248937",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000357,
-            "name": "Largie Ramazani",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "433952",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000358,
-            "name": "Tanaka Ao",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "248056",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 180,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000359,
-            "name": "Charlie Crew",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "536119",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000360,
-            "name": "Joe Gelhardt",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "462635",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000361,
-            "name": "Darko Gyabi",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "470294",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000363,
-            "name": "Patrick Bamford",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "106617",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000364,
-            "name": "Mateo Joseph Fernández-Regatillo",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 9,
-            "team_name": "Leeds",
-            "nationality": "",
-            "photo": "565297",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Liverpool": [
-        {
-            "id": 20559,
-            "name": "Alisson Becker",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 33,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "116535",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 540,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10651,
-            "name": "Joe Gomez",
-            "position": "Left/Centre/Right Central Defender",
-            "number": 2,
-            "age": 28,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "171287",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 29,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 43586,
-            "name": "Wataru Endo",
-            "position": "Centre Defensive Midfielder",
-            "number": 3,
-            "age": 32,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 5140,
-            "name": "Virgil van Dijk",
-            "position": "Centre Central Defender",
-            "number": 4,
-            "age": 34,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "97032",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 23593,
-            "name": "Ibrahima Konaté",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 26,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "204716",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 562,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 116665,
-            "name": "Milos Kerkez",
-            "position": "Left Full Back",
-            "number": 6,
-            "age": 21,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "544877",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 510,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 75382,
-            "name": "Florian Wirtz",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 7,
-            "age": 22,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "494595",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 481,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 33231,
-            "name": "Dominik Szoboszlai",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 8,
-            "age": 24,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "424876",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 21737,
-            "name": "Alexander Isak",
-            "position": "Centre Striker",
-            "number": 9,
-            "age": 26,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "219168",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 179,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 63633,
-            "name": "Alexis Mac Allister",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 10,
-            "age": 26,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "243016",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 385,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 5178,
-            "name": "Mohamed Salah",
-            "position": "Left/Centre/Right Winger",
-            "number": 11,
-            "age": 33,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "118748",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 2,
-                "assists": 2,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 68582,
-            "name": "Conor Bradley",
-            "position": "Right Full Back",
-            "number": 12,
-            "age": 22,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "492777",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 235,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 15802,
-            "name": "Federico Chiesa",
-            "position": "Left/Centre/Right Winger",
-            "number": 14,
-            "age": 27,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "223541",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 63,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 149016,
-            "name": "Giovanni Leoni",
-            "position": "Central Defender",
-            "number": 15,
-            "age": 18,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "647681",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 23815,
-            "name": "Curtis Jones",
-            "position": "Centre Central Midfielder",
-            "number": 17,
-            "age": 24,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "206915",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 225,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 32894,
-            "name": "Cody Gakpo",
-            "position": "Centre Striker",
-            "number": 18,
-            "age": 26,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "243298",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 555,
-                "goals": 2,
-                "assists": 2,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 81542,
-            "name": "Hugo Ekitiké",
-            "position": "Centre Striker",
-            "number": 22,
-            "age": 23,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "510663",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 381,
-                "goals": 3,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10458,
-            "name": "Andy Robertson",
-            "position": "Left Full Back",
-            "number": 26,
-            "age": 31,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "122798",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 117,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10479,
-            "name": "Freddie Woodman",
-            "position": "Goalkeeper",
-            "number": 28,
-            "age": 28,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "155503",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 19919,
-            "name": "Jeremie Frimpong",
-            "position": "Right Full Back",
-            "number": 30,
-            "age": 24,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "216094",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 78,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 49909,
-            "name": "Ryan Gravenberch",
-            "position": "Centre Central Midfielder",
-            "number": 38,
-            "age": 23,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "441266",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 540,
-                "goals": 2,
-                "assists": 2,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 303753,
-            "name": "Ármin Pécsi",
-            "position": "Goalkeeper",
-            "number": 41,
-            "age": 20,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "586268",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 130665,
-            "name": "Trey Nyoni",
-            "position": "Centre Attacking Midfielder",
-            "number": 42,
-            "age": 18,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "591386",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 114296,
-            "name": "Stefan Bajcetic",
-            "position": "Centre Central Midfielder",
-            "number": 43,
-            "age": 20,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 73893,
-            "name": "Luke Chambers",
-            "position": "Left Central Defender",
-            "number": 44,
-            "age": 21,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 301543,
-            "name": "Will Wright",
-            "position": "Forward",
-            "number": 44,
-            "age": 17,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 23813,
-            "name": "Rhys Williams",
-            "position": "Centre Central Defender",
-            "number": 46,
-            "age": 24,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "219937",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 125829,
-            "name": "Calvin Ramsay",
-            "position": "Right Full Back",
-            "number": 47,
-            "age": 22,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "489580",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 70228,
-            "name": "Kaide Gordon",
-            "position": "Right Winger",
-            "number": 49,
-            "age": 21,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 129831,
-            "name": "Kieran Morrison",
-            "position": "Attacking Midfielder",
-            "number": 68,
-            "age": 18,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 134796,
-            "name": "Rio Ngumoha",
-            "position": "Left Winger",
-            "number": 73,
-            "age": 17,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "611922",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 10,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 119292,
-            "name": "Jayden Danns",
-            "position": "Centre Striker",
-            "number": 76,
-            "age": 19,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "500058",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 112473,
-            "name": "Tommy Pilling",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 21,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000367,
-            "name": "Giorgi Mamardashvili",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "449027",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 90,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000377,
-            "name": "Konstantinos Tsimikas",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "214285",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000378,
-            "name": "Amara Nallo",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "611926",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000383,
-            "name": "Luis Díaz Marulanda",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "244731",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000392,
-            "name": "Endo Wataru",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "158983",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 36,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000393,
-            "name": "Stefan Bajčetić Maquieira",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "535928",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000394,
-            "name": "James McConnell",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "491501",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000395,
-            "name": "Tyler Morton",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "440148",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000397,
-            "name": "Darwin Núñez Ribeiro",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 10,
-            "team_name": "Liverpool",
-            "nationality": "",
-            "photo": "447203",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Man City": [
-        {
-            "id": 32280,
-            "name": "James Trafford",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 22,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "432720",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 270,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 16431,
-            "name": "Rúben Dias",
-            "position": "Centre Central Defender",
-            "number": 3,
-            "age": 28,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 26335,
-            "name": "Tijjani Reijnders",
-            "position": "Centre Central Midfielder",
-            "number": 4,
-            "age": 27,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "433036",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 607,
-                "goals": 1,
-                "assists": 2,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 4505,
-            "name": "John Stones",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 31,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "97299",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 264,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 4499,
-            "name": "Nathan Aké",
-            "position": "Left/Centre Central Defender",
-            "number": 6,
-            "age": 30,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "126184",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 111,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 76216,
-            "name": "Omar Marmoush",
-            "position": "Left/Centre/Right Striker",
-            "number": 7,
-            "age": 26,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "438234",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 148,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 12520,
-            "name": "Mateo Kovacic",
-            "position": "Centre Central Midfielder",
-            "number": 8,
-            "age": 31,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "91651",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 65970,
-            "name": "Erling Haaland",
-            "position": "Centre Striker",
-            "number": 9,
-            "age": 25,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "223094",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 593,
-                "goals": 9,
-                "assists": 1,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 68150,
-            "name": "Rayan Cherki",
-            "position": "Attacking Midfielder",
-            "number": 10,
-            "age": 22,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "466052",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 70,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 54156,
-            "name": "Jérémy Doku",
-            "position": "Left/Right Winger",
-            "number": 11,
-            "age": 23,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "248875",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 385,
-                "goals": 0,
-                "assists": 4,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 4511,
-            "name": "Marcus Bettinelli",
-            "position": "Goalkeeper",
-            "number": 13,
-            "age": 33,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "122074",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 67849,
-            "name": "Nico González",
-            "position": "Central Midfielder",
-            "number": 14,
-            "age": 23,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 16286,
-            "name": "Rodri",
-            "position": "Centre Central Midfielder",
-            "number": 16,
-            "age": 29,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 47133,
-            "name": "Stefan Ortega",
-            "position": "Goalkeeper",
-            "number": 18,
-            "age": 32,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 5067,
-            "name": "Bernardo Silva",
-            "position": "Left/Centre Attacking Midfielder",
-            "number": 20,
-            "age": 31,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 71432,
-            "name": "Rayan Aït-Nouri",
-            "position": "Left Full Back",
-            "number": 21,
-            "age": 24,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "448514",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 202,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 67178,
-            "name": "Josko Gvardiol",
-            "position": "Defender",
-            "number": 24,
-            "age": 23,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "477424",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 339,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 22857,
-            "name": "Gianluigi Donnarumma",
-            "position": "Goalkeeper",
-            "number": 25,
-            "age": 26,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "204936",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 360,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 126943,
-            "name": "Savinho",
-            "position": "Right Winger",
-            "number": 26,
-            "age": 21,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 76204,
-            "name": "Matheus Nunes",
-            "position": "Centre Central Midfielder",
-            "number": 27,
-            "age": 27,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "465351",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 333,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10768,
-            "name": "Kalvin Phillips",
-            "position": "Centre Defensive Midfielder",
-            "number": 44,
-            "age": 29,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "155405",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 137371,
-            "name": "Abdukodir Khusanov",
-            "position": "Central Defender",
-            "number": 45,
-            "age": 21,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "578153",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 227,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 14805,
-            "name": "Phil Foden",
-            "position": "Centre/Right Attacking Midfielder",
-            "number": 47,
-            "age": 25,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "209244",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 352,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 66657,
-            "name": "Oscar Bobb",
-            "position": "Left/Centre/Right Winger",
-            "number": 52,
-            "age": 22,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "477555",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 360,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 141186,
-            "name": "Ryan McAidoo",
-            "position": "Left/Right Winger",
-            "number": 56,
-            "age": 17,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "616288",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 134787,
-            "name": "Kaden Braithwaite",
-            "position": "Centre Central Defender",
-            "number": 61,
-            "age": 17,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 127852,
-            "name": "Divine Mukasa",
-            "position": "Midfielder",
-            "number": 63,
-            "age": 18,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "590039",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117450,
-            "name": "Mahamadou Susoho",
-            "position": "Midfielder",
-            "number": 76,
-            "age": 20,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 99281,
-            "name": "Rico Lewis",
-            "position": "Right Full Back",
-            "number": 82,
-            "age": 20,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "477064",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 167,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 128136,
-            "name": "Stephen Mfuni",
-            "position": "Defender",
-            "number": 91,
-            "age": 17,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "566213",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 107820,
-            "name": "Callum Doyle",
-            "position": "Defender",
-            "number": 0,
-            "age": 22,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117447,
-            "name": "Tomas Galvez",
-            "position": "Left Full Back",
-            "number": 0,
-            "age": 20,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 128969,
-            "name": "Reigan Heskey",
-            "position": "Forward",
-            "number": 0,
-            "age": 17,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 120676,
-            "name": "Jaden Heskey",
-            "position": "Forward",
-            "number": 0,
-            "age": 19,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000399,
-            "name": "Ederson Santana de Moraes",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "121160",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000400,
-            "name": "Stefan Ortega Moreno",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "88248",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000404,
-            "name": "Manuel Akanji",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "211975",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000408,
-            "name": "Rúben dos Santos Gato Alves Dias",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "171314",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 545,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 10000000411,
-            "name": "Nico O'Reilly",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "472769",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 390,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 10000000412,
-            "name": "Vitor de Oliveira Nunes dos Reis",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "616222",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000415,
-            "name": "Sávio Moreira de Oliveira",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "510281",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 167,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000416,
-            "name": "Bernardo Mota Veiga de Carvalho e Silva",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "165809",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 370,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10000000420,
-            "name": "İlkay Gündoğan",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "59859",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000421,
-            "name": "Rodrigo 'Rodri' Hernandez Cascante",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "220566",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 291,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000423,
-            "name": "Nico González Iglesias",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "465694",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 350,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10000000425,
-            "name": "Claudio Echeverri",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "575204",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000428,
-            "name": "Sverre Nypan",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 11,
-            "team_name": "Man City",
-            "nationality": "",
-            "photo": "566164",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Man Utd": [
-        {
-            "id": 71744,
-            "name": "Altay Bayindir",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 27,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "451302",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 540,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 24252,
-            "name": "Diogo Dalot",
-            "position": "Right Full Back",
-            "number": 2,
-            "age": 26,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "216051",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 335,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 33245,
-            "name": "Noussair Mazraoui",
-            "position": "Right Full Back",
-            "number": 3,
-            "age": 27,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "230001",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 130,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 20226,
-            "name": "Matthijs de Ligt",
-            "position": "Centre Central Defender",
-            "number": 4,
-            "age": 26,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "209365",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 9566,
-            "name": "Harry Maguire",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 32,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "95658",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 180,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 67191,
-            "name": "Lisandro Martínez",
-            "position": "Central Defender",
-            "number": 6,
-            "age": 27,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "221820",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 14580,
-            "name": "Mason Mount",
-            "position": "Centre Attacking Midfielder",
-            "number": 7,
-            "age": 26,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "184341",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 271,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 23396,
-            "name": "Bruno Fernandes",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 8,
-            "age": 31,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "141746",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 626,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 51202,
-            "name": "Matheus Cunha",
-            "position": "Left/Centre Second Striker",
-            "number": 10,
-            "age": 26,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 50848,
-            "name": "Joshua Zirkzee",
-            "position": "Centre Striker",
-            "number": 11,
-            "age": 24,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "458249",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 74,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 23581,
-            "name": "Tyrell Malacia",
-            "position": "Left Full Back",
-            "number": 12,
-            "age": 26,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "222690",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 146567,
-            "name": "Patrick Dorgu",
-            "position": "Left Full Back",
-            "number": 13,
-            "age": 20,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "596777",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 470,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 118591,
-            "name": "Leny Yoro",
-            "position": "Centre Central Defender",
-            "number": 15,
-            "age": 19,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "550864",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 449,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 69176,
-            "name": "Amad Diallo",
-            "position": "Right Winger",
-            "number": 16,
-            "age": 23,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "493250",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 446,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 5793,
-            "name": "Casemiro",
-            "position": "Centre Central Midfielder",
-            "number": 18,
-            "age": 33,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 0,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 66360,
-            "name": "Bryan Mbeumo",
-            "position": "Right Winger",
-            "number": 19,
-            "age": 26,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "446008",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 595,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 2933,
-            "name": "Tom Heaton",
-            "position": "Goalkeeper",
-            "number": 22,
-            "age": 39,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "21205",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 4608,
-            "name": "Luke Shaw",
-            "position": "Left Full Back",
-            "number": 23,
-            "age": 30,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "106760",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 605,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 118031,
-            "name": "Manuel Ugarte",
-            "position": "Centre Defensive Midfielder",
-            "number": 25,
-            "age": 24,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "232112",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 240,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 133114,
-            "name": "Ayden Heaven",
-            "position": "Left Full Back",
-            "number": 26,
-            "age": 19,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "606745",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 3,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 66036,
-            "name": "Benjamin Sesko",
-            "position": "Striker",
-            "number": 30,
-            "age": 22,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "485711",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 384,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 67910,
-            "name": "Senne Lammens",
-            "position": "Goalkeeper",
-            "number": 31,
-            "age": 23,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "465247",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 90,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 129833,
-            "name": "Chido Obi",
-            "position": "Centre Striker",
-            "number": 32,
-            "age": 17,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "596047",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117564,
-            "name": "Tyler Fredricson",
-            "position": "Centre Central Defender",
-            "number": 33,
-            "age": 20,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "547676",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 304191,
-            "name": "Diego León",
-            "position": "Left Full Back",
-            "number": 35,
-            "age": 18,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 108936,
-            "name": "Kobbie Mainoo",
-            "position": "Centre Central Midfielder",
-            "number": 37,
-            "age": 20,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "516895",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 113,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117565,
-            "name": "Sonny Aljofree",
-            "position": "Defender",
-            "number": 0,
-            "age": 20,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000432,
-            "name": "André Onana",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "202641",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000433,
-            "name": "Elyh Harrison",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "588555",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000435,
-            "name": "Dermot Mee",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "461537",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000439,
-            "name": "Diego León Blanco",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "661712",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000445,
-            "name": "Harry Amass",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "577974",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000450,
-            "name": "Matheus Santos Carneiro da Cunha",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "430871",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 351,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000451,
-            "name": "Marcus Rashford",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "176297",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000454,
-            "name": "Antony dos Santos",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "467169",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000457,
-            "name": "Carlos Henrique Casimiro",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "61256",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 330,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000460,
-            "name": "Toby Collyer",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "490881",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000461,
-            "name": "Jayce Fitzgerald",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "556639",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000462,
-            "name": "Jack Fletcher",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "547037",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000463,
-            "name": "Sékou Koné",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "618873",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000464,
-            "name": "Jack Moorhouse",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "559684",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000465,
-            "name": "Rasmus Højlund",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "497894",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000468,
-            "name": "Ethan Wheatley",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 12,
-            "team_name": "Man Utd",
-            "nationality": "",
-            "photo": "575034",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Newcastle": [
-        {
-            "id": 10079,
-            "name": "Nick Pope",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 33,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "98747",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 5
-            }
-        },
-        {
-            "id": 3905,
-            "name": "Kieran Trippier",
-            "position": "Right Full Back",
-            "number": 2,
-            "age": 35,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "77794",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 429,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 108922,
-            "name": "Lewis Hall",
-            "position": "Left Full Back",
-            "number": 3,
-            "age": 21,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "487838",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 133,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 49908,
-            "name": "Sven Botman",
-            "position": "Central Defender",
-            "number": 4,
-            "age": 25,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "220237",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 338,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 5220,
-            "name": "Fabian Schär",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 33,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "119471",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 350,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 9257,
-            "name": "Jamaal Lascelles",
-            "position": "Centre Central Defender",
-            "number": 6,
-            "age": 31,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "101148",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 19,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 20607,
-            "name": "Joelinton",
-            "position": "Left Central Midfielder",
-            "number": 7,
-            "age": 29,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 71623,
-            "name": "Sandro Tonali",
-            "position": "Centre Defensive Midfielder",
-            "number": 8,
-            "age": 25,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "432422",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 605,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 5
-            }
-        },
-        {
-            "id": 117497,
-            "name": "Yoane Wissa",
-            "position": "Centre Striker",
-            "number": 9,
-            "age": 29,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "216646",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 23747,
-            "name": "Anthony Gordon",
-            "position": "Winger",
-            "number": 10,
-            "age": 24,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "232826",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 272,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 14716,
-            "name": "Harvey Barnes",
-            "position": "Left/Right Winger",
-            "number": 11,
-            "age": 27,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "201666",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 314,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 124462,
-            "name": "Malick Thiaw",
-            "position": "Defender",
-            "number": 12,
-            "age": 24,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "465642",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 272,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 66494,
-            "name": "Emil Krafth",
-            "position": "Right Full Back",
-            "number": 17,
-            "age": 31,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "111773",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 114590,
-            "name": "William Osula",
-            "position": "Centre Striker",
-            "number": 18,
-            "age": 22,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "538207",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 160,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 49259,
-            "name": "Anthony Elanga",
-            "position": "Left Winger",
-            "number": 20,
-            "age": 23,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "449434",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 326,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 49495,
-            "name": "Tino Livramento",
-            "position": "Right Full Back",
-            "number": 21,
-            "age": 22,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "441191",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 526,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 5
-            }
-        },
-        {
-            "id": 9662,
-            "name": "Jacob Murphy",
-            "position": "Left/Right Winger",
-            "number": 23,
-            "age": 30,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "114243",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 309,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 2896,
-            "name": "John Ruddy",
-            "position": "Goalkeeper",
-            "number": 26,
-            "age": 38,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 115256,
-            "name": "Nick Woltemade",
-            "position": "Second Striker",
-            "number": 27,
-            "age": 23,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "470313",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 303,
-                "goals": 3,
-                "assists": 0,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 14446,
-            "name": "Joe Willock",
-            "position": "Centre Attacking Midfielder",
-            "number": 28,
-            "age": 26,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "200089",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 86,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 8321,
-            "name": "Mark Gillespie",
-            "position": "Goalkeeper",
-            "number": 29,
-            "age": 33,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "81441",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 31883,
-            "name": "Harrison Ashby",
-            "position": "Right Full Back",
-            "number": 30,
-            "age": 23,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "441024",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 64145,
-            "name": "Max Thompson",
-            "position": "Goalkeeper",
-            "number": 31,
-            "age": 21,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 8707,
-            "name": "Dan Burn",
-            "position": "Centre Central Defender",
-            "number": 33,
-            "age": 33,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "78916",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 5
-            }
-        },
-        {
-            "id": 127659,
-            "name": "Alex Murphy",
-            "position": "Left Full Back",
-            "number": 37,
-            "age": 21,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "545477",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 74761,
-            "name": "Bruno Guimarães",
-            "position": "Centre Defensive Midfielder",
-            "number": 39,
-            "age": 27,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 0,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 19888,
-            "name": "Jacob Ramsey",
-            "position": "Left/Centre Winger",
-            "number": 41,
-            "age": 24,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "232653",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 59,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 304679,
-            "name": "Park Seung-Soo",
-            "position": "Left Winger",
-            "number": 64,
-            "age": 18,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117647,
-            "name": "Lewis Miley",
-            "position": "Midfielder",
-            "number": 67,
-            "age": 19,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "547719",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 167,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000472,
-            "name": "Odysseas Vlachodimos",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "111452",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000483,
-            "name": "Miodrag Pivaš",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "578512",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000484,
-            "name": "Matt Targett",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "169359",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000488,
-            "name": "Bruno Guimarães Rodriguez Moura",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "208706",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 540,
-                "goals": 2,
-                "assists": 1,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 10000000490,
-            "name": "Joelinton Cássio Apolinário de Lira",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "180974",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 401,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 10000000492,
-            "name": "Antoñito Cordero Campillo",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "640108",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000495,
-            "name": "Isaac Hayden",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "153127",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000496,
-            "name": "Garang Kuol",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "564510",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000498,
-            "name": "Joe White",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "461484",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000501,
-            "name": "Sean Neave",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "599303",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000674,
-            "name": "Aaron Ramsdale",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "225321",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000689,
-            "name": "Seung-Soo Park",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 23,
-            "team_name": "Newcastle",
-            "nationality": "",
-            "photo": "623110",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Nott'm Forest": [
-        {
-            "id": 23811,
-            "name": "Neco Williams",
-            "position": "Right Full Back",
-            "number": 3,
-            "age": 24,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "215136",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 67510,
-            "name": "Morato",
-            "position": "Centre Central Defender",
-            "number": 4,
-            "age": 24,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 139648,
-            "name": "Murillo",
-            "position": "Left/Centre Central Defender",
-            "number": 5,
-            "age": 23,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 108816,
-            "name": "Ibrahim Sangaré",
-            "position": "Centre Central Midfielder",
-            "number": 6,
-            "age": 27,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "210462",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 351,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 23702,
-            "name": "Callum Hudson-Odoi",
-            "position": "Left Winger",
-            "number": 7,
-            "age": 24,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "209046",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 395,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 51593,
-            "name": "Elliot Anderson",
-            "position": "Centre Central Midfielder",
-            "number": 8,
-            "age": 22,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "215379",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 15340,
-            "name": "Taiwo Awoniyi",
-            "position": "Centre Striker",
-            "number": 9,
-            "age": 28,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "210156",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 15259,
-            "name": "Morgan Gibbs-White",
-            "position": "Centre Central Midfielder",
-            "number": 10,
-            "age": 25,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "222531",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 551,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 3756,
-            "name": "Chris Wood",
-            "position": "Centre Striker",
-            "number": 11,
-            "age": 33,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "60689",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 522,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 141639,
-            "name": "John Victor",
-            "position": "Goalkeeper",
-            "number": 13,
-            "age": 29,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 50623,
-            "name": "Dan Ndoye",
-            "position": "Left/Right Winger",
-            "number": 14,
-            "age": 24,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "456512",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 493,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 68219,
-            "name": "Arnaud Kalimuendo",
-            "position": "Centre Striker",
-            "number": 15,
-            "age": 23,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "465680",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 65,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 115172,
-            "name": "Nicolás Domínguez",
-            "position": "Centre Central Midfielder",
-            "number": 16,
-            "age": 27,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "250199",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 45,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 15269,
-            "name": "Angus Gunn",
-            "position": "Goalkeeper",
-            "number": 18,
-            "age": 29,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "107265",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 304123,
-            "name": "Igor Jesus",
-            "position": "Striker",
-            "number": 19,
-            "age": 24,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 98300,
-            "name": "Omari Hutchinson",
-            "position": "Forward",
-            "number": 21,
-            "age": 21,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "503301",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 52,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 14238,
-            "name": "Ryan Yates",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 22,
-            "age": 27,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "204968",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 88,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 304238,
-            "name": "Jair Cunha",
-            "position": "Central Defender",
-            "number": 23,
-            "age": 20,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 49270,
-            "name": "James McAtee",
-            "position": "Centre/Right Attacking Midfielder",
-            "number": 24,
-            "age": 22,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "432714",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 126,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 16723,
-            "name": "Matz Sels",
-            "position": "Goalkeeper",
-            "number": 26,
-            "age": 33,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "85633",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 138137,
-            "name": "Dilane Bakwa",
-            "position": "Centre Striker",
-            "number": 29,
-            "age": 23,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "476887",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 172,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 16204,
-            "name": "Willy Boly",
-            "position": "Centre Central Defender",
-            "number": 30,
-            "age": 34,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "90585",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 16035,
-            "name": "Nikola Milenkovic",
-            "position": "Centre Central Defender",
-            "number": 31,
-            "age": 27,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "227444",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10439,
-            "name": "Ola Aina",
-            "position": "Right Full Back",
-            "number": 34,
-            "age": 29,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "159506",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 270,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 70249,
-            "name": "Nicolò Savona",
-            "position": "Right Full Back",
-            "number": 37,
-            "age": 22,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "500151",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 143,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117754,
-            "name": "Zach Abbott",
-            "position": "Centre Central Defender",
-            "number": 44,
-            "age": 19,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "549067",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000012,
-            "name": "Oleksandr Zinchenko",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "206325",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 180,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000503,
-            "name": "Carlos Miguel dos Santos Pereira",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "475123",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000504,
-            "name": "Matt Turner",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "224068",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000506,
-            "name": "Murillo Costa dos Santos",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "575476",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 306,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000509,
-            "name": "David Mota Veiga Teixeira do Carmo",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "451432",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000510,
-            "name": "Jair Paula da Cunha Filho",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "575458",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 90,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000511,
-            "name": "Felipe Rodrigues da Silva",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "485047",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 346,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000512,
-            "name": "Omar Richards",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "204822",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000518,
-            "name": "João Pedro Ferreira da Silva",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "510500",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 11,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000520,
-            "name": "Lewis O'Brien",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "243345",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000523,
-            "name": "Eric da Silva Moreira",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "569014",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000524,
-            "name": "Marko Stamenić",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "495161",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000526,
-            "name": "Igor Jesus Maciel da Cruz",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "482973",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 101,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000699,
-            "name": "Douglas Luiz Soares de Paulo",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "230046",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 75,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000715,
-            "name": "John Victor Maciel Furtado",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "221389",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000729,
-            "name": "Luis Eduardo Soares da Silva",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 15,
-            "team_name": "Nott'm Forest",
-            "nationality": "",
-            "photo": "560441",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Sunderland": [
-        {
-            "id": 23899,
-            "name": "Anthony Patterson",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 25,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "232571",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 51609,
-            "name": "Dennis Cirkin",
-            "position": "Left Full Back",
-            "number": 3,
-            "age": 23,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "461195",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 35731,
-            "name": "Dan Neil",
-            "position": "Centre Central Midfielder",
-            "number": 4,
-            "age": 23,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "223336",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 1,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 19864,
-            "name": "Dan Ballard",
-            "position": "Centre Central Defender",
-            "number": 5,
-            "age": 26,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "223827",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 219,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 68210,
-            "name": "Timothée Pembélé",
-            "position": "Right Full Back",
-            "number": 6,
-            "age": 23,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "465702",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 118633,
-            "name": "Chemsdine Talbi",
-            "position": "Left/Right Winger",
-            "number": 7,
-            "age": 20,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "549912",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 501,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 4
-            }
-        },
-        {
-            "id": 67784,
-            "name": "Brian Brobbey",
-            "position": "Forward",
-            "number": 9,
-            "age": 23,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "441264",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 57,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 119614,
-            "name": "Chris Rigg",
-            "position": "Centre Central Midfielder",
-            "number": 11,
-            "age": 18,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "554197",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 96,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 126920,
-            "name": "Eliezer Mayenda",
-            "position": "Centre Striker",
-            "number": 12,
-            "age": 20,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "564406",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 243,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10361,
-            "name": "Luke O'Nien",
-            "position": "Centre Central Midfielder",
-            "number": 13,
-            "age": 30,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "167512",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 51610,
-            "name": "Romaine Mundle",
-            "position": "Right Winger",
-            "number": 14,
-            "age": 22,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "461199",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 66659,
-            "name": "Omar Alderete",
-            "position": "Central Defender",
-            "number": 15,
-            "age": 28,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "201895",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 577,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 66499,
-            "name": "Blondy Nna Noukeu",
-            "position": "Goalkeeper",
-            "number": 16,
-            "age": 24,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "490000",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 128863,
-            "name": "Abdoullah Ba",
-            "position": "Central Midfielder",
-            "number": 17,
-            "age": 22,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "477851",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 63733,
-            "name": "Reinildo Mandava",
-            "position": "Left Full Back",
-            "number": 17,
-            "age": 31,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "434399",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 392,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 52989,
-            "name": "Wilson Isidor",
-            "position": "Centre Striker",
-            "number": 18,
-            "age": 25,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "437505",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 377,
-                "goals": 3,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 126110,
-            "name": "Habib Diarra",
-            "position": "Defensive Midfielder",
-            "number": 19,
-            "age": 21,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "547027",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 345,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 51199,
-            "name": "Nordi Mukiele",
-            "position": "Right Full Back",
-            "number": 20,
-            "age": 27,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "200834",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 450,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 4727,
-            "name": "Simon Moore",
-            "position": "Goalkeeper",
-            "number": 21,
-            "age": 35,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "74854",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 75692,
-            "name": "Robin Roefs",
-            "position": "Goalkeeper",
-            "number": 22,
-            "age": 22,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "498016",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 126317,
-            "name": "Simon Adingra",
-            "position": "Left Winger",
-            "number": 24,
-            "age": 23,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "535818",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 271,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10394,
-            "name": "Bertrand Traoré",
-            "position": "Left/Right Winger",
-            "number": 25,
-            "age": 30,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "110504",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 88,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 11284,
-            "name": "Arthur Masuaku",
-            "position": "Left Full Back",
-            "number": 26,
-            "age": 31,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "105717",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 125,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 69750,
-            "name": "Jay Matete",
-            "position": "Centre Central Midfielder",
-            "number": 27,
-            "age": 24,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "493837",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 124944,
-            "name": "Noah Sadiki",
-            "position": "Central Midfielder",
-            "number": 27,
-            "age": 20,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "577669",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 623,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 138104,
-            "name": "Enzo Le Fée",
-            "position": "Midfielder",
-            "number": 28,
-            "age": 25,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "484420",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 375,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 134829,
-            "name": "Ahmed Abdullahi",
-            "position": "Forward",
-            "number": 29,
-            "age": 21,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "611975",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 122126,
-            "name": "Trai Hume",
-            "position": "Right Full Back",
-            "number": 32,
-            "age": 23,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "487676",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 618,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 112246,
-            "name": "Leo Hjelde",
-            "position": "Centre Central Defender",
-            "number": 33,
-            "age": 22,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "477547",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 12136,
-            "name": "Granit Xhaka",
-            "position": "Central Defender",
-            "number": 34,
-            "age": 33,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "84450",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 3,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 19929,
-            "name": "Ian Poveda",
-            "position": "Right Winger",
-            "number": 36,
-            "age": 25,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "215460",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 107812,
-            "name": "Zak Johnson",
-            "position": "Right Full Back",
-            "number": 41,
-            "age": 21,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "514613",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 20053,
-            "name": "Aji Alese",
-            "position": "Centre Central Defender",
-            "number": 42,
-            "age": 24,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "220684",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 23742,
-            "name": "Joe Anderson",
-            "position": "Centre Central Defender",
-            "number": 45,
-            "age": 24,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "232820",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117521,
-            "name": "Harrison Jones",
-            "position": "Attacking Midfielder",
-            "number": 50,
-            "age": 20,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "547410",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 20077,
-            "name": "Jenson Jones",
-            "position": "Defender",
-            "number": 51,
-            "age": 19,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 145417,
-            "name": "Jaydon Jones",
-            "position": "Midfielder",
-            "number": 52,
-            "age": 18,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 124383,
-            "name": "Jack Whittaker",
-            "position": "Midfielder",
-            "number": 53,
-            "age": 18,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117518,
-            "name": "Ben Middlemas",
-            "position": "Centre Central Midfielder",
-            "number": 55,
-            "age": 20,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 135764,
-            "name": "Tymur Tutierov",
-            "position": "Centre Striker",
-            "number": 57,
-            "age": 20,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000537,
-            "name": "Niall Huggins",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "492066",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000542,
-            "name": "Jenson Seelt",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "519634",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 133,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000545,
-            "name": "Patrick Roberts",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "124165",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 27,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000546,
-            "name": "Milan Aleksić",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "626844",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000555,
-            "name": "Alan Browne",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "171422",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000556,
-            "name": "Pierre Ekwah Elimby",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "458297",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000559,
-            "name": "Nectarios Triantis",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "500696",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000563,
-            "name": "Luís Hemir Silva Semedo",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "551153",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000564,
-            "name": "Nazarii Rusyn",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "440955",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000724,
-            "name": "Lutsharel Geertruida",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 29,
-            "team_name": "Sunderland",
-            "nationality": "",
-            "photo": "247955",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 57,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "Spurs": [
-        {
-            "id": 71923,
-            "name": "Guglielmo Vicario",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 29,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "184254",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 69070,
-            "name": "Radu Dragusin",
-            "position": "Left/Centre/Right Central Defender",
-            "number": 3,
-            "age": 23,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "493125",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 25892,
-            "name": "Kevin Danso",
-            "position": "Centre Central Defender",
-            "number": 4,
-            "age": 27,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "135720",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 16,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 69274,
-            "name": "Xavi Simons",
-            "position": "Attacking Midfielder",
-            "number": 7,
-            "age": 22,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "493362",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 249,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 50245,
-            "name": "Yves Bissouma",
-            "position": "Centre Central Midfielder",
-            "number": 8,
-            "age": 29,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "227127",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 24630,
-            "name": "Richarlison",
-            "position": "Left/Centre/Right Second Striker",
-            "number": 9,
-            "age": 28,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 3,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 8456,
-            "name": "James Maddison",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 10,
-            "age": 28,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "172780",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 76614,
-            "name": "Mathys Tel",
-            "position": "Forward",
-            "number": 11,
-            "age": 20,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "511499",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 175,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 126824,
-            "name": "Destiny Udogie",
-            "position": "Left Full Back",
-            "number": 13,
-            "age": 22,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "487053",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 301,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117596,
-            "name": "Archie Gray",
-            "position": "Central Midfielder",
-            "number": 14,
-            "age": 19,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "547701",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 71,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 133603,
-            "name": "Lucas Bergvall",
-            "position": "Central Midfielder",
-            "number": 15,
-            "age": 19,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "570526",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 363,
-                "goals": 1,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 66635,
-            "name": "Cristian Romero",
-            "position": "Centre Central Defender",
-            "number": 17,
-            "age": 27,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "221632",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 10443,
-            "name": "Dominic Solanke",
-            "position": "Striker",
-            "number": 19,
-            "age": 28,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "154566",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 31,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 51364,
-            "name": "Mohammed Kudus",
-            "position": "Midfielder",
-            "number": 20,
-            "age": 25,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "460842",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 618,
-                "goals": 1,
-                "assists": 5,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 49316,
-            "name": "Dejan Kulusevski",
-            "position": "Right Winger",
-            "number": 21,
-            "age": 25,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "445044",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 49374,
-            "name": "Brennan Johnson",
-            "position": "Centre Striker",
-            "number": 22,
-            "age": 24,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "242898",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 266,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 32229,
-            "name": "Pedro Porro",
-            "position": "Right Full Back",
-            "number": 23,
-            "age": 26,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "441164",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 545,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 23764,
-            "name": "Djed Spence",
-            "position": "Right Full Back",
-            "number": 24,
-            "age": 25,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "232859",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 403,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 125524,
-            "name": "Kota Takai",
-            "position": "Defender",
-            "number": 25,
-            "age": 21,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 118579,
-            "name": "Wilson Odobert",
-            "position": "Left Winger",
-            "number": 28,
-            "age": 20,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "550839",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 236,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117318,
-            "name": "Pape Matar Sarr",
-            "position": "Centre Central Midfielder",
-            "number": 29,
-            "age": 23,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "482442",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 374,
-                "goals": 1,
-                "assists": 2,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 22802,
-            "name": "Rodrigo Bentancur",
-            "position": "Centre Central Midfielder",
-            "number": 30,
-            "age": 28,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "202993",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 410,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 123998,
-            "name": "Antonín Kinsky",
-            "position": "Goalkeeper",
-            "number": 31,
-            "age": 22,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "485055",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 4408,
-            "name": "Ben Davies",
-            "position": "Left Full Back",
-            "number": 33,
-            "age": 32,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "115556",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 75582,
-            "name": "Micky van de Ven",
-            "position": "Central Defender",
-            "number": 37,
-            "age": 24,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "491279",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 619,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 3
-            }
-        },
-        {
-            "id": 15114,
-            "name": "Brandon Austin",
-            "position": "Goalkeeper",
-            "number": 40,
-            "age": 26,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "214572",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 66570,
-            "name": "Dane Scarlett",
-            "position": "Centre Striker",
-            "number": 44,
-            "age": 21,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "490145",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 127846,
-            "name": "Callum Olusesi",
-            "position": "Midfielder",
-            "number": 52,
-            "age": 18,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "499726",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 145986,
-            "name": "Tynan Thompson",
-            "position": "Winger",
-            "number": 54,
-            "age": 17,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 134786,
-            "name": "Malachi Hardy",
-            "position": "Centre Central Defender",
-            "number": 66,
-            "age": 17,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 146050,
-            "name": "Jun'ai Byfield",
-            "position": "Centre Central Defender",
-            "number": 67,
-            "age": 16,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 134791,
-            "name": "Lucá Williams-Barnett",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 68,
-            "age": 17,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000576,
-            "name": "Ashley Phillips",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "548308",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000577,
-            "name": "Takai Kōta",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "553299",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000578,
-            "name": "Luka Vušković",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "610799",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000579,
-            "name": "Son Heung-min",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "85971",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000589,
-            "name": "Manor Solomon",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "235674",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000590,
-            "name": "Bryan Gil Salvatierra",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "436234",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000592,
-            "name": "Mikey Moore",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "499721",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000594,
-            "name": "Yang Min-hyeok",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "623095",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000597,
-            "name": "Richarlison de Andrade",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "212319",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 453,
-                "goals": 3,
-                "assists": 1,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10000000598,
-            "name": "Will Lankshear",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "552427",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000673,
-            "name": "João Maria Lobo Alves Palhares Costa Palhinha Gonçalves",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "154296",
-            "is_starter": True,
-            "stats": {
-                "appearances": 6,
-                "starts": 6,
-                "minutes": 513,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 10000000726,
-            "name": "Randal Kolo Muani",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 21,
-            "team_name": "Spurs",
-            "nationality": "",
-            "photo": "247693",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ],
-    "West Ham": [
-        {
-            "id": 118083,
-            "name": "Mads Hermansen",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 25,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "467189",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 360,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 13815,
-            "name": "Kyle Walker-Peters",
-            "position": "Left/Right Full Back",
-            "number": 2,
-            "age": 28,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "158534",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 391,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 13522,
-            "name": "Maximilian Kilman",
-            "position": "Left/Centre Central Defender",
-            "number": 3,
-            "age": 28,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "214048",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 65961,
-            "name": "Crysencio Summerville",
-            "position": "Left Winger",
-            "number": 7,
-            "age": 23,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "450070",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 311,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 4617,
-            "name": "James Ward-Prowse",
-            "position": "Central Midfielder",
-            "number": 8,
-            "age": 30,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "101178",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 414,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 8454,
-            "name": "Callum Wilson",
-            "position": "Striker",
-            "number": 9,
-            "age": 33,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "75115",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 170,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 55776,
-            "name": "Lucas Paquetá",
-            "position": "Centre Attacking Midfielder",
-            "number": 10,
-            "age": 28,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 42569,
-            "name": "Niclas Füllkrug",
-            "position": "Centre Striker",
-            "number": 11,
-            "age": 32,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "91889",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 379,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 145347,
-            "name": "El Hadji Malick Diouf",
-            "position": "Midfielder",
-            "number": 12,
-            "age": 20,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "613804",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 0,
-                "assists": 4,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 32638,
-            "name": "Konstantinos Mavropanos",
-            "position": "Centre Central Defender",
-            "number": 15,
-            "age": 27,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "233963",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 450,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 146354,
-            "name": "Luis Guilherme",
-            "position": "Left/Right Winger",
-            "number": 17,
-            "age": 19,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 119072,
-            "name": "Mateus Fernandes",
-            "position": "Centre Central Midfielder",
-            "number": 18,
-            "age": 21,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 8868,
-            "name": "Jarrod Bowen",
-            "position": "Centre Striker",
-            "number": 20,
-            "age": 28,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "178186",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 630,
-                "goals": 3,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 3309,
-            "name": "Lukasz Fabianski",
-            "position": "Goalkeeper",
-            "number": 22,
-            "age": 40,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "37096",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 5748,
-            "name": "Alphonse Areola",
-            "position": "Goalkeeper",
-            "number": 23,
-            "age": 32,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "84182",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 270,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 40159,
-            "name": "Guido Rodríguez",
-            "position": "Centre Defensive Midfielder",
-            "number": 24,
-            "age": 31,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "197024",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 70,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 63656,
-            "name": "Jean-Clair Todibo",
-            "position": "Centre Central Defender",
-            "number": 25,
-            "age": 25,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "462116",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 126,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 122005,
-            "name": "Soungoutou Magassa",
-            "position": "Centre Defensive Midfielder",
-            "number": 27,
-            "age": 22,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "564940",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 159,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 25183,
-            "name": "Tomás Soucek",
-            "position": "Centre Defensive Midfielder",
-            "number": 28,
-            "age": 30,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "215439",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 231,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 14164,
-            "name": "Aaron Wan-Bissaka",
-            "position": "Right Full Back",
-            "number": 29,
-            "age": 27,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "214590",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 258,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 117579,
-            "name": "Ollie Scarles",
-            "position": "Left Full Back",
-            "number": 30,
-            "age": 19,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "536109",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 66560,
-            "name": "Freddie Potts",
-            "position": "Centre Defensive Midfielder",
-            "number": 32,
-            "age": 22,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "490142",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 105,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 110117,
-            "name": "George Earthy",
-            "position": "Attacking Midfielder",
-            "number": 40,
-            "age": 21,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "490885",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 122149,
-            "name": "Callum Marshall",
-            "position": "Centre Striker",
-            "number": 50,
-            "age": 20,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "565431",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 29,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 140459,
-            "name": "Daniel Cummings",
-            "position": "Forward",
-            "number": 0,
-            "age": 19,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 138518,
-            "name": "Inès Belloumou",
-            "position": "Defender",
-            "number": 0,
-            "age": 24,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 304548,
-            "name": "Ruby Warwick",
-            "position": "Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000149,
-            "name": "Igor Julio dos Santos de Paulo",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "223434",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 1,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000601,
-            "name": "Wes Foderingham",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "82143",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000602,
-            "name": "Krisztián Hegyi",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "483364",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000604,
-            "name": "Emerson Palmieri dos Santos",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "109533",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000607,
-            "name": "Nayef Aguerd",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "210494",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 180,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000611,
-            "name": "Kaelan Casey",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "518438",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000612,
-            "name": "Lucas Tolentino Coelho de Lima",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "224024",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 607,
-                "goals": 2,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000616,
-            "name": "Edson Álvarez Velázquez",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "213999",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000617,
-            "name": "Maxwel Cornet",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "149519",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000619,
-            "name": "Luis Guilherme Lira dos Santos",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "577114",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 54,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000621,
-            "name": "Andy Irving",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "229384",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 25,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000622,
-            "name": "Lewis Orford",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "518442",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000708,
-            "name": "Mateus Gonçalo Espanha Fernandes",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 25,
-            "team_name": "West Ham",
-            "nationality": "",
-            "photo": "551226",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 398,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        }
-    ],
-    "Wolves": [
-        {
-            "id": 15715,
-            "name": "José Sá",
-            "position": "Goalkeeper",
-            "number": 1,
-            "age": 32,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 4229,
-            "name": "Matt Doherty",
-            "position": "Right Full Back",
-            "number": 2,
-            "age": 33,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "87835",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 225,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 66692,
-            "name": "Hugo Bueno",
-            "position": "Left Full Back",
-            "number": 3,
-            "age": 23,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 43010,
-            "name": "Santiago Bueno",
-            "position": "Centre Central Defender",
-            "number": 4,
-            "age": 26,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 0,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 76310,
-            "name": "Marshall Munetsi",
-            "position": "Central Midfielder",
-            "number": 5,
-            "age": 29,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "433312",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 519,
-                "goals": 0,
-                "assists": 2,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 136815,
-            "name": "David Møller Wolfe",
-            "position": "Left Full Back",
-            "number": 6,
-            "age": 23,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "497949",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 144,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 143214,
-            "name": "André",
-            "position": "Centre Defensive Midfielder",
-            "number": 7,
-            "age": 24,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 133679,
-            "name": "João Gomes",
-            "position": "Centre Central Midfielder",
-            "number": 8,
-            "age": 24,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 35670,
-            "name": "Jørgen Strand Larsen",
-            "position": "Striker",
-            "number": 9,
-            "age": 25,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "247412",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 362,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 2
-            }
-        },
-        {
-            "id": 143218,
-            "name": "Jhon Arias",
-            "position": "Attacking Midfielder",
-            "number": 10,
-            "age": 28,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "230376",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 357,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 20337,
-            "name": "Hwang Hee-Chan",
-            "position": "Centre Striker",
-            "number": 11,
-            "age": 29,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "184754",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 275,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 110203,
-            "name": "Emmanuel Agbadou",
-            "position": "Centre Central Defender",
-            "number": 12,
-            "age": 28,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "516939",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 525,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 115371,
-            "name": "Tolu Arokodare",
-            "position": "Striker",
-            "number": 14,
-            "age": 24,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "488213",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 162,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 115114,
-            "name": "Yerson Mosquera",
-            "position": "Centre Central Defender",
-            "number": 15,
-            "age": 24,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "501837",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 137,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 108947,
-            "name": "Rodrigo Gomes",
-            "position": "Left/Right Wing Back",
-            "number": 21,
-            "age": 22,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "483081",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 165,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 69766,
-            "name": "Tawanda Chirewa",
-            "position": "Left/Centre/Right Attacking Midfielder",
-            "number": 23,
-            "age": 21,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "497606",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 92635,
-            "name": "Toti Gomes",
-            "position": "Centre Central Defender",
-            "number": 24,
-            "age": 26,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "510362",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 390,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 9651,
-            "name": "Dan Bentley",
-            "position": "Goalkeeper",
-            "number": 25,
-            "age": 32,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "79602",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 52951,
-            "name": "Ki-Jana Hoever",
-            "position": "Right Full Back",
-            "number": 26,
-            "age": 23,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "441271",
-            "is_starter": False,
-            "stats": {
-                "appearances": 2,
-                "starts": 2,
-                "minutes": 106,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 126108,
-            "name": "Jean-Ricner Bellegarde",
-            "position": "Centre Central Midfielder",
-            "number": 27,
-            "age": 27,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "231057",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 252,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 303861,
-            "name": "Fer López",
-            "position": "Right Winger",
-            "number": 28,
-            "age": 21,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 139644,
-            "name": "Enso González",
-            "position": "Forward",
-            "number": 30,
-            "age": 20,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 4331,
-            "name": "Sam Johnstone",
-            "position": "Goalkeeper",
-            "number": 31,
-            "age": 32,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "101982",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 270,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 145492,
-            "name": "Mateus Mané",
-            "position": "Centre Striker",
-            "number": 36,
-            "age": 18,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 111988,
-            "name": "Jackson Tchatchoua",
-            "position": "Right Full Back",
-            "number": 38,
-            "age": 24,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "523705",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 355,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000628,
-            "name": "José Malheiro de Sá",
-            "position": "Goalkeeper",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "149065",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 360,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000633,
-            "name": "Hugo Bueno López",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "490721",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 438,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000636,
-            "name": "Santiago Ignacio Bueno",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "231480",
-            "is_starter": False,
-            "stats": {
-                "appearances": 3,
-                "starts": 3,
-                "minutes": 304,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000639,
-            "name": "Bastien Meupiyou Menadjou",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "560248",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000640,
-            "name": "Pedro Cardoso de Lima",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "641221",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000641,
-            "name": "Alfie Pond",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "517179",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000643,
-            "name": "André Trindade da Costa Neto",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "509291",
-            "is_starter": False,
-            "stats": {
-                "appearances": 5,
-                "starts": 5,
-                "minutes": 442,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000645,
-            "name": "Fer López González",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "643135",
-            "is_starter": False,
-            "stats": {
-                "appearances": 1,
-                "starts": 1,
-                "minutes": 102,
-                "goals": 0,
-                "assists": 1,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000646,
-            "name": "João Victor Gomes da Silva",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "448089",
-            "is_starter": True,
-            "stats": {
-                "appearances": 7,
-                "starts": 7,
-                "minutes": 603,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 1
-            }
-        },
-        {
-            "id": 10000000647,
-            "name": "Gonçalo Manuel Ganchinho Guedes",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "181284",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000649,
-            "name": "Boubacar Traoré",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "476502",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000651,
-            "name": "Tom Edozie",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "596054",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000652,
-            "name": "Enso González Medina",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "593001",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000653,
-            "name": "Joe Hodge",
-            "position": "Central Midfielder",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "240299",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000655,
-            "name": "Fábio Soares Silva",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "449988",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000656,
-            "name": "Saša Kalajdžić",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "429414",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 14,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000657,
-            "name": "Leon Chiwome",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "589507",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000658,
-            "name": "Nathan Fraser",
-            "position": "Striker",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "531363",
-            "is_starter": False,
-            "stats": {
-                "appearances": 0,
-                "starts": 0,
-                "minutes": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        },
-        {
-            "id": 10000000709,
-            "name": "Ladislav Krejcí",
-            "position": "Central Defender",
-            "number": 0,
-            "age": 0,
-            "team_id": 38,
-            "team_name": "Wolves",
-            "nationality": "",
-            "photo": "431248",
-            "is_starter": False,
-            "stats": {
-                "appearances": 4,
-                "starts": 4,
-                "minutes": 360,
-                "goals": 1,
-                "assists": 0,
-                "clean_sheets": 0
-            }
-        }
-    ]
-}
+import json
+import os
+import threading
+import unicodedata
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+SQUAD_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'squad_data.json')
+
+
+def normalize_name(name: str) -> str:
+    """
+    이름 비교용 정규화 (악센트 제거, 대소문자 무시, 공백 정리)
+
+    예: "Joško  Gvardiol" → "josko gvardiol"
+    """
+    decomposed = unicodedata.normalize('NFKD', name or '')
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return ' '.join(stripped.casefold().split())
+
+
+class SquadStore(Mapping):
+    """
+    팀별 선수 명단 (읽기 전용 Mapping: 팀 이름 → 선수 dict 리스트)
+
+    thread-safe. 반환되는 선수 dict/리스트는 공유 객체이므로 수정하지 않는다.
+    """
+
+    def __init__(self, path: str = SQUAD_DATA_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._metadata: Dict = {}
+        self._teams: Dict[str, List[Dict]] = {}
+        self._by_id: Dict[int, Dict] = {}
+        self._team_by_id: Dict[int, str] = {}
+        self._by_name: Dict[str, List[Dict]] = {}
+
+    # ------------------------------------------------------------------
+    # Mapping 인터페이스
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, team_name: str) -> List[Dict]:
+        self._ensure_loaded()
+        return self._teams[team_name]
+
+    def __iter__(self) -> Iterator[str]:
+        self._ensure_loaded()
+        return iter(self._teams)
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._teams)
+
+    # ------------------------------------------------------------------
+    # 인덱스 조회
+    # ------------------------------------------------------------------
+
+    @property
+    def metadata(self) -> Dict:
+        """생성 시각, 시즌, 데이터 소스"""
+        self._ensure_loaded()
+        return dict(self._metadata)
+
+    def get_player(self, player_id: int) -> Optional[Dict]:
+        """선수 ID로 선수 조회 (없으면 None)"""
+        self._ensure_loaded()
+        return self._by_id.get(player_id)
+
+    def team_of(self, player_id: int) -> Optional[str]:
+        """선수 ID가 속한 팀 이름 (없으면 None)"""
+        self._ensure_loaded()
+        return self._team_by_id.get(player_id)
+
+    def find_by_name(self, name: str, team_name: Optional[str] = None) -> List[Dict]:
+        """
+        정규화된 이름이 같은 선수들
+
+        Args:
+            name: 선수 이름 (악센트/대소문자 무시)
+            team_name: 지정하면 해당 팀 선수만
+        """
+        self._ensure_loaded()
+        players = self._by_name.get(normalize_name(name), [])
+        if team_name is not None:
+            players = [p for p in players if self._team_by_id.get(p.get('id')) == team_name]
+        return list(players)
+
+    # ------------------------------------------------------------------
+    # 로드 / 갱신
+    # ------------------------------------------------------------------
+
+    def reload(self):
+        """다음 접근 시 파일을 다시 읽도록 표시"""
+        with self._lock:
+            self._loaded = False
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            with open(self.path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+            self._build(document)
+            self._loaded = True
+
+    def _build(self, document: Dict):
+        teams = document.get('teams', {})
+        by_id, team_by_id, by_name = {}, {}, {}
+        for team_name, players in teams.items():
+            for player in players:
+                player_id = player.get('id')
+                # ID가 중복되면 먼저 나온 팀을 사용 (기존 선형 탐색과 동일)
+                if player_id not in by_id:
+                    by_id[player_id] = player
+                    team_by_id[player_id] = team_name
+                by_name.setdefault(normalize_name(player.get('name', '')), []).append(player)
+
+        self._metadata = {key: value for key, value in document.items() if key != 'teams'}
+        self._teams = teams
+        self._by_id = by_id
+        self._team_by_id = team_by_id
+        self._by_name = by_name
+
+
+SQUAD_DATA = SquadStore()
+
+
+def save_squad_data(squad_data: Dict[str, List[Dict]],
+                    source: str = '',
+                    season: Optional[str] = None,
+                    path: Optional[str] = None) -> str:
+    """
+    선수 명단을 JSON으로 저장하고 SQUAD_DATA 갱신
+
+    임시 파일에 쓴 뒤 교체하므로 다른 워커가 읽는 도중 깨진 파일을 보지 않는다.
+
+    Args:
+        squad_data: {팀 이름: [선수 dict, ...]}
+        source: 데이터 소스 설명
+        season: 시즌 (예: "2025-26")
+        path: 저장 경로 (기본: squad_data.json)
+
+    Returns:
+        저장한 파일 경로
+    """
+    path = path or SQUAD_DATA.path
+    document = {
+        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'season': season,
+        'source': source,
+        'teams': squad_data,
+    }
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+    if os.path.abspath(path) == os.path.abspath(SQUAD_DATA.path):
+        SQUAD_DATA.reload()
+    return path
+
 
 def get_squad(team_name):
     """팀 이름으로 선수 명단 가져오기"""
     return SQUAD_DATA.get(team_name, [])
 
+
 def get_all_teams():
     """모든 팀 이름 리스트"""
     return list(SQUAD_DATA.keys())
@@ -10,7 +10,8 @@ import time
 import logging
 import os
 import json
-from datetime import datetime
+
+from data.squad_data import save_squad_data
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -241,38 +242,17 @@ class SquadScraper:
 
         return all_squads
 
-    def export_to_python_file(self, all_squads, output_file='../data/squad_data.py'):
+    def export_squad_data(self, all_squads, output_file=None):
         """
-        수집한 선수 데이터를 Python 파일로 저장
+        수집한 선수 데이터를 squad_data.json으로 저장
 
         Args:
             all_squads: get_all_squads()의 결과
-            output_file: 저장할 파일 경로
+            output_file: 저장할 파일 경로 (기본: data/squad_data.json)
         """
-        logger.info(f"Exporting squad data to {output_file}")
-
-        output_path = os.path.join(os.path.dirname(__file__), output_file)
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('"""\n')
-            f.write('EPL 전체 팀 선수 명단\n')
-            f.write(f'자동 생성됨: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n')
-            f.write('"""\n\n')
-            f.write('SQUAD_DATA = {\n')
-
-            for team_name, players in sorted(all_squads.items()):
-                f.write(f"    '{team_name}': [\n")
-                for player in players:
-                    f.write('        {\n')
-                    for key, value in player.items():
-                        if isinstance(value, str):
-                            f.write(f"            '{key}': '{value}',\n")
-                        else:
-                            f.write(f"            '{key}': {value},\n")
-                    f.write('        },\n')
-                f.write('    ],\n')
-
-            f.write('}\n')
+        logger.info("Exporting squad data")
+
+        output_path = save_squad_data(dict(sorted(all_squads.items())), source='FBref', path=output_file)
 
         logger.info(f"✅ Squad data exported to {output_path}")
 
@@ -291,4 +271,4 @@ if __name__ == '__main__':
     # 전체 팀 수집 (주석 처리 - 필요 시 실행)
     # print("\nCollecting all teams...")
     # all_squads = scraper.get_all_squads(use_cache=False)
-    # scraper.export_to_python_file(all_squads)
+    # scraper.export_squad_data(all_squads)
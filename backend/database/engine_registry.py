@@ -0,0 +1,175 @@
+"""
+SQLAlchemy Engine Registry
+URL별 engine/sessionmaker를 프로세스 전체에서 하나씩 공유
+
+create_engine은 호출마다 새 커넥션 풀을 만들고 dialect 초기화를 다시 하므로
+요청/선수 단위로 호출하면 지연과 파일 디스크립터 낭비가 커진다.
+여기서는 URL을 키로 engine을 한 번만 만들고 이후 재사용한다.
+
+SQLite 파일 DB는 연결마다 WAL 등 pragma를 적용해 읽기와 쓰기가
+서로 막지 않도록 한다 (동시 시뮬레이션 중 평점 저장 등).
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Generator, Optional, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
+
+logger = logging.getLogger(__name__)
+
+
+# 풀 설정 (환경변수로 조정)
+POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '3600'))
+
+# SQLite 연결마다 적용하는 pragma
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',        # 읽기/쓰기 동시 진행
+    'synchronous': 'NORMAL',      # WAL에서 안전한 수준, fsync 횟수 감소
+    'busy_timeout': '5000',       # 쓰기 잠금 대기 (ms)
+}
+
+_engines: Dict[str, Engine] = {}
+_sessionmakers: Dict[Tuple[str, bool, bool], sessionmaker] = {}
+_lock = threading.Lock()
+
+
+def sqlite_url(db_path: str) -> str:
+    """파일 경로 → SQLite URL (상대 경로는 현재 작업 디렉토리 기준으로 고정)"""
+    if db_path == ':memory:':
+        return 'sqlite://'
+    return f'sqlite:///{os.path.abspath(db_path)}'
+
+
+def _is_sqlite_file(url: str) -> bool:
+    return url.startswith('sqlite') and url not in ('sqlite://', 'sqlite:///:memory:')
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+    except Exception as e:
+        # 읽기 전용 파일 등: pragma 없이 계속 사용
+        logger.warning(f"Could not apply SQLite pragmas: {e}")
+    finally:
+        cursor.close()
+
+
+def _warn_if_missing(url: str) -> None:
+    """SQLite는 없는 파일에 연결하면 빈 DB를 만들므로, 경로 설정 오류를 로그로 남긴다"""
+    database = make_url(url).database
+    if database and not os.path.exists(database):
+        logger.warning(f"SQLite database not found, an empty one will be created: {database}")
+
+
+def get_engine(url: str,
+               pool_size: Optional[int] = None,
+               max_overflow: Optional[int] = None,
+               pool_recycle: Optional[int] = None,
+               echo: bool = False) -> Engine:
+    """
+    URL별 공유 engine (최초 호출 시 생성)
+
+    풀 설정은 engine을 처음 만들 때만 적용된다.
+
+    Args:
+        url: SQLAlchemy URL
+        pool_size: 풀 크기 (None이면 DB_POOL_SIZE)
+        max_overflow: 초과 허용 연결 수 (None이면 DB_MAX_OVERFLOW)
+        pool_recycle: 연결 재생성 주기 초 (None이면 DB_POOL_RECYCLE)
+        echo: SQL 로깅
+    """
+    engine = _engines.get(url)
+    if engine is not None:
+        return engine
+
+    with _lock:
+        engine = _engines.get(url)
+        if engine is not None:
+            return engine
+
+        options = {'echo': echo, 'pool_pre_ping': True}
+        if url.startswith('sqlite') and not _is_sqlite_file(url):
+            # 메모리 DB: SQLAlchemy 기본 SingletonThreadPool 유지
+            options['connect_args'] = {'check_same_thread': False}
+        else:
+            options.update(
+                pool_size=POOL_SIZE if pool_size is None else pool_size,
+                max_overflow=MAX_OVERFLOW if max_overflow is None else max_overflow,
+                pool_recycle=POOL_RECYCLE if pool_recycle is None else pool_recycle
+            )
+            if url.startswith('sqlite'):
+                # 풀의 연결이 여러 스레드에서 재사용되므로 스레드 검사 해제
+                options['connect_args'] = {'check_same_thread': False}
+
+        if _is_sqlite_file(url):
+            _warn_if_missing(url)
+
+        engine = create_engine(url, **options)
+        if _is_sqlite_file(url):
+            event.listen(engine, 'connect', _apply_sqlite_pragmas)
+
+        _engines[url] = engine
+        logger.info(f"Created database engine: {engine.url!r}")
+        return engine
+
+
+def get_sessionmaker(url: str, autoflush: bool = True, expire_on_commit: bool = False,
+                     **engine_options) -> sessionmaker:
+    """
+    URL + 세션 옵션별 공유 sessionmaker (engine은 URL별로 하나)
+
+    autoflush: 쿼리 전에 pending 변경을 자동 flush (SQLAlchemy 기본값)
+    expire_on_commit=False: commit/close 후에도 조회한 객체의 속성을 읽을 수 있음
+    """
+    key = (url, autoflush, expire_on_commit)
+    factory = _sessionmakers.get(key)
+    if factory is None:
+        engine = get_engine(url, **engine_options)
+        with _lock:
+            factory = _sessionmakers.get(key)
+            if factory is None:
+                factory = sessionmaker(bind=engine, autoflush=autoflush,
+                                       expire_on_commit=expire_on_commit)
+                _sessionmakers[key] = factory
+    return factory
+
+
+@contextmanager
+def session_scope(url: str, autoflush: bool = True, expire_on_commit: bool = False,
+                  **engine_options) -> Generator[Session, None, None]:
+    """
+    세션 컨텍스트: 정상 종료 시 commit, 예외 시 rollback, 항상 close
+
+    autoflush/expire_on_commit은 get_sessionmaker와 같음
+
+    Usage:
+        with session_scope(sqlite_url(DB_PATH)) as session:
+            session.query(Player).all()
+    """
+    session = get_sessionmaker(url, autoflush, expire_on_commit, **engine_options)()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def dispose_engines():
+    """모든 engine의 풀 정리 (테스트/프로세스 fork 후)"""
+    with _lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _sessionmakers.clear()
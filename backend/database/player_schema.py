@@ -2,12 +2,15 @@
 선수 분석 플랫폼을 위한 데이터베이스 스키마
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import relationship
+from contextlib import contextmanager
 from datetime import datetime
 import os
 
+from database.engine_registry import get_engine, get_sessionmaker, session_scope, sqlite_url
+
 Base = declarative_base()
 
 
@@ -111,21 +114,16 @@ class PositionAttribute(Base):
 # 데이터베이스 초기화 함수
 def init_player_db(db_path='player_analysis.db'):
     """데이터베이스 초기화"""
-    # 환경 변수에서 DATABASE_URL 확인 (PostgreSQL)
-    database_url = os.getenv('DATABASE_URL')
-    if database_url:
-        engine = create_engine(database_url, echo=False)
-    else:
-        # Fallback to SQLite
-        engine = create_engine(f'sqlite:///{db_path}', echo=False)
+    # 환경 변수에서 DATABASE_URL 확인 (PostgreSQL), 없으면 SQLite
+    engine = get_engine(os.getenv('DATABASE_URL') or sqlite_url(db_path))
 
     Base.metadata.create_all(engine)
     return engine
 
 
-def get_player_session(db_path='player_analysis.db'):
+def player_database_url(db_path='player_analysis.db'):
     """
-    세션 생성 (SQLite 또는 PostgreSQL)
+    선수 DB URL (SQLite 또는 PostgreSQL)
 
     IMPORTANT: db_path 파라미터가 제공되면 DATABASE_URL 환경변수보다 우선순위가 높음
     """
@@ -135,16 +133,31 @@ def get_player_session(db_path='player_analysis.db'):
     # 환경 변수에서 DATABASE_URL 확인 (명시적 경로가 없을 때만)
     database_url = os.getenv('DATABASE_URL') if not is_explicit_path else None
 
-    if database_url and not is_explicit_path:
-        # PostgreSQL 연결
-        engine = create_engine(database_url, echo=False)
-    else:
-        # SQLite 연결 (로컬 개발)
-        connection_string = f'sqlite:///{db_path}'
-        engine = create_engine(connection_string, echo=False)
+    # PostgreSQL 또는 SQLite (로컬 개발)
+    return database_url or sqlite_url(db_path)
+
+
+def get_player_session(db_path='player_analysis.db'):
+    """
+    세션 생성 (SQLite 또는 PostgreSQL)
+
+    engine/커넥션 풀은 URL별로 프로세스 전체에서 공유된다 (database.engine_registry).
+    호출자가 session.close()로 연결을 풀에 반환해야 한다.
+    """
+    return get_sessionmaker(player_database_url(db_path))()
+
 
-    Session = sessionmaker(bind=engine)
-    return Session()
+@contextmanager
+def player_session_scope(db_path='player_analysis.db'):
+    """
+    세션 컨텍스트 (정상 종료 시 commit, 예외 시 rollback, 항상 close)
+
+    Usage:
+        with player_session_scope(DB_PATH) as session:
+            player = session.query(Player).filter_by(id=player_id).first()
+    """
+    with session_scope(player_database_url(db_path)) as session:
+        yield session
 
 
 def init_position_attributes(session):
@@ -0,0 +1,53 @@
+"""
+Cache Codec
+
+Compact binary serialization for cache values.
+
+Payloads are tagged with one leading byte so readers can tell the format:
+msgpack for plain data (dicts, lists, str, bytes, numbers, bool, None) and
+pickle for values msgpack cannot represent (datetime, dataclasses, ...), or
+for everything when msgpack is not installed.
+"""
+import pickle
+from typing import Any
+
+try:
+    import msgpack
+except ImportError:  # optional: every value falls back to pickle
+    msgpack = None
+
+# Codec tags (first byte of every encoded payload)
+TAG_MSGPACK = b'm'
+TAG_PICKLE = b'p'
+
+
+def encode(value: Any) -> bytes:
+    """
+    Serialize value to tagged bytes
+
+    msgpack round-trips dicts (including int keys), lists, str, bytes, numbers,
+    bool and None; tuples come back as lists.
+    """
+    if msgpack is not None:
+        try:
+            return TAG_MSGPACK + msgpack.packb(value, use_bin_type=True)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return TAG_PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode(payload: bytes) -> Any:
+    """
+    Inverse of encode()
+
+    Raises:
+        ValueError: Unknown tag, or msgpack payload without msgpack installed
+    """
+    tag, body = payload[:1], payload[1:]
+    if tag == TAG_MSGPACK:
+        if msgpack is None:
+            raise ValueError("msgpack payload but msgpack is not installed")
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+    if tag == TAG_PICKLE:
+        return pickle.loads(body)
+    raise ValueError(f"Unknown cache payload tag: {tag!r}")
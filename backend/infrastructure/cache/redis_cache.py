@@ -11,6 +11,7 @@ import redis
 from redis import Redis
 
 from config.settings import get_settings
+from infrastructure.cache import codec
 
 
 class CacheKeyStrategy:
@@ -98,13 +99,35 @@ class RedisCache:
         """Check if caching is enabled"""
         return self._settings.cache.enabled
 
+    @staticmethod
+    def _serialize(value: Any, serializer: str):
+        if serializer == 'json':
+            return json.dumps(value)
+        elif serializer == 'pickle':
+            return pickle.dumps(value)
+        elif serializer == 'msgpack':
+            return codec.encode(value)
+        else:
+            return str(value)
+
+    @staticmethod
+    def _deserialize(value: bytes, deserializer: str) -> Any:
+        if deserializer == 'json':
+            return json.loads(value)
+        elif deserializer == 'pickle':
+            return pickle.loads(value)
+        elif deserializer == 'msgpack':
+            return codec.decode(value)
+        else:
+            return value.decode('utf-8')
+
     def get(self, key: str, deserializer: str = 'json') -> Optional[Any]:
         """
         Get value from cache
 
         Args:
             key: Cache key
-            deserializer: Deserialization method ('json' or 'pickle')
+            deserializer: Deserialization method ('json', 'pickle' or 'msgpack')
 
         Returns:
             Cached value or None if not found
@@ -117,12 +140,7 @@ class RedisCache:
             if value is None:
                 return None
 
-            if deserializer == 'json':
-                return json.loads(value)
-            elif deserializer == 'pickle':
-                return pickle.loads(value)
-            else:
-                return value.decode('utf-8')
+            return self._deserialize(value, deserializer)
 
         except Exception as e:
             print(f"Cache get error for key {key}: {e}")
@@ -142,7 +160,7 @@ class RedisCache:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds. If None, uses default TTL.
-            serializer: Serialization method ('json' or 'pickle')
+            serializer: Serialization method ('json', 'pickle' or 'msgpack')
 
         Returns:
             True if successful, False otherwise
@@ -151,12 +169,7 @@ class RedisCache:
             return False
 
         try:
-            if serializer == 'json':
-                serialized = json.dumps(value)
-            elif serializer == 'pickle':
-                serialized = pickle.dumps(value)
-            else:
-                serialized = str(value)
+            serialized = self._serialize(value, serializer)
 
             if ttl is None:
                 ttl = self._settings.cache.default_ttl
@@ -307,12 +320,7 @@ class RedisCache:
 
             for key, value in zip(keys, values):
                 if value is not None:
-                    if deserializer == 'json':
-                        result[key] = json.loads(value)
-                    elif deserializer == 'pickle':
-                        result[key] = pickle.loads(value)
-                    else:
-                        result[key] = value.decode('utf-8')
+                    result[key] = self._deserialize(value, deserializer)
 
             return result
 
@@ -344,12 +352,7 @@ class RedisCache:
             pipe = self._redis.pipeline()
 
             for key, value in mapping.items():
-                if serializer == 'json':
-                    serialized = json.dumps(value)
-                elif serializer == 'pickle':
-                    serialized = pickle.dumps(value)
-                else:
-                    serialized = str(value)
+                serialized = self._serialize(value, serializer)
 
                 if ttl is None:
                     ttl = self._settings.cache.default_ttl
@@ -364,18 +367,38 @@ class RedisCache:
             return False
 
 
+_function_cache = None
+
+
+def get_function_cache():
+    """
+    Shared TieredCache (in-process LRU + Redis) backing @cached
+
+    Created on first use so importing this module does not connect to Redis.
+    """
+    global _function_cache
+    if _function_cache is None:
+        from infrastructure.cache.tiered_cache import TieredCache
+        _function_cache = TieredCache.from_settings('functions')
+    return _function_cache
+
+
 def cached(
     key_func: Callable,
     ttl: Optional[int] = None,
-    serializer: str = 'pickle'
+    serializer: str = 'msgpack'
 ):
     """
     Decorator to cache function results
 
+    Results are served from the shared in-process tier first, then Redis.
+    Concurrent misses for the same key run the function once.
+
     Args:
         key_func: Function to generate cache key from function arguments
         ttl: Time to live in seconds
-        serializer: Serialization method ('json' or 'pickle')
+        serializer: Kept for compatibility; values use the msgpack codec
+            (with pickle fallback for types msgpack can't represent)
 
     Example:
         >>> @cached(
@@ -388,26 +411,12 @@ def cached(
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            cache = RedisCache()
-
-            if not cache.enabled:
-                return func(*args, **kwargs)
+            cache = get_function_cache()
 
             # Generate cache key
             cache_key = key_func(*args, **kwargs)
 
-            # Try to get from cache
-            cached_value = cache.get(cache_key, deserializer=serializer)
-            if cached_value is not None:
-                return cached_value
-
-            # Execute function
-            result = func(*args, **kwargs)
-
-            # Store in cache
-            cache.set(cache_key, result, ttl=ttl, serializer=serializer)
-
-            return result
+            return cache.get_or_set(cache_key, lambda: func(*args, **kwargs), ttl=ttl)
 
         return wrapper
     return decorator
@@ -431,8 +440,8 @@ def invalidate_cache(*keys: str):
         def wrapper(*args, **kwargs):
             result = func(*args, **kwargs)
 
-            # Invalidate cache after successful execution
-            cache = RedisCache()
+            # Invalidate cache after successful execution (both tiers)
+            cache = get_function_cache()
             for key in keys:
                 if '*' in key:
                     cache.delete_pattern(key)
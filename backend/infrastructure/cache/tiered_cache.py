@@ -0,0 +1,334 @@
+"""
+Tiered Cache
+
+Two-level cache: a bounded in-process LRU/TTL tier in front of Redis.
+
+- Local hits return the stored Python object directly (no network round trip,
+  no deserialization). Values are shared between callers and must not be mutated.
+- Redis hits are decoded once and promoted into the local tier.
+- Values are stored in Redis with the compact msgpack codec (see codec.py).
+- get_or_set coalesces concurrent misses for the same key into one computation
+  (single-flight), so an expired hot key does not trigger a stampede.
+- Hit/miss/latency counters are kept in CacheStats.
+"""
+import fnmatch
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Same prefix as CacheKeyStrategy (redis_cache is imported lazily: it loads settings)
+KEY_PREFIX = "epl_predictor"
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss/latency counters (approximate under concurrency)"""
+    local_hits: int = 0
+    remote_hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    coalesced: int = 0
+    remote_errors: int = 0
+    remote_gets: int = 0
+    remote_get_seconds: float = 0.0
+    computes: int = 0
+    compute_seconds: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.local_hits + self.remote_hits + self.misses
+        return (self.local_hits + self.remote_hits) / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        stats = asdict(self)
+        stats['hit_ratio'] = round(self.hit_ratio, 4)
+        stats['avg_remote_get_ms'] = round(1000 * self.remote_get_seconds / self.remote_gets, 3) if self.remote_gets else 0.0
+        stats['avg_compute_ms'] = round(1000 * self.compute_seconds / self.computes, 3) if self.computes else 0.0
+        return stats
+
+
+class LocalTier:
+    """
+    Bounded in-process LRU with per-entry expiry (thread-safe)
+
+    Expired entries are dropped when read, and swept every max_entries writes
+    so keys that are never read again do not pin memory.
+    """
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl, value)
+            self._entries.move_to_end(key)
+            self._writes += 1
+            if self._writes >= self.max_entries:
+                self._writes = 0
+                self._purge_expired()
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_pattern(self, pattern: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _purge_expired(self):
+        now = self.clock()
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TieredCache:
+    """
+    In-process LRU/TTL tier + Redis tier
+
+    Usage:
+        cache = TieredCache.from_settings('simulation', ttl=3600)
+        key = cache.key('match', home, away)
+        value = cache.get_or_set(key, lambda: expensive(home, away))
+
+        @cache.memoize(ttl=600)
+        def load(team_id): ...
+
+    None is treated as "not cached" and is never stored.
+    """
+
+    def __init__(self,
+                 namespace: str,
+                 redis_cache=None,
+                 ttl: int = 300,
+                 local_ttl: Optional[float] = None,
+                 max_entries: int = 1024,
+                 remote_retry_after: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize tiered cache
+
+        Args:
+            namespace: Key namespace (keys live under "epl_predictor:<namespace>:")
+            redis_cache: RedisCache instance (None for in-process only)
+            ttl: Default time to live in seconds
+            local_ttl: Max lifetime of a local entry. Defaults to ttl without Redis,
+                and to min(ttl, 60) with Redis so deletes from other processes propagate.
+            max_entries: Local tier capacity
+            remote_retry_after: Seconds to bypass Redis after a failed write
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.namespace = namespace
+        self.prefix = f"{KEY_PREFIX}:{namespace}"
+        self.redis_cache = redis_cache
+        self.ttl = ttl
+        if local_ttl is None:
+            local_ttl = ttl if redis_cache is None else min(ttl, 60)
+        self.local_ttl = local_ttl
+        self.local = LocalTier(max_entries, clock=clock)
+        self.remote_retry_after = remote_retry_after
+        self.clock = clock
+        self.stats = CacheStats()
+
+        self._remote_down_until = 0.0
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, namespace: str, **kwargs) -> 'TieredCache':
+        """Use the configured Redis as second tier (in-process only if unavailable)"""
+        try:
+            from infrastructure.cache.redis_cache import RedisCache
+            redis_cache = RedisCache()
+            if not redis_cache.enabled:
+                redis_cache = None
+        except Exception as e:
+            logger.warning(f"[TieredCache:{namespace}] Redis unavailable, using in-process cache only: {e}")
+            redis_cache = None
+        return cls(namespace, redis_cache=redis_cache, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def key(self, *parts: Any) -> str:
+        """Namespaced key from parts (e.g. cache.key('match', 12) -> 'epl_predictor:ns:match:12')"""
+        return f"{self.prefix}:{':'.join(str(part) for part in parts)}"
+
+    def digest_key(self, *parts: Any) -> str:
+        """Namespaced key from a stable digest of arbitrary JSON-able parts"""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=repr)
+        return self.key(hashlib.sha256(payload.encode('utf-8')).hexdigest())
+
+    # ------------------------------------------------------------------
+    # Operations
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Cached value or default"""
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        """Store value in both tiers (None is ignored)"""
+        if value is None:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        self.local.set(key, value, min(ttl, self.local_ttl))
+        self.stats.sets += 1
+
+        if self._remote_available():
+            if not self.redis_cache.set(key, value, ttl=ttl, serializer='msgpack'):
+                self._mark_remote_down(f"write failed for {key}")
+
+    def delete(self, key: str):
+        """Remove key from both tiers"""
+        self.local.delete(key)
+        if self._remote_available():
+            self.redis_cache.delete(key)
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Remove keys matching a glob pattern (e.g. "epl_predictor:ns:player:*") from both tiers"""
+        deleted = self.local.delete_pattern(pattern)
+        if self._remote_available():
+            deleted = max(deleted, self.redis_cache.delete_pattern(pattern))
+        return deleted
+
+    def clear(self):
+        """Remove every key in this namespace"""
+        self.local.clear()
+        if self._remote_available():
+            self.redis_cache.delete_pattern(f"{self.prefix}:*")
+
+    def get_or_set(self, key: str, compute: Callable[[], Any], ttl: Optional[int] = None) -> Any:
+        """
+        Cached value, or compute() once and cache it
+
+        Concurrent callers missing the same key wait for the first caller's
+        computation instead of running their own. If compute raises, every
+        waiting caller receives the exception and nothing is cached.
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            self.stats.coalesced += 1
+            return future.result()
+
+        try:
+            # Another leader may have finished between our lookup and taking the slot
+            value = self.local.get(key)
+            if value is _MISSING:
+                started = time.perf_counter()
+                value = compute()
+                self.stats.computes += 1
+                self.stats.compute_seconds += time.perf_counter() - started
+                self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def memoize(self, ttl: Optional[int] = None, key_func: Optional[Callable[..., str]] = None):
+        """
+        Decorator caching a function's result via get_or_set
+
+        Args:
+            ttl: Time to live (default: cache ttl)
+            key_func: Builds the key from the call arguments
+                (default: digest of function name + arguments)
+        """
+        def decorator(func):
+            name = f"{func.__module__}.{func.__qualname__}"
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                key = key_func(*args, **kwargs) if key_func else self.digest_key(name, args, kwargs)
+                return self.get_or_set(key, lambda: func(*args, **kwargs), ttl=ttl)
+
+            wrapper.cache = self
+            return wrapper
+        return decorator
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _lookup(self, key: str) -> Any:
+        value = self.local.get(key)
+        if value is not _MISSING:
+            self.stats.local_hits += 1
+            return value
+
+        if self._remote_available():
+            started = time.perf_counter()
+            value = self.redis_cache.get(key, deserializer='msgpack')
+            self.stats.remote_gets += 1
+            self.stats.remote_get_seconds += time.perf_counter() - started
+            if value is not None:
+                self.stats.remote_hits += 1
+                self.local.set(key, value, self.local_ttl)
+                return value
+
+        self.stats.misses += 1
+        return _MISSING
+
+    def _remote_available(self) -> bool:
+        return self.redis_cache is not None and self.clock() >= self._remote_down_until
+
+    def _mark_remote_down(self, reason: str):
+        self.stats.remote_errors += 1
+        self._remote_down_until = self.clock() + self.remote_retry_after
+        logger.warning(f"[TieredCache:{self.namespace}] Redis {reason}; "
+                       f"using in-process tier for {self.remote_retry_after:.0f}s")
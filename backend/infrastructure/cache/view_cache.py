@@ -0,0 +1,77 @@
+"""
+View Cache
+
+Flask response caching on top of TieredCache (replaces Flask-Caching's
+@cache.cached on API views).
+
+Only 200 responses are cached. The body, status and headers are stored as
+plain data, so Redis holds them as msgpack and local hits rebuild the
+response without unpickling. A non-200 response belongs to the request that
+rendered it; requests coalesced onto that render run the view themselves.
+"""
+import hashlib
+from functools import wraps
+from typing import Optional
+
+from flask import current_app, request
+
+from infrastructure.cache.tiered_cache import TieredCache
+
+# Recomputed by the response class on every rebuild
+_SKIPPED_HEADERS = frozenset({'content-length'})
+
+
+class _Uncacheable(Exception):
+    """Carries a non-200 response out of get_or_set so it is not stored"""
+
+    def __init__(self, response):
+        super().__init__(response.status_code)
+        self.response = response
+
+
+def view_key(cache: TieredCache, query_string: bool = False) -> str:
+    """Cache key for the current request (path, plus sorted query args if requested)"""
+    if not query_string:
+        return cache.key('view', request.path)
+    args = sorted(request.args.items(multi=True))
+    digest = hashlib.md5(repr(args).encode('utf-8')).hexdigest()
+    return cache.key('view', request.path, digest)
+
+
+def cached_view(cache: TieredCache, ttl: Optional[int] = None, query_string: bool = False):
+    """
+    Decorator caching a Flask view's response
+
+    Concurrent requests for the same uncached key render the view once.
+
+    Args:
+        cache: TieredCache to store responses in
+        ttl: Time to live in seconds (default: cache ttl)
+        query_string: Include query arguments in the key
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            rendered = False
+
+            def render():
+                nonlocal rendered
+                rendered = True
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code != 200 or response.direct_passthrough:
+                    raise _Uncacheable(response)
+                headers = [[name, value] for name, value in response.headers.items()
+                           if name.lower() not in _SKIPPED_HEADERS]
+                return [response.get_data(), response.status_code, headers]
+
+            try:
+                body, status, headers = cache.get_or_set(view_key(cache, query_string), render, ttl=ttl)
+            except _Uncacheable as e:
+                if rendered:
+                    return e.response
+                # Waited on another request's uncacheable render: never share its Response object
+                return current_app.make_response(view(*args, **kwargs))
+            return current_app.response_class(body, status=status, headers=headers)
+
+        return wrapper
+    return decorator
@@ -8,6 +8,9 @@ import numpy as np
 from datetime import datetime
 import logging
 
+from value_betting.market_scan import MarketScan, scan_markets
+from value_betting.odds_tensor import OUTCOMES
+
 logger = logging.getLogger(__name__)
 
 
@@ -197,6 +200,75 @@ class OddsAggregator:
         
         raise ValueError(f"Unknown method: {method}")
     
+    def scan_markets(self, matches: List[Dict]) -> MarketScan:
+        """
+        여러 경기 배당률을 한 번에 스캔 (신뢰도 가중치 적용)
+        
+        갱신마다 한 번 만들어 analyze_scan, ValueDetector.detect_in_scan,
+        ArbitrageFinder.find_in_scan에 같이 넘긴다.
+        """
+        return scan_markets(matches, trust_scores=self.trust_scores)
+    
+    def analyze_scan(self, scan: MarketScan) -> List[Dict]:
+        """
+        MarketScan → 경기별 분석 결과 (analyze_match_odds 형식, 입력 순서)
+        """
+        bookmakers = scan.tensor.bookmakers
+        pinnacle = scan.tensor.columns.get('pinnacle')
+        
+        # 경기별 dict 생성 전에 배열을 한 번에 파이썬 값으로 변환
+        overround = scan.overround.tolist()
+        fairest_columns = scan.fairest.tolist()
+        best_columns = scan.best_column.tolist()
+        best_values = scan.best_odds.tolist()
+        consensus = scan.consensus.tolist()
+        variance = scan.variance.tolist()
+        has_pinnacle = scan.complete[:, pinnacle].tolist() if pinnacle is not None else [False] * len(scan)
+        
+        analyses = []
+        for m, match_data in enumerate(scan.tensor.matches):
+            columns = scan.columns_of(m)
+            
+            # 1. 각 북메이커의 overround
+            overrounds = {bookmakers[c]: overround[m][c] for c in columns}
+            
+            # 2. 최저 마진 북메이커 (가장 fair한 배당률)
+            fairest = fairest_columns[m]
+            min_overround = overround[m][fairest] if fairest >= 0 else 0.0
+            
+            # 3. 최고 배당률
+            best_odds = {
+                outcome: (bookmakers[best_columns[m][o]], best_values[m][o])
+                for o, outcome in enumerate(OUTCOMES) if best_columns[m][o] >= 0
+            }
+            
+            # 4. Consensus 확률 / 5. Pinnacle 확률 (기준)
+            pinnacle_prob = None
+            if has_pinnacle[m]:
+                pinnacle_prob = dict(zip(OUTCOMES, scan.fair[m, pinnacle].tolist()))
+            
+            # 6. 배당률 분산 (북메이커들 간 의견 차이)
+            odds_variance = dict(zip(OUTCOMES, variance[m]))
+            
+            analyses.append({
+                'home_team': match_data['home_team'],
+                'away_team': match_data['away_team'],
+                'commence_time': match_data.get('commence_time'),
+                'num_bookmakers': len(columns),
+                'overrounds': overrounds,
+                'fairest_bookmaker': {
+                    'name': bookmakers[fairest] if fairest >= 0 else None,
+                    'margin': min_overround * 100  # % 형식
+                },
+                'best_odds': best_odds,
+                'consensus_probability': dict(zip(OUTCOMES, consensus[m])),
+                'pinnacle_probability': pinnacle_prob,
+                'odds_variance': odds_variance,
+                'market_efficiency': self._assess_market_efficiency(odds_variance, min_overround)
+            })
+        
+        return analyses
+
     def analyze_match_odds(
         self,
         match_data: Dict
@@ -214,70 +286,10 @@ class OddsAggregator:
         Returns:
             Dict: 분석 결과
         """
-        bookmakers = match_data['bookmakers']
-        
-        # 1. 각 북메이커의 overround 계산
-        overrounds = {}
-        for bookie, odds in bookmakers.items():
-            overrounds[bookie] = self.calculate_overround(odds)
-        
-        # 2. 최저 마진 북메이커 (가장 fair한 배당률)
-        min_overround_bookie = min(overrounds, key=overrounds.get)
-        min_overround = overrounds[min_overround_bookie]
-        
-        # 3. 최고 배당률
-        best_odds = self.get_best_odds(bookmakers)
-        
-        # 4. Consensus 확률
-        consensus_prob = self.get_consensus_probability(bookmakers, method='weighted_average')
-        
-        # 5. Pinnacle 확률 (기준)
-        pinnacle_prob = None
-        if 'pinnacle' in bookmakers:
-            pinnacle_prob = self.convert_odds_to_probability(
-                bookmakers['pinnacle'],
-                remove_overround=True
-            )
-        
-        # 6. 배당률 분산 (북메이커들 간 의견 차이)
-        odds_variance = self._calculate_odds_variance(bookmakers)
-        
-        return {
-            'home_team': match_data['home_team'],
-            'away_team': match_data['away_team'],
-            'commence_time': match_data.get('commence_time'),
-            'num_bookmakers': len(bookmakers),
-            'overrounds': overrounds,
-            'fairest_bookmaker': {
-                'name': min_overround_bookie,
-                'margin': min_overround * 100  # % 형식
-            },
-            'best_odds': best_odds,
-            'consensus_probability': consensus_prob,
-            'pinnacle_probability': pinnacle_prob,
-            'odds_variance': odds_variance,
-            'market_efficiency': self._assess_market_efficiency(odds_variance, min_overround)
-        }
-    
-    def _calculate_odds_variance(
-        self,
-        bookmakers: Dict[str, Dict[str, float]]
-    ) -> Dict[str, float]:
-        """배당률 분산 계산 (북메이커 간 의견 불일치 정도)"""
-        variance = {}
-        
-        for outcome in ['home', 'draw', 'away']:
-            odds_list = [
-                odds[outcome] for odds in bookmakers.values()
-                if outcome in odds
-            ]
-            
-            if len(odds_list) >= 2:
-                variance[outcome] = float(np.var(odds_list))
-            else:
-                variance[outcome] = 0.0
-        
-        return variance
+        analyses = self.analyze_scan(self.scan_markets([match_data]))
+        if not analyses:
+            raise ValueError(f"Invalid odds data: {match_data}")
+        return analyses[0]
     
     def _assess_market_efficiency(
         self,
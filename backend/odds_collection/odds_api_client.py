@@ -14,6 +14,8 @@ from typing import Dict, List, Optional
 from datetime import datetime
 import logging
 
+from utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,10 +33,11 @@ class OddsAPIClient:
         if not self.api_key:
             logger.warning("ODDS_API_KEY not found. Using demo mode.")
         
-        self.session = requests.Session()
-        self.session.headers.update({
+        # 공용 HTTP 클라이언트 (연결 풀 공유, 동시 요청 병합으로 API 할당량 절약)
+        self.http = get_http_client()
+        self.headers = {
             'User-Agent': 'Soccer-Predictor/1.0'
-        })
+        }
     
     def get_sports(self) -> List[Dict]:
         """
@@ -47,10 +50,7 @@ class OddsAPIClient:
         params = {'apiKey': self.api_key}
         
         try:
-            response = self.session.get(endpoint, params=params, timeout=10)
-            response.raise_for_status()
-            
-            sports = response.json()
+            sports = self.http.get_json(endpoint, params=params, headers=self.headers, timeout=10)
             logger.info(f"Fetched {len(sports)} sports")
             return sports
             
@@ -111,8 +111,7 @@ class OddsAPIClient:
         }
         
         try:
-            response = self.session.get(endpoint, params=params, timeout=15)
-            response.raise_for_status()
+            response = self.http.fetch(endpoint, params=params, headers=self.headers, timeout=15)
             
             # API 사용량 확인 (헤더에 포함됨)
             remaining = response.headers.get('x-requests-remaining')
@@ -121,7 +120,7 @@ class OddsAPIClient:
             if remaining:
                 logger.info(f"API requests: {used} used, {remaining} remaining")
             
-            odds_data = response.json()
+            odds_data = response.data
             logger.info(f"Fetched odds for {len(odds_data)} EPL matches")
             
             return odds_data
@@ -149,9 +148,7 @@ class OddsAPIClient:
         }
         
         try:
-            response = self.session.get(endpoint, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            return self.http.get_json(endpoint, params=params, headers=self.headers, timeout=10)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch match odds for {event_id}: {e}")
@@ -5,13 +5,14 @@ EPL 데이터 동기화 (정합성 체크 포함)
 - 두 API의 선수 데이터를 매칭하여 하나로 통합
 """
 import requests
-import json
 import sqlite3
-from datetime import datetime
 from difflib import SequenceMatcher
 import os
 import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data.squad_data import save_squad_data
+
 SEASON_ID = 777
 
 # 팀 이름 매핑 (Premier League → 우리 시스템)
@@ -468,14 +469,8 @@ def update_database(teams_info, all_players):
     return True
 
 def update_squad_data_file(all_players):
-    """squad_data.py 파일 업데이트"""
-    print("\n📝 squad_data.py 업데이트 중...")
-
-    output_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'data',
-        'squad_data.py'
-    )
+    """squad_data.json 파일 업데이트"""
+    print("\n📝 squad_data.json 업데이트 중...")
 
     # 팀별 선수 정렬
     squad_data = {}
@@ -487,22 +482,7 @@ def update_squad_data_file(all_players):
         ))
         squad_data[team_name] = sorted_players
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('"""\n')
-        f.write('EPL 전체 팀 선수 명단\n')
-        f.write(f'자동 생성됨: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n')
-        f.write('시즌: 2025-26\n')
-        f.write('데이터 소스: Premier League API + FPL API (정합성 매칭)\n')
-        f.write('"""\n\n')
-        json_str = json.dumps(squad_data, indent=4, ensure_ascii=False)
-        json_str = json_str.replace(': true', ': True').replace(': false', ': False')
-        f.write(f'SQUAD_DATA = {json_str}\n\n')
-        f.write('def get_squad(team_name):\n')
-        f.write('    """팀 이름으로 선수 명단 가져오기"""\n')
-        f.write('    return SQUAD_DATA.get(team_name, [])\n\n')
-        f.write('def get_all_teams():\n')
-        f.write('    """모든 팀 이름 리스트"""\n')
-        f.write('    return list(SQUAD_DATA.keys())\n')
+    output_path = save_squad_data(squad_data, source='Premier League API + FPL API (정합성 매칭)', season='2025-26')
 
     print(f"   ✅ 파일 저장: {output_path}")
 
@@ -526,7 +506,7 @@ if __name__ == '__main__':
             print("\n❌ 데이터베이스 업데이트 실패")
             sys.exit(1)
 
-        # 5. squad_data.py 업데이트
+        # 5. squad_data.json 업데이트
         update_squad_data_file(all_players)
 
         # 최종 통계
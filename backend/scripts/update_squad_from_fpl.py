@@ -1,12 +1,14 @@
 """
-Fantasy Premier League API에서 실제 선수 데이터 가져와서 squad_data.py 업데이트
+Fantasy Premier League API에서 실제 선수 데이터 가져와서 squad_data.json 업데이트
 """
 import requests
-import json
 from datetime import datetime
 import os
 import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data.squad_data import save_squad_data
+
 # 2025-26 시즌 EPL 팀 (20개) - 정확한 현재 시즌 팀 목록
 CURRENT_EPL_TEAMS = {
     'Arsenal', 'Aston Villa', 'Bournemouth', 'Brentford', 'Brighton', 'Burnley',
@@ -138,30 +140,8 @@ def fetch_real_squad_data():
             starters = sum(1 for p in players if p['is_starter'])
             print(f"  {team_name:25s}: {len(players):2d} 명 (주전: {starters:2d})")
         
-        # squad_data.py 생성
-        output_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'data',
-            'squad_data.py'
-        )
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('"""\n')
-            f.write('EPL 전체 팀 선수 명단\n')
-            f.write(f'자동 생성됨: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n')
-            f.write('시즌: 2025-26\n')
-            f.write('데이터 소스: Fantasy Premier League API\n')
-            f.write('"""\n\n')
-            # JSON으로 변환 후 true/false를 True/False로 변경 (Python 호환)
-            json_str = json.dumps(squad_data, indent=4, ensure_ascii=False)
-            json_str = json_str.replace(': true', ': True').replace(': false', ': False')
-            f.write(f'SQUAD_DATA = {json_str}\n\n')
-            f.write('def get_squad(team_name):\n')
-            f.write('    """팀 이름으로 선수 명단 가져오기"""\n')
-            f.write('    return SQUAD_DATA.get(team_name, [])\n\n')
-            f.write('def get_all_teams():\n')
-            f.write('    """모든 팀 이름 리스트"""\n')
-            f.write('    return list(SQUAD_DATA.keys())\n')
+        # squad_data.json 생성
+        output_path = save_squad_data(squad_data, source='Fantasy Premier League API', season='2025-26')
         
         print("\n" + "="*60)
         print(f"✅ 파일 저장 완료: {output_path}")
@@ -3,18 +3,18 @@
 선수 로스터 자동 업데이트 스크립트
 - FBref에서 EPL 20개 팀의 선수명단 스크래핑
 - Player DB 테이블 업데이트
-- squad_data.py 파일 업데이트 (기존 코드 호환성)
+- squad_data.json 파일 업데이트 (기존 코드 호환성)
 """
 
 import sys
 import os
-from datetime import datetime
 
 # 프로젝트 루트를 경로에 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from data_collection.fbref_scraper import FBrefScraper
 from database.schema import Team, Player, get_session, init_db
+from data.squad_data import save_squad_data
 import logging
 
 logging.basicConfig(
@@ -110,52 +110,33 @@ class RosterUpdater:
         return player_count
 
     def update_squad_data_file(self):
-        """squad_data.py 파일 업데이트 (기존 코드 호환성)"""
-        logger.info("\n=== Updating squad_data.py file ===")
-
-        squad_data_path = os.path.join(
-            os.path.dirname(__file__), '..', 'data', 'squad_data.py'
-        )
+        """squad_data.json 파일 업데이트 (기존 코드 호환성)"""
+        logger.info("\n=== Updating squad_data.json file ===")
 
         # DB에서 모든 팀과 선수 정보 가져오기
         teams = self.session.query(Team).filter_by(league='EPL').all()
 
-        # squad_data.py 파일 생성
-        with open(squad_data_path, 'w', encoding='utf-8') as f:
-            f.write('"""\n')
-            f.write('EPL 전체 팀 선수 명단\n')
-            f.write(f'자동 생성됨: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n')
-            f.write('"""\n\n')
-            f.write('SQUAD_DATA = {\n')
-
-            for team in teams:
-                players = self.session.query(Player).filter_by(team_id=team.id).all()
-                if not players:
-                    continue
-
-                f.write(f"    '{team.name}': [\n")
-
-                for player in players:
-                    f.write('        {\n')
-                    f.write(f"            'id': {player.id},\n")
-                    f.write(f"            'name': '{player.name}',\n")
-                    f.write(f"            'position': '{player.position}',\n")
-                    f.write(f"            'number': {player.number if player.number else 0},\n")
-                    f.write(f"            'age': {player.age if player.age else 0},\n")
-                    f.write(f"            'nationality': '{player.nationality if player.nationality else ''}'\n")
-                    f.write('        },\n')
-
-                f.write('    ],\n\n')
-
-            f.write('}\n\n')
-            f.write('def get_squad(team_name):\n')
-            f.write('    """팀 이름으로 선수 명단 가져오기"""\n')
-            f.write('    return SQUAD_DATA.get(team_name, [])\n\n')
-            f.write('def get_all_teams():\n')
-            f.write('    """모든 팀 이름 리스트"""\n')
-            f.write('    return list(SQUAD_DATA.keys())\n')
-
-        logger.info(f"✓ squad_data.py updated: {len(teams)} teams")
+        squad_data = {}
+        for team in teams:
+            players = self.session.query(Player).filter_by(team_id=team.id).all()
+            if not players:
+                continue
+
+            squad_data[team.name] = [
+                {
+                    'id': player.id,
+                    'name': player.name,
+                    'position': player.position,
+                    'number': player.number if player.number else 0,
+                    'age': player.age if player.age else 0,
+                    'nationality': player.nationality if player.nationality else ''
+                }
+                for player in players
+            ]
+
+        squad_data_path = save_squad_data(squad_data, source='Player database')
+
+        logger.info(f"✓ squad_data.json updated: {len(teams)} teams")
         return squad_data_path
 
     def display_summary(self):
@@ -193,7 +174,7 @@ def main():
         # 1. 모든 팀의 로스터 업데이트
         updated_teams, total_players = updater.update_all_rosters()
 
-        # 2. squad_data.py 파일 업데이트
+        # 2. squad_data.json 파일 업데이트
         if updated_teams > 0:
             squad_file = updater.update_squad_data_file()
             logger.info(f"✓ Squad data file saved: {squad_file}")
@@ -9,12 +9,13 @@ Sources:
 - Football-Data.org API
 """
 
-import requests
 from typing import Dict, Optional, Tuple, List
 import logging
 from datetime import datetime
 import os
 
+from utils.http_client import FPL_CACHE_TTL, FPL_STALE_TTL, get_http_client
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -40,6 +41,10 @@ class DataAggregationService:
 
         # Cache TTL
         self.cache_ttl = int(os.getenv('DATA_CACHE_TTL', '3600'))
+        self.sharp_vision_ttl = int(os.getenv('SHARP_VISION_CACHE_TTL', '60'))
+
+        # Shared HTTP client (connection pool, request coalescing, response cache)
+        self.http = get_http_client()
 
     # ============================================================================
     # MAIN AGGREGATION METHOD
@@ -116,10 +121,7 @@ class DataAggregationService:
         """
         try:
             # Call existing /api/match-predictions endpoint
-            response = requests.get(self.sharp_vision_url, timeout=10)
-            response.raise_for_status()
-
-            predictions = response.json().get('predictions', [])
+            predictions = self.http.get_json(self.sharp_vision_url, ttl=self.sharp_vision_ttl).get('predictions', [])
 
             # Find matching fixture
             for pred in predictions:
@@ -158,9 +160,8 @@ class DataAggregationService:
         """
         try:
             # Get bootstrap-static data (teams, players, fixtures)
-            response = requests.get(f"{self.fpl_api_url}/bootstrap-static/", timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self.http.get_json(f"{self.fpl_api_url}/bootstrap-static/",
+                                      ttl=FPL_CACHE_TTL, stale_ttl=FPL_STALE_TTL)
 
             teams = data.get('teams', [])
 
@@ -240,14 +241,11 @@ class DataAggregationService:
             headers = {'X-Auth-Token': self.football_data_token}
 
             # Premier League competition ID = 2021
-            response = requests.get(
+            data = self.http.get_json(
                 f"{self.football_data_url}/competitions/2021/standings",
                 headers=headers,
-                timeout=10
+                ttl=self.cache_ttl
             )
-            response.raise_for_status()
-
-            data = response.json()
             standings = data.get('standings', [])
 
             if not standings:
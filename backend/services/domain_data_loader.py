@@ -4,10 +4,11 @@ Domain Data Loader
 """
 
 import os
-import json
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
 
+from services.team_data_snapshot import get_team_data_snapshot
+
 
 @dataclass
 class TeamDomainData:
@@ -28,6 +29,8 @@ class DomainDataLoader:
         """
         Args:
             data_root: 데이터 루트 디렉토리 (기본값: backend/data)
+
+        파일 파싱 결과는 TeamDataSnapshot에서 공유된다 (파일이 바뀔 때만 다시 읽음).
         """
         if data_root is None:
             # 현재 파일에서 backend/data 경로 계산
@@ -51,13 +54,11 @@ class DomainDataLoader:
         """
         file_path = os.path.join(self.formations_dir, f"{team_name}.json")
 
-        if not os.path.exists(file_path):
-            return None
-
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('formation')
+            data = get_team_data_snapshot().read_json(file_path)
+            if data is None:
+                return None
+            return data.get('formation')
         except Exception as e:
             print(f"⚠️ Failed to load formation for {team_name}: {e}")
             return None
@@ -71,13 +72,11 @@ class DomainDataLoader:
         """
         file_path = os.path.join(self.lineups_dir, f"{team_name}.json")
 
-        if not os.path.exists(file_path):
-            return None
-
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('lineup')
+            data = get_team_data_snapshot().read_json(file_path)
+            if data is None:
+                return None
+            return data.get('lineup')
         except Exception as e:
             print(f"⚠️ Failed to load lineup for {team_name}: {e}")
             return None
@@ -94,16 +93,14 @@ class DomainDataLoader:
         """
         file_path = os.path.join(self.team_strength_dir, f"{team_name}.json")
 
-        if not os.path.exists(file_path):
-            return None
-
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return {
-                    'ratings': data.get('ratings', {}),
-                    'comment': data.get('comment', '')
-                }
+            data = get_team_data_snapshot().read_json(file_path)
+            if data is None:
+                return None
+            return {
+                'ratings': data.get('ratings', {}),
+                'comment': data.get('comment', '')
+            }
         except Exception as e:
             print(f"⚠️ Failed to load team strength for {team_name}: {e}")
             return None
@@ -121,17 +118,15 @@ class DomainDataLoader:
         """
         file_path = os.path.join(self.tactics_dir, f"{team_name}.json")
 
-        if not os.path.exists(file_path):
-            return None
-
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return {
-                    'defensive': data.get('defensive', {}),
-                    'offensive': data.get('offensive', {}),
-                    'transition': data.get('transition', {})
-                }
+            data = get_team_data_snapshot().read_json(file_path)
+            if data is None:
+                return None
+            return {
+                'defensive': data.get('defensive', {}),
+                'offensive': data.get('offensive', {}),
+                'transition': data.get('transition', {})
+            }
         except Exception as e:
             print(f"⚠️ Failed to load tactics for {team_name}: {e}")
             return None
@@ -151,13 +146,8 @@ class DomainDataLoader:
         """
         file_path = os.path.join(self.overall_scores_dir, f"{team_name}.json")
 
-        if not os.path.exists(file_path):
-            return None
-
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data
+            return get_team_data_snapshot().read_json(file_path)
         except Exception as e:
             print(f"⚠️ Failed to load overall score for {team_name}: {e}")
             return None
@@ -15,7 +15,8 @@ Enriched Domain Data Loader
 import os
 import sys
 import json
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 from pathlib import Path
 
 # 경로 설정
@@ -24,7 +25,8 @@ backend_dir = os.path.dirname(current_dir)
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 
-from database.player_schema import Player, PlayerRating, get_player_session
+from database.player_schema import Player, PlayerRating, player_session_scope
+from services.team_data_snapshot import get_team_data_snapshot
 from ai.enriched_data_models import (
     EnrichedPlayerInput,
     EnrichedTeamInput,
@@ -74,6 +76,34 @@ class IncompleteDataError(DataLoaderError):
 # SQLite Repository
 # ==========================================================================
 
+# (Player, ratings_dict, sub_position, user_commentary)
+PlayerRecord = Tuple[Player, Dict[str, float], Optional[str], Optional[str]]
+
+
+def parse_rating_records(ratings_records: Iterable[PlayerRating]) -> Tuple[Dict[str, float], Optional[str], Optional[str]]:
+    """
+    player_ratings 행 → (ratings_dict, sub_position, user_commentary)
+
+    _comment / _subPosition은 notes 컬럼의 메타데이터, 나머지 '_' 접두사 행은 무시
+    """
+    ratings_dict = {}
+    sub_position = None
+    user_commentary = None
+
+    for record in ratings_records:
+        if record.attribute_name == '_comment':
+            # 코멘터리는 notes에 저장됨
+            user_commentary = record.notes if record.notes else None
+        elif record.attribute_name == '_subPosition':
+            # 세부 포지션은 notes에 저장됨
+            sub_position = record.notes if record.notes else None
+        elif not record.attribute_name.startswith('_'):
+            # 일반 속성
+            ratings_dict[record.attribute_name] = record.rating
+
+    return (ratings_dict, sub_position, user_commentary)
+
+
 class PlayerRatingsRepository:
     """
     SQLite player_ratings 테이블에서 데이터 로드
@@ -99,77 +129,84 @@ class PlayerRatingsRepository:
         Raises:
             PlayerNotFoundError: 선수를 찾을 수 없음
         """
-        session = None
         try:
-            session = get_player_session(self.db_path)
-
-            # 선수 정보 조회
-            player = session.query(Player).filter_by(id=player_id).first()
-            if not player:
-                raise PlayerNotFoundError(f"Player with ID {player_id} not found in database")
-
-            # 선수 평가 조회
-            ratings_records = session.query(PlayerRating).filter_by(
-                player_id=player_id,
-                user_id=user_id
-            ).all()
-
-            if not ratings_records:
-                # 평가가 없는 경우
-                return (player, {}, None, None)
-
-            # 데이터 파싱
-            ratings_dict = {}
-            sub_position = None
-            user_commentary = None
-
-            for record in ratings_records:
-                if record.attribute_name == '_comment':
-                    # 코멘터리는 notes에 저장됨
-                    user_commentary = record.notes if record.notes else None
-                elif record.attribute_name == '_subPosition':
-                    # 세부 포지션은 notes에 저장됨
-                    sub_position = record.notes if record.notes else None
-                elif not record.attribute_name.startswith('_'):
-                    # 일반 속성
-                    ratings_dict[record.attribute_name] = record.rating
-
-            return (player, ratings_dict, sub_position, user_commentary)
+            with player_session_scope(self.db_path) as session:
+                # 선수 정보 조회
+                player = session.query(Player).filter_by(id=player_id).first()
+                if not player:
+                    raise PlayerNotFoundError(f"Player with ID {player_id} not found in database")
+
+                # 선수 평가 조회
+                ratings_records = session.query(PlayerRating).filter_by(
+                    player_id=player_id,
+                    user_id=user_id
+                ).all()
+
+            return (player, *parse_rating_records(ratings_records))
 
         except Exception as e:
             if isinstance(e, PlayerNotFoundError):
                 raise
             raise DataLoaderError(f"Failed to load player ratings: {str(e)}")
-        finally:
-            if session:
-                session.close()
+
+    def get_players_ratings(self,
+                            player_ids: Iterable[int],
+                            user_id: str = 'default') -> Dict[int, PlayerRecord]:
+        """
+        여러 선수의 평가 데이터 일괄 조회 (players / player_ratings IN 쿼리 2회)
+
+        Returns:
+            {player_id: (Player, ratings_dict, sub_position, user_commentary)}
+            DB에 없는 선수는 결과에 포함되지 않음 (호출자가 확인)
+        """
+        unique_ids = sorted(set(player_ids))
+        if not unique_ids:
+            return {}
+
+        try:
+            with player_session_scope(self.db_path) as session:
+                players = session.query(Player).filter(Player.id.in_(unique_ids)).all()
+                ratings_records = session.query(PlayerRating).filter(
+                    PlayerRating.player_id.in_(unique_ids),
+                    PlayerRating.user_id == user_id
+                ).all()
+        except Exception as e:
+            raise DataLoaderError(f"Failed to load player ratings: {str(e)}")
+
+        records_by_player = defaultdict(list)
+        for record in ratings_records:
+            records_by_player[record.player_id].append(record)
+
+        return {
+            player.id: (player, *parse_rating_records(records_by_player[player.id]))
+            for player in players
+        }
 
     def get_player_by_id(self, player_id: int) -> Optional[Player]:
         """선수 기본 정보만 조회"""
-        session = None
-        try:
-            session = get_player_session(self.db_path)
+        with player_session_scope(self.db_path) as session:
             return session.query(Player).filter_by(id=player_id).first()
-        finally:
-            if session:
-                session.close()
 
 
 # ==========================================================================
 # JSON Loaders
 # ==========================================================================
 
-def load_json_file(file_path: str) -> Dict:
-    """JSON 파일 로드 (에러 처리 포함)"""
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"JSON file not found: {file_path}")
+def load_json_file(file_path: str) -> Mapping:
+    """
+    JSON 파일 로드 (에러 처리 포함)
 
+    파일이 바뀌지 않았으면 TeamDataSnapshot의 읽기 전용 파싱 결과를 복사 없이 재사용한다.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        data = get_team_data_snapshot().read_frozen(file_path)
     except json.JSONDecodeError as e:
         raise DataLoaderError(f"Invalid JSON format in {file_path}: {str(e)}")
 
+    if data is None:
+        raise FileNotFoundError(f"JSON file not found: {file_path}")
+    return data
+
 
 def load_formation(team_name: str) -> str:
     """포메이션 로드"""
@@ -182,12 +219,12 @@ def load_formation(team_name: str) -> str:
     return data['formation']
 
 
-def load_lineup(team_name: str) -> Dict[str, int]:
+def load_lineup(team_name: str) -> Mapping[str, int]:
     """
     라인업 로드
 
     Returns:
-        {"GK": player_id, "LB": player_id, ...}
+        {"GK": player_id, "LB": player_id, ...} (읽기 전용)
     """
     file_path = os.path.join(LINEUPS_DIR, f"{team_name}.json")
     data = load_json_file(file_path)
@@ -218,36 +255,20 @@ def load_formation_tactics(formation: str) -> Optional['FormationTactics']:
     Returns:
         FormationTactics or None if not found
     """
-    from ai.enriched_data_models import FormationTactics
-
     file_path = os.path.join(DATA_DIR, 'formation_tactics.json')
 
     try:
-        data = load_json_file(file_path)
-
-        if 'formation_tactics' not in data:
-            print(f"⚠️  Formation tactics file missing 'formation_tactics' field")
+        if not os.path.exists(file_path):
+            print(f"⚠️  Formation tactics file not found: {file_path}")
             return None
 
-        tactics_data = data['formation_tactics'].get(formation)
-        if not tactics_data:
+        # 파일 전체는 바뀔 때만 파싱 (TeamDataSnapshot)
+        formation_tactics = get_team_data_snapshot().formation_tactics(formation, file_path)
+        if not formation_tactics:
             print(f"⚠️  Formation tactics not found for: {formation}")
             return None
 
-        return FormationTactics(
-            formation=formation,
-            name=tactics_data['name'],
-            style=tactics_data['style'],
-            buildup=tactics_data['buildup'],
-            pressing=tactics_data['pressing'],
-            space_utilization=tactics_data['space_utilization'],
-            strengths=tactics_data['strengths'],
-            weaknesses=tactics_data['weaknesses'],
-            note=tactics_data.get('note')
-        )
-    except FileNotFoundError:
-        print(f"⚠️  Formation tactics file not found: {file_path}")
-        return None
+        return formation_tactics
     except Exception as e:
         print(f"⚠️  Failed to load formation tactics: {str(e)}")
         return None
@@ -307,7 +328,7 @@ class EnrichedDomainDataLoader:
         단계:
         1. Formation 로드
         2. Lineup 로드 (11명 player_id)
-        3. 각 선수의 평가 데이터 로드 (SQLite)
+        3. 선수 평가 데이터 일괄 로드 (SQLite)
         4. Team Strength 로드
         5. EnrichedTeamInput 조합
 
@@ -322,6 +343,57 @@ class EnrichedDomainDataLoader:
             IncompleteDataError: 불완전한 데이터
             PlayerNotFoundError: 선수 평가 없음
         """
+        return self.load_teams([team_name])[team_name]
+
+    def load_match_data(self, home_team: str, away_team: str) -> Tuple[EnrichedTeamInput, EnrichedTeamInput]:
+        """
+        경기 양 팀 데이터 로드 (22명 선수 평가를 한 번에 조회)
+
+        Returns:
+            (home EnrichedTeamInput, away EnrichedTeamInput)
+        """
+        teams = self.load_teams([home_team, away_team])
+        return teams[home_team], teams[away_team]
+
+    def load_teams(self, team_names: List[str]) -> Dict[str, EnrichedTeamInput]:
+        """
+        여러 팀 데이터 로드
+
+        JSON은 팀별로 읽고, 모든 라인업의 선수 평가는 IN 쿼리 2회로 한 번에 조회한다
+        (20개 팀 일괄 로드도 DB 왕복 2회).
+
+        Returns:
+            {team_name: EnrichedTeamInput} (입력 순서)
+
+        Raises:
+            load_team_data와 동일
+        """
+        team_files = {}
+        for team_name in team_names:
+            if team_name not in team_files:
+                team_files[team_name] = self._load_team_files(team_name)
+
+        player_ids = [
+            player_id
+            for files in team_files.values()
+            for player_id in files['lineup'].values()
+        ]
+        try:
+            print(f"\nLoading player ratings from database ({len(set(player_ids))} players)...")
+            player_records = self.player_repo.get_players_ratings(player_ids)
+        except DataLoaderError as e:
+            print(f"\n❌ Failed to load player ratings: {str(e)}\n")
+            raise
+
+        return {
+            team_name: self._build_team_input(team_name, files, player_records)
+            for team_name, files in team_files.items()
+        }
+
+    def _load_team_files(self, team_name: str) -> Dict:
+        """
+        팀 JSON 로드 (formation, formation tactics, lineup, team strength)
+        """
         print(f"\n{'='*70}")
         print(f"📂 Loading team data: {team_name}")
         print(f"{'='*70}\n")
@@ -347,37 +419,7 @@ class EnrichedDomainDataLoader:
             lineup_dict = load_lineup(team_name)
             print(f"  ✅ Lineup: {len(lineup_dict)} players")
 
-            # Step 3: 각 선수의 평가 데이터 로드
-            print("\nStep 3/5: Loading player ratings from database...")
-            enriched_lineup = {}
-
-            for position, player_id in lineup_dict.items():
-                try:
-                    player, ratings, sub_pos, commentary = self.player_repo.get_player_ratings(player_id)
-
-                    enriched_player = EnrichedPlayerInput(
-                        player_id=player_id,
-                        name=player.name,
-                        position=player.position,
-                        ratings=ratings,
-                        sub_position=sub_pos,
-                        user_commentary=commentary
-                    )
-
-                    enriched_lineup[position] = enriched_player
-
-                    # 로그 출력
-                    rating_str = f"{enriched_player.overall_rating:.2f}" if ratings else "N/A"
-                    commentary_str = f" | Commentary: {commentary[:30]}..." if commentary else ""
-                    print(f"    [{position:6s}] {player.name:25s} (Rating: {rating_str}){commentary_str}")
-
-                except PlayerNotFoundError as e:
-                    print(f"    ⚠️  [{position}] Player {player_id} not found in database")
-                    raise
-
-            print(f"  ✅ Loaded {len(enriched_lineup)} player ratings")
-
-            # Step 4: Team Strength 로드
+            # Step 4: Team Strength 로드 (Step 3 선수 평가는 모든 팀을 모아 일괄 조회)
             print("\nStep 4/5: Loading team strength...")
             team_strength_ratings, team_commentary = load_team_strength(team_name)
             print(f"  ✅ Team strength loaded:")
@@ -387,15 +429,67 @@ class EnrichedDomainDataLoader:
             if team_commentary:
                 print(f"      Team Commentary: {team_commentary}")
 
+            return {
+                'formation': formation,
+                'formation_tactics': formation_tactics,
+                'lineup': lineup_dict,
+                'team_strength_ratings': team_strength_ratings,
+                'team_commentary': team_commentary
+            }
+
+        except (FileNotFoundError, IncompleteDataError) as e:
+            print(f"\n❌ Failed to load {team_name} data: {str(e)}\n")
+            raise
+        except Exception as e:
+            print(f"\n❌ Unexpected error loading {team_name} data: {str(e)}\n")
+            raise DataLoaderError(f"Unexpected error: {str(e)}")
+
+    def _build_team_input(self,
+                          team_name: str,
+                          files: Dict,
+                          player_records: Dict[int, PlayerRecord]) -> EnrichedTeamInput:
+        """
+        팀 JSON + 일괄 조회한 선수 평가 → EnrichedTeamInput
+        """
+        try:
+            # Step 3: 각 선수의 평가 데이터 (일괄 조회 결과에서 조합)
+            print(f"\nStep 3/5: Building {team_name} player ratings...")
+            enriched_lineup = {}
+
+            for position, player_id in files['lineup'].items():
+                if player_id not in player_records:
+                    print(f"    ⚠️  [{position}] Player {player_id} not found in database")
+                    raise PlayerNotFoundError(f"Player with ID {player_id} not found in database")
+
+                player, ratings, sub_pos, commentary = player_records[player_id]
+
+                enriched_player = EnrichedPlayerInput(
+                    player_id=player_id,
+                    name=player.name,
+                    position=player.position,
+                    ratings=ratings,
+                    sub_position=sub_pos,
+                    user_commentary=commentary
+                )
+
+                enriched_lineup[position] = enriched_player
+
+                # 로그 출력
+                rating_str = f"{enriched_player.overall_rating:.2f}" if ratings else "N/A"
+                commentary_str = f" | Commentary: {commentary[:30]}..." if commentary else ""
+                print(f"    [{position:6s}] {player.name:25s} (Rating: {rating_str}){commentary_str}")
+
+            print(f"  ✅ Loaded {len(enriched_lineup)} player ratings")
+
             # Step 5: EnrichedTeamInput 조합
             print("\nStep 5/5: Creating EnrichedTeamInput...")
             team_input = EnrichedTeamInput(
                 name=team_name,
-                formation=formation,
+                formation=files['formation'],
                 lineup=enriched_lineup,
-                team_strength_ratings=team_strength_ratings,
-                team_strategy_commentary=team_commentary,
-                formation_tactics=formation_tactics
+                team_strength_ratings=files['team_strength_ratings'],
+                team_strategy_commentary=files['team_commentary'],
+                formation_tactics=files['formation_tactics']
             )
 
             # derived_strengths 자동 계산됨 (__post_init__)
@@ -413,7 +507,7 @@ class EnrichedDomainDataLoader:
 
             return team_input
 
-        except (FileNotFoundError, IncompleteDataError, PlayerNotFoundError) as e:
+        except PlayerNotFoundError as e:
             print(f"\n❌ Failed to load {team_name} data: {str(e)}\n")
             raise
         except Exception as e:
@@ -9,20 +9,39 @@ Phase 3 E2E Integration:
 """
 
 import logging
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 from datetime import datetime
 import queue
 import threading
 
 from services.enriched_data_loader import EnrichedDomainDataLoader
 from ai.ai_factory import get_ai_client
+from simulation.v2.parallel_executor import ExecutorConfig
 from simulation.v2.simulation_pipeline import get_pipeline, PipelineConfig
+from utils.cancellation import CancellationToken, SimulationCancelled, checkpoint
 from utils.simulation_events import SimulationEvent
 import time
 
 logger = logging.getLogger(__name__)
 
 
+def pipeline_config() -> PipelineConfig:
+    """
+    V2 pipeline settings used by the service
+
+    The Monte Carlo executor mode and worker count come from
+    SIMULATION_EXECUTOR_MODE / SIMULATION_EXECUTOR_WORKERS.
+    """
+    executor = ExecutorConfig.from_env()
+    return PipelineConfig(
+        max_iterations=5,
+        initial_runs=100,
+        final_runs=3000,
+        convergence_threshold=0.85,
+        executor_mode=executor.mode,
+        max_workers=executor.max_workers
+    )
+
 class EnrichedSimulationService:
     """
     Orchestrate enriched match simulation workflow.
@@ -147,12 +166,7 @@ class EnrichedSimulationService:
         start_time = datetime.utcnow()
 
         # Get pipeline
-        pipeline = get_pipeline(config=PipelineConfig(
-            max_iterations=5,
-            initial_runs=100,
-            final_runs=3000,
-            convergence_threshold=0.85
-        ))
+        pipeline = get_pipeline(config=pipeline_config())
 
         # Run enriched pipeline
         success, pipeline_result, error = pipeline.run_enriched(
@@ -226,6 +240,10 @@ class EnrichedSimulationService:
 
         NEW: Uses V2 Pipeline (Phase 1-7) with multi-scenario simulation
 
+        The pipeline runs in a worker thread (run_v2_pipeline). Closing the
+        generator (client disconnect) cancels the pipeline at its next checkpoint.
+        For the asyncio/FastAPI path use services.simulation_stream instead.
+
         Args:
             home_team: Home team name
             away_team: Away team name
@@ -238,216 +256,208 @@ class EnrichedSimulationService:
         last_heartbeat = time.time()
         HEARTBEAT_INTERVAL = 15  # Send heartbeat every 15 seconds
 
+        event_queue = queue.Queue()
+        cancel_token = CancellationToken()
+
+        def run_pipeline_in_thread():
+            """Run pipeline in separate thread"""
+            try:
+                self.run_v2_pipeline(home_team, away_team, match_context, event_queue.put, cancel_token)
+            except SimulationCancelled as e:
+                logger.info(f"V2 simulation cancelled: {home_team} vs {away_team} ({e})")
+            finally:
+                # Signal completion with None
+                event_queue.put(None)
+
+        pipeline_thread = threading.Thread(target=run_pipeline_in_thread)
+        pipeline_thread.daemon = True
+        pipeline_thread.start()
+
+        try:
+            while True:
+                # Check for heartbeat
+                if time.time() - last_heartbeat > HEARTBEAT_INTERVAL:
+                    yield SimulationEvent.heartbeat(time.time() - start_time)
+                    last_heartbeat = time.time()
+
+                try:
+                    # Get event from queue (timeout 0.5s to check heartbeat)
+                    event = event_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+
+                # None signals completion
+                if event is None:
+                    break
+                yield event
+        finally:
+            # No-op when the pipeline already finished
+            cancel_token.cancel("stream closed")
+
+    def run_v2_pipeline(
+        self,
+        home_team: str,
+        away_team: str,
+        match_context: Optional[Dict],
+        emit: Callable[[SimulationEvent], None],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> None:
+        """
+        Run the V2 Pipeline synchronously, reporting progress through emit.
+
+        Emits the same event sequence as simulate_with_progress_v2, ending with
+        either a completed or an error event.
+
+        Args:
+            home_team: Home team name
+            away_team: Away team name
+            match_context: Optional match context
+            emit: Called with each SimulationEvent (may block for backpressure)
+            cancel_token: Checked between validation chunks and while waiting on AI calls
+
+        Raises:
+            SimulationCancelled: cancel_token was cancelled (no final event is emitted)
+        """
+        start_time = time.time()
+
         try:
             # Set default match context
             if match_context is None:
                 match_context = {}
 
             # Event 1: Started
-            yield SimulationEvent.started(home_team, away_team, match_context)
+            emit(SimulationEvent.started(home_team, away_team, match_context))
 
             # Event 2-3: Load home team
-            yield SimulationEvent.loading_home_team(home_team)
+            emit(SimulationEvent.loading_home_team(home_team))
 
             try:
                 home_team_data = self.loader.load_team_data(home_team)
-                yield SimulationEvent.home_team_loaded(
+                emit(SimulationEvent.home_team_loaded(
                     home_team,
                     len(home_team_data.lineup),
                     home_team_data.formation
-                )
+                ))
             except Exception as e:
-                yield SimulationEvent.error(
+                emit(SimulationEvent.error(
                     f"Failed to load home team: {str(e)}",
                     stage='data_loading'
-                )
+                ))
                 return
 
             # Event 4-5: Load away team
-            yield SimulationEvent.loading_away_team(away_team)
+            emit(SimulationEvent.loading_away_team(away_team))
 
             try:
                 away_team_data = self.loader.load_team_data(away_team)
-                yield SimulationEvent.away_team_loaded(
+                emit(SimulationEvent.away_team_loaded(
                     away_team,
                     len(away_team_data.lineup),
                     away_team_data.formation
-                )
+                ))
             except Exception as e:
-                yield SimulationEvent.error(
+                emit(SimulationEvent.error(
                     f"Failed to load away team: {str(e)}",
                     stage='data_loading'
-                )
+                ))
                 return
 
             # Event 6: V2 Pipeline Starting
-            yield SimulationEvent(
+            emit(SimulationEvent(
                 event_type='v2_pipeline_starting',
                 data={
                     'message': 'Starting V2 Pipeline with multi-scenario simulation',
                     'engine': 'V2 Pipeline',
                     'phases': 7
                 }
-            )
-
-            # Get pipeline
-            from simulation.v2.simulation_pipeline import get_pipeline, PipelineConfig
-            pipeline = get_pipeline(config=PipelineConfig(
-                max_iterations=5,
-                initial_runs=100,
-                final_runs=3000,
-                convergence_threshold=0.85
             ))
 
-            # Storage for pipeline events
-            pipeline_result = None
-            pipeline_error = None
+            pipeline = get_pipeline(config=pipeline_config())
 
-            # Event callback function
-            def pipeline_event_callback(event_type: str, data: dict):
-                # Convert pipeline events to SSE events
-                yield SimulationEvent(
-                    event_type=event_type,
-                    data=data
-                )
-
-            # Run V2 Pipeline with real-time event streaming using queue
-            try:
-                # Create event queue for thread-safe communication
-                event_queue = queue.Queue()
-                pipeline_result = {'success': False, 'result': None, 'error': None}
-
-                def collect_events_to_queue(event_type: str, data: dict):
-                    """Callback that puts events into queue"""
-                    event = SimulationEvent(event_type=event_type, data=data)
-                    event_queue.put(event)
-
-                def run_pipeline_in_thread():
-                    """Run pipeline in separate thread"""
-                    try:
-                        success, result, error = pipeline.run_enriched(
-                            home_team=home_team_data,
-                            away_team=away_team_data,
-                            match_context=match_context,
-                            event_callback=collect_events_to_queue
-                        )
-                        pipeline_result['success'] = success
-                        pipeline_result['result'] = result
-                        pipeline_result['error'] = error
-                    except Exception as e:
-                        logger.error(f"Pipeline thread error: {str(e)}")
-                        pipeline_result['success'] = False
-                        pipeline_result['error'] = str(e)
-                    finally:
-                        # Signal completion with None
-                        event_queue.put(None)
-
-                # Start pipeline in separate thread
-                pipeline_thread = threading.Thread(target=run_pipeline_in_thread)
-                pipeline_thread.daemon = True
-                pipeline_thread.start()
-
-                # Yield events as they arrive from queue
-                while True:
-                    try:
-                        # Check for heartbeat
-                        if time.time() - last_heartbeat > HEARTBEAT_INTERVAL:
-                            yield SimulationEvent(
-                                event_type='heartbeat',
-                                data={
-                                    'message': 'Connection keepalive',
-                                    'elapsed': round(time.time() - start_time, 1)
-                                }
-                            )
-                            last_heartbeat = time.time()
-
-                        # Get event from queue (timeout 0.5s to check heartbeat)
-                        event = event_queue.get(timeout=0.5)
-
-                        # None signals completion
-                        if event is None:
-                            break
-
-                        # Yield the event
-                        yield event
-
-                    except queue.Empty:
-                        # No event yet, continue (allows heartbeat check)
-                        continue
-
-                # Wait for thread to complete
-                pipeline_thread.join(timeout=10)
-
-                # Check pipeline result
-                if not pipeline_result['success']:
-                    yield SimulationEvent.error(
-                        f"Pipeline failed: {pipeline_result['error']}",
-                        stage='v2_pipeline'
-                    )
-                    return
+            # Pipeline phase events are forwarded as SSE events
+            success, result_data, error = pipeline.run_enriched(
+                home_team=home_team_data,
+                away_team=away_team_data,
+                match_context=match_context,
+                event_callback=lambda event_type, data: emit(SimulationEvent(event_type=event_type, data=data)),
+                cancel_token=cancel_token
+            )
 
-            except Exception as e:
-                logger.error(f"V2 Pipeline error: {str(e)}")
-                yield SimulationEvent.error(
-                    f"Pipeline execution error: {str(e)}",
+            if not success:
+                checkpoint(cancel_token)
+                emit(SimulationEvent.error(
+                    f"Pipeline failed: {error}",
                     stage='v2_pipeline'
-                )
+                ))
                 return
 
             # Build final result from pipeline output
-            processing_time = time.time() - start_time
-            result_data = pipeline_result['result']  # Get result from pipeline_result dict
-            report = result_data['report']
-            prediction = report['prediction']
-
-            final_result = {
-                'success': True,
-                'prediction': prediction['win_probabilities'],  # {home, draw, away}
-                'predicted_score': f"{prediction['expected_goals']['home']:.0f}-{prediction['expected_goals']['away']:.0f}",
-                'expected_goals': prediction['expected_goals'],
-                'confidence': 'high' if pipeline_result['converged'] else 'medium',
-                'analysis': {
-                    'key_factors': [],
-                    'dominant_scenario': report['dominant_scenario'],
-                    'all_scenarios': report['all_scenarios'],
-                    'tactical_insight': f"Simulation converged after {pipeline_result['iterations']} iterations."
-                },
-                'summary': f"{home_team} vs {away_team}: {report['dominant_scenario']['name']}",
-                'teams': {
-                    'home': {
-                        'name': home_team_data.name,
-                        'formation': home_team_data.formation
-                    },
-                    'away': {
-                        'name': away_team_data.name,
-                        'formation': away_team_data.formation
-                    }
-                },
-                'pipeline_metadata': {
-                    'converged': result_data['converged'],
-                    'iterations': result_data['iterations'],
-                    'total_simulations': result_data['metadata']['total_simulations'],
-                    'scenarios_count': len(result_data['scenarios'])
-                },
-                'usage': {
-                    'total_tokens': 0,  # V2 Pipeline doesn't track tokens
-                    'processing_time': processing_time,
-                    'cost_usd': 0.0
-                },
-                'match_context': match_context,
-                'timestamp': datetime.utcnow().isoformat()
-            }
+            final_result = self._build_v2_result(
+                result_data, home_team_data, away_team_data, match_context, time.time() - start_time
+            )
 
             # Event: Completed
-            total_time = time.time() - start_time
-            yield SimulationEvent.completed(final_result, total_time)
+            emit(SimulationEvent.completed(final_result, time.time() - start_time))
+
+        except SimulationCancelled:
+            raise
 
         except Exception as e:
-            logger.error(f"Unexpected error in simulate_with_progress_v2: {str(e)}")
-            yield SimulationEvent.error(
+            logger.error(f"Unexpected error in V2 simulation: {str(e)}")
+            emit(SimulationEvent.error(
                 f"Unexpected error: {str(e)}",
                 stage='unknown'
-            )
+            ))
+
+    def _build_v2_result(
+        self,
+        result_data: Dict,
+        home_team_data,
+        away_team_data,
+        match_context: Dict,
+        processing_time: float
+    ) -> Dict:
+        """Format V2 Pipeline output for the frontend."""
+        report = result_data['report']
+        prediction = report['prediction']
+
+        return {
+            'success': True,
+            'prediction': prediction['win_probabilities'],  # {home, draw, away}
+            'predicted_score': f"{prediction['expected_goals']['home']:.0f}-{prediction['expected_goals']['away']:.0f}",
+            'expected_goals': prediction['expected_goals'],
+            'confidence': 'high' if result_data['converged'] else 'medium',
+            'analysis': {
+                'key_factors': [],
+                'dominant_scenario': report['dominant_scenario'],
+                'all_scenarios': report['all_scenarios'],
+                'tactical_insight': f"Simulation converged after {result_data['iterations']} iterations."
+            },
+            'summary': f"{home_team_data.name} vs {away_team_data.name}: {report['dominant_scenario']['name']}",
+            'teams': {
+                'home': {
+                    'name': home_team_data.name,
+                    'formation': home_team_data.formation
+                },
+                'away': {
+                    'name': away_team_data.name,
+                    'formation': away_team_data.formation
+                }
+            },
+            'pipeline_metadata': {
+                'converged': result_data['converged'],
+                'iterations': result_data['iterations'],
+                'total_simulations': result_data['metadata']['total_simulations'],
+                'scenarios_count': len(result_data['scenarios'])
+            },
+            'usage': {
+                'total_tokens': 0,  # V2 Pipeline doesn't track tokens
+                'processing_time': processing_time,
+                'cost_usd': 0.0
+            },
+            'match_context': match_context,
+            'timestamp': datetime.utcnow().isoformat()
+        }
 
     def simulate_with_progress(
         self,
@@ -0,0 +1,483 @@
+"""
+Feed Snapshots
+FPL 피드 기반 계산 결과의 사전 계산 스냅샷
+
+- standings: 리그 순위표 (fixtures의 완료 경기로 계산)
+- fixture_rounds: 미래 경기 "홈_원정" → 라운드 매핑 + 현재 라운드
+- leaderboard: 득점/도움/클린시트/포인트 상위 선수 (SQUAD_DATA 매핑)
+- 그 외 register로 추가한 빌더 (예: 데모 배당률 대시보드)
+
+스케줄러가 주기적으로 refresh_all을 호출해 공유 저장소(Redis 또는 로컬 파일)에
+버전이 붙은 스냅샷으로 게시하고, 요청 핸들러는 get으로 읽기만 한다.
+워커 프로세스가 여러 개여도 같은 저장소를 읽으므로 피드 다운로드/계산은
+워커마다 반복되지 않는다. 내용이 바뀌지 않으면 버전을 올리지 않는다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from services.fpl_snapshot import FPLSnapshot
+from utils.http_client import get_fpl_json
+from utils.team_mapping import is_relegated_team
+
+logger = logging.getLogger(__name__)
+
+
+KEY_PREFIX = "epl_predictor:feed_snapshot"
+
+DEFAULT_SNAPSHOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'feed_snapshots'))
+
+# 갱신 주기 (분)
+REFRESH_INTERVAL_MINUTES = int(os.getenv('FEED_REFRESH_MINUTES', '10'))
+
+# 주기 갱신을 맡을 프로세스 선정용 잠금 파일 (호스트당 하나)
+REFRESH_LOCK_PATH = DEFAULT_SNAPSHOT_DIR + '.refresh.lock'
+
+
+@dataclass
+class FeedSnapshot:
+    """게시된 스냅샷"""
+    name: str
+    version: int            # 내용이 바뀔 때마다 1씩 증가
+    fingerprint: str        # data의 SHA-256
+    built_at: float         # time.time()
+    data: Any
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: Dict) -> 'FeedSnapshot':
+        return cls(**payload)
+
+
+def _fingerprint(data: Any) -> str:
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# ----------------------------------------------------------------------
+# 저장소
+# ----------------------------------------------------------------------
+
+class FileSnapshotStore:
+    """
+    로컬 디렉토리 저장소 ({name}.json)
+
+    임시 파일에 쓴 뒤 교체하므로 읽는 쪽이 쓰는 도중의 파일을 보지 않는다.
+    같은 호스트의 워커들이 공유하며, 파일이 바뀔 때만 다시 파싱한다.
+    """
+
+    def __init__(self, directory: str = DEFAULT_SNAPSHOT_DIR):
+        self.directory = directory
+        self._parsed: Dict[str, tuple] = {}     # name → ((mtime_ns, size), FeedSnapshot)
+        self._lock = threading.Lock()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f'{name}.json')
+
+    def get(self, name: str) -> Optional[FeedSnapshot]:
+        path = self._path(name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._parsed.get(name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                snapshot = FeedSnapshot.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable feed snapshot {path}: {e}")
+            return None
+
+        with self._lock:
+            self._parsed[name] = (stamp, snapshot)
+        return snapshot
+
+    def put(self, snapshot: FeedSnapshot):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(snapshot.name)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+class RedisSnapshotStore:
+    """
+    RedisCache 저장소 (여러 호스트가 공유)
+
+    요청마다 Redis에서 JSON을 다시 파싱하지 않도록 local_ttl초 동안 프로세스 내에 보관한다.
+    """
+
+    def __init__(self, redis_cache, ttl: int = 7 * 24 * 3600, local_ttl: float = 5.0):
+        self.redis_cache = redis_cache
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self._local: Dict[str, tuple] = {}      # name → (읽은 시각, FeedSnapshot)
+
+    def get(self, name: str) -> Optional[FeedSnapshot]:
+        cached = self._local.get(name)
+        if cached is not None and time.monotonic() - cached[0] < self.local_ttl:
+            return cached[1]
+
+        payload = self.redis_cache.get(f'{KEY_PREFIX}:{name}', deserializer='json')
+        snapshot = FeedSnapshot.from_dict(payload) if payload else None
+        if snapshot is not None:
+            self._local[name] = (time.monotonic(), snapshot)
+        return snapshot
+
+    def put(self, snapshot: FeedSnapshot):
+        if not self.redis_cache.set(f'{KEY_PREFIX}:{snapshot.name}', snapshot.to_dict(), ttl=self.ttl, serializer='json'):
+            raise RuntimeError(f"Redis write failed for feed snapshot {snapshot.name}")
+        self._local[snapshot.name] = (time.monotonic(), snapshot)
+
+
+def default_store():
+    """설정의 Redis (사용 가능하면) 또는 로컬 파일 저장소"""
+    try:
+        from infrastructure.cache.redis_cache import RedisCache
+        redis_cache = RedisCache()
+        if redis_cache.enabled and redis_cache._redis.ping():
+            return RedisSnapshotStore(redis_cache)
+    except Exception as e:
+        logger.info(f"Feed snapshots: Redis unavailable, using local files ({e})")
+    return FileSnapshotStore()
+
+
+# ----------------------------------------------------------------------
+# 빌더 (bootstrap / fixtures → 응답 데이터)
+# ----------------------------------------------------------------------
+
+def build_standings(bootstrap: Dict, fixtures: List[Dict]) -> List[Dict]:
+    """
+    리그 순위표 (강등팀 제외, 승점 > 득실차 > 득점 순)
+    """
+    standings = {}
+    for team in bootstrap.get('teams', []):
+        if is_relegated_team(team['name']):
+            continue
+
+        standings[team['id']] = {
+            'id': team['id'],
+            'name': team['name'],
+            'short_name': team['short_name'],
+            'played': 0,
+            'won': 0,
+            'drawn': 0,
+            'lost': 0,
+            'goals_for': 0,
+            'goals_against': 0,
+            'goal_difference': 0,
+            'points': 0,
+            'position': team.get('position', 0)
+        }
+
+    # 완료된 경기만 반영
+    for fixture in fixtures:
+        if not fixture.get('finished') or fixture.get('team_h_score') is None:
+            continue
+
+        home_score = fixture['team_h_score']
+        away_score = fixture['team_a_score']
+        for team_id, scored, conceded in ((fixture['team_h'], home_score, away_score),
+                                          (fixture['team_a'], away_score, home_score)):
+            row = standings.get(team_id)
+            if row is None:
+                continue
+            row['played'] += 1
+            row['goals_for'] += scored
+            row['goals_against'] += conceded
+            if scored > conceded:
+                row['won'] += 1
+                row['points'] += 3
+            elif scored == conceded:
+                row['drawn'] += 1
+                row['points'] += 1
+            else:
+                row['lost'] += 1
+
+    standings_list = list(standings.values())
+    for row in standings_list:
+        row['goal_difference'] = row['goals_for'] - row['goals_against']
+
+    standings_list.sort(key=lambda x: (x['points'], x['goal_difference'], x['goals_for']), reverse=True)
+    for idx, row in enumerate(standings_list):
+        row['position'] = idx + 1
+    return standings_list
+
+
+def build_fixture_rounds(bootstrap: Dict, fixtures: List[Dict]) -> Dict:
+    """
+    미래 경기 라운드 매핑
+
+    Returns:
+        {'round_mapping': {"홈팀_원정팀": 라운드}, 'current_round': int}
+    """
+    teams = {team['id']: team['name'] for team in bootstrap.get('teams', [])}
+
+    events = bootstrap.get('events', [])
+    current_event = next((e for e in events if e.get('is_current', False)), None)
+    next_event = next((e for e in events if e.get('is_next', False)), None)
+    current_round = (next_event or current_event or {}).get('id', 1)
+
+    round_mapping = {}
+    for fixture in fixtures:
+        if fixture.get('finished', False):
+            continue
+        home_team = teams.get(fixture.get('team_h'))
+        away_team = teams.get(fixture.get('team_a'))
+        if home_team and away_team:
+            round_mapping[f"{home_team}_{away_team}"] = fixture.get('event', current_round)
+
+    return {'round_mapping': round_mapping, 'current_round': current_round}
+
+
+def build_leaderboard(snapshot: FPLSnapshot, limit: int = 20) -> Dict:
+    """
+    EPL 리더보드 (득점왕, 도움왕, 클린시트, 포인트)
+
+    SQUAD_DATA와 매핑되는 선수는 SQUAD_DATA의 ID/이름/포지션을 사용하고,
+    매핑되지 않으면 FPL 데이터를 그대로 사용한다.
+    """
+    enriched_players = []
+    mapped_count = 0
+    unmapped_count = 0
+
+    for player in snapshot.elements:
+        team = snapshot.teams_by_id.get(player['team'], {})
+        team_name = team.get('name', 'Unknown')
+
+        # 강등팀 제외
+        if is_relegated_team(team_name):
+            continue
+
+        fpl_stats = {
+            'goals': player.get('goals_scored', 0),
+            'assists': player.get('assists', 0),
+            'clean_sheets': player.get('clean_sheets', 0),
+            'total_points': player.get('total_points', 0),
+            'form': float(player.get('form', 0)),
+            'minutes': player.get('minutes', 0)
+        }
+
+        squad_player = snapshot.squad_player(player, team_name)
+        if squad_player:
+            mapped_count += 1
+            identity = {
+                'id': squad_player['id'],
+                'name': squad_player['name'],
+                'position': squad_player['position']
+            }
+        else:
+            unmapped_count += 1
+            identity = {
+                'id': player['id'],
+                'name': player['web_name'],
+                'position': ['GK', 'DEF', 'MID', 'FWD'][player['element_type'] - 1]
+            }
+
+        enriched_players.append({
+            'id': identity['id'],
+            'code': player.get('code'),  # 선수 사진 URL용 코드 (FPL)
+            'name': identity['name'],
+            'team': team_name,
+            'team_short': team.get('short_name', 'UNK'),
+            'position': identity['position'],
+            **fpl_stats
+        })
+
+    logger.info(f"📊 리더보드 매핑 결과: 성공 {mapped_count}명, 실패 {unmapped_count}명")
+
+    return {
+        'top_scorers': sorted([p for p in enriched_players if p['goals'] > 0],
+                              key=lambda x: x['goals'], reverse=True)[:limit],
+        'top_assists': sorted([p for p in enriched_players if p['assists'] > 0],
+                              key=lambda x: x['assists'], reverse=True)[:limit],
+        'top_clean_sheets': sorted([p for p in enriched_players if p['clean_sheets'] > 0],
+                                   key=lambda x: x['clean_sheets'], reverse=True)[:limit],
+        'top_points': sorted(enriched_players,
+                             key=lambda x: x['total_points'], reverse=True)[:limit]
+    }
+
+
+def fpl_builders(fetch_bootstrap: Callable[[], Dict] = lambda: get_fpl_json('bootstrap-static/'),
+                 fetch_fixtures: Callable[[], List[Dict]] = lambda: get_fpl_json('fixtures/')) -> Dict[str, Callable[[], Any]]:
+    """FPL 피드 기반 기본 빌더 (피드는 공용 HTTP 캐시에서 가져옴)"""
+    return {
+        'standings': lambda: build_standings(fetch_bootstrap(), fetch_fixtures()),
+        'fixture_rounds': lambda: build_fixture_rounds(fetch_bootstrap(), fetch_fixtures()),
+        'leaderboard': lambda: build_leaderboard(FPLSnapshot(fetch_bootstrap())),
+    }
+
+
+# ----------------------------------------------------------------------
+# 갱신 / 조회
+# ----------------------------------------------------------------------
+
+class FeedSnapshotRefresher:
+    """
+    빌더 실행 → 저장소 게시, 핸들러용 조회
+
+    빌더가 실패하면 이전 스냅샷을 그대로 둔다.
+    """
+
+    def __init__(self, store=None, builders: Optional[Dict[str, Callable[[], Any]]] = None):
+        """
+        Args:
+            store: FileSnapshotStore / RedisSnapshotStore (기본: default_store())
+            builders: 이름 → 데이터 생성 함수 (기본: fpl_builders())
+        """
+        self._store = store
+        self.builders: Dict[str, Callable[[], Any]] = dict(fpl_builders() if builders is None else builders)
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    @property
+    def store(self):
+        """저장소 (기본 저장소는 처음 사용할 때 연결, import 시 Redis에 접속하지 않음)"""
+        if self._store is None:
+            with self._locks_lock:
+                if self._store is None:
+                    self._store = default_store()
+        return self._store
+
+    def register(self, name: str, builder: Callable[[], Any]):
+        """빌더 추가 (JSON 직렬화 가능한 값을 반환해야 함)"""
+        self.builders[name] = builder
+
+    def refresh(self, name: str, min_age: float = 0) -> Optional[FeedSnapshot]:
+        """
+        빌더를 실행해 게시
+
+        Args:
+            name: 스냅샷 이름
+            min_age: 게시된 스냅샷이 이 시간(초)보다 새것이면 건너뜀
+                (다른 워커가 방금 갱신한 경우)
+
+        Returns:
+            게시된(또는 유지된) 스냅샷
+        """
+        with self._lock_for(name):
+            current = self.store.get(name)
+            if current is not None and time.time() - current.built_at < min_age:
+                return current
+
+            data = self.builders[name]()
+            digest = _fingerprint(data)
+            if current is not None and current.fingerprint == digest:
+                snapshot = FeedSnapshot(name, current.version, digest, time.time(), current.data)
+            else:
+                version = current.version + 1 if current is not None else 1
+                snapshot = FeedSnapshot(name, version, digest, time.time(), data)
+                logger.info(f"📦 Feed snapshot published: {name} v{version}")
+            self.store.put(snapshot)
+            return snapshot
+
+    def refresh_all(self, min_age: float = 0) -> Dict[str, Optional[int]]:
+        """
+        모든 빌더 갱신 (스케줄러 작업)
+
+        Returns:
+            이름 → 버전 (실패 시 None)
+        """
+        versions = {}
+        for name in list(self.builders):
+            try:
+                versions[name] = self.refresh(name, min_age=min_age).version
+            except Exception as e:
+                logger.error(f"❌ Feed snapshot refresh failed for {name}: {e}")
+                versions[name] = None
+        return versions
+
+    def get(self, name: str) -> FeedSnapshot:
+        """
+        게시된 스냅샷 (아직 없으면 지금 만들어 게시)
+
+        Raises:
+            KeyError: 등록되지 않은 이름
+            빌더 예외: 게시된 스냅샷이 없고 생성도 실패한 경우
+        """
+        snapshot = self.store.get(name)
+        if snapshot is not None:
+            return snapshot
+        if name not in self.builders:
+            raise KeyError(name)
+        return self.refresh(name)
+
+    def _lock_for(self, name: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(name, threading.Lock())
+
+
+# 전역 인스턴스
+_refresher_instance = None
+_refresher_lock = threading.Lock()
+
+
+def get_feed_snapshots() -> FeedSnapshotRefresher:
+    """프로세스 공유 FeedSnapshotRefresher"""
+    global _refresher_instance
+    if _refresher_instance is None:
+        with _refresher_lock:
+            if _refresher_instance is None:
+                _refresher_instance = FeedSnapshotRefresher()
+    return _refresher_instance
+
+
+_refresh_lock_file = None
+
+
+def start_scheduled_refresh(start: Optional[Callable[[], None]] = None,
+                            lock_path: str = REFRESH_LOCK_PATH) -> bool:
+    """
+    주기 갱신 작업 시작 (호스트당 한 프로세스)
+
+    gunicorn 워커마다 스케줄러 스레드가 생기지 않도록, 잠금 파일을 얻은
+    프로세스만 작업을 시작한다. 다른 프로세스는 게시된 스냅샷을 읽기만 한다.
+
+    Args:
+        start: 작업 시작 함수 (기본: get_scheduler().start_feed_refresh)
+        lock_path: 잠금 파일 경로
+
+    Returns:
+        이 프로세스가 갱신을 맡았으면 True
+    """
+    global _refresh_lock_file
+
+    with _refresher_lock:
+        if _refresh_lock_file is not None:
+            return True
+
+        import fcntl
+
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        lock_file = open(lock_path, 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False    # 다른 프로세스가 갱신 중
+
+        try:
+            if start is None:
+                from utils.scheduler import get_scheduler
+                start = get_scheduler().start_feed_refresh
+            start()
+        except BaseException:
+            lock_file.close()
+            raise
+
+        _refresh_lock_file = lock_file
+        return True
@@ -6,7 +6,8 @@ Fantasy Premier League API에서 선수 통계 조회
 import requests
 import logging
 from typing import Dict, Optional, List
-from datetime import datetime, timedelta
+
+from utils.http_client import FPL_API_URL, get_fpl_json
 
 logger = logging.getLogger(__name__)
 
@@ -14,40 +15,21 @@ logger = logging.getLogger(__name__)
 class FPLPlayerService:
     """FPL API 선수 스탯 조회 서비스"""
 
-    FPL_BASE_URL = "https://fantasy.premierleague.com/api"
-    CACHE_TTL = 3600  # 1시간 캐시
-
-    def __init__(self):
-        self._cache = {}
-        self._cache_time = None
+    FPL_BASE_URL = FPL_API_URL
 
     def _fetch_bootstrap_data(self) -> Optional[Dict]:
         """
         FPL Bootstrap 데이터 조회 (전체 선수 목록)
 
+        공용 HTTP 클라이언트 캐시를 사용하므로 API 서버의 fetch_fantasy_data 등
+        다른 호출자와 같은 응답을 공유한다.
+
         Returns:
             Dict with 'elements' (players), 'teams', 'element_types' (positions)
         """
-        # 캐시 확인
-        if self._cache and self._cache_time:
-            if datetime.now() - self._cache_time < timedelta(seconds=self.CACHE_TTL):
-                logger.debug("FPL bootstrap data from cache")
-                return self._cache
-
         try:
-            url = f"{self.FPL_BASE_URL}/bootstrap-static/"
-            logger.info(f"Fetching FPL bootstrap data from: {url}")
-
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # 캐시 저장
-            self._cache = data
-            self._cache_time = datetime.now()
-
-            logger.info(f"FPL bootstrap data fetched: {len(data.get('elements', []))} players")
+            data = get_fpl_json('bootstrap-static/')
+            logger.debug(f"FPL bootstrap data: {len(data.get('elements', []))} players")
             return data
 
         except requests.RequestException as e:
@@ -82,8 +64,8 @@ class FPLPlayerService:
 
             # 이름 매칭 (대소문자 무시)
             if player_name.lower() in fpl_name.lower() or fpl_name.lower() in player_name.lower():
-                player['team_name'] = teams.get(player['team'])
-                matches.append(player)
+                # bootstrap은 공유 객체이므로 복사본에 팀 이름 추가
+                matches.append({**player, 'team_name': teams.get(player['team'])})
 
         if not matches:
             logger.warning(f"No FPL player found for: {player_name}")
@@ -0,0 +1,315 @@
+"""
+FPL Snapshot
+FPL bootstrap-static 응답의 인덱스 스냅샷
+
+bootstrap 응답이 바뀔 때 한 번만 만들고 다음을 미리 계산한다.
+- 팀 이름/ID 맵, 팀별 선수 리스트
+- 정규화된 선수 이름 (전체/팀별)
+- 완료된 gameweek 수
+
+SQUAD_DATA 매핑(FPL ID → SQUAD_DATA 선수)과 팀 내 ICT 순위는 팀별로
+처음 요청될 때 계산해 스냅샷 수명 동안 재사용한다.
+SQUAD_DATA가 다시 로드되면 해당 팀 인덱스를 새로 만든다.
+"""
+
+import logging
+import re
+import threading
+from collections.abc import Mapping
+from typing import Callable, Dict, List, Optional, Tuple
+
+from data.squad_data import SQUAD_DATA
+from utils.team_mapping import normalize_team_name
+
+logger = logging.getLogger(__name__)
+
+
+# ICT Index 팀 내 순위 기준
+STARTER_RANK = 15       # 1-15위: starter
+SUBSTITUTE_RANK = 25    # 16-25위: substitute, 이후: other
+
+_NON_ALPHA = re.compile(r'[^a-zA-Z\s]')
+
+
+def normalize_player_name(name: str) -> str:
+    """
+    선수 이름 정규화 (매칭을 위해)
+
+    특수 문자 제거, 소문자 변환, 공백 정리
+    """
+    return ' '.join(_NON_ALPHA.sub('', name.lower()).split())
+
+
+def full_name(fpl_player: Dict) -> str:
+    """FPL 선수 전체 이름 ("first_name second_name")"""
+    return f"{fpl_player['first_name']} {fpl_player['second_name']}"
+
+
+def _names_match(a: str, b: str) -> bool:
+    return a in b or b in a
+
+
+class SquadIndex:
+    """
+    한 팀 SQUAD_DATA 선수 인덱스 (FPL 선수 → SQUAD_DATA 선수 매칭)
+
+    매칭 순서: ID → 정확한 이름 → 부분 이름 (성 또는 web_name 포함)
+    """
+
+    def __init__(self, squad_players: List[Dict]):
+        self.players = squad_players
+        self.by_id: Dict[int, Dict] = {}
+        self.by_name: Dict[str, Dict] = {}
+        for sp in squad_players:
+            self.by_id.setdefault(sp['id'], sp)
+            self.by_name.setdefault(sp['name'], sp)
+        self.lowered: List[Tuple[str, Dict]] = [(sp['name'].lower(), sp) for sp in squad_players]
+
+    def match(self, fpl_player: Dict) -> Optional[Dict]:
+        """FPL 선수에 대응하는 SQUAD_DATA 선수 (없으면 None)"""
+        fpl_id = fpl_player['id']
+        fpl_name = full_name(fpl_player)
+        fpl_web_name = fpl_player.get('web_name', '')
+
+        # 1. ID 매칭 (가장 정확)
+        sp = self.by_id.get(fpl_id)
+        if sp is not None:
+            logger.debug(f"✅ ID 매칭: {sp['name']} (ID: {sp['id']})")
+            return sp
+
+        # 2. 정확한 이름 매칭
+        sp = self.by_name.get(fpl_name) or self.by_name.get(fpl_web_name)
+        if sp is not None:
+            logger.debug(f"✅ 이름 매칭: {sp['name']} (ID: {sp['id']})")
+            return sp
+
+        # 3. 부분 이름 매칭 (성이 같거나 포함)
+        fpl_last_name = fpl_player['second_name'].lower()
+        fpl_web_name_lower = fpl_web_name.lower()
+        for sp_name_lower, sp in self.lowered:
+            if fpl_last_name in sp_name_lower or fpl_web_name_lower in sp_name_lower:
+                logger.debug(f"✅ 부분 이름 매칭: {sp['name']} (ID: {sp['id']}) <- FPL: {fpl_name}")
+                return sp
+
+        return None
+
+
+class _TeamEntry:
+    """팀별 지연 계산 결과 (SQUAD_DATA 리스트가 바뀌면 폐기)"""
+
+    def __init__(self, squad_players: List[Dict]):
+        self.index = SquadIndex(squad_players)
+        self.matches: Dict[int, Optional[Dict]] = {}    # FPL ID → SQUAD_DATA 선수
+        self.roles: Optional[Dict[int, Dict]] = None     # SQUAD_DATA ID → 역할
+
+
+class FPLSnapshot:
+    """
+    FPL bootstrap 인덱스 (읽기 전용)
+
+    반환하는 선수 dict/역할 dict는 공유 객체이므로 수정하지 않는다.
+    """
+
+    def __init__(self, bootstrap: Dict, squad_data: Optional[Mapping] = None):
+        """
+        Args:
+            bootstrap: bootstrap-static 응답
+            squad_data: 팀 이름 → 선수 리스트 (기본: SQUAD_DATA)
+        """
+        self.bootstrap = bootstrap
+        self.squad_data = SQUAD_DATA if squad_data is None else squad_data
+
+        self.elements: List[Dict] = bootstrap.get('elements', [])
+        self.teams: List[Dict] = bootstrap.get('teams', [])
+        self.team_ids: Dict[str, int] = {}
+        for team in self.teams:
+            self.team_ids.setdefault(team['name'], team['id'])
+        self.teams_by_id: Dict[int, Dict] = {team['id']: team for team in self.teams}
+
+        self.elements_by_id: Dict[int, Dict] = {}
+        self.players_by_team: Dict[int, List[Dict]] = {}
+        self._names: List[Tuple[str, Dict]] = []
+        self._names_by_team: Dict[int, List[Tuple[str, Dict]]] = {}
+        self._exact: Dict[str, Dict] = {}
+        self._exact_by_team: Dict[Tuple[int, str], Dict] = {}
+        for player in self.elements:
+            normalized = normalize_player_name(full_name(player))
+            entry = (normalized, player)
+            self.elements_by_id[player['id']] = player
+            self.players_by_team.setdefault(player['team'], []).append(player)
+            self._names.append(entry)
+            self._names_by_team.setdefault(player['team'], []).append(entry)
+            self._exact.setdefault(normalized, player)
+            self._exact_by_team.setdefault((player['team'], normalized), player)
+
+        completed = sum(1 for event in bootstrap.get('events', []) if event.get('finished', False))
+        self.matches_played = completed if completed > 0 else 1  # 최소 1경기
+
+        self._teams: Dict[str, _TeamEntry] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def of(cls, fantasy_data) -> Optional['FPLSnapshot']:
+        """스냅샷 또는 bootstrap dict → 스냅샷 (None은 그대로)"""
+        if fantasy_data is None or isinstance(fantasy_data, cls):
+            return fantasy_data
+        return cls(fantasy_data)
+
+    # ------------------------------------------------------------------
+    # 팀 / 선수 조회
+    # ------------------------------------------------------------------
+
+    def team_id(self, team_name: str) -> Optional[int]:
+        """팀 이름 (Squad/Fantasy 형식 모두 가능) → FPL 팀 ID"""
+        return self.team_ids.get(normalize_team_name(team_name, to_format='fantasy'))
+
+    def find_player(self, player_name: str, team_id: Optional[int] = None) -> Optional[Dict]:
+        """
+        이름으로 FPL 선수 찾기
+
+        정규화된 이름이 정확히 같은 선수를 우선하고, 없으면 한쪽이
+        다른 쪽을 포함하는 첫 선수를 반환한다.
+
+        Args:
+            player_name: 선수 이름
+            team_id: 지정하면 해당 팀 선수만
+        """
+        normalized = normalize_player_name(player_name)
+        if team_id is None:
+            exact, candidates = self._exact.get(normalized), self._names
+        else:
+            exact, candidates = self._exact_by_team.get((team_id, normalized)), self._names_by_team.get(team_id, [])
+        if exact is not None:
+            return exact
+
+        for candidate_name, player in candidates:
+            if _names_match(normalized, candidate_name):
+                return player
+        return None
+
+    # ------------------------------------------------------------------
+    # SQUAD_DATA 매핑 / ICT 역할
+    # ------------------------------------------------------------------
+
+    def squad_player(self, fpl_player: Dict, team_name: str) -> Optional[Dict]:
+        """
+        FPL 선수 → SQUAD_DATA 선수 (team_name 명단 기준, 결과는 캐시)
+
+        team_name이 SQUAD_DATA에 없으면 None
+        """
+        entry = self._team_entry(team_name)
+        if entry is None:
+            return None
+
+        fpl_id = fpl_player['id']
+        if fpl_id in entry.matches:
+            return entry.matches[fpl_id]
+
+        squad_player = entry.index.match(fpl_player)
+        if squad_player is None:
+            logger.warning(f"❌ 매칭 실패: FPL {full_name(fpl_player)} (ID: {fpl_id}) in {team_name}")
+        entry.matches[fpl_id] = squad_player
+        return squad_player
+
+    def player_roles(self, team_name: str) -> Dict[int, Dict]:
+        """
+        팀 내 ICT Index 기반 선수 역할
+
+        - starter: 팀 내 ICT Index 상위 15명 (주전)
+        - substitute: 팀 내 ICT Index 16-25위 (후보)
+        - other: 나머지 (기타)
+
+        Returns:
+            {squad_data_player_id: {'role': str, 'ict_index': float, 'rank': int}}
+            ⚠️ SQUAD_DATA 선수 ID를 키로 사용 (FPL ID가 아님!)
+        """
+        team_id = self.team_id(team_name)
+        if not team_id:
+            logger.warning(f"⚠️ Team not found in Fantasy API: {team_name}")
+            return {}
+
+        entry = self._team_entry(team_name)
+        if entry is None:
+            return {}
+        if entry.roles is not None:
+            return entry.roles
+
+        # 해당 팀 선수들 ICT Index 기준 정렬
+        team_players = []
+        for player in self.players_by_team.get(team_id, []):
+            squad_player = self.squad_player(player, team_name)
+            if squad_player:
+                team_players.append((float(player.get('ict_index', '0.0')), squad_player['id']))
+        team_players.sort(key=lambda item: item[0], reverse=True)
+
+        roles = {}
+        for rank, (ict_index, squad_id) in enumerate(team_players, start=1):
+            if rank <= STARTER_RANK:
+                role = 'starter'
+            elif rank <= SUBSTITUTE_RANK:
+                role = 'substitute'
+            else:
+                role = 'other'
+            roles[squad_id] = {'role': role, 'ict_index': ict_index, 'rank': rank}
+
+        logger.info(
+            f"📊 {team_name} ICT Index 역할 할당: "
+            f"주전 {sum(1 for r in roles.values() if r['role'] == 'starter')}명, "
+            f"후보 {sum(1 for r in roles.values() if r['role'] == 'substitute')}명, "
+            f"기타 {sum(1 for r in roles.values() if r['role'] == 'other')}명 "
+            f"(매핑된 선수 {len(team_players)}명)"
+        )
+        entry.roles = roles
+        return roles
+
+    def _team_entry(self, team_name: str) -> Optional[_TeamEntry]:
+        squad_players = self.squad_data.get(team_name)
+        if squad_players is None:
+            return None
+
+        entry = self._teams.get(team_name)
+        if entry is not None and entry.index.players is squad_players:
+            return entry
+
+        with self._lock:
+            entry = self._teams.get(team_name)
+            if entry is None or entry.index.players is not squad_players:
+                entry = _TeamEntry(squad_players)
+                self._teams[team_name] = entry
+            return entry
+
+
+class FPLSnapshotCache:
+    """
+    bootstrap 조회 함수 → 스냅샷
+
+    조회 함수가 이전과 같은 bootstrap 객체를 돌려주면 스냅샷을 재사용하고,
+    새 객체(갱신된 응답)를 돌려줄 때만 다시 만든다.
+    조회 함수는 자체 캐시를 가진 저비용 호출이어야 한다 (예: fetch_fantasy_data).
+    """
+
+    def __init__(self, fetch: Callable[[], Optional[Dict]]):
+        self.fetch = fetch
+        self._snapshot: Optional[FPLSnapshot] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[FPLSnapshot]:
+        """현재 bootstrap의 스냅샷 (조회 실패 시 None)"""
+        bootstrap = self.fetch()
+        if not bootstrap:
+            return None
+
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.bootstrap is bootstrap:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot.bootstrap is not bootstrap:
+                self._snapshot = FPLSnapshot(bootstrap)
+                logger.info(f"FPL snapshot built: {len(self._snapshot.elements)} players")
+            return self._snapshot
+
+    def invalidate(self):
+        """다음 get에서 스냅샷을 다시 만들도록 표시"""
+        with self._lock:
+            self._snapshot = None
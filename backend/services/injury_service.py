@@ -19,6 +19,8 @@ from typing import Dict, List, Optional, Tuple
 import requests
 from bs4 import BeautifulSoup
 
+from utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,6 +77,9 @@ class InjuryService:
             "X-RapidAPI-Host": "api-football-v1.p.rapidapi.com"
         }
 
+        # 공용 HTTP 클라이언트 (연결 풀 공유, 동시 요청 병합; 결과 캐시는 cache_dir 파일이 담당)
+        self.http = get_http_client()
+
         logger.info("InjuryService initialized")
 
     # ==========================================================================
@@ -108,12 +113,10 @@ class InjuryService:
             }
 
             logger.info(f"Fetching injuries from API-Football for {team_name} (team_id={team_id})")
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-
-            if response.status_code != 200:
-                return False, None, f"API returned status {response.status_code}"
-
-            data = response.json()
+            try:
+                data = self.http.get_json(url, headers=self.headers, params=params, timeout=10)
+            except requests.HTTPError as e:
+                return False, None, f"API returned status {e.response.status_code}"
 
             if 'response' not in data:
                 return False, None, "Invalid API response format"
@@ -180,12 +183,12 @@ class InjuryService:
             url = f"https://fbref.com/en/squads/{team_id}/injuries/{team_name}-Injuries"
 
             logger.info(f"Scraping injuries from FBref for {team_name}")
-            response = requests.get(url, timeout=10)
-
-            if response.status_code != 200:
-                return False, None, f"FBref returned status {response.status_code}"
+            try:
+                content = self.http.fetch(url, timeout=10, as_json=False).data
+            except requests.HTTPError as e:
+                return False, None, f"FBref returned status {e.response.status_code}"
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(content, 'html.parser')
 
             # Parse injury table
             injuries = []
@@ -0,0 +1,310 @@
+"""
+Simulation Job Runners
+Work functions executed by simulation job workers
+
+A runner takes (payload, emit, cancel_token), reports progress by emitting
+SimulationEvents (stored in the job's event log, streamed to clients as-is)
+and returns the JSON-serializable result stored on the job. Runners emit their
+own final success/completed event. On failure they either raise (the worker
+records an error event) or emit their own error event and raise JobFailed.
+
+Runners are referenced by import path ("module:function") so worker processes
+started with the spawn method can resolve them.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+from services.simulation_jobs import JobFailed
+from utils.cancellation import CancellationToken, SimulationCancelled, call_with_cancellation, checkpoint
+from utils.simulation_events import SimulationEvent, SimulationEventType
+
+logger = logging.getLogger(__name__)
+
+
+Emit = Callable[[SimulationEvent], None]
+
+# kind -> "module:function"
+DEFAULT_RUNNERS = {
+    'v3': 'services.simulation_job_runners:run_v3_simulation',
+    'v2_enriched': 'services.simulation_job_runners:run_v2_enriched_simulation',
+    'ai_simulation': 'services.simulation_job_runners:run_ai_simulation',
+}
+
+
+def fixture_seed(home_team: str, away_team: str) -> int:
+    """
+    Monte Carlo seed derived from the fixture
+
+    Repeat requests for a fixture use the same seed, so Phase 3 results can be
+    served from the pipeline result cache while the inputs are unchanged.
+    """
+    from simulation.v3.pipeline.result_cache import fingerprint
+
+    return int(fingerprint('v3_seed', home_team, away_team)[:8], 16)
+
+
+def run_v3_simulation(payload: Dict[str, Any], emit: Emit,
+                      cancel_token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+    """
+    V3 Pipeline (Ensemble → AI scenarios → Monte Carlo validation)
+
+    Payload: {"home_team", "away_team", "validation_runs"?, "seed"?}
+    Emits the event sequence the /v3/stream client expects. Phases go through
+    the pipeline's result cache (seed defaults to fixture_seed).
+    """
+    try:
+        return _run_v3_pipeline(payload, emit, cancel_token)
+    except SimulationCancelled:
+        raise
+    except Exception as e:
+        logger.error(f"V3 Pipeline error: {str(e)}", exc_info=True)
+        emit(SimulationEvent.error(f'V3 Pipeline error: {str(e)}', 'pipeline_error'))
+        raise JobFailed(str(e)) from e
+
+
+def _run_v3_pipeline(payload: Dict[str, Any], emit: Emit,
+                     cancel_token: Optional[CancellationToken]) -> Dict[str, Any]:
+    from services.enriched_data_loader import EnrichedDomainDataLoader
+    from simulation.v2.parallel_executor import AdaptiveSamplingConfig, ExecutorConfig
+    from simulation.v3.pipeline import SimulationPipelineV3, PipelineConfig
+
+    home_team = payload['home_team']
+    away_team = payload['away_team']
+    start_time = time.time()
+
+    logger.info(f"Simulation job (V3 Pipeline): {home_team} vs {away_team}")
+
+    # Send started event
+    emit(SimulationEvent.info(
+        f"V3 Pipeline started: {home_team} vs {away_team}",
+        "started"
+    ))
+
+    # Phase 0: Load team data
+    emit(SimulationEvent.info("Loading team data...", "loading_teams"))
+
+    loader = EnrichedDomainDataLoader()
+    home_data, away_data = loader.load_match_data(home_team, away_team)
+
+    emit(SimulationEvent.info(
+        f"Teams loaded: {home_team} (Attack: {home_data.derived_strengths.attack_strength:.1f}), "
+        f"{away_team} (Attack: {away_data.derived_strengths.attack_strength:.1f})",
+        "teams_loaded"
+    ))
+
+    # Create pipeline config (Monte Carlo executor from SIMULATION_EXECUTOR_*,
+    # CI-based early stopping from SIMULATION_ADAPTIVE_*)
+    executor = ExecutorConfig.from_env()
+    config = PipelineConfig(
+        validation_runs=payload.get('validation_runs', 3000),  # Production setting
+        executor_mode=executor.mode,
+        max_workers=executor.max_workers,
+        adaptive_sampling=AdaptiveSamplingConfig.from_env(),
+        seed=payload.get('seed', fixture_seed(home_team, away_team)),
+        log_level="INFO"
+    )
+
+    pipeline = SimulationPipelineV3(config=config)
+
+    # ========================================
+    # Phase 1: Mathematical Models (Ensemble)
+    # ========================================
+    emit(SimulationEvent.info(
+        "Phase 1/4: Running Mathematical Models (Poisson, Zone, Player)...",
+        "phase1_started"
+    ))
+
+    ensemble_result, ensemble_cached = pipeline.ensemble_phase(home_data, away_data)
+    checkpoint(cancel_token)
+
+    emit(SimulationEvent.info(
+        f"Phase 1 Complete: Ensemble probabilities calculated",
+        "phase1_complete",
+        {
+            "probabilities": ensemble_result.ensemble_probabilities,
+            "home_win": ensemble_result.ensemble_probabilities['home_win'],
+            "draw": ensemble_result.ensemble_probabilities['draw'],
+            "away_win": ensemble_result.ensemble_probabilities['away_win'],
+            "cached": ensemble_cached
+        }
+    ))
+
+    # ========================================
+    # Phase 2: AI Scenario Generation
+    # ========================================
+    emit(SimulationEvent.info(
+        "Phase 2/4: Generating AI scenarios (NO Templates)...",
+        "phase2_started"
+    ))
+
+    generated_scenarios = call_with_cancellation(
+        cancel_token, pipeline.scenario_phase, home_data, away_data, ensemble_result
+    )
+
+    emit(SimulationEvent.info(
+        f"Phase 2 Complete: {generated_scenarios.scenario_count} scenarios generated",
+        "phase2_complete",
+        {
+            "scenario_count": generated_scenarios.scenario_count,
+            "scenarios": [
+                {
+                    "id": sc.id,
+                    "name": sc.name,
+                    "probability": sc.expected_probability
+                }
+                for sc in generated_scenarios.scenarios
+            ]
+        }
+    ))
+
+    # ========================================
+    # Phase 3: Monte Carlo Validation
+    # ========================================
+    # With adaptive sampling, scenarios stop early once their CI is narrow enough
+    adaptive = config.adaptive_sampling
+    runs_per_scenario = adaptive.max_runs if adaptive else config.validation_runs
+    emit(SimulationEvent.info(
+        f"Phase 3/4: Running {'up to ' if adaptive else ''}"
+        f"{generated_scenarios.scenario_count * runs_per_scenario:,} simulations...",
+        "phase3_started",
+        {
+            "total_runs": generated_scenarios.scenario_count * runs_per_scenario,
+            "runs_per_scenario": runs_per_scenario,
+            "adaptive": adaptive is not None
+        }
+    ))
+
+    validation_result, validation_cached = pipeline.validation_phase(
+        generated_scenarios.scenarios,
+        home_data,
+        away_data,
+        ensemble_result,
+        cancel_token
+    )
+
+    emit(SimulationEvent.info(
+        f"Phase 3 Complete: {validation_result.total_runs:,} simulations completed",
+        "phase3_complete",
+        {
+            "total_runs": validation_result.total_runs,
+            "convergence": validation_result.final_probabilities,
+            "cached": validation_cached
+        }
+    ))
+
+    # Prepare final result
+    execution_time = time.time() - start_time
+
+    final_result = {
+        "match": {
+            "home_team": home_team,
+            "away_team": away_team
+        },
+        "probabilities": {
+            "home_win": validation_result.final_probabilities['home_win'],
+            "draw": validation_result.final_probabilities['draw'],
+            "away_win": validation_result.final_probabilities['away_win']
+        },
+        "scenarios": [
+            {
+                "id": sc.id,
+                "name": sc.name,
+                "expected_probability": sc.expected_probability,
+                "events_count": len(sc.events)
+            }
+            for sc in generated_scenarios.scenarios
+        ],
+        "validation": {
+            "total_scenarios": validation_result.total_scenarios,
+            "total_runs": validation_result.total_runs,
+            "scenario_results": [
+                {
+                    "scenario_id": sr.scenario_id,
+                    "scenario_name": sr.scenario_name,
+                    "convergence_probability": sr.convergence_probability,
+                    "avg_score": sr.avg_score
+                }
+                for sr in validation_result.scenario_results
+            ]
+        },
+        "execution_time": execution_time,
+        "seed": validation_result.seed,
+        "pipeline": "v3",
+        "timestamp": time.time()
+    }
+
+    # Send completed event
+    emit(SimulationEvent.success(
+        f"V3 Pipeline completed in {execution_time:.1f}s",
+        "completed",
+        final_result
+    ))
+
+    logger.info(f"Simulation job completed (V3 Pipeline): {home_team} vs {away_team} ({execution_time:.1f}s)")
+
+    return final_result
+
+
+def run_v2_enriched_simulation(payload: Dict[str, Any], emit: Emit,
+                               cancel_token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+    """
+    V2 Pipeline (Phase 1-7) on enriched team data
+
+    Payload: {"home_team", "away_team", "match_context"?}
+    """
+    from services.enriched_simulation_service import get_enriched_simulation_service
+
+    outcome = {}
+
+    def forward(event: SimulationEvent):
+        if event.event_type == SimulationEventType.COMPLETED:
+            outcome['result'] = event.data.get('result')
+        elif event.event_type == SimulationEventType.ERROR:
+            outcome['error'] = event.data.get('error')
+        emit(event)
+
+    get_enriched_simulation_service().run_v2_pipeline(
+        payload['home_team'],
+        payload['away_team'],
+        payload.get('match_context'),
+        forward,
+        cancel_token
+    )
+
+    if 'result' not in outcome:
+        raise JobFailed(outcome.get('error') or 'V2 pipeline produced no result')
+    return outcome['result']
+
+
+def run_ai_simulation(payload: Dict[str, Any], emit: Emit,
+                      cancel_token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+    """
+    Single-call AI match simulation (SimulationService.simulate_match)
+
+    Payload: {"home_team", "away_team", "user_id", "tier", "weights"?}
+    """
+    from services.simulation_service import get_simulation_service
+
+    home_team = payload['home_team']
+    away_team = payload['away_team']
+    start_time = time.time()
+    emit(SimulationEvent.started(home_team, away_team))
+
+    success, result, error = call_with_cancellation(
+        cancel_token,
+        get_simulation_service().simulate_match,
+        home_team=home_team,
+        away_team=away_team,
+        user_id=payload.get('user_id'),
+        tier=payload.get('tier', 'BASIC'),
+        weights=payload.get('weights')
+    )
+
+    if not success:
+        emit(SimulationEvent.error(error or 'Simulation failed', stage='ai_simulation'))
+        raise JobFailed(error or 'Simulation failed')
+
+    emit(SimulationEvent.completed(result, time.time() - start_time))
+    return result
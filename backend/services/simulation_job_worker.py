@@ -0,0 +1,271 @@
+"""
+Simulation Job Worker
+Local worker processes that execute queued simulation jobs
+
+Each worker process claims the oldest queued job from the SQLite store, runs
+its runner (services.simulation_job_runners) and records the result. While a
+job runs, a heartbeat thread keeps it alive in the store and turns a
+cancellation request (DELETE /jobs/<id>) into a CancellationToken cancel.
+
+JobWorkerPool starts the processes (spawn, so no Flask/thread state is forked),
+restarts ones that die, requeues jobs whose worker vanished and purges old
+jobs. Run it either:
+
+- embedded: start_embedded_workers() from the web app. Only one web process
+  per host holds the pool (file lock next to the database); SIMULATION_JOB_WORKERS
+  sets its size, 0 disables it
+- standalone: python -m services.simulation_job_worker --workers 4
+"""
+
+import argparse
+import importlib
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from services.simulation_job_runners import DEFAULT_RUNNERS
+from services.simulation_jobs import (
+    CANCELLED,
+    FAILED,
+    SUCCEEDED,
+    JobFailed,
+    SimulationJob,
+    SimulationJobStore,
+    get_job_store
+)
+from utils.cancellation import CancellationToken, SimulationCancelled
+from utils.simulation_events import SimulationEvent
+
+logger = logging.getLogger(__name__)
+
+
+HEARTBEAT_SECONDS = 1.0          # job heartbeat / cancellation check
+IDLE_POLL_SECONDS = 0.5          # queue poll when idle
+STALE_AFTER_SECONDS = 30.0       # running job without heartbeat → worker lost
+SUPERVISE_SECONDS = 5.0
+RETENTION_SECONDS = 7 * 24 * 3600
+
+
+def resolve_runner(path: str) -> Callable:
+    """'module:function' → callable"""
+    module_name, _, attribute = path.partition(':')
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def run_job(store: SimulationJobStore, job: SimulationJob, runner: Callable) -> str:
+    """
+    Execute one claimed job and record its outcome
+
+    Returns:
+        Final status
+    """
+    cancel_token = CancellationToken()
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(HEARTBEAT_SECONDS):
+            try:
+                if store.heartbeat(job.id):
+                    cancel_token.cancel("cancelled by request")
+            except Exception as e:
+                logger.warning(f"Job {job.id} heartbeat failed: {e}")
+
+    def emit(event: SimulationEvent):
+        cancel_token.raise_if_cancelled()
+        store.append_event(job.id, event)
+
+    heartbeat = threading.Thread(target=beat, name=f'job-heartbeat-{job.id[:8]}', daemon=True)
+    heartbeat.start()
+    started = time.time()
+    try:
+        result = runner(job.payload, emit, cancel_token)
+        status, error = SUCCEEDED, None
+    except SimulationCancelled as e:
+        result, status, error = None, CANCELLED, str(e)
+        store.append_event(job.id, SimulationEvent.error('Simulation cancelled', stage='cancelled'))
+    except JobFailed as e:
+        # Runner already reported the failure in the event log
+        result, status, error = None, FAILED, str(e)
+    except Exception as e:
+        logger.error(f"Simulation job {job.id} failed: {e}", exc_info=True)
+        result, status, error = None, FAILED, str(e)
+        store.append_event(job.id, SimulationEvent.error(f"Simulation failed: {e}", stage='job_error'))
+    finally:
+        stop.set()
+
+    store.finish(job.id, status, result=result, error=error)
+    logger.info(f"Simulation job {job.id} ({job.kind}) {status} in {time.time() - started:.1f}s")
+    return status
+
+
+def worker_main(db_path: str, worker_name: str, runners: Dict[str, str], stop_event) -> None:
+    """Worker process entry point: claim and run jobs until stop_event is set"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)    # the parent handles Ctrl+C
+    logging.basicConfig(level=logging.INFO)
+    store = SimulationJobStore(Path(db_path))
+    resolved: Dict[str, Callable] = {}
+
+    while not stop_event.is_set():
+        job = store.claim(worker_name)
+        if job is None:
+            stop_event.wait(IDLE_POLL_SECONDS)
+            continue
+
+        if job.kind not in runners:
+            store.append_event(job.id, SimulationEvent.error(f"Unknown job kind: {job.kind}", stage='job_error'))
+            store.finish(job.id, FAILED, error=f"unknown kind {job.kind}")
+            continue
+        if job.kind not in resolved:
+            resolved[job.kind] = resolve_runner(runners[job.kind])
+        run_job(store, job, resolved[job.kind])
+
+
+class JobWorkerPool:
+    """
+    Supervised pool of job worker processes
+
+    Usage:
+        pool = JobWorkerPool(num_workers=2)
+        pool.start()
+        ...
+        pool.stop()
+    """
+
+    def __init__(self,
+                 store: Optional[SimulationJobStore] = None,
+                 num_workers: int = 2,
+                 runners: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            store: Job store (default: global store)
+            num_workers: Worker process count
+            runners: kind → "module:function" (default: DEFAULT_RUNNERS)
+        """
+        self.store = store or get_job_store()
+        self.num_workers = num_workers
+        self.runners = dict(runners or DEFAULT_RUNNERS)
+        self._context = multiprocessing.get_context('spawn')
+        self._stop_event = self._context.Event()
+        self._processes: List[Optional[multiprocessing.Process]] = [None] * num_workers
+        self._supervisor: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    @property
+    def alive(self) -> int:
+        return sum(1 for process in self._processes if process is not None and process.is_alive())
+
+    def start(self) -> None:
+        """Start worker processes and the supervisor thread"""
+        for slot in range(self.num_workers):
+            self._spawn(slot)
+        self._supervisor = threading.Thread(target=self._supervise, name='job-supervisor', daemon=True)
+        self._supervisor.start()
+        logger.info(f"Simulation job pool started ({self.num_workers} workers, {self.store.path})")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop claiming jobs and wait for running ones (terminates after timeout)"""
+        self._stopping.set()
+        self._stop_event.set()
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            if process is None:
+                continue
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+                process.join(1.0)
+        logger.info("Simulation job pool stopped")
+
+    def _spawn(self, slot: int) -> None:
+        name = f"{socket.gethostname()}:{os.getpid()}:{slot}"
+        process = self._context.Process(
+            target=worker_main,
+            args=(str(self.store.path), name, self.runners, self._stop_event),
+            name=f'simulation-job-worker-{slot}',
+            daemon=True
+        )
+        process.start()
+        self._processes[slot] = process
+
+    def _supervise(self) -> None:
+        last_purge = 0.0
+        while not self._stopping.wait(SUPERVISE_SECONDS):
+            try:
+                for slot, process in enumerate(self._processes):
+                    if process is not None and not process.is_alive():
+                        logger.warning(f"Simulation job worker {slot} exited ({process.exitcode}), restarting")
+                        self._spawn(slot)
+                self.store.recover_stale(STALE_AFTER_SECONDS)
+                if time.monotonic() - last_purge > 3600:
+                    self.store.purge(RETENTION_SECONDS)
+                    last_purge = time.monotonic()
+            except Exception as e:
+                logger.error(f"Simulation job supervisor error: {e}")
+
+
+# Embedded pool (at most one per host, see start_embedded_workers)
+_embedded_pool: Optional[JobWorkerPool] = None
+_embedded_lock_file = None
+_embedded_guard = threading.Lock()
+
+
+def start_embedded_workers(num_workers: Optional[int] = None) -> Optional[JobWorkerPool]:
+    """
+    Start the worker pool inside this web process if no other process on the host has
+
+    Args:
+        num_workers: Worker count (default: SIMULATION_JOB_WORKERS, 2; 0 disables)
+
+    Returns:
+        The pool if this process owns it, else None
+    """
+    global _embedded_pool, _embedded_lock_file
+
+    if num_workers is None:
+        num_workers = int(os.getenv('SIMULATION_JOB_WORKERS', '2'))
+    if num_workers <= 0:
+        return None
+
+    with _embedded_guard:
+        if _embedded_pool is not None:
+            return _embedded_pool
+
+        import fcntl
+
+        store = get_job_store()
+        lock_file = open(f"{store.path}.workers.lock", 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return None     # another process on this host runs the pool
+
+        _embedded_lock_file = lock_file
+        _embedded_pool = JobWorkerPool(store, num_workers)
+        _embedded_pool.start()
+        return _embedded_pool
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run simulation job workers")
+    parser.add_argument('--workers', type=int, default=int(os.getenv('SIMULATION_JOB_WORKERS', '2')))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    pool = JobWorkerPool(num_workers=args.workers)
+    pool.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pool.stop()
+
+
+if __name__ == '__main__':
+    main()
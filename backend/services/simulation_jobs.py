@@ -0,0 +1,518 @@
+"""
+Simulation Jobs
+Durable job queue for long-running simulations
+
+Web requests only submit a job and read its event log. Local worker processes
+(services.simulation_job_worker) run the pipeline, so gunicorn workers stay
+free no matter how many simulations are in flight.
+
+- Storage: SQLite file (SIMULATION_JOBS_PATH, default data/simulation_jobs.db)
+  in WAL mode, shared by web and worker processes and kept across restarts
+- Deduplication: a job's fingerprint covers its kind, its inputs and the team
+  data version. While a job with the same fingerprint is queued or running,
+  submit() returns that job instead of creating another one
+- Progress: workers append SimulationEvents to a per-job event log. Readers
+  tail it by sequence number, so several clients can follow one job and a
+  reconnecting client resumes with Last-Event-ID
+- Access: users who submitted or joined a job are attached to it. Only they
+  can read it, and cancelling only detaches the caller until the last
+  attached user leaves
+- Recovery: running jobs whose worker stopped heartbeating are requeued
+  (or failed after max attempts)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.simulation_events import SimulationEvent
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / 'data' / 'simulation_jobs.db'
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+TERMINAL_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+# Payload fields that identify the submitting user (kept out of to_dict, jobs are shared)
+PRIVATE_PAYLOAD_FIELDS = ('user_id', 'tier')
+
+
+class JobFailed(Exception):
+    """Runner failure that has already been reported in the job's event log"""
+
+
+@dataclass
+class SimulationJob:
+    """Job record"""
+    id: str
+    kind: str
+    fingerprint: str
+    payload: Dict[str, Any]
+    status: str
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+    created_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+    worker: Optional[str]
+    attempts: int
+    cancel_requested: bool
+
+    @property
+    def terminal(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """Public view (without fingerprint and the submitting user's identity)"""
+        job = asdict(self)
+        job.pop('fingerprint')
+        job['payload'] = {key: value for key, value in job['payload'].items()
+                          if key not in PRIVATE_PAYLOAD_FIELDS}
+        if not include_result:
+            job.pop('result')
+        return job
+
+
+@dataclass
+class JobEvent:
+    """Event log entry"""
+    seq: int
+    event_type: str
+    data: Dict[str, Any]
+    timestamp: str
+
+    def to_sse_format(self) -> str:
+        """SSE frame with the sequence number as event id (for Last-Event-ID resume)"""
+        event = SimulationEvent(event_type=self.event_type, data=self.data, timestamp=self.timestamp)
+        return f"id: {self.seq}\n{event.to_sse_format()}"
+
+
+_JOB_COLUMNS = ('id, kind, fingerprint, payload, status, result, error, created_at, '
+                'started_at, finished_at, worker, attempts, cancel_requested')
+
+
+class SimulationJobStore:
+    """
+    SQLite job queue + event log (thread-safe, multi-process)
+    """
+
+    def __init__(self, path: Path = DEFAULT_PATH):
+        """
+        Initialize job store
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit mode; multi-statement updates use explicit BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                ' id TEXT PRIMARY KEY,'
+                ' kind TEXT NOT NULL,'
+                ' fingerprint TEXT NOT NULL,'
+                ' payload TEXT NOT NULL,'
+                ' status TEXT NOT NULL,'
+                ' result TEXT,'
+                ' error TEXT,'
+                ' created_at REAL NOT NULL,'
+                ' started_at REAL,'
+                ' finished_at REAL,'
+                ' heartbeat_at REAL,'
+                ' worker TEXT,'
+                ' attempts INTEGER NOT NULL DEFAULT 0,'
+                ' cancel_requested INTEGER NOT NULL DEFAULT 0);'
+                'CREATE INDEX IF NOT EXISTS jobs_queue ON jobs (status, created_at);'
+                "CREATE UNIQUE INDEX IF NOT EXISTS jobs_inflight ON jobs (fingerprint)"
+                "  WHERE status IN ('queued', 'running');"
+                'CREATE TABLE IF NOT EXISTS job_events ('
+                ' job_id TEXT NOT NULL,'
+                ' seq INTEGER NOT NULL,'
+                ' event_type TEXT NOT NULL,'
+                ' data TEXT NOT NULL,'
+                ' timestamp TEXT NOT NULL,'
+                ' PRIMARY KEY (job_id, seq));'
+                'CREATE TABLE IF NOT EXISTS job_users ('
+                ' job_id TEXT NOT NULL,'
+                ' user_id TEXT NOT NULL,'
+                ' PRIMARY KEY (job_id, user_id));'
+            )
+
+    @classmethod
+    def from_env(cls) -> 'SimulationJobStore':
+        """Store at SIMULATION_JOBS_PATH (default data/simulation_jobs.db)"""
+        return cls(Path(os.getenv('SIMULATION_JOBS_PATH', str(DEFAULT_PATH))))
+
+    # ------------------------------------------------------------------
+    # Submission / lookup
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        fingerprint: str,
+        user_id: Optional[str] = None
+    ) -> Tuple[SimulationJob, bool]:
+        """
+        Queue a job, or join the in-flight job with the same fingerprint
+
+        Args:
+            user_id: User to attach to the job (None for anonymous requests)
+
+        Returns:
+            Tuple of (job, created)
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute(
+                    f'SELECT {_JOB_COLUMNS} FROM jobs WHERE fingerprint = ? AND status IN (?, ?)',
+                    (fingerprint, *ACTIVE_STATUSES)
+                ).fetchone()
+                if row is not None:
+                    self._attach(row[0], user_id)
+                    self._conn.execute('COMMIT')
+                    return _job_from_row(row), False
+
+                job_id = uuid.uuid4().hex
+                self._conn.execute(
+                    'INSERT INTO jobs (id, kind, fingerprint, payload, status, created_at)'
+                    ' VALUES (?, ?, ?, ?, ?, ?)',
+                    (job_id, kind, fingerprint, _dumps(payload), QUEUED, now)
+                )
+                self._attach(job_id, user_id)
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+
+        logger.info(f"Simulation job {job_id} queued ({kind})")
+        return self.get(job_id), True
+
+    def get(self, job_id: str) -> Optional[SimulationJob]:
+        with self._lock:
+            row = self._conn.execute(f'SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return _job_from_row(row) if row else None
+
+    def is_attached(self, job_id: str, user_id: str) -> bool:
+        """Whether the user submitted or joined the job"""
+        with self._lock:
+            row = self._conn.execute('SELECT 1 FROM job_users WHERE job_id = ? AND user_id = ?',
+                                     (job_id, str(user_id))).fetchone()
+        return row is not None
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status"""
+        with self._lock:
+            rows = self._conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        return dict(rows)
+
+    def wait(self, job_id: str, timeout: float, poll: float = 0.25) -> Optional[SimulationJob]:
+        """Poll until the job finishes or timeout elapses (returns the latest record)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job.terminal or time.monotonic() >= deadline:
+                return job
+            time.sleep(poll)
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def claim(self, worker: str) -> Optional[SimulationJob]:
+        """Take the oldest queued job and mark it running"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute(
+                    'SELECT id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1', (QUEUED,)
+                ).fetchone()
+                if row is None:
+                    self._conn.execute('COMMIT')
+                    return None
+                self._conn.execute(
+                    'UPDATE jobs SET status = ?, started_at = ?, heartbeat_at = ?, worker = ?,'
+                    ' attempts = attempts + 1 WHERE id = ?',
+                    (RUNNING, now, now, worker, row[0])
+                )
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return self.get(row[0])
+
+    def heartbeat(self, job_id: str) -> bool:
+        """Refresh a running job's heartbeat; returns whether cancellation was requested"""
+        with self._lock:
+            self._conn.execute('UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND status = ?',
+                               (time.time(), job_id, RUNNING))
+            row = self._conn.execute('SELECT cancel_requested FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return bool(row and row[0])
+
+    def finish(self, job_id: str, status: str, result: Optional[Dict] = None, error: Optional[str] = None) -> bool:
+        """Record the outcome of a running job (False if it was no longer running)"""
+        if status not in TERMINAL_STATUSES:
+            raise ValueError(f"Not a terminal status: {status}")
+        with self._lock:
+            updated = self._conn.execute(
+                'UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ? AND status = ?',
+                (status, _dumps(result) if result is not None else None, error, time.time(), job_id, RUNNING)
+            ).rowcount
+        logger.info(f"Simulation job {job_id} {status}" + (f": {error}" if error else ""))
+        return bool(updated)
+
+    def request_cancel(self, job_id: str) -> Optional[SimulationJob]:
+        """
+        Cancel a job (queued jobs stop immediately, running jobs at their next checkpoint)
+        """
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                cancelled_queued = self._cancel(job_id)
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        if cancelled_queued:
+            self.append_event(job_id, SimulationEvent.error('Simulation cancelled', stage='cancelled'))
+        return self.get(job_id)
+
+    def release(self, job_id: str, user_id: str) -> Tuple[Optional[SimulationJob], bool]:
+        """
+        Detach a user from a job, cancelling it once no attached user is left
+
+        Returns:
+            Tuple of (job, cancelled); job is None if the user was not attached
+        """
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                detached = self._conn.execute('DELETE FROM job_users WHERE job_id = ? AND user_id = ?',
+                                              (job_id, str(user_id))).rowcount
+                remaining = self._conn.execute('SELECT COUNT(*) FROM job_users WHERE job_id = ?',
+                                               (job_id,)).fetchone()[0]
+                cancelled = bool(detached) and remaining == 0
+                cancelled_queued = self._cancel(job_id) if cancelled else False
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        if not detached:
+            return None, False
+        if cancelled_queued:
+            self.append_event(job_id, SimulationEvent.error('Simulation cancelled', stage='cancelled'))
+        return self.get(job_id), cancelled
+
+    def recover_stale(self, timeout: float, max_attempts: int = 2) -> List[str]:
+        """
+        Requeue running jobs whose worker stopped heartbeating
+
+        Jobs that already used max_attempts are failed instead.
+
+        Returns:
+            IDs of recovered jobs
+        """
+        cutoff = time.time() - timeout
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                stale = self._conn.execute(
+                    'SELECT id, attempts FROM jobs WHERE status = ? AND heartbeat_at < ?', (RUNNING, cutoff)
+                ).fetchall()
+                for job_id, attempts in stale:
+                    if attempts >= max_attempts:
+                        self._conn.execute(
+                            'UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?',
+                            (FAILED, 'worker lost', time.time(), job_id)
+                        )
+                    else:
+                        self._conn.execute('UPDATE jobs SET status = ?, worker = NULL WHERE id = ?', (QUEUED, job_id))
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+
+        for job_id, attempts in stale:
+            if attempts >= max_attempts:
+                self.append_event(job_id, SimulationEvent.error('Simulation worker lost', stage='job_error'))
+            else:
+                self.append_event(job_id, SimulationEvent.info('Worker lost, simulation requeued', 'requeued'))
+            logger.warning(f"Recovered stale simulation job {job_id} (attempt {attempts})")
+        return [job_id for job_id, _ in stale]
+
+    def purge(self, older_than: float) -> int:
+        """Delete finished jobs (and their event logs) older than older_than seconds"""
+        cutoff = time.time() - older_than
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                for table in ('job_events', 'job_users'):
+                    self._conn.execute(
+                        f'DELETE FROM {table} WHERE job_id IN '
+                        '(SELECT id FROM jobs WHERE status IN (?, ?, ?) AND finished_at < ?)',
+                        (*TERMINAL_STATUSES, cutoff)
+                    )
+                deleted = self._conn.execute(
+                    'DELETE FROM jobs WHERE status IN (?, ?, ?) AND finished_at < ?', (*TERMINAL_STATUSES, cutoff)
+                ).rowcount
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return deleted
+
+    def _attach(self, job_id: str, user_id: Optional[str]) -> None:
+        """Attach a user to a job (inside the caller's transaction)"""
+        if user_id is not None:
+            self._conn.execute('INSERT OR IGNORE INTO job_users (job_id, user_id) VALUES (?, ?)',
+                               (job_id, str(user_id)))
+
+    def _cancel(self, job_id: str) -> bool:
+        """Mark a job cancelled (inside the caller's transaction); returns whether it was still queued"""
+        cancelled_queued = self._conn.execute(
+            'UPDATE jobs SET status = ?, finished_at = ?, error = ? WHERE id = ? AND status = ?',
+            (CANCELLED, time.time(), 'cancelled before start', job_id, QUEUED)
+        ).rowcount
+        self._conn.execute('UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = ?',
+                           (job_id, RUNNING))
+        return bool(cancelled_queued)
+
+    # ------------------------------------------------------------------
+    # Event log
+    # ------------------------------------------------------------------
+
+    def append_event(self, job_id: str, event: SimulationEvent) -> None:
+        """Append to the job's event log"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO job_events (job_id, seq, event_type, data, timestamp)'
+                ' SELECT ?, COALESCE(MAX(seq), 0) + 1, ?, ?, ? FROM job_events WHERE job_id = ?',
+                (job_id, event.event_type, _dumps(event.data), event.timestamp, job_id)
+            )
+
+    def events(self, job_id: str, after_seq: int = 0, limit: int = 500) -> List[JobEvent]:
+        """Events with seq > after_seq, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT seq, event_type, data, timestamp FROM job_events'
+                ' WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?',
+                (job_id, after_seq, limit)
+            ).fetchall()
+        return [JobEvent(seq, event_type, json.loads(data), timestamp) for seq, event_type, data, timestamp in rows]
+
+    def follow(
+        self,
+        job_id: str,
+        after_seq: int = 0,
+        poll: float = 0.25,
+        heartbeat_seconds: float = 15.0
+    ) -> Iterator[str]:
+        """
+        Tail a job's event log as SSE frames until the job finishes
+
+        Yields heartbeat frames while the job is quiet (AI calls take 60-90s).
+        """
+        started = last_frame = time.monotonic()
+        while True:
+            # Read the status first so events appended just before finishing are not missed
+            job = self.get(job_id)
+            events = self.events(job_id, after_seq)
+            for event in events:
+                after_seq = event.seq
+                yield event.to_sse_format()
+            if events:
+                last_frame = time.monotonic()
+                continue
+            if job is None or job.terminal:
+                return
+            if time.monotonic() - last_frame >= heartbeat_seconds:
+                yield SimulationEvent.heartbeat(time.monotonic() - started).to_sse_format()
+                last_frame = time.monotonic()
+            time.sleep(poll)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _job_from_row(row) -> SimulationJob:
+    (job_id, kind, fingerprint, payload, status, result, error, created_at,
+     started_at, finished_at, worker, attempts, cancel_requested) = row
+    return SimulationJob(
+        id=job_id,
+        kind=kind,
+        fingerprint=fingerprint,
+        payload=json.loads(payload),
+        status=status,
+        result=json.loads(result) if result else None,
+        error=error,
+        created_at=created_at,
+        started_at=started_at,
+        finished_at=finished_at,
+        worker=worker,
+        attempts=attempts,
+        cancel_requested=bool(cancel_requested)
+    )
+
+
+def job_fingerprint(kind: str, inputs: Dict[str, Any]) -> str:
+    """
+    Fingerprint of a fixture request: kind + inputs + team data version
+
+    Editing a team's lineup/ratings changes the data version, so a new request
+    does not join a job that started from the old data.
+    """
+    from simulation.v3.pipeline.result_cache import data_version, fingerprint
+
+    return fingerprint('simulation_job', kind, inputs, data_version())
+
+
+# Global store instance
+_job_store: Optional[SimulationJobStore] = None
+_job_store_lock = threading.Lock()
+
+
+def get_job_store() -> SimulationJobStore:
+    """
+    Get global job store (singleton)
+
+    Returns:
+        SimulationJobStore instance
+    """
+    global _job_store
+
+    if _job_store is None:
+        with _job_store_lock:
+            if _job_store is None:
+                _job_store = SimulationJobStore.from_env()
+    return _job_store
+
+
+def reset_job_store():
+    """Reset global job store (useful for testing)"""
+    global _job_store
+    _job_store = None
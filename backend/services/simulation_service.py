@@ -5,14 +5,12 @@ AI Match Simulation v3.0
 Main orchestrator for AI-powered match predictions with caching and tier-based features.
 """
 
-import redis
-import json
 from typing import Dict, Optional, Tuple
 import logging
-from datetime import datetime, timedelta
-import hashlib
+from datetime import datetime
 
 from ai.ai_factory import get_ai_client
+from infrastructure.cache.tiered_cache import TieredCache
 from services.data_aggregation_service import get_data_aggregation_service
 
 
@@ -20,6 +18,10 @@ from services.data_aggregation_service import get_data_aggregation_service
 logger = logging.getLogger(__name__)
 
 
+class SimulationFailed(Exception):
+    """Data aggregation or AI simulation failed (nothing is cached)."""
+
+
 class SimulationService:
     """
     Main simulation service orchestrating all AI match prediction components.
@@ -27,7 +29,7 @@ class SimulationService:
     Features:
     - Data aggregation from multiple sources
     - Tier-based Claude AI analysis
-    - Redis caching (1 hour TTL)
+    - Tiered caching: in-process LRU + Redis (1 hour TTL)
     - Usage tracking
     """
 
@@ -36,20 +38,9 @@ class SimulationService:
         self.ai_client = get_ai_client()
         self.data_service = get_data_aggregation_service()
 
-        # Initialize Redis cache
-        try:
-            import os
-            redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
-            self.redis_client = redis.from_url(redis_url, decode_responses=True)
-            self.redis_available = True
-            logger.info("Redis cache initialized")
-        except Exception as e:
-            logger.warning(f"Redis not available, using memory cache: {str(e)}")
-            self.redis_client = None
-            self.redis_available = False
-            self._memory_cache = {}
-
+        # Simulation result cache (in-process LRU in front of Redis)
         self.cache_ttl = 3600  # 1 hour
+        self.cache = TieredCache.from_settings('simulation', ttl=self.cache_ttl, max_entries=256)
 
     # ==========================================================================
     # MAIN SIMULATION METHOD
@@ -73,21 +64,41 @@ class SimulationService:
         """
         logger.info(f"Simulating {home_team} vs {away_team} for user {user_id} (tier={tier}, weights={weights})")
 
-        # Check cache (include weights in cache key)
+        # Check cache (include weights in cache key). Concurrent requests for
+        # the same match/tier/weights share one AI call.
         cache_key = self._generate_cache_key(home_team, away_team, tier, weights)
-        cached_result = self._get_from_cache(cache_key)
-        if cached_result:
+        computed = []
+
+        def compute():
+            computed.append(True)
+            return self._run_simulation(home_team, away_team, tier, weights)
+
+        try:
+            result = self.cache.get_or_set(cache_key, compute)
+        except SimulationFailed as e:
+            return False, None, str(e)
+
+        # Cached dicts are shared: hand out a copy
+        if not computed:
             logger.info(f"Cache hit for {home_team} vs {away_team}")
-            cached_result['from_cache'] = True
-            return True, cached_result, None
+            return True, {**result, 'from_cache': True}, None
+        return True, dict(result), None
 
+    def _run_simulation(self, home_team: str, away_team: str, tier: str,
+                        weights: Optional[Dict] = None) -> Dict:
+        """
+        Aggregate data and run the AI simulation (cache miss path).
+
+        Raises:
+            SimulationFailed: Data aggregation or AI simulation failed
+        """
         # Aggregate data (pass weights)
         try:
             data_context = self.data_service.aggregate_match_data(home_team, away_team, tier, weights)
         except Exception as e:
             error_msg = f"Data aggregation failed: {str(e)}"
             logger.error(error_msg)
-            return False, None, error_msg
+            raise SimulationFailed(error_msg)
 
         # Run AI simulation
         success, prediction, usage_data, error = self.ai_client.simulate_match(
@@ -98,7 +109,7 @@ class SimulationService:
 
         if not success:
             logger.error(f"AI simulation failed: {error}")
-            return False, None, error
+            raise SimulationFailed(error)
 
         # Build result (include weights used)
         result = {
@@ -115,11 +126,8 @@ class SimulationService:
             'timestamp': datetime.utcnow().isoformat()
         }
 
-        # Cache result
-        self._save_to_cache(cache_key, result)
-
         logger.info(f"Simulation complete (tokens={usage_data['total_tokens']}, cost=${usage_data['cost_usd']:.6f})")
-        return True, result, None
+        return result
 
     # ==========================================================================
     # CACHING
@@ -129,43 +137,10 @@ class SimulationService:
                            weights: Optional[Dict] = None) -> str:
         """Generate cache key for match simulation (including weights)."""
         # Include weights in cache key so different weight configs have different caches
-        weights_str = ""
+        weights_key = None
         if weights:
-            weights_str = f":{weights.get('user_value', 0.65)}:{weights.get('odds', 0.20)}:{weights.get('stats', 0.15)}"
-        key_string = f"simulation:{home_team}:{away_team}:{tier}{weights_str}"
-        return hashlib.md5(key_string.encode()).hexdigest()
-
-    def _get_from_cache(self, key: str) -> Optional[Dict]:
-        """Get simulation result from cache."""
-        try:
-            if self.redis_available:
-                cached = self.redis_client.get(key)
-                if cached:
-                    return json.loads(cached)
-            else:
-                # Memory cache
-                if key in self._memory_cache:
-                    cached_data, expires_at = self._memory_cache[key]
-                    if datetime.utcnow() < expires_at:
-                        return cached_data
-                    else:
-                        del self._memory_cache[key]
-            return None
-        except Exception as e:
-            logger.error(f"Cache get error: {str(e)}")
-            return None
-
-    def _save_to_cache(self, key: str, data: Dict):
-        """Save simulation result to cache."""
-        try:
-            if self.redis_available:
-                self.redis_client.setex(key, self.cache_ttl, json.dumps(data))
-            else:
-                # Memory cache
-                expires_at = datetime.utcnow() + timedelta(seconds=self.cache_ttl)
-                self._memory_cache[key] = (data, expires_at)
-        except Exception as e:
-            logger.error(f"Cache save error: {str(e)}")
+            weights_key = [weights.get('user_value', 0.65), weights.get('odds', 0.20), weights.get('stats', 0.15)]
+        return self.cache.digest_key(home_team, away_team, tier, weights_key)
 
 
 # Global service instance
@@ -0,0 +1,245 @@
+"""
+Simulation Stream
+asyncio-native SSE streaming for long-running simulations
+
+The pipeline itself is synchronous (CPU-bound Monte Carlo + blocking LLM calls),
+so each stream runs it on a dedicated worker thread and bridges its events into
+the event loop:
+
+- Bounded channel: events go through an asyncio.Queue(maxsize=channel_size).
+  A slow client blocks the worker at its next event instead of buffering
+  without limit.
+- Cancellation: when the client disconnects, the stream hits its time limit or
+  the server shuts down, the stream's CancellationToken is cancelled. The
+  pipeline checks it between validation chunks and while waiting on AI calls,
+  so the worker exits within about a second and its slot is released.
+- Heartbeats: a heartbeat event every heartbeat_seconds keeps proxies from
+  closing the connection during 60-90s AI calls.
+- Limits: at most max_concurrent workers at once (a slot is held until the
+  worker thread actually exits, not just until the client leaves), and each
+  stream is cut off after max_duration_seconds.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from utils.cancellation import POLL_INTERVAL, CancellationToken, SimulationCancelled
+from utils.simulation_events import SimulationEvent
+
+logger = logging.getLogger(__name__)
+
+
+# work(emit, cancel_token): runs on the worker thread, reports through emit
+StreamWork = Callable[[Callable[[SimulationEvent], None], CancellationToken], None]
+
+# End-of-stream marker put on the channel by the worker
+_DONE = object()
+
+
+@dataclass
+class StreamLimits:
+    """Per-server and per-stream resource limits"""
+    max_concurrent: int = 4                # simultaneous pipeline workers
+    channel_size: int = 64                 # buffered events per stream
+    heartbeat_seconds: float = 15.0
+    max_duration_seconds: float = 900.0    # hard cap per stream
+
+
+class SimulationStreamManager:
+    """
+    Runs synchronous simulation work behind asyncio SSE streams
+
+    Usage (FastAPI):
+        manager = get_stream_manager()
+        if not manager.has_capacity():
+            raise HTTPException(429, ...)
+        return StreamingResponse(
+            manager.stream(work, is_disconnected=request.is_disconnected),
+            media_type='text/event-stream'
+        )
+    """
+
+    def __init__(self, limits: Optional[StreamLimits] = None):
+        """
+        Initialize stream manager
+
+        Args:
+            limits: Resource limits (defaults if None)
+        """
+        self.limits = limits or StreamLimits()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.limits.max_concurrent,
+            thread_name_prefix='simulation-stream'
+        )
+        self._lock = threading.Lock()
+        self._active = 0
+        self._tokens = set()
+
+    @property
+    def active(self) -> int:
+        """Worker threads currently running (including ones still winding down)"""
+        return self._active
+
+    def has_capacity(self) -> bool:
+        return self._active < self.limits.max_concurrent
+
+    async def stream(
+        self,
+        work: StreamWork,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Run work on a worker thread and yield its events as SSE frames
+
+        Args:
+            work: work(emit, cancel_token), should stop with SimulationCancelled
+                once the token is cancelled
+            is_disconnected: Optional async disconnect probe (checked on heartbeats,
+                for servers that do not cancel the response task on disconnect)
+
+        Yields:
+            SSE formatted strings
+        """
+        token = CancellationToken()
+        if not self._acquire(token):
+            yield SimulationEvent.error(
+                f"Too many concurrent simulations (limit {self.limits.max_concurrent})",
+                stage='stream_limit'
+            ).to_sse_format()
+            return
+
+        loop = asyncio.get_running_loop()
+        channel: asyncio.Queue = asyncio.Queue(maxsize=self.limits.channel_size)
+
+        def emit(item) -> None:
+            """Worker side: put into the channel, blocking while it is full"""
+            token.raise_if_cancelled()
+            future = asyncio.run_coroutine_threadsafe(channel.put(item), loop)
+            while True:
+                try:
+                    future.result(timeout=POLL_INTERVAL)
+                    return
+                except FuturesTimeout:
+                    if token.cancelled:
+                        future.cancel()
+                        token.raise_if_cancelled()
+
+        def run() -> None:
+            try:
+                work(emit, token)
+            except SimulationCancelled as e:
+                logger.info(f"Simulation stream cancelled: {e}")
+            except Exception as e:
+                logger.error(f"Simulation stream worker failed: {e}", exc_info=True)
+                try:
+                    emit(SimulationEvent.error(f"Unexpected error: {e}", stage='unknown'))
+                except SimulationCancelled:
+                    pass
+            finally:
+                try:
+                    emit(_DONE)
+                except SimulationCancelled:
+                    pass
+                except RuntimeError:
+                    pass  # event loop already closed
+                self._release(token)
+
+        started = time.monotonic()
+        deadline = started + self.limits.max_duration_seconds
+        try:
+            worker = loop.run_in_executor(self._executor, run)
+        except RuntimeError:
+            # executor shut down
+            self._release(token)
+            raise
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    token.cancel("time limit")
+                    yield SimulationEvent.error(
+                        f"Simulation exceeded {self.limits.max_duration_seconds:.0f}s limit",
+                        stage='stream_limit'
+                    ).to_sse_format()
+                    return
+
+                try:
+                    item = await asyncio.wait_for(
+                        channel.get(), timeout=min(self.limits.heartbeat_seconds, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    if worker.done() and channel.empty():
+                        return
+                    if is_disconnected is not None and await is_disconnected():
+                        token.cancel("client disconnected")
+                        return
+                    yield SimulationEvent.heartbeat(time.monotonic() - started).to_sse_format()
+                    continue
+
+                if item is _DONE:
+                    return
+                yield item.to_sse_format()
+        finally:
+            # Disconnect (CancelledError/GeneratorExit), limit or normal end
+            token.cancel("stream closed")
+
+    def shutdown(self) -> None:
+        """Cancel every running stream and stop the worker pool"""
+        with self._lock:
+            tokens = list(self._tokens)
+        for token in tokens:
+            token.cancel("server shutdown")
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _acquire(self, token: CancellationToken) -> bool:
+        with self._lock:
+            if self._active >= self.limits.max_concurrent:
+                return False
+            self._active += 1
+            self._tokens.add(token)
+            return True
+
+    def _release(self, token: CancellationToken) -> None:
+        with self._lock:
+            if token in self._tokens:
+                self._tokens.discard(token)
+                self._active -= 1
+
+
+# Global manager instance
+_stream_manager: Optional[SimulationStreamManager] = None
+_stream_manager_lock = threading.Lock()
+
+
+def get_stream_manager(limits: Optional[StreamLimits] = None) -> SimulationStreamManager:
+    """
+    Get global stream manager (singleton)
+
+    Args:
+        limits: Resource limits (only used when the manager is first created)
+
+    Returns:
+        SimulationStreamManager instance
+    """
+    global _stream_manager
+
+    if _stream_manager is None:
+        with _stream_manager_lock:
+            if _stream_manager is None:
+                _stream_manager = SimulationStreamManager(limits)
+    return _stream_manager
+
+
+def reset_stream_manager():
+    """Shut down and reset global manager (useful for testing)"""
+    global _stream_manager
+    if _stream_manager is not None:
+        _stream_manager.shutdown()
+    _stream_manager = None
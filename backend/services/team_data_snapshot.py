@@ -0,0 +1,277 @@
+"""
+Team Data Snapshot
+팀 JSON 데이터의 프로세스 내 파싱 캐시
+
+대상:
+- data/formations, lineups, team_strength, tactics, overall_scores/{team}.json
+- data/formation_tactics.json (포메이션별 FormationTactics로 한 번만 변환)
+
+read_json은 호출자가 수정해도 되는 복사본을, read_frozen/get_frozen은 복사 없이
+공유하는 읽기 전용 구조(dict → MappingProxyType, list → tuple)를 반환한다.
+시뮬레이션 로더처럼 매 요청 읽기만 하는 경로는 read_frozen을 쓴다.
+
+파일은 처음 읽을 때 한 번 파싱하고, 이후에는 os.stat의 (mtime, size)만
+비교해 바뀐 파일만 다시 파싱한다. 저장 API는 파일을 쓴 직후 invalidate를
+호출해 mtime 해상도와 무관하게 다음 조회에서 새 내용을 읽게 한다.
+
+version은 이미 읽은 파일의 내용이 바뀌었거나 invalidate될 때마다 증가하므로
+하위 캐시가 키에 포함해 팀 데이터 변경 시 항목을 무효화할 수 있다.
+프로세스 간에 공유되는 캐시(Redis)는 같은 stat 확인에서 나오는
+content_version (파일 스탬프 digest)을 키로 쓴다.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from ai.enriched_data_models import FormationTactics
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_DATA_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
+
+# 팀별 JSON 디렉토리 (data_root 기준)
+TEAM_DATA_KINDS = ('formations', 'lineups', 'team_strength', 'tactics', 'overall_scores')
+
+FORMATION_TACTICS_FILE = 'formation_tactics.json'
+
+
+@dataclass(frozen=True)
+class _Entry:
+    stamp: Tuple[int, int]      # (mtime_ns, size)
+    value: Any                  # 파싱 결과 (공유 객체, 외부로는 복사본 또는 불변 객체만 반환)
+
+
+def freeze_json(value: Any) -> Any:
+    """JSON 값 → 읽기 전용 구조 (dict → MappingProxyType, list → tuple)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze_json(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_json(item) for item in value)
+    return value
+
+
+def parse_formation_tactics(data: Dict) -> Dict[str, FormationTactics]:
+    """
+    formation_tactics.json → {formation: FormationTactics}
+
+    필드가 빠진 포메이션은 건너뛴다 (나머지 포메이션은 계속 사용).
+    """
+    table = {}
+    for formation, tactics_data in data.get('formation_tactics', {}).items():
+        try:
+            table[formation] = FormationTactics(
+                formation=formation,
+                name=tactics_data['name'],
+                style=tactics_data['style'],
+                buildup=tactics_data['buildup'],
+                pressing=tactics_data['pressing'],
+                space_utilization=tactics_data['space_utilization'],
+                strengths=tactics_data['strengths'],
+                weaknesses=tactics_data['weaknesses'],
+                note=tactics_data.get('note')
+            )
+        except KeyError as e:
+            logger.warning(f"Formation tactics for {formation} missing field: {e}")
+    return table
+
+
+class TeamDataSnapshot:
+    """
+    팀 JSON 파싱 캐시 (파일 경로 → 파싱 결과)
+
+    thread-safe. 경로를 절대 경로로 정규화해 키로 쓰므로 data_root가 다른
+    로더들이 같은 인스턴스를 공유해도 된다.
+    """
+
+    def __init__(self, data_root: Optional[str] = None):
+        """
+        Args:
+            data_root: team_file / warm에서 쓰는 데이터 루트 (기본: backend/data)
+        """
+        self.data_root = os.path.abspath(data_root or DEFAULT_DATA_ROOT)
+        self._entries: Dict[Tuple[str, Optional[Callable]], _Entry] = {}  # (경로, parser) → 항목
+        self._lock = threading.Lock()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """이미 읽은 팀 데이터가 바뀔 때마다 증가하는 카운터"""
+        return self._version
+
+    def team_file(self, kind: str, team_name: str) -> str:
+        """팀 JSON 경로 (kind: TEAM_DATA_KINDS)"""
+        if kind not in TEAM_DATA_KINDS:
+            raise ValueError(f"kind must be one of {TEAM_DATA_KINDS}, got {kind!r}")
+        return os.path.join(self.data_root, kind, f"{team_name}.json")
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get(self, kind: str, team_name: str) -> Optional[Dict]:
+        """팀 JSON (없으면 None)"""
+        return self.read_json(self.team_file(kind, team_name))
+
+    def read_json(self, path: str) -> Optional[Dict]:
+        """
+        JSON 파일 내용 (없으면 None)
+
+        호출자가 수정해도 캐시가 바뀌지 않도록 복사본을 반환한다.
+
+        Raises:
+            json.JSONDecodeError: 잘못된 JSON
+        """
+        data = self._load(path)
+        return copy.deepcopy(data) if data is not None else None
+
+    def get_frozen(self, kind: str, team_name: str) -> Optional[Mapping]:
+        """팀 JSON의 읽기 전용 구조 (없으면 None)"""
+        return self.read_frozen(self.team_file(kind, team_name))
+
+    def read_frozen(self, path: str) -> Optional[Mapping]:
+        """
+        JSON 파일 내용을 읽기 전용 구조로 (없으면 None)
+
+        파일이 바뀌지 않았으면 매번 같은 객체를 복사 없이 반환한다.
+
+        Raises:
+            json.JSONDecodeError: 잘못된 JSON
+        """
+        return self._load(path, freeze_json)
+
+    def formation_tactics(self, formation: str, path: Optional[str] = None) -> Optional[FormationTactics]:
+        """
+        포메이션 전술 정보 (formation_tactics.json은 파일이 바뀔 때만 다시 파싱)
+
+        Args:
+            formation: 포메이션 이름 (예: "4-3-3")
+            path: formation_tactics.json 경로 (기본: data_root 아래)
+
+        Returns:
+            FormationTactics (공유 객체, 수정 금지) 또는 None (파일/포메이션 없음)
+        """
+        table = self._load(path or os.path.join(self.data_root, FORMATION_TACTICS_FILE), parse_formation_tactics)
+        if table is None:
+            return None
+        return table.get(formation)
+
+    # ------------------------------------------------------------------
+    # 무효화 / 사전 로드
+    # ------------------------------------------------------------------
+
+    def invalidate(self, path: Optional[str] = None):
+        """
+        파일 하나(또는 전체) 캐시 제거, version 증가
+
+        저장 API가 파일을 쓴 직후 호출한다.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                path = os.path.abspath(path)
+                for key in [key for key in self._entries if key[0] == path]:
+                    del self._entries[key]
+            self._version += 1
+
+    def warm(self) -> int:
+        """
+        data_root의 팀 JSON과 formation_tactics.json을 미리 파싱
+
+        Returns:
+            파싱된 파일 수
+        """
+        loaded = sum(self._try_load(path, parser) for path, parser in self._data_files())
+        logger.info(f"Team data snapshot warmed: {loaded} files")
+        return loaded
+
+    def content_version(self) -> str:
+        """
+        data_root 팀 데이터의 내용 버전 (프로세스 간 공유 캐시 키용)
+
+        warm과 같은 파일을 stat으로 확인해 바뀐 파일은 다시 파싱하고(version 증가),
+        파일별 (상대 경로, mtime, size) 스탬프의 digest를 반환한다. version은
+        프로세스마다 따로 세는 카운터라 여러 프로세스가 공유하는 키로는 쓸 수 없다.
+        """
+        stamps = []
+        for path, parser in self._data_files():
+            if not self._try_load(path, parser):
+                continue
+            entry = self._entries.get((os.path.abspath(path), parser))
+            if entry is not None:
+                stamps.append([os.path.relpath(path, self.data_root), *entry.stamp])
+        return hashlib.sha256(json.dumps(stamps).encode('utf-8')).hexdigest()
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    def _load(self, path: str, parser: Optional[Callable[[Dict], Any]] = None) -> Any:
+        """stat 비교 후 필요할 때만 읽어서 파싱 (파일 없으면 None)"""
+        path = os.path.abspath(path)
+        key = (path, parser)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                if self._entries.pop(key, None) is not None:
+                    self._version += 1
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(key)
+        if entry is not None and entry.stamp == stamp:
+            return entry.value
+
+        with open(path, 'r', encoding='utf-8') as f:
+            value = json.load(f)
+        if parser is not None:
+            value = parser(value)
+
+        with self._lock:
+            if entry is not None:
+                self._version += 1
+            self._entries[key] = _Entry(stamp, value)
+        return value
+
+    def _data_files(self) -> List[Tuple[str, Optional[Callable[[Dict], Any]]]]:
+        """(경로, parser): TEAM_DATA_KINDS 디렉토리의 JSON (읽기 전용 구조) + formation_tactics.json"""
+        files = []
+        for kind in TEAM_DATA_KINDS:
+            directory = os.path.join(self.data_root, kind)
+            if not os.path.isdir(directory):
+                continue
+            files.extend((os.path.join(directory, filename), freeze_json)
+                         for filename in sorted(os.listdir(directory)) if filename.endswith('.json'))
+        files.append((os.path.join(self.data_root, FORMATION_TACTICS_FILE), parse_formation_tactics))
+        return files
+
+    def _try_load(self, path: str, parser: Optional[Callable[[Dict], Any]] = None) -> int:
+        try:
+            return int(self._load(path, parser) is not None)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping {path}: {e}")
+            return 0
+
+
+# 전역 인스턴스
+_snapshot_instance = None
+_snapshot_lock = threading.Lock()
+
+
+def get_team_data_snapshot() -> TeamDataSnapshot:
+    """프로세스 공유 TeamDataSnapshot"""
+    global _snapshot_instance
+    if _snapshot_instance is None:
+        with _snapshot_lock:
+            if _snapshot_instance is None:
+                _snapshot_instance = TeamDataSnapshot()
+    return _snapshot_instance
@@ -23,9 +23,20 @@ from .event_simulation_engine import (
     EventSampler,
     MatchParameters,
     MatchContext,
+    BatchSimulationResult,
     create_match_parameters,
     EPL_BASELINE
 )
+from .probability_tables import ProbabilityTables, compile_probability_tables
+from .streaming_aggregator import SimulationAccumulator
+from .parallel_executor import (
+    MonteCarloExecutor,
+    ExecutorConfig,
+    AdaptiveSamplingConfig,
+    AdaptiveRunResult,
+    outcome_ci_half_width,
+    EXECUTOR_MODES
+)
 
 __all__ = [
     # Data structures
@@ -43,6 +54,22 @@ __all__ = [
     'EventSampler',
     'MatchParameters',
     'MatchContext',
+    'BatchSimulationResult',
     'create_match_parameters',
     'EPL_BASELINE',
+
+    # Probability tables
+    'ProbabilityTables',
+    'compile_probability_tables',
+
+    # Streaming aggregation
+    'SimulationAccumulator',
+
+    # Parallel execution
+    'MonteCarloExecutor',
+    'ExecutorConfig',
+    'AdaptiveSamplingConfig',
+    'AdaptiveRunResult',
+    'outcome_ci_half_width',
+    'EXECUTOR_MODES',
 ]
@@ -5,11 +5,19 @@ Event-Based Simulation Engine
 90분 분 단위 이벤트 기반 시뮬레이션
 """
 
-import random
 import numpy as np
 from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
-from .scenario_guide import ScenarioGuide
+from utils.rng import RNGProvider, UniformStream, SeedLike
+from .scenario_guide import ScenarioGuide, EVENT_TYPE_INDEX
+from .probability_tables import (
+    ProbabilityTables,
+    compile_probability_tables,
+    score_state_factor,
+    fatigue_factors,
+    ATTACKING_FORMATIONS,
+    DEFENSIVE_FORMATIONS
+)
 
 
 # EPL 기준 통계 (재캘리브레이션)
@@ -48,6 +56,15 @@ EPL_BASELINE = {
 }
 
 
+# Batch 엔진 이벤트 코드 (0 = 이벤트 없음)
+BATCH_EVENT_TYPES = ("goal", "shot_on_target", "shot_off_target", "corner", "foul")
+BATCH_EVENT_CODES = {event_type: code for code, event_type in enumerate(BATCH_EVENT_TYPES, 1)}
+_BATCH_CODE_TO_EVENT_TYPE = np.array(
+    [-1] + [EVENT_TYPE_INDEX[event_type] for event_type in BATCH_EVENT_TYPES],
+    dtype=np.int16
+)
+
+
 @dataclass
 class MatchParameters:
     """경기 파라미터"""
@@ -69,6 +86,61 @@ class MatchContext:
     defending_team: str
 
 
+@dataclass
+class BatchSimulationResult:
+    """
+    N회 시뮬레이션 결과 (run 단위 배열)
+
+    이벤트 리스트 대신 run별 집계 배열만 보관한다.
+    """
+    n_runs: int
+    home_goals: np.ndarray             # (n_runs,)
+    away_goals: np.ndarray             # (n_runs,)
+    narrative_adherence: np.ndarray    # (n_runs,)
+    event_counts: np.ndarray           # (n_runs, len(BATCH_EVENT_TYPES))
+    goal_timing: np.ndarray            # (n_runs, 3) - 0-30 / 30-60 / 60-90분
+
+    @classmethod
+    def merge(cls, parts: List['BatchSimulationResult']) -> 'BatchSimulationResult':
+        """chunk별 결과 병합"""
+        if len(parts) == 1:
+            return parts[0]
+        return cls(
+            n_runs=sum(part.n_runs for part in parts),
+            home_goals=np.concatenate([part.home_goals for part in parts]),
+            away_goals=np.concatenate([part.away_goals for part in parts]),
+            narrative_adherence=np.concatenate([part.narrative_adherence for part in parts]),
+            event_counts=np.concatenate([part.event_counts for part in parts]),
+            goal_timing=np.concatenate([part.goal_timing for part in parts])
+        )
+
+    def outcome_counts(self) -> Dict[str, int]:
+        """승/무/패 횟수"""
+        home_wins = int(np.count_nonzero(self.home_goals > self.away_goals))
+        away_wins = int(np.count_nonzero(self.home_goals < self.away_goals))
+        return {
+            "home_win": home_wins,
+            "draw": self.n_runs - home_wins - away_wins,
+            "away_win": away_wins
+        }
+
+    def event_type_counts(self, event_type: str) -> np.ndarray:
+        """특정 이벤트 타입의 run별 발생 횟수 (엔진이 생성하지 않는 타입은 0)"""
+        code = BATCH_EVENT_CODES.get(event_type)
+        if code is None:
+            return np.zeros(self.n_runs, dtype=np.int32)
+        return self.event_counts[:, code - 1]
+
+    def score_counts(self) -> Dict[str, int]:
+        """스코어별 발생 횟수 {"1-0": N, ...}"""
+        pairs, counts = np.unique(
+            np.stack([self.home_goals, self.away_goals], axis=1),
+            axis=0,
+            return_counts=True
+        )
+        return {f"{home}-{away}": int(count) for (home, away), count in zip(pairs, counts)}
+
+
 class EventProbabilityCalculator:
     """
     현재 경기 상황에서 이벤트 확률 계산
@@ -163,11 +235,11 @@ class EventProbabilityCalculator:
 
         # Formation matchup adjustments
         # 4-3-3 attacks well
-        if att_formation in ["4-3-3", "4-2-3-1"]:
+        if att_formation in ATTACKING_FORMATIONS:
             probs["shot_per_minute"] *= 1.12
 
         # 5-3-2 defends well
-        if def_formation in ["5-3-2", "5-4-1"]:
+        if def_formation in DEFENSIVE_FORMATIONS:
             probs["shot_per_minute"] *= 0.88
 
         # Press intensity
@@ -237,6 +309,13 @@ class EventSampler:
     설계 문서 Section 4.2
     """
 
+    def __init__(self, rng: Optional[UniformStream] = None):
+        """
+        Args:
+            rng: 스칼라 난수 스트림 (None이면 비결정적 스트림 생성)
+        """
+        self.rng = rng or RNGProvider().stream()
+
     def sample(self, event_probs: Dict, context: MatchContext) -> Optional[Dict]:
         """
         확률 기반 이벤트 생성
@@ -249,11 +328,11 @@ class EventSampler:
             발생한 이벤트 또는 None
         """
         # Shot?
-        if random.random() < event_probs["shot_per_minute"]:
+        if self.rng.random() < event_probs["shot_per_minute"]:
             return self._resolve_shot(event_probs, context)
 
         # Corner?
-        if random.random() < event_probs["corner_per_minute"]:
+        if self.rng.random() < event_probs["corner_per_minute"]:
             return {
                 "type": "corner",
                 "team": context.attacking_team,
@@ -261,7 +340,7 @@ class EventSampler:
             }
 
         # Foul?
-        if random.random() < event_probs["foul_per_minute"]:
+        if self.rng.random() < event_probs["foul_per_minute"]:
             return self._resolve_foul(event_probs, context)
 
         return None
@@ -271,9 +350,9 @@ class EventSampler:
         슛 → 온타겟 → 득점 체인
         """
         # On target?
-        if random.random() < probs["shot_on_target_ratio"]:
+        if self.rng.random() < probs["shot_on_target_ratio"]:
             # Goal?
-            if random.random() < probs["goal_conversion_on_target"]:
+            if self.rng.random() < probs["goal_conversion_on_target"]:
                 return {
                     "type": "goal",
                     "team": context.attacking_team,
@@ -308,15 +387,36 @@ class EventBasedSimulationEngine:
     설계 문서 Section 4 구현
     """
 
-    def __init__(self):
-        """Initialize engine"""
+    def __init__(self, rng: Optional[RNGProvider] = None):
+        """
+        Args:
+            rng: 난수 스트림 제공자 (None이면 비결정적)
+                simulate_match는 provider의 스칼라 스트림 하나를 이어서 사용하고,
+                seed 없이 호출된 simulate_batch는 호출마다 새 자식 스트림을 받는다.
+        """
+        self.rng = rng or RNGProvider()
+        self.random = self.rng.stream()
         self.probability_calculator = EventProbabilityCalculator()
-        self.event_sampler = EventSampler()
+        self.event_sampler = EventSampler(self.random)
 
-    def simulate_match(
+    def compile_tables(
         self,
         params: MatchParameters,
         scenario_guide: ScenarioGuide
+    ) -> ProbabilityTables:
+        """
+        경기 중 변하지 않는 확률 보정을 (90, 2) 테이블로 사전 계산
+
+        같은 params/scenario_guide로 여러 번 시뮬레이션할 때 한 번 만들어
+        simulate_match(tables=...)에 넘기면 재계산을 피할 수 있다.
+        """
+        return compile_probability_tables(params, scenario_guide, self.probability_calculator.baseline)
+
+    def simulate_match(
+        self,
+        params: MatchParameters,
+        scenario_guide: ScenarioGuide,
+        tables: Optional[ProbabilityTables] = None
     ) -> Dict:
         """
         90분 시뮬레이션 (1분 단위)
@@ -324,6 +424,7 @@ class EventBasedSimulationEngine:
         Args:
             params: 경기 파라미터
             scenario_guide: 시나리오 가이드
+            tables: 사전 계산된 확률 테이블 (None이면 내부에서 생성)
 
         Returns:
             {
@@ -332,6 +433,16 @@ class EventBasedSimulationEngine:
                 "narrative_adherence": 0.82
             }
         """
+        if tables is None:
+            tables = self.compile_tables(params, scenario_guide)
+
+        # 분 단위 스칼라 조회는 NumPy 인덱싱보다 list가 빠름
+        shot_table = tables.shot.tolist()
+        on_target_table = tables.on_target.tolist()
+        conversion_table = tables.conversion.tolist()
+        corner_table = tables.corner.tolist()
+        foul_table = tables.foul.tolist()
+
         # Initialize state
         state = {
             "minute": 0,
@@ -350,36 +461,51 @@ class EventBasedSimulationEngine:
             state["minute"] = minute
 
             # 1. Determine possession
-            possession_team = self._determine_possession(params, state)
+            possession_team = self._determine_possession(params, state, tables.base_home_possession)
+            defending_team = "away" if possession_team == "home" else "home"
+            side = 0 if possession_team == "home" else 1
 
-            # 2. Get scenario boost for this minute
-            boost = scenario_guide.get_boost_at(minute)
-
-            # 3. Create context
+            # 2. Create context (state는 sampler가 읽기만 하므로 복사하지 않음)
             context = MatchContext(
                 minute=minute,
-                score=state["score"].copy(),
-                possession=state["possession"].copy(),
-                stamina=state["stamina"].copy(),
-                formation=state["formation"].copy(),
+                score=state["score"],
+                possession=state["possession"],
+                stamina=state["stamina"],
+                formation=state["formation"],
                 attacking_team=possession_team,
-                defending_team="away" if possession_team == "home" else "home"
+                defending_team=defending_team
             )
 
-            # 4. Calculate event probabilities
-            event_probs = self.probability_calculator.calculate(context, params, boost)
+            # 3. Event probabilities (테이블 + 스코어/점유율/체력 보정)
+            shot = shot_table[minute][side] * score_state_factor(
+                state["score"][possession_team] - state["score"][defending_team]
+            ) * (state["possession"][possession_team] / 50.0)
+            on_target = on_target_table[minute][side]
+
+            fatigue = fatigue_factors(minute, state["stamina"][possession_team])
+            if fatigue:
+                shot *= fatigue[0]
+                on_target *= fatigue[1]
+
+            event_probs = {
+                "shot_per_minute": shot,
+                "shot_on_target_ratio": on_target,
+                "goal_conversion_on_target": conversion_table[minute][side],
+                "corner_per_minute": corner_table[minute][side],
+                "foul_per_minute": foul_table[minute][side]
+            }
 
-            # 5. Sample event
+            # 4. Sample event
             event = self.event_sampler.sample(event_probs, context)
 
-            # 6. Resolve event
+            # 5. Resolve event
             if event:
                 self._resolve_event(event, state)
 
-            # 7. Update state
+            # 6. Update state
             self._update_state(state, minute, params)
 
-        # 8. Calculate narrative adherence
+        # 7. Calculate narrative adherence
         narrative_adherence = self._calculate_adherence(state, scenario_guide)
 
         return {
@@ -389,19 +515,117 @@ class EventBasedSimulationEngine:
             "event_statistics": self._calculate_event_statistics(state)
         }
 
-    def _determine_possession(self, params: MatchParameters, state: Dict) -> str:
+    def simulate_batch(
+        self,
+        params: MatchParameters,
+        scenario_guide: ScenarioGuide,
+        n_runs: int,
+        seed: SeedLike = None
+    ) -> BatchSimulationResult:
+        """
+        N경기 동시 시뮬레이션 (NumPy 배열, runs × minutes)
+
+        simulate_match와 동일한 확률 모델을 사용하되 분 단위 루프 안에서
+        모든 run을 배열 연산으로 한 번에 처리한다. 점유/슛/온타겟/득점/
+        코너/파울 추첨은 모두 벡터화되어 있다.
+
+        Args:
+            params: 경기 파라미터
+            scenario_guide: 시나리오 가이드
+            n_runs: 시뮬레이션 횟수
+            seed: 난수 시드 또는 SeedSequence (None이면 engine의 RNGProvider에서 파생)
+
+        Returns:
+            BatchSimulationResult
+        """
+        rng = np.random.default_rng(seed) if seed is not None else self.rng.generator()
+        tables = self.compile_tables(params, scenario_guide)
+
+        goals = np.zeros((n_runs, 2), dtype=np.int32)
+        event_codes = np.zeros((n_runs, 90), dtype=np.int8)
+        event_teams = np.zeros((n_runs, 90), dtype=np.int8)
+        runs = np.arange(n_runs)
+
+        for minute in range(90):
+            # 1. 점유
+            home_possession = np.clip(tables.base_home_possession + rng.normal(0, 10, n_runs), 30, 70)
+            attacker = (rng.random(n_runs) >= home_possession / 100).astype(np.int8)
+            defender = 1 - attacker
+            possession_share = np.where(attacker == 0, home_possession, 100 - home_possession)
+
+            # 2. 확률 (테이블 + 스코어/점유율/체력 보정)
+            score_diff = goals[runs, attacker] - goals[runs, defender]
+            p_shot = tables.shot[minute, attacker] * score_state_factor(score_diff) * (possession_share / 50.0)
+            p_on_target = tables.on_target[minute, attacker]
+
+            # 두 팀의 체력 감소가 동일하므로 체력은 분에 대한 결정적 함수
+            fatigue = fatigue_factors(minute, max(50, 100 - 0.5 * max(0, minute - 61)))
+            if fatigue:
+                p_shot = p_shot * fatigue[0]
+                p_on_target = p_on_target * fatigue[1]
+
+            p_conversion = tables.conversion[minute, attacker]
+            p_corner = tables.corner[minute, attacker]
+            p_foul = tables.foul[minute, attacker]
+
+            # 3. 이벤트 추첨 (슛 → 온타겟 → 득점 / 코너 / 파울)
+            draws = rng.random((3, n_runs))
+            shot = draws[0] < p_shot
+            on_target = shot & (draws[1] < p_on_target)
+            goal = on_target & (draws[2] < p_conversion)
+            corner = ~shot & (draws[1] < p_corner)
+            foul = ~shot & ~corner & (draws[2] < p_foul)
+
+            codes = np.zeros(n_runs, dtype=np.int8)
+            codes[shot] = BATCH_EVENT_CODES["shot_off_target"]
+            codes[on_target] = BATCH_EVENT_CODES["shot_on_target"]
+            codes[goal] = BATCH_EVENT_CODES["goal"]
+            codes[corner] = BATCH_EVENT_CODES["corner"]
+            codes[foul] = BATCH_EVENT_CODES["foul"]
+            event_codes[:, minute] = codes
+            event_teams[:, minute] = np.where(foul, defender, attacker)
+
+            # 4. 득점 반영
+            goals[runs[goal], attacker[goal]] += 1
+
+        event_counts = np.stack(
+            [np.count_nonzero(event_codes == code, axis=1) for code in range(1, len(BATCH_EVENT_TYPES) + 1)],
+            axis=1
+        ).astype(np.int32)
+
+        is_goal = event_codes == BATCH_EVENT_CODES["goal"]
+        goal_timing = np.stack(
+            [is_goal[:, :30].sum(axis=1), is_goal[:, 30:60].sum(axis=1), is_goal[:, 60:].sum(axis=1)],
+            axis=1
+        ).astype(np.int32)
+
+        return BatchSimulationResult(
+            n_runs=n_runs,
+            home_goals=goals[:, 0],
+            away_goals=goals[:, 1],
+            narrative_adherence=scenario_guide.batch_adherence(_BATCH_CODE_TO_EVENT_TYPE[event_codes], event_teams),
+            event_counts=event_counts,
+            goal_timing=goal_timing
+        )
+
+    def _determine_possession(
+        self,
+        params: MatchParameters,
+        state: Dict,
+        base_home_possession: Optional[float] = None
+    ) -> str:
         """
         점유 팀 결정
         """
         # Base possession on team strength
-        home_midfield = params.home_team.get("midfield_strength", 75)
-        away_midfield = params.away_team.get("midfield_strength", 75)
-
-        total = home_midfield + away_midfield
-        home_possession = home_midfield / total * 100
+        if base_home_possession is None:
+            home_midfield = params.home_team.get("midfield_strength", 75)
+            away_midfield = params.away_team.get("midfield_strength", 75)
+            base_home_possession = home_midfield / (home_midfield + away_midfield) * 100
+        home_possession = base_home_possession
 
         # Add some randomness
-        home_possession += random.gauss(0, 10)
+        home_possession += self.random.gauss(0, 10)
         home_possession = max(30, min(70, home_possession))
 
         # Update state
@@ -409,7 +633,7 @@ class EventBasedSimulationEngine:
         state["possession"]["away"] = 100 - home_possession
 
         # Determine who has possession this minute
-        return "home" if random.random() < (home_possession / 100) else "away"
+        return "home" if self.random.random() < (home_possession / 100) else "away"
 
     def _resolve_event(self, event: Dict, state: Dict):
         """
@@ -441,28 +665,7 @@ class EventBasedSimulationEngine:
         시나리오와 실제 결과의 일치율
         설계 문서 Section 4.2
         """
-        adherence_score = 0.0
-        expected_events = scenario_guide.events
-
-        if not expected_events:
-            return 1.0  # No expectations = perfect adherence
-
-        for expected_event in expected_events:
-            # Find matching events in actual results
-            start, end = expected_event.minute_range
-            event_type = expected_event.type.value
-
-            matching_events = [
-                e for e in state["events"]
-                if e["type"] == event_type
-                and start <= e["minute"] <= end
-                and (expected_event.team is None or e.get("team") == expected_event.team)
-            ]
-
-            if matching_events:
-                adherence_score += 1.0
-
-        return adherence_score / len(expected_events)
+        return scenario_guide.adherence(state["events"])
 
     def _calculate_event_statistics(self, state: Dict) -> Dict:
         """
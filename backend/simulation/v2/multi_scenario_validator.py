@@ -6,10 +6,11 @@ Multi-Scenario Validator
 """
 
 import logging
-import numpy as np
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from utils.cancellation import CancellationToken, checkpoint
+from utils.rng import RNGProvider, SeedLike, as_seed_sequence
 from .scenario import Scenario
 from .scenario_guide import ScenarioGuide
 from .event_simulation_engine import (
@@ -17,6 +18,8 @@ from .event_simulation_engine import (
     MatchParameters,
     EPL_BASELINE
 )
+from .parallel_executor import MonteCarloExecutor
+from .streaming_aggregator import SimulationAccumulator
 
 logger = logging.getLogger(__name__)
 
@@ -40,16 +43,30 @@ class MultiScenarioValidator:
     설계 문서 Phase 2 구현
     """
 
-    def __init__(self):
-        """Initialize validator"""
+    def __init__(
+        self,
+        use_batch_engine: bool = True,
+        executor: Optional[MonteCarloExecutor] = None
+    ):
+        """
+        Initialize validator
+
+        Args:
+            use_batch_engine: True면 simulate_batch (벡터화) 사용
+            executor: batch 실행기 (serial/thread/process, 기본: serial)
+        """
         self.engine = EventBasedSimulationEngine()
+        self.use_batch_engine = use_batch_engine
+        self.executor = executor or MonteCarloExecutor()
         logger.info("MultiScenarioValidator initialized")
 
     def validate_scenarios(
         self,
         scenarios: List[Scenario],
         base_params: MatchParameters,
-        n: int = 100
+        n: int = 100,
+        seed: SeedLike = None,
+        cancel_token: Optional[CancellationToken] = None
     ) -> List[Dict]:
         """
         각 시나리오 × n회 시뮬레이션
@@ -58,31 +75,47 @@ class MultiScenarioValidator:
             scenarios: 검증할 시나리오 리스트
             base_params: 기본 경기 파라미터
             n: 반복 횟수 (기본: 100)
+            seed: master seed (시나리오별, batch 모드에서는 chunk별 스트림 파생)
+            cancel_token: 취소 토큰 (batch 모드는 chunk마다, 아니면 100 run마다 확인)
 
         Returns:
             검증 결과 리스트
         """
         logger.info(f"Validating {len(scenarios)} scenarios × {n} runs...")
 
+        # 1. ScenarioGuide 생성 + 2. 시나리오별 파라미터 병합
+        guides = [ScenarioGuide(scenario) for scenario in scenarios]
+        scenario_params = [self._merge_parameters(base_params, scenario) for scenario in scenarios]
+
+        # 3. N회 시뮬레이션 (batch 모드는 모든 시나리오를 executor에 한 번에 제출)
+        #    run 결과는 SimulationAccumulator에 즉시 집계되고 보관하지 않음
+        scenario_seeds = as_seed_sequence(seed).spawn(len(scenarios))
+        if self.use_batch_engine:
+            accumulators = self.executor.run_many(
+                list(zip(scenario_params, guides, [n] * len(scenarios), scenario_seeds)),
+                cancel_token=cancel_token
+            )
+
         validation_results = []
 
         for i, scenario in enumerate(scenarios, 1):
             logger.info(f"[{i}/{len(scenarios)}] Validating {scenario.id}: {scenario.name}")
 
-            # 1. ScenarioGuide 생성
-            guide = ScenarioGuide(scenario)
-
-            # 2. 시나리오별 파라미터 병합
-            scenario_params = self._merge_parameters(base_params, scenario)
-
-            # 3. N회 시뮬레이션
-            outcomes = []
-            for run_idx in range(n):
-                result = self.engine.simulate_match(scenario_params, guide)
-                outcomes.append(result)
+            if self.use_batch_engine:
+                accumulator = accumulators[i - 1]
+            else:
+                engine = EventBasedSimulationEngine(RNGProvider(scenario_seeds[i - 1]))
+                tables = engine.compile_tables(scenario_params[i - 1], guides[i - 1])
+                accumulator = SimulationAccumulator(e.type.value for e in scenario.events)
+                for run_idx in range(n):
+                    if run_idx % 100 == 0:
+                        checkpoint(cancel_token)
+                    accumulator.add_result(
+                        engine.simulate_match(scenario_params[i - 1], guides[i - 1], tables=tables)
+                    )
 
             # 4. 통계 집계
-            stats = self._aggregate_outcomes(outcomes, scenario, n)
+            stats = self._aggregate_accumulator(accumulator, scenario)
             validation_results.append(stats)
 
             logger.info(f"   ✓ Win rate: H={stats['win_rate']['home']:.1%}, "
@@ -162,67 +195,58 @@ class MultiScenarioValidator:
         Returns:
             집계된 통계
         """
-        # Win rates
-        home_wins = sum(1 for o in outcomes if o["final_score"]["home"] > o["final_score"]["away"])
-        away_wins = sum(1 for o in outcomes if o["final_score"]["away"] > o["final_score"]["home"])
-        draws = n - home_wins - away_wins
+        accumulator = SimulationAccumulator(e.type.value for e in scenario.events)
+        for outcome in outcomes:
+            accumulator.add_result(outcome)
+        return self._aggregate_accumulator(accumulator, scenario)
 
-        win_rate = {
-            "home": home_wins / n,
-            "away": away_wins / n,
-            "draw": draws / n
-        }
+    def _aggregate_accumulator(
+        self,
+        accumulator: SimulationAccumulator,
+        scenario: Scenario
+    ) -> Dict:
+        """
+        온라인 집계 결과 → 시나리오 통계
 
-        # Average scores
-        home_scores = [o["final_score"]["home"] for o in outcomes]
-        away_scores = [o["final_score"]["away"] for o in outcomes]
+        Args:
+            accumulator: 시나리오의 SimulationAccumulator
+            scenario: 시나리오
 
-        avg_score = {
-            "home": np.mean(home_scores),
-            "away": np.mean(away_scores)
-        }
+        Returns:
+            집계된 통계
+        """
+        n = accumulator.n_runs
+        outcome_counts = accumulator.outcome_counts()
 
-        score_variance = {
-            "home": np.var(home_scores),
-            "away": np.var(away_scores)
+        # Win rates
+        win_rate = {
+            "home": outcome_counts["home_win"] / n,
+            "away": outcome_counts["away_win"] / n,
+            "draw": outcome_counts["draw"] / n
         }
 
         # Narrative adherence
-        adherence_scores = [o["narrative_adherence"] for o in outcomes]
         narrative_adherence = {
-            "mean": np.mean(adherence_scores),
-            "std": np.std(adherence_scores),
-            "min": np.min(adherence_scores),
-            "max": np.max(adherence_scores)
+            "mean": accumulator.adherence_mean,
+            "std": accumulator.adherence_std(),
+            "min": accumulator.adherence_min,
+            "max": accumulator.adherence_max
         }
 
-        # Bias metrics
-        bias_metrics = self._calculate_bias_metrics(outcomes, scenario)
-
-        # Event distribution
-        event_distribution = self._analyze_event_distribution(outcomes, scenario)
-
-        # Score distribution
-        score_distribution = self._calculate_score_distribution(outcomes)
-
         return {
             "scenario_id": scenario.id,
             "scenario_name": scenario.name,
             "total_runs": n,
             "win_rate": win_rate,
-            "avg_score": avg_score,
-            "score_variance": score_variance,
+            "avg_score": accumulator.avg_score(),
+            "score_variance": accumulator.score_variance(),
             "narrative_adherence": narrative_adherence,
-            "bias_metrics": bias_metrics,
-            "event_distribution": event_distribution,
-            "score_distribution": score_distribution
+            "bias_metrics": self._calculate_bias_metrics(accumulator),
+            "event_distribution": self._analyze_event_distribution(accumulator),
+            "score_distribution": self._calculate_score_distribution(accumulator)
         }
 
-    def _calculate_bias_metrics(
-        self,
-        outcomes: List[Dict],
-        scenario: Scenario
-    ) -> Dict[str, float]:
+    def _calculate_bias_metrics(self, accumulator: SimulationAccumulator) -> Dict[str, float]:
         """
         편향도 계산 (EPL 기준 대비)
 
@@ -233,18 +257,14 @@ class MultiScenarioValidator:
             }
         """
         # Average total goals
-        total_goals = np.mean([
-            o["final_score"]["home"] + o["final_score"]["away"]
-            for o in outcomes
-        ])
+        total_goals = accumulator.total_goals() / accumulator.n_runs
 
         # Score bias (vs EPL 2.8)
         epl_avg_goals = EPL_BASELINE["avg_goals_per_game"]
         score_bias = abs(total_goals - epl_avg_goals) / epl_avg_goals
 
         # Home advantage bias
-        home_wins = sum(1 for o in outcomes if o["final_score"]["home"] > o["final_score"]["away"])
-        home_win_rate = home_wins / len(outcomes)
+        home_win_rate = accumulator.outcomes["home_win"] / accumulator.n_runs
         epl_home_win_rate = EPL_BASELINE["home_win_rate"]
         home_advantage_bias = abs(home_win_rate - epl_home_win_rate) / epl_home_win_rate
 
@@ -255,11 +275,7 @@ class MultiScenarioValidator:
             "epl_reference": epl_avg_goals
         }
 
-    def _analyze_event_distribution(
-        self,
-        outcomes: List[Dict],
-        scenario: Scenario
-    ) -> Dict:
+    def _analyze_event_distribution(self, accumulator: SimulationAccumulator) -> Dict:
         """
         이벤트 분포 분석
 
@@ -269,34 +285,15 @@ class MultiScenarioValidator:
                 "goal_timing": {...}
             }
         """
-        # Count expected events that occurred
-        expected_event_types = [e.type.value for e in scenario.events]
-
-        occurred_count = 0
-        for outcome in outcomes:
-            for expected_type in expected_event_types:
-                # Check if this event type occurred
-                matching_events = [
-                    e for e in outcome["events"]
-                    if e["type"] == expected_type
-                ]
-                if matching_events:
-                    occurred_count += 1
-                    break  # Count once per outcome
-
-        expected_events_occurred = occurred_count / len(outcomes)
+        expected_events_occurred = accumulator.expected_event_runs / accumulator.n_runs
 
         # Goal timing analysis
-        all_goals = []
-        for outcome in outcomes:
-            goals = [e for e in outcome["events"] if e["type"] == "goal"]
-            all_goals.extend(goals)
-
+        total_goals = sum(accumulator.goal_timing)
         goal_timing = {
-            "0-30min": len([g for g in all_goals if g["minute"] < 30]) / max(len(all_goals), 1),
-            "30-60min": len([g for g in all_goals if 30 <= g["minute"] < 60]) / max(len(all_goals), 1),
-            "60-90min": len([g for g in all_goals if g["minute"] >= 60]) / max(len(all_goals), 1),
-            "total_goals": len(all_goals)
+            "0-30min": accumulator.goal_timing[0] / max(total_goals, 1),
+            "30-60min": accumulator.goal_timing[1] / max(total_goals, 1),
+            "60-90min": accumulator.goal_timing[2] / max(total_goals, 1),
+            "total_goals": total_goals
         }
 
         return {
@@ -304,26 +301,17 @@ class MultiScenarioValidator:
             "goal_timing": goal_timing
         }
 
-    def _calculate_score_distribution(self, outcomes: List[Dict]) -> Dict[str, float]:
+    def _calculate_score_distribution(self, accumulator: SimulationAccumulator) -> Dict[str, float]:
         """
         스코어 분포 계산
 
         Returns:
             {"0-0": 0.03, "1-0": 0.12, ...}
         """
-        score_counts = {}
-
-        for outcome in outcomes:
-            home = outcome["final_score"]["home"]
-            away = outcome["final_score"]["away"]
-            score_str = f"{home}-{away}"
-            score_counts[score_str] = score_counts.get(score_str, 0) + 1
-
-        # Convert to probabilities
-        total = len(outcomes)
+        total = accumulator.n_runs
         score_distribution = {
             score: count / total
-            for score, count in score_counts.items()
+            for score, count in accumulator.score_counts().items()
         }
 
         # Sort by probability (descending)
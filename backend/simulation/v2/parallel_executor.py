@@ -0,0 +1,318 @@
+"""
+Monte Carlo Executor
+시나리오 × N회 시뮬레이션을 여러 워커로 분할 실행
+
+- serial: 현재 프로세스에서 순차 실행
+- thread: ThreadPoolExecutor
+- process: ProcessPoolExecutor (멀티코어)
+
+run은 고정 크기 chunk로 분할되고, chunk마다 master seed에서 파생된
+독립 난수 스트림을 사용한다. chunk 분할이 워커 수와 무관하므로 같은
+master seed면 어떤 모드/워커 수에서도 동일한 결과가 나온다.
+워커는 run별 결과 대신 chunk의 SimulationAccumulator(부분 집계)만
+반환하고, 부모 프로세스는 이를 병합하므로 메모리는 run 수와 무관하다.
+
+run_adaptive는 순차 샘플링 모드: chunk 단위로 실행하다가 홈승/무/원정승
+확률의 신뢰구간 반폭이 목표치 이하가 되면 해당 시나리오를 멈춘다.
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from utils.cancellation import CancellationToken, checkpoint
+from utils.rng import SeedLike, as_seed_sequence
+from .scenario_guide import ScenarioGuide
+from .event_simulation_engine import EventBasedSimulationEngine, MatchParameters
+from .streaming_aggregator import SimulationAccumulator
+
+logger = logging.getLogger(__name__)
+
+
+EXECUTOR_MODES = ("serial", "thread", "process")
+
+# 병렬 실행 중 취소 확인 주기 (초)
+CANCEL_POLL_SECONDS = 0.2
+
+# (params, scenario_guide, n_runs, seed)
+SimulationTask = Tuple[MatchParameters, ScenarioGuide, int, SeedLike]
+
+
+@dataclass
+class ExecutorConfig:
+    """Executor 설정"""
+    mode: str = "serial"                 # serial / thread / process
+    max_workers: Optional[int] = None    # None = os.cpu_count()
+    chunk_size: int = 500                # chunk당 run 수
+
+    def __post_init__(self):
+        if self.mode not in EXECUTOR_MODES:
+            raise ValueError(f"mode must be one of {EXECUTOR_MODES}, got {self.mode!r}")
+        if self.chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {self.chunk_size}")
+
+    @classmethod
+    def from_env(cls) -> 'ExecutorConfig':
+        """
+        SIMULATION_EXECUTOR_MODE (기본 thread) / SIMULATION_EXECUTOR_WORKERS (기본 os.cpu_count())
+
+        daemon 프로세스(job worker)는 자식 프로세스를 만들 수 없으므로 그 안에서는
+        process 모드를 thread로 실행한다.
+        """
+        mode = os.getenv('SIMULATION_EXECUTOR_MODE', 'thread').lower()
+        workers = os.getenv('SIMULATION_EXECUTOR_WORKERS')
+        if mode == 'process' and multiprocessing.current_process().daemon:
+            logger.warning("MonteCarloExecutor: process mode is not available in a daemon process, using threads")
+            mode = 'thread'
+        return cls(mode=mode, max_workers=int(workers) if workers else None)
+
+
+@dataclass
+class AdaptiveSamplingConfig:
+    """순차 샘플링 (early stopping) 설정"""
+    target_half_width: float = 0.02      # 홈승/무/원정승 확률 CI 반폭 목표
+    confidence: float = 0.95             # 신뢰수준
+    min_runs: int = 500                  # 최소 run 수 (작은 표본의 CI 과소추정 방지)
+    max_runs: int = 6000                 # 최대 run 수 (hard cap)
+    chunk_runs: int = 250                # 라운드당 run 수
+
+    def __post_init__(self):
+        if not (0.0 < self.target_half_width < 0.5):
+            raise ValueError(f"target_half_width must be in (0, 0.5), got {self.target_half_width}")
+        if not (0.0 < self.confidence < 1.0):
+            raise ValueError(f"confidence must be in (0, 1), got {self.confidence}")
+        if not (1 <= self.min_runs <= self.max_runs):
+            raise ValueError(f"need 1 <= min_runs <= max_runs, got {self.min_runs}, {self.max_runs}")
+        if self.chunk_runs < 1:
+            raise ValueError(f"chunk_runs must be >= 1, got {self.chunk_runs}")
+
+    @classmethod
+    def from_env(cls) -> Optional['AdaptiveSamplingConfig']:
+        """
+        SIMULATION_ADAPTIVE_SAMPLING=true면 설정 반환 (아니면 None = 고정 run 수)
+
+        SIMULATION_ADAPTIVE_TARGET / _MIN_RUNS / _MAX_RUNS로 기본값 변경
+        """
+        if os.getenv('SIMULATION_ADAPTIVE_SAMPLING', 'false').lower() != 'true':
+            return None
+        defaults = cls()
+        return cls(
+            target_half_width=float(os.getenv('SIMULATION_ADAPTIVE_TARGET', defaults.target_half_width)),
+            min_runs=int(os.getenv('SIMULATION_ADAPTIVE_MIN_RUNS', defaults.min_runs)),
+            max_runs=int(os.getenv('SIMULATION_ADAPTIVE_MAX_RUNS', defaults.max_runs))
+        )
+
+
+@dataclass
+class AdaptiveRunResult:
+    """순차 샘플링 결과 (시나리오 1개)"""
+    accumulator: SimulationAccumulator
+    ci_half_width: float                 # 종료 시점의 최대 CI 반폭
+    converged: bool                      # 목표 반폭 도달 여부 (False = max_runs 도달)
+
+
+def outcome_ci_half_width(accumulator: SimulationAccumulator, confidence: float = 0.95) -> float:
+    """
+    홈승/무/원정승 비율의 정규근사 신뢰구간 반폭 중 최댓값
+
+    z * sqrt(p(1-p)/n), p는 (count + 0.5) / (n + 1)로 보정해
+    0/1 비율에서도 반폭이 0이 되지 않도록 한다.
+    """
+    n = accumulator.n_runs
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    half_widths = []
+    for count in accumulator.outcome_counts().values():
+        p = (count + 0.5) / (n + 1)
+        half_widths.append(z * math.sqrt(p * (1 - p) / n))
+    return max(half_widths)
+
+
+def _simulate_chunk(
+    params: MatchParameters,
+    scenario_guide: ScenarioGuide,
+    n_runs: int,
+    seed: np.random.SeedSequence
+) -> SimulationAccumulator:
+    """
+    워커에서 실행되는 단일 chunk (process 모드에서 pickle 가능하도록 모듈 함수)
+
+    run별 배열은 워커 안에서 집계 후 버리고 부분 집계만 반환한다.
+    """
+    batch = EventBasedSimulationEngine().simulate_batch(params, scenario_guide, n_runs, seed=seed)
+    return SimulationAccumulator.from_batch(batch, {event.type.value for event in scenario_guide.events})
+
+
+class MonteCarloExecutor:
+    """
+    Batch 시뮬레이션을 chunk 단위로 분할해 병렬 실행
+    """
+
+    def __init__(self, config: Optional[ExecutorConfig] = None):
+        """
+        Args:
+            config: Executor 설정 (기본: serial)
+        """
+        self.config = config or ExecutorConfig()
+        self._pool: Optional[Executor] = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        return self.config.max_workers or os.cpu_count() or 1
+
+    def run(
+        self,
+        params: MatchParameters,
+        scenario_guide: ScenarioGuide,
+        n_runs: int,
+        seed: SeedLike = None
+    ) -> SimulationAccumulator:
+        """
+        단일 시나리오 N회 시뮬레이션
+
+        Returns:
+            병합된 SimulationAccumulator
+        """
+        return self.run_many([(params, scenario_guide, n_runs, seed)])[0]
+
+    def run_many(
+        self,
+        tasks: List[SimulationTask],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> List[SimulationAccumulator]:
+        """
+        여러 시나리오를 한 번에 실행 (모든 chunk를 동시에 제출)
+
+        Args:
+            tasks: [(params, scenario_guide, n_runs, seed), ...]
+            cancel_token: chunk마다 확인하는 취소 토큰 (취소되면 남은 chunk를 버리고
+                SimulationCancelled)
+
+        Returns:
+            task 순서대로 병합된 SimulationAccumulator 리스트
+        """
+        chunks = []  # (task_index, params, guide, chunk_runs, seed_sequence)
+        for task_index, (params, guide, n_runs, seed) in enumerate(tasks):
+            chunk_sizes = self._split_runs(n_runs)
+            seed_sequences = as_seed_sequence(seed).spawn(len(chunk_sizes))
+            for chunk_runs, seed_sequence in zip(chunk_sizes, seed_sequences):
+                chunks.append((task_index, params, guide, chunk_runs, seed_sequence))
+
+        results = [
+            SimulationAccumulator({event.type.value for event in guide.events})
+            for _, guide, _, _ in tasks
+        ]
+
+        # chunk 순서대로 병합 (모드와 무관하게 동일한 부동소수점 결과)
+        if self.config.mode == "serial" or len(chunks) <= 1:
+            for chunk in chunks:
+                checkpoint(cancel_token)
+                results[chunk[0]].merge(_simulate_chunk(*chunk[1:]))
+        else:
+            pool = self._get_pool()
+            futures = [pool.submit(_simulate_chunk, *chunk[1:]) for chunk in chunks]
+            try:
+                if cancel_token is not None:
+                    pending = set(futures)
+                    while pending:
+                        cancel_token.raise_if_cancelled()
+                        _, pending = wait(pending, timeout=CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for chunk, future in zip(chunks, futures):
+                    results[chunk[0]].merge(future.result())
+            finally:
+                # 취소/실패 시 아직 시작하지 않은 chunk가 워커를 점유하지 않도록
+                for future in futures:
+                    future.cancel()
+
+        return results
+
+    def run_adaptive(
+        self,
+        tasks: List[Tuple[MatchParameters, ScenarioGuide, SeedLike]],
+        config: AdaptiveSamplingConfig,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> List[AdaptiveRunResult]:
+        """
+        순차 샘플링: 라운드마다 미수렴 시나리오에 chunk를 하나씩 추가 실행
+
+        Args:
+            tasks: [(params, scenario_guide, seed), ...]
+            config: 순차 샘플링 설정
+            cancel_token: 라운드와 chunk마다 확인하는 취소 토큰 (취소되면 SimulationCancelled)
+
+        Returns:
+            task 순서대로 AdaptiveRunResult 리스트
+        """
+        seed_sequences = [as_seed_sequence(seed) for _, _, seed in tasks]
+        merged = [SimulationAccumulator({event.type.value for event in guide.events}) for _, guide, _ in tasks]
+        runs_done = [0] * len(tasks)
+        half_widths = [1.0] * len(tasks)
+        active = list(range(len(tasks)))
+
+        while active:
+            checkpoint(cancel_token)
+            round_tasks = []
+            for index in active:
+                chunk_runs = min(config.chunk_runs, config.max_runs - runs_done[index])
+                params, guide, _ = tasks[index]
+                # spawn()은 호출마다 새 자식을 만들므로 라운드별 스트림이 결정적으로 분리됨
+                round_tasks.append((params, guide, chunk_runs, seed_sequences[index].spawn(1)[0]))
+
+            for index, partial in zip(active, self.run_many(round_tasks, cancel_token)):
+                merged[index].merge(partial)
+                runs_done[index] = merged[index].n_runs
+                half_widths[index] = outcome_ci_half_width(merged[index], config.confidence)
+
+            active = [
+                index for index in active
+                if runs_done[index] < config.max_runs
+                and (runs_done[index] < config.min_runs or half_widths[index] > config.target_half_width)
+            ]
+
+        return [
+            AdaptiveRunResult(
+                accumulator=merged[index],
+                ci_half_width=half_widths[index],
+                converged=half_widths[index] <= config.target_half_width
+            )
+            for index in range(len(tasks))
+        ]
+
+    def shutdown(self):
+        """워커 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _split_runs(self, n_runs: int) -> List[int]:
+        """n_runs → chunk 크기 리스트 (워커 수와 무관)"""
+        chunk_size = self.config.chunk_size
+        sizes = [chunk_size] * (n_runs // chunk_size)
+        if n_runs % chunk_size:
+            sizes.append(n_runs % chunk_size)
+        return sizes
+
+    def _get_pool(self) -> Executor:
+        """워커 풀 (최초 사용 시 생성, 이후 재사용 - 여러 스레드에서 호출 가능)"""
+        with self._pool_lock:
+            if self._pool is None:
+                if self.config.mode == "process":
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+                logger.info(f"MonteCarloExecutor: started {self.config.mode} pool ({self.max_workers} workers)")
+            return self._pool
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
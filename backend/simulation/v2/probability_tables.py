@@ -0,0 +1,141 @@
+"""
+Precompiled Probability Tables
+MatchParameters + ScenarioGuide → 분 × 팀 이벤트 확률 배열
+
+EventProbabilityCalculator.calculate는 매 분마다 baseline을 복사하고
+팀 능력치/전술/서사 부스트 보정을 다시 계산한다. 이 값들은 경기 중
+변하지 않으므로 경기 시작 전에 (90, 2) 배열로 한 번만 계산하고,
+실행 중에는 스코어 상황 / 점유율 / 체력 보정만 곱한다.
+
+index 규칙: [minute, side], side 0 = 홈팀 공격, 1 = 원정팀 공격
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .scenario import EventType
+from .scenario_guide import ScenarioGuide
+
+
+MATCH_MINUTES = 90
+
+# 공격 포메이션 / 수비 포메이션 보정 대상
+ATTACKING_FORMATIONS = ("4-3-3", "4-2-3-1")
+DEFENSIVE_FORMATIONS = ("5-3-2", "5-4-1")
+
+# 서사 부스트 event_type → 영향을 받는 확률 테이블
+BOOST_TARGETS = {
+    EventType.WING_BREAKTHROUGH: "shot",
+    EventType.SHOT_ON_TARGET: "on_target",
+    EventType.GOAL: "conversion",
+    EventType.CORNER: "corner",
+}
+
+
+@dataclass
+class ProbabilityTables:
+    """분 × 팀 이벤트 확률 (스코어/점유율/체력 보정 전)"""
+    shot: np.ndarray              # (90, 2) shot_per_minute
+    on_target: np.ndarray         # (90, 2) shot_on_target_ratio
+    conversion: np.ndarray        # (90, 2) goal_conversion_on_target
+    corner: np.ndarray            # (90, 2) corner_per_minute
+    foul: np.ndarray              # (90, 2) foul_per_minute (공격 side 기준, 수비팀이 범함)
+    base_home_possession: float   # 미드필드 능력치 기반 홈 점유율 (무작위 변동 전)
+
+
+def compile_probability_tables(
+    params,
+    scenario_guide: ScenarioGuide,
+    baseline: Dict
+) -> ProbabilityTables:
+    """
+    경기 중 변하지 않는 보정을 모두 적용한 확률 테이블 생성
+
+    Args:
+        params: MatchParameters
+        scenario_guide: 시나리오 가이드
+        baseline: EPL 기준 통계 (EPL_BASELINE)
+
+    Returns:
+        ProbabilityTables
+    """
+    teams = (params.home_team, params.away_team)
+    formations = (params.home_formation, params.away_formation)
+
+    shot_rate = np.empty(2)
+    foul_rate = np.empty(2)
+    for side in (0, 1):
+        attacking, defending = teams[side], teams[1 - side]
+
+        # 팀 능력치 (공격력 vs 수비력)
+        attack_rating = attacking.get("attack_strength", 75) / 100.0
+        defense_rating = defending.get("defense_strength", 75) / 100.0
+        shot = baseline["shot_per_minute"] * attack_rating / max(defense_rating, 0.5)
+        foul = baseline["foul_per_minute"]
+
+        # 전술 매치업
+        if formations[side] in ATTACKING_FORMATIONS:
+            shot *= 1.12
+        if formations[1 - side] in DEFENSIVE_FORMATIONS:
+            shot *= 0.88
+        if defending.get("press_intensity", 70) > 80:
+            shot *= 0.92
+            foul *= 1.25
+
+        shot_rate[side] = shot
+        foul_rate[side] = foul
+
+    # 서사 부스트 (해당 분에 공격 중인 팀에만 적용)
+    boosts = {
+        target: scenario_guide.get_multipliers(event_type)
+        for event_type, target in BOOST_TARGETS.items()
+    }
+
+    tables = {
+        "shot": shot_rate[None, :] * boosts["shot"],
+        "on_target": baseline["shot_on_target_ratio"] * boosts["on_target"],
+        "conversion": baseline["goal_conversion_on_target"] * boosts["conversion"],
+        "corner": baseline["corner_per_minute"] * boosts["corner"],
+    }
+
+    home_midfield = params.home_team.get("midfield_strength", 75)
+    away_midfield = params.away_team.get("midfield_strength", 75)
+
+    return ProbabilityTables(
+        shot=tables["shot"],
+        on_target=tables["on_target"],
+        conversion=tables["conversion"],
+        corner=tables["corner"],
+        foul=np.tile(foul_rate, (MATCH_MINUTES, 1)),
+        base_home_possession=home_midfield / (home_midfield + away_midfield) * 100
+    )
+
+
+def score_state_factor(score_diff):
+    """
+    스코어 상황 보정 (공격팀 기준 득실차)
+
+    지고 있으면 1.18, 이기고 있으면 0.85. 스칼라/배열 모두 지원.
+    """
+    if np.isscalar(score_diff):
+        if score_diff < 0:
+            return 1.18
+        if score_diff > 0:
+            return 0.85
+        return 1.0
+    return np.where(score_diff < 0, 1.18, np.where(score_diff > 0, 0.85, 1.0))
+
+
+def fatigue_factors(minute: int, stamina: float) -> Optional[Tuple[float, float]]:
+    """
+    체력 보정 (70분 이후)
+
+    Returns:
+        (shot 배수, on_target 배수) 또는 None (보정 없음)
+    """
+    if minute <= 70:
+        return None
+    fatigue_factor = (100 - stamina) / 100.0
+    return 1 + fatigue_factor * 0.25, 1 - fatigue_factor * 0.15
@@ -5,14 +5,28 @@ Scenario Guide
 시나리오를 분별 부스트 맵으로 변환
 """
 
-from typing import Dict, Optional
-from .scenario import Scenario
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .scenario import Scenario, EventType
+
+
+MATCH_MINUTES = 90
+
+# 배열 형태의 축 순서
+TEAM_INDEX = {"home": 0, "away": 1}
+EVENT_TYPE_INDEX = {event_type.value: index for index, event_type in enumerate(EventType)}
 
 
 class ScenarioGuide:
     """
     시나리오를 분 단위 부스트 맵으로 변환
     설계 문서 Section 4.2
+
+    두 가지 형태를 함께 제공한다.
+    - boosts_by_minute / get_boost_at: 분별 부스트 dict
+    - boost_multipliers: (2, len(EventType), 90) 배수 배열 (team × event_type × minute)
     """
 
     def __init__(self, scenario: Scenario):
@@ -24,10 +38,17 @@ class ScenarioGuide:
         self.boosts_by_minute = self._parse_events()
         self.events = scenario.events  # For narrative adherence calculation
 
+        self.boost_multipliers = self._build_boost_multipliers()
+        self._compile_expected_events()
+
     def _parse_events(self) -> Dict[int, Dict]:
         """
         이벤트 시퀀스 → 분별 부스트 맵
 
+        같은 분에 여러 이벤트가 겹치면 먼저 나온 이벤트를 유지하고,
+        같은 타입일 때만 더 높은 부스트로 교체한다.
+        부스트 dict는 이벤트당 하나를 만들어 해당 범위의 분들이 공유한다.
+
         Returns:
             {
                 15: {
@@ -41,33 +62,64 @@ class ScenarioGuide:
         boosts = {}
 
         for event in self.scenario.events:
+            boost = {
+                "team": event.team,
+                "event_type": event.type.value,
+                "multiplier": event.probability_boost,
+                "actor": event.actor,
+                "method": event.method
+            }
+
             # minute_range is a tuple (start, end)
             start, end = event.minute_range
 
             for minute in range(start, end + 1):
-                # Multiple events can overlap - use the highest boost
-                if minute in boosts:
-                    # If same event type, take higher boost
-                    if boosts[minute]["event_type"] == event.type.value:
-                        if event.probability_boost > boosts[minute]["multiplier"]:
-                            boosts[minute] = {
-                                "team": event.team,
-                                "event_type": event.type.value,
-                                "multiplier": event.probability_boost,
-                                "actor": event.actor,
-                                "method": event.method
-                            }
-                else:
-                    boosts[minute] = {
-                        "team": event.team,
-                        "event_type": event.type.value,
-                        "multiplier": event.probability_boost,
-                        "actor": event.actor,
-                        "method": event.method
-                    }
+                current = boosts.get(minute)
+                if current is None:
+                    boosts[minute] = boost
+                elif current["event_type"] == boost["event_type"] and boost["multiplier"] > current["multiplier"]:
+                    boosts[minute] = boost
 
         return boosts
 
+    def _build_boost_multipliers(self) -> np.ndarray:
+        """
+        분별 부스트 맵 → (2, len(EventType), 90) 배수 배열
+
+        get_boost_at과 동일하게 분당 하나의 부스트만 반영된다.
+        """
+        multipliers = np.ones((len(TEAM_INDEX), len(EVENT_TYPE_INDEX), MATCH_MINUTES))
+
+        for minute, boost in self.boosts_by_minute.items():
+            team = TEAM_INDEX.get(boost["team"])
+            if team is None or minute >= MATCH_MINUTES:
+                continue
+            multipliers[team, EVENT_TYPE_INDEX[boost["event_type"]], minute] = boost["multiplier"]
+
+        return multipliers
+
+    def _compile_expected_events(self):
+        """
+        서사 일치율 계산용 예상 이벤트 배열
+
+        - expected_types: (K,) EventType index
+        - expected_teams: (K,) 0 = home, 1 = away, -1 = 팀 무관, -2 = 매칭 불가
+        - expected_windows: (K, 91) minute_range 마스크 (0-90분)
+        """
+        n_expected = len(self.events)
+        self.expected_types = np.empty(n_expected, dtype=np.int16)
+        self.expected_teams = np.empty(n_expected, dtype=np.int16)
+        self.expected_windows = np.zeros((n_expected, MATCH_MINUTES + 1), dtype=bool)
+
+        for k, event in enumerate(self.events):
+            start, end = event.minute_range
+            self.expected_types[k] = EVENT_TYPE_INDEX[event.type.value]
+            if event.team is None:
+                self.expected_teams[k] = -1
+            else:
+                self.expected_teams[k] = TEAM_INDEX.get(event.team, -2)
+            self.expected_windows[k, start:end + 1] = True
+
     def get_boost_at(self, minute: int) -> Optional[Dict]:
         """
         특정 분의 부스트 반환
@@ -80,6 +132,72 @@ class ScenarioGuide:
         """
         return self.boosts_by_minute.get(minute, None)
 
+    def get_multipliers(self, event_type: EventType) -> np.ndarray:
+        """
+        이벤트 타입의 팀별 분당 배수
+
+        Returns:
+            (90, 2) 배열 [minute, side]
+        """
+        return self.boost_multipliers[:, EVENT_TYPE_INDEX[event_type.value], :].T
+
+    def adherence(self, events: List[Dict]) -> float:
+        """
+        단일 경기 이벤트 리스트의 서사 일치율
+
+        예상 이벤트마다 같은 타입/팀의 이벤트가 minute_range 안에 있으면 1점.
+
+        Args:
+            events: [{"type": "goal", "team": "home", "minute": 23}, ...]
+
+        Returns:
+            0.0-1.0 (예상 이벤트가 없으면 1.0)
+        """
+        if not self.events:
+            return 1.0  # No expectations = perfect adherence
+
+        # 한 경기의 이벤트는 수십 개뿐이므로 NumPy 대신 타입별 인덱스로 검사
+        events_by_type = {}
+        for event in events:
+            events_by_type.setdefault(event["type"], []).append(event)
+
+        matched = 0
+        for expected_event in self.events:
+            start, end = expected_event.minute_range
+            for event in events_by_type.get(expected_event.type.value, ()):
+                if start <= event["minute"] <= end and (
+                    expected_event.team is None or event.get("team") == expected_event.team
+                ):
+                    matched += 1
+                    break
+
+        return matched / len(self.events)
+
+    def batch_adherence(self, event_types: np.ndarray, event_teams: np.ndarray) -> np.ndarray:
+        """
+        run × minute 이벤트 배열의 run별 서사 일치율
+
+        Args:
+            event_types: (n_runs, minutes) EventType index (-1 = 이벤트 없음)
+            event_teams: (n_runs, minutes) 0 = home, 1 = away
+
+        Returns:
+            (n_runs,) 서사 일치율
+        """
+        n_runs, n_minutes = event_types.shape
+        if not self.events:
+            return np.ones(n_runs)
+
+        # hits[run, k, m] = m분 이벤트가 예상 이벤트 k와 타입/팀/시간 모두 일치
+        in_window = self.expected_windows[:, :n_minutes]                            # (K, M)
+        type_match = event_types[:, None, :] == self.expected_types[None, :, None]  # (runs, K, M)
+        team_match = (
+            (self.expected_teams[None, :, None] == -1)
+            | (event_teams[:, None, :] == self.expected_teams[None, :, None])
+        )
+        hits = type_match & team_match & in_window[None, :, :]
+        return hits.any(axis=2).sum(axis=1) / len(self.events)
+
     def get_events_in_range(self, start: int, end: int) -> list:
         """
         특정 시간 범위의 예상 이벤트 반환
@@ -11,11 +11,15 @@ from dataclasses import dataclass
 
 from .ai_scenario_generator import get_scenario_generator
 from .ai_scenario_generator_enriched import get_enriched_scenario_generator
-from .multi_scenario_validator import get_validator
+from .multi_scenario_validator import get_validator, MultiScenarioValidator
+from .parallel_executor import MonteCarloExecutor, ExecutorConfig
 from .ai_analyzer import get_analyzer, apply_adjustments
 from .event_simulation_engine import create_match_parameters, MatchParameters
 from .enriched_helpers import enriched_to_match_params
 from .scenario import Scenario
+from .speculative import SpeculativeValidator
+from utils.cancellation import CancellationToken, SimulationCancelled, call_with_cancellation
+from utils.rng import RNGProvider
 from ai.enriched_data_models import EnrichedTeamInput
 from ai.ai_factory import get_ai_client
 import json
@@ -31,6 +35,15 @@ class PipelineConfig:
     initial_runs: int = 100
     final_runs: int = 3000
     convergence_threshold: float = 0.85
+    executor_mode: str = "serial"          # Monte Carlo 실행: serial / thread / process
+    max_workers: Optional[int] = None      # None = os.cpu_count()
+    seed: Optional[int] = None             # Monte Carlo master seed (None = 실행마다 새로 생성)
+    pipelined: bool = True                 # AI 응답 대기 중 Monte Carlo 추측 실행 (결과는 순차 실행과 동일)
+    baseline: bool = False                 # Phase 1 대기 중 이벤트 없는 기준선 시뮬레이션 (pipelined일 때, baseline_results)
+
+
+# 기준선 시뮬레이션 난수 스트림 (spawn 인덱스와 겹치지 않는 substream key)
+BASELINE_STREAM = 2 ** 31
 
 
 class SimulationPipeline:
@@ -46,7 +59,15 @@ class SimulationPipeline:
         """
         self.config = config or PipelineConfig()
         self.scenario_generator = get_scenario_generator()
-        self.validator = get_validator()
+        if self.config.executor_mode == "serial":
+            self.validator = get_validator()
+        else:
+            self.validator = MultiScenarioValidator(
+                executor=MonteCarloExecutor(ExecutorConfig(
+                    mode=self.config.executor_mode,
+                    max_workers=self.config.max_workers
+                ))
+            )
         self.analyzer = get_analyzer()
 
         logger.info(f"SimulationPipeline initialized (max_iterations={self.config.max_iterations})")
@@ -57,7 +78,8 @@ class SimulationPipeline:
         base_params: MatchParameters,
         player_stats: Optional[Dict] = None,
         tactics: Optional[Dict] = None,
-        domain_knowledge: Optional[str] = None
+        domain_knowledge: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None
     ) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """
         전체 파이프라인 실행
@@ -68,20 +90,34 @@ class SimulationPipeline:
             player_stats: 선수 능력치 (선택)
             tactics: 전술 정보 (선택)
             domain_knowledge: 사용자 도메인 지식 (핵심!)
+            cancel_token: 취소 토큰 (검증 chunk와 AI 호출 대기 중 확인, 취소되면 즉시 실패 반환)
 
         Returns:
             Tuple of (success, result_dict, error_message)
         """
+        speculative = None
         try:
             logger.info("="*70)
             logger.info("Simulation Pipeline Started")
             logger.info("="*70)
 
+            # 반복/최종 검증마다 master seed에서 독립 스트림 파생
+            rng = RNGProvider(self.config.seed)
+            speculative = SpeculativeValidator(
+                self.validator, enabled=self.config.pipelined, cancel_token=cancel_token
+            )
+
+            # Phase 1 대기 중: 이벤트 없는 기준선(모델 파라미터 그대로) 시뮬레이션 (opt-in)
+            if self.config.baseline:
+                speculative.submit('baseline', [self._baseline_scenario()], base_params,
+                                   self.config.final_runs, rng.substream(BASELINE_STREAM))
+
             # Phase 1: AI 시나리오 생성
             logger.info("\n[Phase 1] AI Scenario Generation")
             logger.info("-"*70)
 
-            success, scenarios, error = self.scenario_generator.generate_scenarios(
+            success, scenarios, error = call_with_cancellation(
+                cancel_token, self.scenario_generator.generate_scenarios,
                 match_context=match_context,
                 player_stats=player_stats,
                 tactics=tactics,
@@ -101,21 +137,28 @@ class SimulationPipeline:
             converged = False
             history = []
             current_scenarios = scenarios
+            next_seed = rng.spawn(1)[0]
 
             while not converged and iteration <= self.config.max_iterations:
                 logger.info(f"\n>>> Iteration {iteration}/{self.config.max_iterations}")
 
                 # Phase 2: Simulate (100 runs per scenario)
                 logger.info(f"  Phase 2: Simulating ({len(current_scenarios)} × {self.config.initial_runs})...")
-                validation_results = self.validator.validate_scenarios(
-                    scenarios=current_scenarios,
-                    base_params=base_params,
-                    n=self.config.initial_runs
+                validation_results = speculative.validate(
+                    'iteration', current_scenarios, base_params, self.config.initial_runs, next_seed
                 )
+                next_seed = rng.spawn(1)[0]
+
+                # Phase 3 대기 중: 조정 없이 다음 반복/최종 검증으로 넘어갈 경우에 대비해 미리 실행
+                # (조정으로 시나리오가 바뀌면 결과는 버려짐)
+                if iteration < self.config.max_iterations:
+                    speculative.submit('iteration', current_scenarios, base_params, self.config.initial_runs, next_seed)
+                speculative.submit('final', current_scenarios, base_params, self.config.final_runs, next_seed)
 
                 # Phase 3: AI Analysis
                 logger.info(f"  Phase 3: AI Analysis...")
-                success, ai_analysis, error = self.analyzer.analyze_and_adjust(
+                success, ai_analysis, error = call_with_cancellation(
+                    cancel_token, self.analyzer.analyze_and_adjust,
                     scenarios=current_scenarios,
                     validation_results=validation_results,
                     iteration=iteration
@@ -161,11 +204,10 @@ class SimulationPipeline:
             logger.info("-"*70)
             logger.info(f"  Simulating ({len(current_scenarios)} × {self.config.final_runs})...")
 
-            final_results = self.validator.validate_scenarios(
-                scenarios=current_scenarios,
-                base_params=base_params,
-                n=self.config.final_runs
+            final_results = speculative.validate(
+                'final', current_scenarios, base_params, self.config.final_runs, next_seed
             )
+            baseline_results = speculative.result('baseline')
 
             logger.info(f"✓ Completed {len(current_scenarios) * self.config.final_runs} simulations")
 
@@ -174,7 +216,8 @@ class SimulationPipeline:
             logger.info("-"*70)
 
             # Try AI-powered report first, fallback to simplified if it fails
-            success, final_report, error = self._build_ai_final_report(
+            success, final_report, error = call_with_cancellation(
+                cancel_token, self._build_ai_final_report,
                 current_scenarios,
                 final_results,
                 history,
@@ -196,6 +239,7 @@ class SimulationPipeline:
             output = {
                 "scenarios": [s.to_dict() for s in current_scenarios],
                 "final_results": final_results,
+                "baseline_results": baseline_results[0] if baseline_results else None,
                 "report": final_report,
                 "history": history,
                 "converged": converged,
@@ -203,7 +247,9 @@ class SimulationPipeline:
                 "metadata": {
                     "home_team": match_context.get("home_team"),
                     "away_team": match_context.get("away_team"),
-                    "total_simulations": (iteration - 1) * len(scenarios) * self.config.initial_runs + len(current_scenarios) * self.config.final_runs
+                    "total_simulations": (iteration - 1) * len(scenarios) * self.config.initial_runs + len(current_scenarios) * self.config.final_runs,
+                    "seed": rng.seed,
+                    "speculation": dict(speculative.stats)
                 }
             }
 
@@ -213,11 +259,29 @@ class SimulationPipeline:
 
             return True, output, None
 
+        except SimulationCancelled as e:
+            logger.info(f"Pipeline cancelled: {e}")
+            return False, None, f"Cancelled: {e}"
+
         except Exception as e:
             error_msg = f"Pipeline error: {str(e)}"
             logger.error(error_msg)
             return False, None, error_msg
 
+        finally:
+            if speculative is not None:
+                speculative.close()
+
+    def _baseline_scenario(self) -> Scenario:
+        """이벤트 없는 기준선 시나리오 (base_params의 모델 예측 그대로)"""
+        return Scenario(
+            id="BASELINE",
+            name="Model baseline",
+            reasoning="No scenario events; team parameters only",
+            events=[],
+            expected_probability=1.0
+        )
+
     def _build_simplified_report(
         self,
         scenarios: List[Scenario],
@@ -504,7 +568,8 @@ ONLY return valid JSON. No additional text."""
         home_team: EnrichedTeamInput,
         away_team: EnrichedTeamInput,
         match_context: Optional[Dict] = None,
-        event_callback=None
+        event_callback=None,
+        cancel_token: Optional[CancellationToken] = None
     ) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """
         전체 파이프라인 실행 (Enriched Domain Input)
@@ -515,16 +580,24 @@ ONLY return valid JSON. No additional text."""
             match_context: 매치 컨텍스트 (optional)
             event_callback: SSE 이벤트 콜백 함수 (optional)
                            Signature: callback(event_type: str, data: dict)
+            cancel_token: 취소 토큰 (검증 chunk와 AI 호출 대기 중 확인, 취소되면 즉시 실패 반환)
 
         Returns:
             Tuple of (success, result_dict, error_message)
         """
+        speculative = None
         try:
             logger.info("="*70)
             logger.info("Enriched Simulation Pipeline Started")
             logger.info("="*70)
             logger.info(f"Match: {home_team.name} vs {away_team.name}")
 
+            # 반복/최종 검증마다 master seed에서 독립 스트림 파생
+            rng = RNGProvider(self.config.seed)
+            speculative = SpeculativeValidator(
+                self.validator, enabled=self.config.pipelined, cancel_token=cancel_token
+            )
+
             # Helper function to emit events
             def emit_event(event_type: str, data: dict):
                 if event_callback:
@@ -539,6 +612,11 @@ ONLY return valid JSON. No additional text."""
             match_context['home_team'] = home_team.name
             match_context['away_team'] = away_team.name
 
+            # Phase 1 대기 중: 이벤트 없는 기준선(모델 파라미터 그대로) 시뮬레이션 (opt-in)
+            if self.config.baseline:
+                speculative.submit('baseline', [self._baseline_scenario()], base_params,
+                                   self.config.final_runs, rng.substream(BASELINE_STREAM))
+
             # Phase 1: Enriched AI Scenario Generation
             logger.info("\n[Phase 1] Enriched AI Scenario Generation")
             logger.info("-"*70)
@@ -551,7 +629,8 @@ ONLY return valid JSON. No additional text."""
             })
 
             enriched_generator = get_enriched_scenario_generator()
-            success, scenarios, error = enriched_generator.generate_scenarios_enriched(
+            success, scenarios, error = call_with_cancellation(
+                cancel_token, enriched_generator.generate_scenarios_enriched,
                 home_team=home_team,
                 away_team=away_team,
                 match_context=match_context
@@ -587,6 +666,7 @@ ONLY return valid JSON. No additional text."""
             converged = False
             history = []
             current_scenarios = scenarios
+            next_seed = rng.spawn(1)[0]
 
             while not converged and iteration <= self.config.max_iterations:
                 logger.info(f"\n>>> Iteration {iteration}/{self.config.max_iterations}")
@@ -610,11 +690,16 @@ ONLY return valid JSON. No additional text."""
                     'total_runs': len(current_scenarios) * self.config.initial_runs
                 })
 
-                validation_results = self.validator.validate_scenarios(
-                    scenarios=current_scenarios,
-                    base_params=base_params,
-                    n=self.config.initial_runs
+                validation_results = speculative.validate(
+                    'iteration', current_scenarios, base_params, self.config.initial_runs, next_seed
                 )
+                next_seed = rng.spawn(1)[0]
+
+                # Phase 3 대기 중: 조정 없이 다음 반복/최종 검증으로 넘어갈 경우에 대비해 미리 실행
+                # (조정으로 시나리오가 바뀌면 결과는 버려짐)
+                if iteration < self.config.max_iterations:
+                    speculative.submit('iteration', current_scenarios, base_params, self.config.initial_runs, next_seed)
+                speculative.submit('final', current_scenarios, base_params, self.config.final_runs, next_seed)
 
                 emit_event('phase2_complete', {
                     'phase': 2,
@@ -631,7 +716,8 @@ ONLY return valid JSON. No additional text."""
                     'message': 'AI analyzing scenario performance...'
                 })
 
-                success, ai_analysis, error = self.analyzer.analyze_and_adjust(
+                success, ai_analysis, error = call_with_cancellation(
+                    cancel_token, self.analyzer.analyze_and_adjust,
                     scenarios=current_scenarios,
                     validation_results=validation_results,
                     iteration=iteration
@@ -735,11 +821,10 @@ ONLY return valid JSON. No additional text."""
                 'progress': 0.85
             })
 
-            final_results = self.validator.validate_scenarios(
-                scenarios=current_scenarios,
-                base_params=base_params,
-                n=self.config.final_runs
+            final_results = speculative.validate(
+                'final', current_scenarios, base_params, self.config.final_runs, next_seed
             )
+            baseline_results = speculative.result('baseline')
 
             logger.info(f"✓ Completed {len(current_scenarios) * self.config.final_runs} simulations")
 
@@ -761,7 +846,8 @@ ONLY return valid JSON. No additional text."""
             })
 
             # Try AI-powered report first, fallback to simplified if it fails
-            success, final_report, error = self._build_ai_final_report(
+            success, final_report, error = call_with_cancellation(
+                cancel_token, self._build_ai_final_report,
                 current_scenarios,
                 final_results,
                 history,
@@ -796,6 +882,7 @@ ONLY return valid JSON. No additional text."""
             output = {
                 "scenarios": [s.to_dict() for s in current_scenarios],
                 "final_results": final_results,
+                "baseline_results": baseline_results[0] if baseline_results else None,
                 "report": final_report,
                 "history": history,
                 "converged": converged,
@@ -804,7 +891,9 @@ ONLY return valid JSON. No additional text."""
                     "home_team": home_team.name,
                     "away_team": away_team.name,
                     "total_simulations": (iteration - 1) * len(scenarios) * self.config.initial_runs + len(current_scenarios) * self.config.final_runs,
-                    "enriched_data_used": True
+                    "enriched_data_used": True,
+                    "seed": rng.seed,
+                    "speculation": dict(speculative.stats)
                 }
             }
 
@@ -814,11 +903,19 @@ ONLY return valid JSON. No additional text."""
 
             return True, output, None
 
+        except SimulationCancelled as e:
+            logger.info(f"Enriched pipeline cancelled: {e}")
+            return False, None, f"Cancelled: {e}"
+
         except Exception as e:
             error_msg = f"Enriched pipeline error: {str(e)}"
             logger.error(error_msg)
             return False, None, error_msg
 
+        finally:
+            if speculative is not None:
+                speculative.close()
+
 
 # Global instance
 _pipeline = None
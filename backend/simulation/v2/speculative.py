@@ -0,0 +1,202 @@
+"""
+Speculative Validation
+AI 호출을 기다리는 동안 Monte Carlo 검증을 미리 실행
+
+SimulationPipeline은 Phase 1 시나리오 생성과 매 반복의 Phase 3 AI 분석에서
+60-90초씩 LLM 응답을 기다리고, 그동안 CPU는 놀고 있다. 다음에 필요할
+가능성이 높은 검증(다음 반복 Phase 2, 최종 Phase 6)을 그 시간에 백그라운드
+스레드에서 실행해 두고, 실제로 필요한 검증과 시나리오/횟수/seed가 정확히
+같을 때만 결과를 사용한다. 다르면 결과를 버리고 평소처럼 실행하므로
+최종 결과는 순차 실행과 동일하다.
+
+추측 작업마다 파이프라인 토큰의 자식 토큰을 두어, 버리거나 close할 때
+실행 중인 작업도 다음 chunk 체크포인트에서 멈춘다 (CPU를 계속 쓰지 않음).
+
+SeedSequence.spawn은 호출마다 다른 자식을 내므로 검증기에는 항상 seed의
+새 복제본을 넘긴다. 추측 실행과 실제 실행이 같은 seed에서 같은 난수열을 쓴다.
+"""
+
+import copy
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from utils.cancellation import CancellationToken
+from .event_simulation_engine import MatchParameters
+from .multi_scenario_validator import MultiScenarioValidator
+from .scenario import Scenario
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Speculation:
+    """백그라운드 검증 작업 하나"""
+    snapshot: List[Dict]               # 제출 시점 시나리오 (to_dict)
+    base_params: MatchParameters
+    n: int
+    seed: np.random.SeedSequence       # 비교는 동일 객체 기준 (파이프라인이 spawn한 seed)
+    future: Future
+    token: CancellationToken           # 파이프라인 토큰의 자식 (버릴 때 취소)
+
+
+class SpeculativeValidator:
+    """
+    MultiScenarioValidator 앞단의 추측 실행기
+
+    Usage:
+        speculative = SpeculativeValidator(validator)
+        speculative.submit('final', scenarios, params, 3000, seed)     # AI 호출 전
+        ...                                                             # AI 호출 (대기)
+        results = speculative.validate('final', scenarios, params, 3000, seed)  # 유효하면 재사용
+        speculative.close()
+
+    enabled=False이면 submit은 아무것도 하지 않고 validate는 바로 실행한다.
+    """
+
+    def __init__(
+        self,
+        validator: MultiScenarioValidator,
+        enabled: bool = True,
+        cancel_token: Optional[CancellationToken] = None
+    ):
+        """
+        Args:
+            validator: 실제 검증기
+            enabled: False면 순차 실행
+            cancel_token: 추측/실제 검증 모두에 전달하는 취소 토큰
+        """
+        self.validator = validator
+        self.enabled = enabled
+        self.cancel_token = cancel_token
+        self.stats = {'submitted': 0, 'used': 0, 'discarded': 0}
+        self._pending: Dict[str, Speculation] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def submit(
+        self,
+        key: str,
+        scenarios: List[Scenario],
+        base_params: MatchParameters,
+        n: int,
+        seed: np.random.SeedSequence
+    ) -> None:
+        """
+        key 슬롯에 검증을 백그라운드로 제출 (같은 key의 이전 작업은 버림)
+
+        시나리오는 깊은 복사본으로 실행하므로 이후 apply_adjustments가 원본을
+        수정해도 작업에 영향이 없다.
+        """
+        if not self.enabled:
+            return
+        self._discard(key)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='speculative-mc')
+
+        scenarios = copy.deepcopy(scenarios)
+        token = self.cancel_token.child() if self.cancel_token is not None else CancellationToken()
+        future = self._pool.submit(
+            self.validator.validate_scenarios,
+            scenarios=scenarios,
+            base_params=base_params,
+            n=n,
+            seed=_replay(seed),
+            cancel_token=token
+        )
+        self._pending[key] = Speculation([s.to_dict() for s in scenarios], base_params, n, seed, future, token)
+        self.stats['submitted'] += 1
+
+    def validate(
+        self,
+        key: str,
+        scenarios: List[Scenario],
+        base_params: MatchParameters,
+        n: int,
+        seed: np.random.SeedSequence
+    ) -> List[Dict]:
+        """
+        검증 결과 (key 슬롯의 추측 결과가 유효하면 사용, 아니면 지금 실행)
+        """
+        results = self.take(key, scenarios, base_params, n, seed)
+        if results is not None:
+            return results
+        return self.validator.validate_scenarios(
+            scenarios=scenarios,
+            base_params=base_params,
+            n=n,
+            seed=_replay(seed),
+            cancel_token=self.cancel_token
+        )
+
+    def take(
+        self,
+        key: str,
+        scenarios: List[Scenario],
+        base_params: MatchParameters,
+        n: int,
+        seed: np.random.SeedSequence
+    ) -> Optional[List[Dict]]:
+        """
+        key 슬롯의 추측 결과 (입력이 다르거나 실패했으면 None)
+
+        아직 실행 중이면 끝날 때까지 기다린다 (처음부터 다시 실행하는 것보다 빠름).
+        """
+        speculation = self._pending.pop(key, None)
+        if speculation is None:
+            return None
+
+        if (speculation.n != n or speculation.seed is not seed or speculation.base_params is not base_params
+                or speculation.snapshot != [s.to_dict() for s in scenarios]):
+            self._drop(key, speculation, "inputs changed")
+            return None
+
+        try:
+            results = speculation.future.result()
+        except Exception as e:
+            # 취소로 중단된 경우 이어지는 실제 검증이 체크포인트에서 SimulationCancelled를 던짐
+            self._drop(key, speculation, f"failed: {e}")
+            return None
+
+        self.stats['used'] += 1
+        logger.info(f"  ⚡ Reusing speculative '{key}' validation ({len(scenarios)} × {n})")
+        return results
+
+    def result(self, key: str) -> Optional[List[Dict]]:
+        """입력 비교 없이 key 슬롯 결과를 꺼냄 (기준선처럼 항상 유효한 작업용)"""
+        speculation = self._pending.pop(key, None)
+        if speculation is None:
+            return None
+        try:
+            results = speculation.future.result()
+        except Exception as e:
+            self._drop(key, speculation, f"failed: {e}")
+            return None
+        self.stats['used'] += 1
+        return results
+
+    def close(self) -> None:
+        """남은 추측 작업을 취소하고 스레드 종료 (실행 중인 작업은 체크포인트에서 멈춤)"""
+        for key in list(self._pending):
+            self._discard(key)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _discard(self, key: str) -> None:
+        speculation = self._pending.pop(key, None)
+        if speculation is not None:
+            self._drop(key, speculation, "not needed")
+
+    def _drop(self, key: str, speculation: Speculation, reason: str) -> None:
+        speculation.token.cancel(f"speculation discarded ({reason})")
+        speculation.future.cancel()
+        self.stats['discarded'] += 1
+        logger.debug(f"  Speculative '{key}' validation discarded ({reason})")
+
+
+def _replay(seed: np.random.SeedSequence) -> np.random.SeedSequence:
+    """아직 spawn하지 않은 seed 복제본 (몇 번을 실행해도 같은 자식 스트림)"""
+    return np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key, pool_size=seed.pool_size)
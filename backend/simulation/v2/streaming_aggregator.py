@@ -0,0 +1,223 @@
+"""
+Streaming Aggregator
+시뮬레이션 결과를 run마다 온라인으로 집계
+
+각 run(또는 batch chunk)이 끝나는 즉시 승/무/패 횟수, 스코어 히스토그램,
+득점 시간대, 서사 일치율 모멘트, 이벤트 타입별 횟수를 갱신하고 run 자체는
+버린다. 메모리 사용량은 run 수와 무관하게 일정하며 (스코어 히스토그램만
+등장한 스코어 수만큼 증가), 병렬 워커의 부분 집계는 merge로 합친다.
+"""
+
+import math
+from collections import Counter
+from typing import Dict, Iterable
+
+import numpy as np
+
+from .event_simulation_engine import BatchSimulationResult, BATCH_EVENT_TYPES
+
+
+class SimulationAccumulator:
+    """
+    시나리오 1개의 Monte Carlo 결과 온라인 집계
+
+    서사 일치율 평균/분산은 Welford 알고리즘으로 갱신하고,
+    부분 집계 병합은 Chan et al.의 병렬 분산 공식을 사용한다.
+    """
+
+    def __init__(self, expected_event_types: Iterable[str] = ()):
+        """
+        Args:
+            expected_event_types: 시나리오가 예상하는 이벤트 타입
+                (run마다 하나라도 발생했는지 집계, MultiScenarioValidator용)
+        """
+        self.expected_event_types = frozenset(expected_event_types)
+
+        self.n_runs = 0
+        self.outcomes = {"home_win": 0, "draw": 0, "away_win": 0}
+        self.score_histogram: Counter = Counter()  # {(home, away): N}
+
+        self.home_goals_sum = 0
+        self.away_goals_sum = 0
+        self.home_goals_sq_sum = 0
+        self.away_goals_sq_sum = 0
+
+        self.goal_timing = [0, 0, 0]  # 0-30 / 30-60 / 60-90분
+        self.event_type_counts: Counter = Counter()
+        self.expected_event_runs = 0  # 예상 이벤트 타입이 하나라도 발생한 run 수
+
+        self.adherence_mean = 0.0
+        self.adherence_m2 = 0.0
+        self.adherence_min = math.inf
+        self.adherence_max = -math.inf
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def add_result(self, result: Dict):
+        """
+        simulate_match 결과 1개 반영
+
+        Args:
+            result: {"final_score": {...}, "events": [...], "narrative_adherence": float}
+        """
+        home = result["final_score"]["home"]
+        away = result["final_score"]["away"]
+
+        self.n_runs += 1
+        if home > away:
+            self.outcomes["home_win"] += 1
+        elif home < away:
+            self.outcomes["away_win"] += 1
+        else:
+            self.outcomes["draw"] += 1
+        self.score_histogram[(home, away)] += 1
+        self.home_goals_sum += home
+        self.away_goals_sum += away
+        self.home_goals_sq_sum += home * home
+        self.away_goals_sq_sum += away * away
+
+        occurred_types = set()
+        for event in result["events"]:
+            event_type = event["type"]
+            occurred_types.add(event_type)
+            self.event_type_counts[event_type] += 1
+            if event_type == "goal":
+                self.goal_timing[min(event["minute"] // 30, 2)] += 1
+
+        if occurred_types & self.expected_event_types:
+            self.expected_event_runs += 1
+
+        # Welford
+        adherence = result["narrative_adherence"]
+        delta = adherence - self.adherence_mean
+        self.adherence_mean += delta / self.n_runs
+        self.adherence_m2 += delta * (adherence - self.adherence_mean)
+        self.adherence_min = min(self.adherence_min, adherence)
+        self.adherence_max = max(self.adherence_max, adherence)
+
+    def add_batch(self, batch: BatchSimulationResult):
+        """
+        simulate_batch 결과 chunk 반영 (반영 후 batch는 버려도 됨)
+        """
+        if batch.n_runs == 0:
+            return
+
+        chunk = SimulationAccumulator(self.expected_event_types)
+        chunk.n_runs = batch.n_runs
+        chunk.outcomes = batch.outcome_counts()
+
+        pairs, counts = np.unique(
+            np.stack([batch.home_goals, batch.away_goals], axis=1),
+            axis=0,
+            return_counts=True
+        )
+        chunk.score_histogram = Counter({
+            (int(home), int(away)): int(count) for (home, away), count in zip(pairs, counts)
+        })
+
+        chunk.home_goals_sum = int(batch.home_goals.sum())
+        chunk.away_goals_sum = int(batch.away_goals.sum())
+        chunk.home_goals_sq_sum = int(np.square(batch.home_goals, dtype=np.int64).sum())
+        chunk.away_goals_sq_sum = int(np.square(batch.away_goals, dtype=np.int64).sum())
+
+        chunk.goal_timing = [int(count) for count in batch.goal_timing.sum(axis=0)]
+        chunk.event_type_counts = Counter({
+            event_type: int(count)
+            for event_type, count in zip(BATCH_EVENT_TYPES, batch.event_counts.sum(axis=0))
+            if count
+        })
+
+        occurred = np.zeros(batch.n_runs, dtype=bool)
+        for event_type in self.expected_event_types:
+            occurred |= batch.event_type_counts(event_type) > 0
+        chunk.expected_event_runs = int(np.count_nonzero(occurred))
+
+        adherence = batch.narrative_adherence
+        chunk.adherence_mean = float(adherence.mean())
+        chunk.adherence_m2 = float(np.square(adherence - chunk.adherence_mean).sum())
+        chunk.adherence_min = float(adherence.min())
+        chunk.adherence_max = float(adherence.max())
+
+        self.merge(chunk)
+
+    def merge(self, other: 'SimulationAccumulator') -> 'SimulationAccumulator':
+        """
+        다른 부분 집계를 병합 (self를 갱신하고 반환)
+        """
+        if other.n_runs == 0:
+            return self
+
+        total = self.n_runs + other.n_runs
+        delta = other.adherence_mean - self.adherence_mean
+        self.adherence_m2 += other.adherence_m2 + delta * delta * self.n_runs * other.n_runs / total
+        self.adherence_mean += delta * other.n_runs / total
+        self.adherence_min = min(self.adherence_min, other.adherence_min)
+        self.adherence_max = max(self.adherence_max, other.adherence_max)
+
+        self.n_runs = total
+        for outcome, count in other.outcomes.items():
+            self.outcomes[outcome] += count
+        self.score_histogram.update(other.score_histogram)
+
+        self.home_goals_sum += other.home_goals_sum
+        self.away_goals_sum += other.away_goals_sum
+        self.home_goals_sq_sum += other.home_goals_sq_sum
+        self.away_goals_sq_sum += other.away_goals_sq_sum
+
+        self.goal_timing = [a + b for a, b in zip(self.goal_timing, other.goal_timing)]
+        self.event_type_counts.update(other.event_type_counts)
+        self.expected_event_runs += other.expected_event_runs
+
+        return self
+
+    @classmethod
+    def from_batch(
+        cls,
+        batch: BatchSimulationResult,
+        expected_event_types: Iterable[str] = ()
+    ) -> 'SimulationAccumulator':
+        """batch chunk 하나로 집계 생성"""
+        accumulator = cls(expected_event_types)
+        accumulator.add_batch(batch)
+        return accumulator
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def outcome_counts(self) -> Dict[str, int]:
+        """승/무/패 횟수"""
+        return dict(self.outcomes)
+
+    def score_counts(self) -> Dict[str, int]:
+        """스코어별 발생 횟수 {"1-0": N, ...}"""
+        return {f"{home}-{away}": count for (home, away), count in self.score_histogram.items()}
+
+    def avg_score(self) -> Dict[str, float]:
+        return {
+            "home": self.home_goals_sum / self.n_runs,
+            "away": self.away_goals_sum / self.n_runs
+        }
+
+    def score_variance(self) -> Dict[str, float]:
+        """모분산 (np.var와 동일)"""
+        avg = self.avg_score()
+        return {
+            "home": max(self.home_goals_sq_sum / self.n_runs - avg["home"] ** 2, 0.0),
+            "away": max(self.away_goals_sq_sum / self.n_runs - avg["away"] ** 2, 0.0)
+        }
+
+    def adherence_std(self) -> float:
+        """서사 일치율 모표준편차 (np.std와 동일)"""
+        if self.n_runs == 0:
+            return 0.0
+        return math.sqrt(max(self.adherence_m2, 0.0) / self.n_runs)
+
+    def total_goals(self) -> int:
+        return self.home_goals_sum + self.away_goals_sum
+
+    def __repr__(self) -> str:
+        return (f"SimulationAccumulator(n_runs={self.n_runs}, outcomes={self.outcomes}, "
+                f"adherence_mean={self.adherence_mean:.3f})")
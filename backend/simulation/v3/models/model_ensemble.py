@@ -16,11 +16,11 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
-from scipy.stats import poisson
 import math
 import logging
 
 from ai.enriched_data_models import EnrichedTeamInput
+from utils.poisson_grid import score_matrix, outcome_probabilities
 
 # Import models (absolute for __main__ execution)
 try:
@@ -84,12 +84,17 @@ class ModelEnsemble:
         'ai_tactical': 0.3
     }
 
-    def __init__(self):
-        """Initialize Model Ensemble"""
+    def __init__(self, ai_client=None):
+        """
+        Initialize Model Ensemble
+
+        Args:
+            ai_client: AI Tactical 모델용 AI client (None이면 get_ai_client())
+        """
         self.poisson_model = PoissonRatingModel()
         self.zone_calculator = ZoneDominanceCalculator()
         self.player_calculator = KeyPlayerInfluenceCalculator()
-        self.ai_tactical_model = AITacticalModel()
+        self.ai_tactical_model = AITacticalModel(ai_client)
 
     def calculate(self,
                   home_team: EnrichedTeamInput,
@@ -239,30 +244,12 @@ class ModelEnsemble:
         lambda_home = zone_result.xG_home
         lambda_away = zone_result.xG_away
 
-        # Poisson distribution으로 스코어 확률 계산
-        score_probs = {}
-        for h in range(7):  # 0-6 goals
-            for a in range(7):
-                prob = poisson.pmf(h, lambda_home) * poisson.pmf(a, lambda_away)
-                score_probs[(h, a)] = prob
-
-        # Win/Draw/Loss 확률
-        home_win = sum(score_probs[(h, a)] for h, a in score_probs if h > a)
-        draw = sum(score_probs[(h, a)] for h, a in score_probs if h == a)
-        away_win = sum(score_probs[(h, a)] for h, a in score_probs if h < a)
+        # Poisson distribution으로 스코어 확률 계산 (0-6 goals)
+        score_grid = score_matrix(lambda_home, lambda_away, max_goals=6)
 
-        # 정규화
-        total = home_win + draw + away_win
-        if total > 0:
-            home_win /= total
-            draw /= total
-            away_win /= total
-
-        return {
-            'home_win': home_win,
-            'draw': draw,
-            'away_win': away_win
-        }
+        # Win/Draw/Loss 확률 (정규화)
+        outcomes = outcome_probabilities(score_grid, normalize=True)
+        return {outcome: float(prob) for outcome, prob in outcomes.items()}
 
     def _player_to_probabilities(self,
                                   player_result: KeyPlayerInfluenceResult,
@@ -15,10 +15,12 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
-from scipy.stats import poisson
 import logging
 
+import numpy as np
+
 from ai.enriched_data_models import EnrichedTeamInput, FormationTactics
+from utils.poisson_grid import score_matrix, outcome_probabilities, score_dict, most_likely_scores
 
 logger = logging.getLogger(__name__)
 
@@ -115,13 +117,13 @@ class PoissonRatingModel:
         logger.info(f"[Poisson-Rating] Expected goals: Home {lambda_home:.2f}, Away {lambda_away:.2f}")
 
         # 4. Poisson Distribution으로 스코어 확률 계산
-        score_probs = self._calculate_score_probabilities(lambda_home, lambda_away)
+        score_grid = self._calculate_score_probabilities(lambda_home, lambda_away)
 
         # 5. Win/Draw/Loss 확률 도출
-        probabilities = self._calculate_outcome_probabilities(score_probs)
+        probabilities = self._calculate_outcome_probabilities(score_grid)
 
         # 6. Most likely scores
-        most_likely_scores = self._get_most_likely_scores(score_probs, top_n=5)
+        top_scores = self._get_most_likely_scores(score_grid, top_n=5)
 
         logger.info(f"[Poisson-Rating] Probabilities: Home {probabilities['home_win']:.1%}, "
                    f"Draw {probabilities['draw']:.1%}, Away {probabilities['away_win']:.1%}")
@@ -130,8 +132,8 @@ class PoissonRatingModel:
             lambda_home=lambda_home,
             lambda_away=lambda_away,
             probabilities=probabilities,
-            most_likely_scores=most_likely_scores,
-            score_probabilities=score_probs,
+            most_likely_scores=top_scores,
+            score_probabilities=score_dict(score_grid),
             formation_compatibility=formation_factor
         )
 
@@ -179,7 +181,7 @@ class PoissonRatingModel:
     def _calculate_score_probabilities(self,
                                         lambda_home: float,
                                         lambda_away: float,
-                                        max_goals: int = 6) -> Dict[Tuple[int, int], float]:
+                                        max_goals: int = 6) -> np.ndarray:
         """
         Poisson 분포로 스코어별 확률 계산
 
@@ -191,76 +193,37 @@ class PoissonRatingModel:
             max_goals: 계산할 최대 골 수 (0-max_goals)
 
         Returns:
-            {(home_goals, away_goals): probability}
+            (max_goals + 1, max_goals + 1) 배열 [home_goals, away_goals]
         """
-        score_probs = {}
-
-        for home_goals in range(max_goals + 1):
-            for away_goals in range(max_goals + 1):
-                prob = poisson.pmf(home_goals, lambda_home) * poisson.pmf(away_goals, lambda_away)
-                score_probs[(home_goals, away_goals)] = prob
-
-        return score_probs
+        return score_matrix(lambda_home, lambda_away, max_goals)
 
-    def _calculate_outcome_probabilities(self,
-                                          score_probs: Dict[Tuple[int, int], float]) -> Dict[str, float]:
+    def _calculate_outcome_probabilities(self, score_grid: np.ndarray) -> Dict[str, float]:
         """
-        Win/Draw/Loss 확률 계산
+        Win/Draw/Loss 확률 계산 (합이 1.0이 되도록 정규화)
 
         Args:
-            score_probs: {(home_goals, away_goals): probability}
+            score_grid: 스코어 확률 행렬 [home_goals, away_goals]
 
         Returns:
             {home_win, draw, away_win}
         """
-        home_win = 0.0
-        draw = 0.0
-        away_win = 0.0
-
-        for (h, a), prob in score_probs.items():
-            if h > a:
-                home_win += prob
-            elif h == a:
-                draw += prob
-            else:  # h < a
-                away_win += prob
-
-        # 정규화 (합이 1.0이 되도록)
-        total = home_win + draw + away_win
-        if total > 0:
-            home_win /= total
-            draw /= total
-            away_win /= total
-
-        return {
-            'home_win': home_win,
-            'draw': draw,
-            'away_win': away_win
-        }
+        outcomes = outcome_probabilities(score_grid, normalize=True)
+        return {outcome: float(prob) for outcome, prob in outcomes.items()}
 
     def _get_most_likely_scores(self,
-                                 score_probs: Dict[Tuple[int, int], float],
+                                 score_grid: np.ndarray,
                                  top_n: int = 5) -> List[Tuple[str, float]]:
         """
         가장 가능성 높은 스코어 추출
 
         Args:
-            score_probs: {(home_goals, away_goals): probability}
+            score_grid: 스코어 확률 행렬 [home_goals, away_goals]
             top_n: 상위 N개
 
         Returns:
             [("1-1", 0.18), ("1-2", 0.16), ...]
         """
-        # 확률 높은 순으로 정렬
-        sorted_scores = sorted(score_probs.items(), key=lambda x: x[1], reverse=True)
-
-        # 상위 N개 추출
-        top_scores = []
-        for (h, a), prob in sorted_scores[:top_n]:
-            score_str = f"{h}-{a}"
-            top_scores.append((score_str, prob))
-
-        return top_scores
+        return [(f"{h}-{a}", prob) for h, a, prob in most_likely_scores(score_grid, top_n)]
 
 
 def calculate_formation_compatibility(home_tactics: Optional[FormationTactics],
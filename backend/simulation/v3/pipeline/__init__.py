@@ -18,9 +18,12 @@ from .simulation_pipeline_v3 import (
     PipelineConfig,
     PipelineResult
 )
+from .result_cache import PipelineResultCache, get_pipeline_result_cache
 
 __all__ = [
     'SimulationPipelineV3',
     'PipelineConfig',
     'PipelineResult',
+    'PipelineResultCache',
+    'get_pipeline_result_cache',
 ]
@@ -0,0 +1,167 @@
+"""
+Pipeline Result Cache
+입력 fingerprint 기반 V3 파이프라인 결과 캐시
+
+두 팀의 EnrichedTeamInput(라인업, 선수 평점, 포메이션, 전술, 코멘터리)이
+바뀌지 않았으면 Phase 1 Ensemble 결과는 다시 계산하지 않고, 시나리오 셋과
+seed까지 같으면 Phase 3 Monte Carlo 검증 결과도 재사용한다.
+
+- 키: 입력을 정렬된 JSON으로 직렬화한 SHA-256 (content-addressed)
+- 저장소: TieredCache 'pipeline_v3' 네임스페이스 (프로세스 내 LRU/TTL → Redis,
+  같은 키의 동시 miss는 한 번만 계산)
+- 무효화: TeamDataSnapshot 내용 버전과 평점 DB의 mtime/size 스탬프를 키에 포함
+  (파일이 바뀌면 키가 달라져 이전 항목은 TTL/LRU로 자연 소멸)
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ai.enriched_data_models import EnrichedTeamInput
+from infrastructure.cache.tiered_cache import CacheStats, TieredCache
+from services.enriched_data_loader import DB_PATH
+from services.team_data_snapshot import TeamDataSnapshot, get_team_data_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+CACHE_NAMESPACE = "pipeline_v3"
+CACHE_TTL = 3600
+CACHE_MAX_ENTRIES = 256
+
+# TeamDataSnapshot이 다루지 않는 무효화 대상 (평점 DB)
+WATCHED_FILES = (DB_PATH,)
+
+
+def fingerprint(*parts: Any) -> str:
+    """
+    입력 → 안정적인 SHA-256 hex digest
+
+    dict 키 순서와 무관하도록 sort_keys로 직렬화한다.
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return repr(value)
+
+
+def data_version(snapshot: Optional[TeamDataSnapshot] = None, files: Iterable[str] = WATCHED_FILES) -> str:
+    """
+    팀 데이터 버전: TeamDataSnapshot.content_version + 평점 DB 스탬프 (경로, mtime, size)
+
+    팀 JSON 변경 판단은 로더가 쓰는 스냅샷과 같은 stat 확인을 사용하므로 두 캐시가
+    서로 다른 데이터를 최신으로 보지 않는다. stat만 하므로 요청마다 호출해도 저렴하다.
+    """
+    snapshot = snapshot or get_team_data_snapshot()
+    stamps = []
+    for path in sorted(files):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        stamps.append((os.path.basename(path), stat.st_mtime_ns, stat.st_size))
+
+    return fingerprint(snapshot.content_version(), stamps)
+
+
+class PipelineResultCache:
+    """
+    V3 파이프라인 Phase 1 / Phase 3 결과 캐시 (TieredCache 위의 키 규칙 + 복사)
+
+    TieredCache의 로컬 항목은 공유 객체이므로 get_or_compute는 복사본을 반환해
+    호출자가 결과를 수정해도 캐시 항목은 바뀌지 않는다.
+    """
+
+    def __init__(self,
+                 cache: Optional[TieredCache] = None,
+                 version_func: Callable[[], str] = data_version):
+        """
+        Args:
+            cache: 저장소 (None이면 프로세스 내 계층만 있는 TieredCache)
+            version_func: 팀 데이터 버전 스탬프 함수 (무효화용)
+        """
+        self.cache = cache or TieredCache(CACHE_NAMESPACE, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES)
+        self.version_func = version_func
+
+    @classmethod
+    def from_settings(cls, **kwargs) -> 'PipelineResultCache':
+        """설정의 Redis를 2차 계층으로 사용 (Redis가 없으면 프로세스 내 계층만)"""
+        cache = TieredCache.from_settings(CACHE_NAMESPACE, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES)
+        return cls(cache, **kwargs)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    # ------------------------------------------------------------------
+    # 키
+    # ------------------------------------------------------------------
+
+    def ensemble_key(self, home_team: EnrichedTeamInput, away_team: EnrichedTeamInput) -> str:
+        """Phase 1 키: 두 팀 입력 + 팀 데이터 버전"""
+        return self.cache.digest_key('ensemble', home_team.to_dict(), away_team.to_dict(), self.version_func())
+
+    def validation_key(self,
+                       ensemble_key: str,
+                       scenarios: List,
+                       seed: int,
+                       validator_settings: Dict[str, Any]) -> str:
+        """Phase 3 키: Phase 1 키 + 시나리오 셋 + seed + 검증 설정"""
+        return self.cache.digest_key('validation', ensemble_key, [scenario.to_dict() for scenario in scenarios],
+                                     seed, validator_settings)
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Returns:
+            (값의 복사본, 캐시 적중 여부 — 다른 요청의 계산을 기다려 받은 경우 포함)
+        """
+        computed = []
+
+        def run():
+            computed.append(True)
+            return compute()
+
+        value = self.cache.get_or_set(key, run)
+        return copy.deepcopy(value), not computed
+
+    def clear(self):
+        """네임스페이스의 캐시 항목 제거"""
+        self.cache.clear()
+
+
+# 전역 인스턴스 (파이프라인은 job마다 새로 만들지만 캐시는 프로세스 전체가 공유)
+_result_cache: Optional[PipelineResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def get_pipeline_result_cache() -> PipelineResultCache:
+    """프로세스 공유 PipelineResultCache (설정의 Redis 사용)"""
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                _result_cache = PipelineResultCache.from_settings()
+    return _result_cache
+
+
+def reset_pipeline_result_cache():
+    """전역 캐시 초기화 (테스트용)"""
+    global _result_cache
+    _result_cache = None
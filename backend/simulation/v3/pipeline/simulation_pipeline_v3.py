@@ -31,8 +31,8 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from dataclasses import asdict, dataclass, field
+from typing import List, Dict, Optional, Tuple
 import logging
 import time
 
@@ -42,6 +42,9 @@ from ai.enriched_data_models import EnrichedTeamInput
 from ..models.model_ensemble import ModelEnsemble, EnsembleResult
 from ..scenario.math_based_generator import MathBasedScenarioGenerator, GeneratedScenarioResult
 from ..validation.monte_carlo_validator import MonteCarloValidator, ValidationResult
+from simulation.v2.parallel_executor import MonteCarloExecutor, ExecutorConfig, AdaptiveSamplingConfig
+from .result_cache import PipelineResultCache, get_pipeline_result_cache
+from utils.cancellation import CancellationToken
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +54,11 @@ class PipelineConfig:
     """Pipeline 설정"""
     validation_runs: int = 3000           # Per scenario
     enable_streaming: bool = False        # SSE streaming
+    executor_mode: str = "serial"         # Monte Carlo 실행: serial / thread / process
+    max_workers: Optional[int] = None     # None = os.cpu_count()
+    adaptive_sampling: Optional[AdaptiveSamplingConfig] = None  # None = 고정 run 수
+    seed: Optional[int] = None            # Monte Carlo master seed (None = 실행마다 새로 생성)
+    result_cache: bool = True             # Phase 1/3 결과 캐시 (Phase 3은 seed 지정 시에만)
     log_level: str = "INFO"
 
 
@@ -71,6 +79,8 @@ class PipelineResult:
     execution_time: float                     # seconds
     home_team_name: str
     away_team_name: str
+    seed: Optional[int] = None                # Monte Carlo master seed (재현용)
+    cached_phases: List[str] = field(default_factory=list)  # 캐시에서 재사용한 단계 ("ensemble", "validation")
 
 
 class SimulationPipelineV3:
@@ -84,12 +94,15 @@ class SimulationPipelineV3:
     - Convergence = Truth
     """
 
-    def __init__(self, config: Optional[PipelineConfig] = None):
+    def __init__(self,
+                 config: Optional[PipelineConfig] = None,
+                 result_cache: Optional[PipelineResultCache] = None):
         """
         Initialize Pipeline V3
 
         Args:
             config: Pipeline 설정
+            result_cache: 결과 캐시 (None이고 config.result_cache면 프로세스 공유 캐시)
         """
         self.config = config or PipelineConfig()
 
@@ -99,7 +112,16 @@ class SimulationPipelineV3:
         # Initialize components
         self.ensemble = ModelEnsemble()
         self.scenario_generator = MathBasedScenarioGenerator()
-        self.validator = MonteCarloValidator()
+        self.validator = MonteCarloValidator(
+            executor=MonteCarloExecutor(ExecutorConfig(
+                mode=self.config.executor_mode,
+                max_workers=self.config.max_workers
+            )),
+            adaptive=self.config.adaptive_sampling
+        )
+        if result_cache is None and self.config.result_cache:
+            result_cache = get_pipeline_result_cache()
+        self.result_cache = result_cache
 
         logger.info("[Pipeline V3] Initialized")
         logger.info(f"[Pipeline V3] Validation runs per scenario: {self.config.validation_runs}")
@@ -118,6 +140,7 @@ class SimulationPipelineV3:
             PipelineResult with all results
         """
         start_time = time.time()
+        cached_phases = []
 
         logger.info("="*80)
         logger.info(f"SIMULATION PIPELINE V3: {home_team.name} vs {away_team.name}")
@@ -125,20 +148,24 @@ class SimulationPipelineV3:
 
         # Phase 1: Mathematical Models (Ensemble)
         logger.info("\n[Phase 1/4] Running Mathematical Models (Ensemble)...")
-        ensemble_result = self._run_phase1_ensemble(home_team, away_team)
+        ensemble_result, hit = self.ensemble_phase(home_team, away_team)
+        if hit:
+            cached_phases.append("ensemble")
 
         # Phase 2: AI Scenario Generation
         logger.info("\n[Phase 2/4] Generating AI Scenarios...")
-        generated_scenarios = self._run_phase2_scenarios(home_team, away_team, ensemble_result)
+        generated_scenarios = self.scenario_phase(home_team, away_team, ensemble_result)
 
         # Phase 3: Monte Carlo Validation
         logger.info("\n[Phase 3/4] Running Monte Carlo Validation...")
-        validation_result = self._run_phase3_validation(
+        validation_result, hit = self.validation_phase(
             generated_scenarios.scenarios,
             home_team,
             away_team,
             ensemble_result
         )
+        if hit:
+            cached_phases.append("validation")
 
         # Phase 4: Final Report
         logger.info("\n[Phase 4/4] Generating Final Report...")
@@ -163,8 +190,80 @@ class SimulationPipelineV3:
             final_probabilities=final_probs,
             execution_time=execution_time,
             home_team_name=home_team.name,
-            away_team_name=away_team.name
+            away_team_name=away_team.name,
+            seed=validation_result.seed,
+            cached_phases=cached_phases
+        )
+
+    # ------------------------------------------------------------------
+    # 단계별 실행 (결과 캐시 사용, 단계 사이에 진행 이벤트를 보내는 호출자용)
+    # ------------------------------------------------------------------
+
+    def ensemble_phase(self,
+                       home_team: EnrichedTeamInput,
+                       away_team: EnrichedTeamInput) -> Tuple[EnsembleResult, bool]:
+        """
+        Phase 1 (입력이 같으면 캐시 재사용)
+
+        Returns:
+            (EnsembleResult, 캐시 적중 여부)
+        """
+        if self.result_cache is None:
+            return self._run_phase1_ensemble(home_team, away_team), False
+
+        ensemble_result, hit = self.result_cache.get_or_compute(
+            self.result_cache.ensemble_key(home_team, away_team),
+            lambda: self._run_phase1_ensemble(home_team, away_team)
+        )
+        if hit:
+            logger.info("[Phase 1] ✓ Ensemble result reused from cache")
+        return ensemble_result, hit
+
+    def scenario_phase(self,
+                       home_team: EnrichedTeamInput,
+                       away_team: EnrichedTeamInput,
+                       ensemble_result: EnsembleResult) -> GeneratedScenarioResult:
+        """Phase 2 (AI 호출은 LLM 응답 캐시가 담당)"""
+        return self._run_phase2_scenarios(home_team, away_team, ensemble_result)
+
+    def validation_phase(self,
+                         scenarios: List,
+                         home_team: EnrichedTeamInput,
+                         away_team: EnrichedTeamInput,
+                         ensemble_result: EnsembleResult,
+                         cancel_token: Optional[CancellationToken] = None) -> Tuple[ValidationResult, bool]:
+        """
+        Phase 3 (config.seed가 있고 입력/시나리오/검증 설정이 같으면 캐시 재사용)
+
+        Returns:
+            (ValidationResult, 캐시 적중 여부)
+        """
+        def run_validation() -> ValidationResult:
+            return self._run_phase3_validation(scenarios, home_team, away_team, ensemble_result, cancel_token)
+
+        # seed 미지정이면 실행마다 다른 표본이어야 하므로 캐시하지 않음
+        if self.result_cache is None or self.config.seed is None:
+            return run_validation(), False
+
+        validation_key = self.result_cache.validation_key(
+            self.result_cache.ensemble_key(home_team, away_team),
+            scenarios,
+            self.config.seed,
+            self._validator_settings()
         )
+        validation_result, hit = self.result_cache.get_or_compute(validation_key, run_validation)
+        if hit:
+            logger.info("[Phase 3] ✓ Validation result reused from cache")
+        return validation_result, hit
+
+    def _validator_settings(self) -> Dict:
+        """Phase 3 결과에 영향을 주는 검증 설정 (캐시 키용, executor 모드/워커 수는 결과 무관)"""
+        adaptive = self.validator.adaptive
+        return {
+            'validation_runs': self.validator.VALIDATION_RUNS,
+            'use_batch_engine': self.validator.use_batch_engine,
+            'adaptive': asdict(adaptive) if adaptive else None
+        }
 
     def _run_phase1_ensemble(self,
                               home_team: EnrichedTeamInput,
@@ -214,10 +313,14 @@ class SimulationPipelineV3:
                                 scenarios: List,
                                 home_team: EnrichedTeamInput,
                                 away_team: EnrichedTeamInput,
-                                ensemble_result: EnsembleResult) -> ValidationResult:
+                                ensemble_result: EnsembleResult,
+                                cancel_token: Optional[CancellationToken] = None) -> ValidationResult:
         """
         Phase 3: Monte Carlo Validation
 
+        Args:
+            cancel_token: 검증 중 chunk마다 확인하는 취소 토큰
+
         Returns:
             ValidationResult
         """
@@ -229,14 +332,18 @@ class SimulationPipelineV3:
             scenarios,
             home_team,
             away_team,
-            ensemble_result
+            ensemble_result,
+            seed=self.config.seed,
+            cancel_token=cancel_token
         )
 
-        logger.info("[Phase 3] ✓ Validation complete")
+        logger.info(f"[Phase 3] ✓ Validation complete (seed={validation_result.seed})")
         logger.info(f"[Phase 3] Convergence probabilities:")
         logger.info(f"  Home: {validation_result.final_probabilities['home_win']:.1%}")
         logger.info(f"  Draw: {validation_result.final_probabilities['draw']:.1%}")
         logger.info(f"  Away: {validation_result.final_probabilities['away_win']:.1%}")
+        logger.info(f"[Phase 3] Runs used: {validation_result.total_runs} "
+                    f"({', '.join(f'{r.scenario_id}={r.total_runs}' for r in validation_result.scenario_results)})")
 
         return validation_result
 
@@ -19,12 +19,17 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 import logging
-from collections import Counter
+
+import numpy as np
 
 from ai.enriched_data_models import EnrichedTeamInput
+from utils.rng import RNGProvider, SeedLike
 from simulation.v2.scenario import Scenario
 from simulation.v2.event_simulation_engine import EventBasedSimulationEngine, MatchParameters
+from simulation.v2.streaming_aggregator import SimulationAccumulator
 from simulation.v2.scenario_guide import ScenarioGuide
+from simulation.v2.parallel_executor import MonteCarloExecutor, AdaptiveSamplingConfig
+from utils.cancellation import CancellationToken, checkpoint
 
 # Import ensemble and models
 try:
@@ -53,6 +58,8 @@ class ScenarioValidationResult:
     avg_score: Dict[str, float]          # {home, away}
     total_runs: int                      # 시뮬레이션 실행 횟수
     outcome_distribution: Dict[str, int]  # {home_win: N, draw: N, away_win: N}
+    ci_half_width: Optional[float] = None  # 순차 샘플링: 종료 시점 최대 CI 반폭
+    stopped_early: bool = False           # 순차 샘플링: max_runs 전에 목표 반폭 도달
 
 
 @dataclass
@@ -62,6 +69,7 @@ class ValidationResult:
     final_probabilities: Dict[str, float]  # 가중 평균된 최종 확률
     total_scenarios: int
     total_runs: int
+    seed: Optional[int] = None             # master seed (같은 seed로 재실행하면 동일 결과)
 
 
 class MonteCarloValidator:
@@ -77,16 +85,41 @@ class MonteCarloValidator:
     # Validation runs per scenario
     VALIDATION_RUNS = 3000
 
-    def __init__(self):
-        """Initialize Monte Carlo Validator"""
+    def __init__(self,
+                 use_batch_engine: bool = True,
+                 executor: Optional[MonteCarloExecutor] = None,
+                 adaptive: Optional[AdaptiveSamplingConfig] = None):
+        """
+        Initialize Monte Carlo Validator
+
+        Args:
+            use_batch_engine: True면 EventBasedSimulationEngine.simulate_batch
+                (벡터화) 사용, False면 simulate_match를 run마다 호출
+            executor: batch 실행기 (serial/thread/process, 기본: serial)
+            adaptive: 순차 샘플링 설정. 지정하면 VALIDATION_RUNS 고정 대신
+                CI 반폭 목표에 도달할 때까지 chunk 단위로 실행 (batch 모드 전용)
+        """
+        if adaptive is not None and not use_batch_engine:
+            raise ValueError("adaptive sampling requires use_batch_engine=True")
+
         self.engine = EventBasedSimulationEngine()
-        logger.info(f"[Validator] Initialized with {self.VALIDATION_RUNS} runs per scenario")
+        self.use_batch_engine = use_batch_engine
+        self.executor = executor or MonteCarloExecutor()
+        self.adaptive = adaptive
+        if adaptive is not None:
+            logger.info(f"[Validator] Initialized with adaptive sampling "
+                        f"(CI ±{adaptive.target_half_width:.1%}, {adaptive.min_runs}-{adaptive.max_runs} runs)")
+        else:
+            logger.info(f"[Validator] Initialized with {self.VALIDATION_RUNS} runs per scenario "
+                        f"({'batch' if use_batch_engine else 'per-match'} engine)")
 
     def validate(self,
                  scenarios: List[Scenario],
                  home_team: EnrichedTeamInput,
                  away_team: EnrichedTeamInput,
-                 ensemble_result: EnsembleResult) -> ValidationResult:
+                 ensemble_result: EnsembleResult,
+                 seed: SeedLike = None,
+                 cancel_token: Optional[CancellationToken] = None) -> ValidationResult:
         """
         시나리오 검증
 
@@ -95,15 +128,64 @@ class MonteCarloValidator:
             home_team: 홈팀 데이터
             away_team: 원정팀 데이터
             ensemble_result: Ensemble 결과 (zone, player 반영용)
+            seed: master seed (None이면 새로 생성해 ValidationResult.seed에 기록)
+            cancel_token: 취소 토큰 (batch 모드는 chunk마다, 아니면 100 run마다 확인)
 
         Returns:
             ValidationResult with convergence probabilities
         """
-        logger.info(f"[Validator] Validating {len(scenarios)} scenarios with {self.VALIDATION_RUNS} runs each")
+        if self.adaptive is not None:
+            logger.info(f"[Validator] Validating {len(scenarios)} scenarios with adaptive sampling "
+                        f"(up to {self.adaptive.max_runs} runs each)")
+        else:
+            logger.info(f"[Validator] Validating {len(scenarios)} scenarios with {self.VALIDATION_RUNS} runs each")
+
+        # 시나리오별 독립 스트림 (batch 모드에서는 다시 chunk별로 파생)
+        rng = RNGProvider(seed)
+        scenario_seeds = rng.spawn(len(scenarios))
+
+        if self.use_batch_engine:
+            scenario_results = self._validate_batch(scenarios, home_team, away_team, ensemble_result,
+                                                    scenario_seeds, cancel_token)
+        else:
+            scenario_results = self._validate_per_match(scenarios, home_team, away_team, ensemble_result,
+                                                        scenario_seeds, cancel_token)
+
+        for scenario_result in scenario_results:
+            logger.info(f"[Validator] {scenario_result.scenario_id}: Convergence - "
+                       f"Home {scenario_result.convergence_probability['home_win']:.1%}, "
+                       f"Draw {scenario_result.convergence_probability['draw']:.1%}, "
+                       f"Away {scenario_result.convergence_probability['away_win']:.1%} "
+                       f"({scenario_result.total_runs} runs)")
 
-        scenario_results = []
+        # 최종 확률 계산 (시나리오별 가중 평균)
+        final_probs = self._calculate_final_probabilities(scenario_results)
+
+        logger.info(f"[Validator] Final probabilities: "
+                   f"Home {final_probs['home_win']:.1%}, "
+                   f"Draw {final_probs['draw']:.1%}, "
+                   f"Away {final_probs['away_win']:.1%}")
 
-        for scenario in scenarios:
+        return ValidationResult(
+            scenario_results=scenario_results,
+            final_probabilities=final_probs,
+            total_scenarios=len(scenarios),
+            total_runs=sum(r.total_runs for r in scenario_results),
+            seed=rng.seed
+        )
+
+    def _validate_batch(self,
+                        scenarios: List[Scenario],
+                        home_team: EnrichedTeamInput,
+                        away_team: EnrichedTeamInput,
+                        ensemble_result: EnsembleResult,
+                        scenario_seeds: List[np.random.SeedSequence],
+                        cancel_token: Optional[CancellationToken] = None) -> List[ScenarioValidationResult]:
+        """
+        모든 시나리오를 executor에 한 번에 제출 (chunk 단위 병렬 실행)
+        """
+        tasks = []
+        for scenario, scenario_seed in zip(scenarios, scenario_seeds):
             logger.info(f"[Validator] Validating scenario: {scenario.id} - {scenario.name}")
 
             # MatchParameters 생성 (zone/player 모델 반영)
@@ -113,46 +195,71 @@ class MonteCarloValidator:
                 ensemble_result,
                 scenario
             )
+            tasks.append((match_params, ScenarioGuide(scenario), self.VALIDATION_RUNS, scenario_seed))
+
+        if self.adaptive is not None:
+            adaptive_results = self.executor.run_adaptive(
+                [(params, guide, task_seed) for params, guide, _, task_seed in tasks],
+                self.adaptive,
+                cancel_token
+            )
+            scenario_results = []
+            for scenario, adaptive_result in zip(scenarios, adaptive_results):
+                scenario_result = self._aggregate_accumulator(scenario, adaptive_result.accumulator)
+                scenario_result.ci_half_width = adaptive_result.ci_half_width
+                scenario_result.stopped_early = adaptive_result.accumulator.n_runs < self.adaptive.max_runs
+                scenario_results.append(scenario_result)
+            return scenario_results
+
+        accumulators = self.executor.run_many(tasks, cancel_token)
+
+        return [
+            self._aggregate_accumulator(scenario, accumulator)
+            for scenario, accumulator in zip(scenarios, accumulators)
+        ]
+
+    def _validate_per_match(self,
+                            scenarios: List[Scenario],
+                            home_team: EnrichedTeamInput,
+                            away_team: EnrichedTeamInput,
+                            ensemble_result: EnsembleResult,
+                            scenario_seeds: List[np.random.SeedSequence],
+                            cancel_token: Optional[CancellationToken] = None) -> List[ScenarioValidationResult]:
+        """
+        simulate_match를 run마다 호출하는 기존 경로 (run 결과는 즉시 집계 후 버림)
+        """
+        scenario_results = []
+
+        for scenario, scenario_seed in zip(scenarios, scenario_seeds):
+            logger.info(f"[Validator] Validating scenario: {scenario.id} - {scenario.name}")
 
-            # ScenarioGuide 생성
+            match_params = self._create_match_parameters(
+                home_team,
+                away_team,
+                ensemble_result,
+                scenario
+            )
             scenario_guide = ScenarioGuide(scenario)
+            engine = EventBasedSimulationEngine(RNGProvider(scenario_seed))
+            tables = engine.compile_tables(match_params, scenario_guide)
 
-            # 시뮬레이션 실행
-            simulation_results = []
+            accumulator = SimulationAccumulator()
             for run in range(self.VALIDATION_RUNS):
-                result = self.engine.simulate_match(
+                if run % 100 == 0:
+                    checkpoint(cancel_token)
+                accumulator.add_result(engine.simulate_match(
                     params=match_params,
-                    scenario_guide=scenario_guide
-                )
-                simulation_results.append(result)
+                    scenario_guide=scenario_guide,
+                    tables=tables
+                ))
 
                 # Progress logging (every 500 runs)
                 if (run + 1) % 500 == 0:
                     logger.debug(f"[Validator] {scenario.id}: {run + 1}/{self.VALIDATION_RUNS} runs completed")
 
-            # 결과 집계
-            scenario_result = self._aggregate_results(scenario, simulation_results)
-            scenario_results.append(scenario_result)
-
-            logger.info(f"[Validator] {scenario.id}: Convergence - "
-                       f"Home {scenario_result.convergence_probability['home_win']:.1%}, "
-                       f"Draw {scenario_result.convergence_probability['draw']:.1%}, "
-                       f"Away {scenario_result.convergence_probability['away_win']:.1%}")
-
-        # 최종 확률 계산 (시나리오별 가중 평균)
-        final_probs = self._calculate_final_probabilities(scenario_results)
+            scenario_results.append(self._aggregate_accumulator(scenario, accumulator))
 
-        logger.info(f"[Validator] Final probabilities: "
-                   f"Home {final_probs['home_win']:.1%}, "
-                   f"Draw {final_probs['draw']:.1%}, "
-                   f"Away {final_probs['away_win']:.1%}")
-
-        return ValidationResult(
-            scenario_results=scenario_results,
-            final_probabilities=final_probs,
-            total_scenarios=len(scenarios),
-            total_runs=len(scenarios) * self.VALIDATION_RUNS
-        )
+        return scenario_results
 
     def _create_match_parameters(self,
                                   home_team: EnrichedTeamInput,
@@ -249,48 +356,41 @@ class MonteCarloValidator:
         Returns:
             ScenarioValidationResult
         """
-        # Extract scores and calculate outcomes
-        outcomes = []
-        total_home_goals = 0
-        total_away_goals = 0
-
+        accumulator = SimulationAccumulator()
         for result in simulation_results:
-            home_score = result['final_score']['home']
-            away_score = result['final_score']['away']
+            accumulator.add_result(result)
+        return self._aggregate_accumulator(scenario, accumulator)
 
-            total_home_goals += home_score
-            total_away_goals += away_score
+    def _aggregate_accumulator(self,
+                               scenario: Scenario,
+                               accumulator: SimulationAccumulator) -> ScenarioValidationResult:
+        """
+        온라인 집계 결과 → ScenarioValidationResult
 
-            # Determine outcome
-            if home_score > away_score:
-                outcomes.append('home_win')
-            elif home_score == away_score:
-                outcomes.append('draw')
-            else:
-                outcomes.append('away_win')
+        Args:
+            scenario: 시나리오
+            accumulator: 시나리오의 SimulationAccumulator
 
-        outcome_counts = Counter(outcomes)
+        Returns:
+            ScenarioValidationResult
+        """
+        total = accumulator.n_runs
+        outcome_counts = {k: v for k, v in accumulator.outcome_counts().items() if v > 0}
 
-        total = len(simulation_results)
         convergence_prob = {
             'home_win': outcome_counts.get('home_win', 0) / total,
             'draw': outcome_counts.get('draw', 0) / total,
             'away_win': outcome_counts.get('away_win', 0) / total,
         }
 
-        avg_score = {
-            'home': total_home_goals / total,
-            'away': total_away_goals / total,
-        }
-
         return ScenarioValidationResult(
             scenario_id=scenario.id,
             scenario_name=scenario.name,
             initial_probability=scenario.expected_probability,
             convergence_probability=convergence_prob,
-            avg_score=avg_score,
+            avg_score=accumulator.avg_score(),
             total_runs=total,
-            outcome_distribution=dict(outcome_counts)
+            outcome_distribution=outcome_counts
         )
 
     def _calculate_final_probabilities(self,
@@ -0,0 +1,456 @@
+"""
+Simulation Benchmark Suite
+EPL Match Predictor v3.0
+
+핵심 시뮬레이션 경로의 처리량 / 지연 / 메모리를 측정하고 JSON baseline과 비교:
+1. EventBasedSimulationEngine.simulate_match
+2. MonteCarloValidator.validate
+3. ModelEnsemble.calculate
+4. PoissonRatingModel.calculate
+5. MatchPredictor.predict_all_matches
+
+입력은 data/의 고정 fixture(포메이션/라인업/팀 전력/전술)로 만들고,
+AI 호출은 StubAIClient로 대체한다. 선수 평점은 사용자 DB 대신
+player_id에서 결정되는 고정 값을 써서 환경과 무관하게 같은 입력을 보장한다.
+
+각 벤치마크는 spawn된 별도 프로세스에서 실행되어 peak RSS가
+벤치마크별로 분리된다.
+
+Usage:
+    python -m tests.performance.benchmark_suite                      # baseline과 비교
+    python -m tests.performance.benchmark_suite --update-baseline    # baseline 갱신
+    python -m tests.performance.benchmark_suite --only poisson_rating --margin 0.3
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import datetime
+import multiprocessing
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Add project root to path
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, BACKEND_DIR)
+
+from ai.base_client import BaseAIClient
+
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'benchmark_baseline.json')
+DEFAULT_MARGIN = 0.25           # baseline p50 대비 25% 이상 느려지면 실패
+BASELINE_VERSION = 1
+
+# 고정 fixture (home, away)
+FIXTURE_MATCHES = [
+    ("Arsenal", "Liverpool"),
+    ("Man City", "Chelsea"),
+]
+
+STUB_TACTICAL_RESPONSE = {
+    "probabilities": {"home_win": 0.45, "draw": 0.28, "away_win": 0.27},
+    "reasoning": "Benchmark stub response.",
+    "key_insights": ["Stub insight 1", "Stub insight 2", "Stub insight 3"],
+    "confidence": 0.6,
+    "context_factors": {"tactical": "stub", "form": "stub", "psychological": "stub"}
+}
+
+
+class StubAIClient(BaseAIClient):
+    """네트워크 호출 없이 고정 응답을 돌려주는 AI client"""
+
+    def generate(self, prompt, system_prompt=None, temperature=0.7, max_tokens=4096):
+        usage = {
+            'input_tokens': len(prompt) // 4,
+            'output_tokens': 200,
+            'total_tokens': len(prompt) // 4 + 200,
+            'cost_usd': 0.0,
+            'model': 'stub'
+        }
+        return True, json.dumps(STUB_TACTICAL_RESPONSE), usage, None
+
+    def simulate_match(self, home_team, away_team, data_context):
+        return False, None, None, "StubAIClient does not simulate matches"
+
+    def get_model_info(self):
+        return {
+            'provider': 'stub',
+            'model': 'stub',
+            'version': '1.0',
+            'capabilities': ['generate'],
+            'cost_per_1k_tokens': 0.0
+        }
+
+    def health_check(self):
+        return True, None
+
+
+# ==========================================================================
+# Fixtures
+# ==========================================================================
+
+def fixture_rating(player_id: int) -> float:
+    """player_id → 3.0-5.0 고정 평점 (0.25 단위)"""
+    return 3.0 + (player_id % 9) * 0.25
+
+
+def load_fixture_team(team_name: str):
+    """
+    data/의 JSON만으로 EnrichedTeamInput 생성 (DB 미사용)
+    """
+    from ai.enriched_data_models import EnrichedTeamInput, EnrichedPlayerInput
+    from services.enriched_data_loader import (
+        load_formation,
+        load_formation_tactics,
+        load_lineup,
+        load_team_strength
+    )
+
+    formation = load_formation(team_name)
+    team_strength_ratings, team_commentary = load_team_strength(team_name)
+
+    lineup = {}
+    for position, player_id in load_lineup(team_name).items():
+        rating = fixture_rating(player_id)
+        lineup[position] = EnrichedPlayerInput(
+            player_id=player_id,
+            name=f"{team_name} {position}",
+            position=position,
+            ratings={'overall': rating, 'speed': rating}
+        )
+
+    return EnrichedTeamInput(
+        name=team_name,
+        formation=formation,
+        lineup=lineup,
+        team_strength_ratings=team_strength_ratings,
+        team_strategy_commentary=team_commentary,
+        formation_tactics=load_formation_tactics(formation)
+    )
+
+
+def load_fixture_matches() -> List[Tuple]:
+    """FIXTURE_MATCHES → [(home EnrichedTeamInput, away EnrichedTeamInput), ...]"""
+    return [(load_fixture_team(home), load_fixture_team(away)) for home, away in FIXTURE_MATCHES]
+
+
+# ==========================================================================
+# Benchmarks
+# ==========================================================================
+# setup 함수는 준비 작업 후 "1회 반복" callable을 반환한다.
+# callable은 해당 반복에서 처리한 경기 수를 반환한다.
+
+def _setup_simulate_match() -> Callable[[], int]:
+    from simulation.v2.event_simulation_engine import EventBasedSimulationEngine, create_match_parameters
+    from simulation.v2.scenario import create_example_scenario
+    from simulation.v2.scenario_guide import ScenarioGuide
+    from utils.rng import RNGProvider
+
+    home, away = load_fixture_matches()[0]
+    params = create_match_parameters(
+        {
+            "attack_strength": home.derived_strengths.attack_strength,
+            "defense_strength": home.derived_strengths.defense_strength,
+            "midfield_strength": home.derived_strengths.midfield_control
+        },
+        {
+            "attack_strength": away.derived_strengths.attack_strength,
+            "defense_strength": away.derived_strengths.defense_strength,
+            "midfield_strength": away.derived_strengths.midfield_control
+        },
+        home.formation,
+        away.formation
+    )
+    guide = ScenarioGuide(create_example_scenario())
+    engine = EventBasedSimulationEngine(RNGProvider(0))
+    tables = engine.compile_tables(params, guide)
+
+    def run() -> int:
+        engine.simulate_match(params, guide, tables=tables)
+        return 1
+
+    return run
+
+
+def _setup_monte_carlo_validate() -> Callable[[], int]:
+    from simulation.v2.scenario import create_example_scenario
+    from simulation.v3.models.model_ensemble import ModelEnsemble
+    from simulation.v3.validation.monte_carlo_validator import MonteCarloValidator
+
+    home, away = load_fixture_matches()[0]
+    ensemble_result = ModelEnsemble(ai_client=StubAIClient()).calculate(home, away)
+    scenarios = [create_example_scenario()]
+    validator = MonteCarloValidator()
+
+    def run() -> int:
+        return validator.validate(scenarios, home, away, ensemble_result, seed=0).total_runs
+
+    return run
+
+
+def _setup_model_ensemble() -> Callable[[], int]:
+    from simulation.v3.models.model_ensemble import ModelEnsemble
+
+    matches = load_fixture_matches()
+    ensemble = ModelEnsemble(ai_client=StubAIClient())
+
+    def run() -> int:
+        for home, away in matches:
+            ensemble.calculate(home, away)
+        return len(matches)
+
+    return run
+
+
+def _setup_poisson_rating() -> Callable[[], int]:
+    from simulation.v3.models.poisson_rating_model import PoissonRatingModel
+
+    matches = load_fixture_matches()
+    model = PoissonRatingModel()
+
+    def run() -> int:
+        for home, away in matches:
+            model.calculate(home, away)
+        return len(matches)
+
+    return run
+
+
+def _setup_predict_all_matches() -> Callable[[], int]:
+    from odds_collection.odds_api_client import get_demo_odds
+    from value_betting.match_predictor import MatchPredictor
+
+    matches = get_demo_odds()
+    predictor = MatchPredictor()
+
+    def run() -> int:
+        return len(predictor.predict_all_matches(matches))
+
+    return run
+
+
+@dataclass
+class BenchmarkSpec:
+    """벤치마크 정의"""
+    name: str
+    setup: Callable[[], Callable[[], int]]
+    iterations: int
+    warmup: int = 1
+
+
+BENCHMARKS: Dict[str, BenchmarkSpec] = {
+    spec.name: spec for spec in [
+        BenchmarkSpec("simulate_match", _setup_simulate_match, iterations=500, warmup=20),
+        BenchmarkSpec("monte_carlo_validate", _setup_monte_carlo_validate, iterations=5),
+        BenchmarkSpec("model_ensemble", _setup_model_ensemble, iterations=50, warmup=2),
+        BenchmarkSpec("poisson_rating", _setup_poisson_rating, iterations=500, warmup=10),
+        BenchmarkSpec("predict_all_matches", _setup_predict_all_matches, iterations=200, warmup=5),
+    ]
+}
+
+
+@dataclass
+class BenchmarkResult:
+    """벤치마크 측정 결과"""
+    name: str
+    iterations: int
+    matches: int                      # 전체 반복에서 처리한 경기 수
+    total_seconds: float
+    matches_per_sec: float
+    p50_ms: float                     # 반복 1회 지연
+    p95_ms: float
+    peak_rss_mb: Optional[float]      # 벤치마크 프로세스의 최대 RSS (측정 불가 시 None)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS (MB)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: bytes
+    return max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+
+
+def run_benchmark(name: str) -> BenchmarkResult:
+    """
+    벤치마크 1개 실행 (현재 프로세스)
+    """
+    logging.disable(logging.CRITICAL)
+    spec = BENCHMARKS[name]
+
+    # setup의 print 출력(데이터 로더)은 측정과 무관하므로 버림
+    with open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            run = spec.setup()
+            for _ in range(spec.warmup):
+                run()
+        finally:
+            sys.stdout = stdout
+
+    latencies = []
+    matches = 0
+    for _ in range(spec.iterations):
+        start = time.perf_counter()
+        matches += run()
+        latencies.append(time.perf_counter() - start)
+
+    total_seconds = sum(latencies)
+    return BenchmarkResult(
+        name=name,
+        iterations=spec.iterations,
+        matches=matches,
+        total_seconds=total_seconds,
+        matches_per_sec=matches / total_seconds if total_seconds > 0 else 0.0,
+        p50_ms=float(np.percentile(latencies, 50)) * 1000,
+        p95_ms=float(np.percentile(latencies, 95)) * 1000,
+        peak_rss_mb=peak_rss_mb()
+    )
+
+
+def run_suite(names: Optional[List[str]] = None, isolate: bool = True) -> List[BenchmarkResult]:
+    """
+    여러 벤치마크 실행
+
+    Args:
+        names: 실행할 벤치마크 이름 (None이면 전체)
+        isolate: True면 벤치마크마다 spawn 프로세스에서 실행 (peak RSS 분리)
+    """
+    names = names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {unknown} (available: {list(BENCHMARKS)})")
+
+    if not isolate:
+        return [run_benchmark(name) for name in names]
+
+    results = []
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results.append(pool.submit(run_benchmark, name).result())
+    return results
+
+
+# ==========================================================================
+# Baseline
+# ==========================================================================
+
+def load_baseline(path: str = DEFAULT_BASELINE_PATH) -> Optional[Dict]:
+    """baseline JSON 로드 (없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(results: List[BenchmarkResult], path: str = DEFAULT_BASELINE_PATH) -> Dict:
+    """측정 결과를 baseline JSON으로 저장"""
+    baseline = {
+        'version': BASELINE_VERSION,
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.platform(),
+        'benchmarks': {result.name: asdict(result) for result in results}
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2)
+        f.write('\n')
+    return baseline
+
+
+def compare_to_baseline(results: List[BenchmarkResult],
+                        baseline: Dict,
+                        margin: float = DEFAULT_MARGIN) -> List[str]:
+    """
+    baseline 대비 성능 저하 검사
+
+    p50 지연이 baseline × (1 + margin)을 넘으면 회귀로 판단한다.
+    baseline에 없는 벤치마크는 비교하지 않는다.
+
+    Returns:
+        회귀 메시지 리스트 (비어 있으면 통과)
+    """
+    regressions = []
+    for result in results:
+        reference = baseline.get('benchmarks', {}).get(result.name)
+        if reference is None:
+            continue
+
+        limit_ms = reference['p50_ms'] * (1 + margin)
+        if result.p50_ms > limit_ms:
+            regressions.append(
+                f"{result.name}: p50 {result.p50_ms:.3f}ms > {limit_ms:.3f}ms "
+                f"(baseline {reference['p50_ms']:.3f}ms + {margin:.0%})"
+            )
+    return regressions
+
+
+def format_results(results: List[BenchmarkResult], baseline: Optional[Dict] = None) -> str:
+    """결과 표 (baseline이 있으면 p50 변화율 포함)"""
+    lines = [
+        f"{'benchmark':<22}{'matches/s':>12}{'p50 ms':>11}{'p95 ms':>11}{'RSS MB':>9}{'vs base':>10}"
+    ]
+    for result in results:
+        change = ""
+        reference = (baseline or {}).get('benchmarks', {}).get(result.name)
+        if reference:
+            change = f"{result.p50_ms / reference['p50_ms'] - 1:+.1%}"
+        rss = f"{result.peak_rss_mb:.0f}" if result.peak_rss_mb is not None else "-"
+        lines.append(
+            f"{result.name:<22}{result.matches_per_sec:>12.1f}{result.p50_ms:>11.3f}"
+            f"{result.p95_ms:>11.3f}{rss:>9}{change:>10}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Simulation benchmark suite")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH, help="baseline JSON 경로")
+    parser.add_argument('--update-baseline', action='store_true', help="측정 결과로 baseline 갱신")
+    parser.add_argument('--margin', type=float, default=DEFAULT_MARGIN, help="허용 p50 저하 비율 (기본 0.25)")
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help="실행할 벤치마크")
+    parser.add_argument('--no-isolate', action='store_true', help="현재 프로세스에서 실행 (RSS가 누적됨)")
+    parser.add_argument('--output', help="측정 결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.only, isolate=not args.no_isolate)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump([asdict(result) for result in results], f, indent=2)
+
+    if args.update_baseline:
+        save_baseline(results, args.baseline)
+        print(format_results(results))
+        print(f"\nBaseline saved: {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    print(format_results(results, baseline))
+
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline} (run with --update-baseline)")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, args.margin)
+    if regressions:
+        print("\nPerformance regressions:")
+        for message in regressions:
+            print(f"  - {message}")
+        return 1
+
+    print(f"\nAll benchmarks within {args.margin:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Performance Regression Tests
+EPL Match Predictor v3.0
+
+Tests Cover:
+1. Baseline comparison logic
+2. Stubbed AI client through ModelEnsemble
+3. Full benchmark suite against the stored baseline (slow, skipped without baseline)
+"""
+
+import pytest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from tests.performance.benchmark_suite import (
+    BenchmarkResult,
+    StubAIClient,
+    STUB_TACTICAL_RESPONSE,
+    compare_to_baseline,
+    load_baseline,
+    load_fixture_matches,
+    run_suite
+)
+
+
+def make_result(name: str, p50_ms: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name,
+        iterations=10,
+        matches=10,
+        total_seconds=p50_ms / 100,
+        matches_per_sec=1000 / p50_ms,
+        p50_ms=p50_ms,
+        p95_ms=p50_ms * 1.2,
+        peak_rss_mb=50.0
+    )
+
+
+class TestBaselineComparison:
+    """Test regression detection against a baseline"""
+
+    def test_within_margin_passes(self):
+        """Test a run slower than baseline but inside the margin passes"""
+        baseline = {'benchmarks': {'poisson_rating': {'p50_ms': 1.0}}}
+
+        assert compare_to_baseline([make_result('poisson_rating', 1.2)], baseline, margin=0.25) == []
+
+    def test_slowdown_beyond_margin_fails(self):
+        """Test a run slower than baseline by more than the margin is reported"""
+        baseline = {'benchmarks': {'poisson_rating': {'p50_ms': 1.0}}}
+
+        regressions = compare_to_baseline([make_result('poisson_rating', 1.3)], baseline, margin=0.25)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith('poisson_rating')
+
+    def test_new_benchmark_is_not_compared(self):
+        """Test benchmarks missing from the baseline are skipped"""
+        assert compare_to_baseline([make_result('simulate_match', 5.0)], {'benchmarks': {}}) == []
+
+
+class TestStubbedEnsemble:
+    """Test the benchmark fixtures run without network access"""
+
+    def test_ensemble_uses_stub_client(self):
+        """Test ModelEnsemble accepts the stub client and uses its probabilities"""
+        from simulation.v3.models.model_ensemble import ModelEnsemble
+
+        home, away = load_fixture_matches()[0]
+        result = ModelEnsemble(ai_client=StubAIClient()).calculate(home, away)
+
+        assert result.ai_result.probabilities == STUB_TACTICAL_RESPONSE['probabilities']
+        assert abs(sum(result.ensemble_probabilities.values()) - 1.0) < 1e-6
+
+
+@pytest.mark.slow
+class TestBenchmarkRegression:
+    """Run the full suite and compare with the stored baseline"""
+
+    def test_no_regression(self):
+        """Test no benchmark is slower than the baseline by more than the margin"""
+        baseline = load_baseline()
+        if baseline is None:
+            pytest.skip("No benchmark baseline (python -m tests.performance.benchmark_suite --update-baseline)")
+
+        results = run_suite()
+
+        assert compare_to_baseline(results, baseline) == []
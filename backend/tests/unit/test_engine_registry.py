@@ -0,0 +1,105 @@
+"""
+Engine Registry 테스트
+"""
+
+import pytest
+from sqlalchemy import text
+
+from database import engine_registry
+from database.engine_registry import get_engine, get_sessionmaker, session_scope, sqlite_url
+from database.player_schema import Player, Team, get_player_session, init_player_db, player_session_scope
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    engine_registry.dispose_engines()
+    yield
+    engine_registry.dispose_engines()
+
+
+def test_engine_is_shared_per_url(tmp_path):
+    url = sqlite_url(str(tmp_path / 'a.db'))
+
+    assert get_engine(url) is get_engine(url)
+    assert get_sessionmaker(url) is get_sessionmaker(url)
+    assert get_engine(sqlite_url(str(tmp_path / 'b.db'))) is not get_engine(url)
+
+
+def test_sqlite_file_uses_wal(tmp_path):
+    url = sqlite_url(str(tmp_path / 'wal.db'))
+
+    with get_engine(url).connect() as connection:
+        assert connection.execute(text('PRAGMA journal_mode')).scalar().lower() == 'wal'
+        assert connection.execute(text('PRAGMA busy_timeout')).scalar() == 5000
+
+
+def test_missing_sqlite_file_is_logged(tmp_path, caplog):
+    existing = tmp_path / 'existing.db'
+    existing.touch()
+
+    with caplog.at_level('WARNING', logger='database.engine_registry'):
+        get_engine(sqlite_url(str(existing)))
+        assert 'not found' not in caplog.text
+        get_engine(sqlite_url(str(tmp_path / 'typo.db')))
+    assert 'SQLite database not found' in caplog.text and 'typo.db' in caplog.text
+
+
+def test_session_scope_commits_and_rolls_back(tmp_path):
+    db_path = str(tmp_path / 'players.db')
+    init_player_db(db_path)
+
+    with player_session_scope(db_path) as session:
+        session.add(Team(id=1, name='Arsenal'))
+
+    with pytest.raises(RuntimeError):
+        with player_session_scope(db_path) as session:
+            session.add(Team(id=2, name='Chelsea'))
+            session.flush()
+            raise RuntimeError('boom')
+
+    with session_scope(sqlite_url(db_path)) as session:
+        assert [team.name for team in session.query(Team).all()] == ['Arsenal']
+
+
+def test_player_sessions_share_one_engine(tmp_path):
+    db_path = str(tmp_path / 'players.db')
+    init_player_db(db_path)
+
+    sessions = [get_player_session(db_path) for _ in range(22)]
+    try:
+        assert len({id(session.get_bind()) for session in sessions}) == 1
+    finally:
+        for session in sessions:
+            session.close()
+
+
+def test_loaded_objects_readable_after_scope(tmp_path):
+    db_path = str(tmp_path / 'players.db')
+    init_player_db(db_path)
+
+    with player_session_scope(db_path) as session:
+        session.add(Team(id=1, name='Arsenal'))
+        session.add(Player(id=7, team_id=1, name='Saka', position='FW'))
+
+    with player_session_scope(db_path) as session:
+        player = session.query(Player).filter_by(id=7).first()
+
+    assert player.name == 'Saka'
+
+
+def test_session_options_are_preserved_per_factory(tmp_path):
+    db_path = str(tmp_path / 'players.db')
+    init_player_db(db_path)
+    url = sqlite_url(db_path)
+
+    manual = get_sessionmaker(url, autoflush=False, expire_on_commit=True)
+    assert manual is get_sessionmaker(url, autoflush=False, expire_on_commit=True)
+    assert manual is not get_sessionmaker(url)
+    assert manual.kw['bind'] is get_sessionmaker(url).kw['bind']       # engine은 공유
+
+    with session_scope(url, autoflush=False) as session:
+        session.add(Team(id=1, name='Arsenal'))
+        assert session.query(Team).count() == 0                          # flush 전이라 보이지 않음
+    with session_scope(url) as session:
+        session.add(Team(id=2, name='Chelsea'))
+        assert session.query(Team).count() == 2                           # autoflush 기본값
@@ -0,0 +1,100 @@
+"""
+EnrichedDomainDataLoader 일괄 로드 테스트
+"""
+
+import json
+
+import pytest
+from sqlalchemy import event
+
+from database import engine_registry
+from database.engine_registry import get_engine
+from database.player_schema import Player, PlayerRating, Team, init_player_db, player_session_scope
+from services import enriched_data_loader
+from services.enriched_data_loader import EnrichedDomainDataLoader, PlayerNotFoundError
+
+POSITIONS = ['GK', 'LB', 'CB1', 'CB2', 'RB', 'DM', 'CM1', 'CM2', 'LW', 'ST', 'RW']
+TEAMS = {'Arsenal': 100, 'Chelsea': 200}
+
+
+def write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+
+@pytest.fixture
+def team_data(tmp_path, monkeypatch):
+    """두 팀의 JSON + 선수 평가 DB"""
+    engine_registry.dispose_engines()
+    db_path = str(tmp_path / 'epl.db')
+    init_player_db(db_path)
+
+    with player_session_scope(db_path) as session:
+        for team_index, (team_name, base_id) in enumerate(TEAMS.items(), start=1):
+            session.add(Team(id=team_index, name=team_name))
+            for offset, position in enumerate(POSITIONS):
+                player_id = base_id + offset
+                session.add(Player(id=player_id, team_id=team_index, name=f'{team_name} {position}',
+                                   position='GK' if position == 'GK' else 'MF'))
+                session.add(PlayerRating(player_id=player_id, attribute_name='passing', rating=3.0 + offset * 0.1))
+                session.add(PlayerRating(player_id=player_id, attribute_name='_comment', rating=0, notes=f'note {player_id}'))
+                session.add(PlayerRating(player_id=player_id, attribute_name='_subPosition', rating=0, notes=position))
+
+    for team_name, base_id in TEAMS.items():
+        write_json(tmp_path / 'formations' / f'{team_name}.json', {'formation': '4-3-3'})
+        write_json(tmp_path / 'lineups' / f'{team_name}.json',
+                   {'lineup': {position: base_id + offset for offset, position in enumerate(POSITIONS)}})
+        write_json(tmp_path / 'team_strength' / f'{team_name}.json', {
+            'ratings': {'tactical_understanding': 3.5, 'positioning_balance': 3.0, 'buildup_quality': 4.0},
+            'comment': f'{team_name} plan'
+        })
+
+    monkeypatch.setattr(enriched_data_loader, 'DATA_DIR', str(tmp_path))
+    monkeypatch.setattr(enriched_data_loader, 'FORMATIONS_DIR', str(tmp_path / 'formations'))
+    monkeypatch.setattr(enriched_data_loader, 'LINEUPS_DIR', str(tmp_path / 'lineups'))
+    monkeypatch.setattr(enriched_data_loader, 'TEAM_STRENGTH_DIR', str(tmp_path / 'team_strength'))
+
+    yield db_path
+    engine_registry.dispose_engines()
+
+
+def count_selects(db_path):
+    statements = []
+    event.listen(get_engine(f'sqlite:///{db_path}'), 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    return statements
+
+
+def test_bulk_ratings_match_single_player_lookup(team_data):
+    repo = enriched_data_loader.PlayerRatingsRepository(team_data)
+
+    bulk = repo.get_players_ratings([100, 101, 205, 999])
+
+    assert set(bulk) == {100, 101, 205}
+    for player_id, (player, ratings, sub_position, commentary) in bulk.items():
+        single = repo.get_player_ratings(player_id)
+        assert player.name == single[0].name
+        assert (ratings, sub_position, commentary) == single[1:]
+
+
+def test_load_match_data_uses_two_queries(team_data):
+    loader = EnrichedDomainDataLoader(team_data)
+    statements = count_selects(team_data)
+
+    home, away = loader.load_match_data('Arsenal', 'Chelsea')
+
+    assert len([s for s in statements if s.lstrip().upper().startswith('SELECT')]) == 2
+    assert home.name == 'Arsenal' and away.name == 'Chelsea'
+    assert home.lineup['ST'].name == 'Arsenal ST'
+    assert away.lineup['GK'].user_commentary == 'note 200'
+    assert away.lineup['CM1'].sub_position == 'CM1'
+    assert home.team_strategy_commentary == 'Arsenal plan'
+
+
+def test_load_team_data_raises_for_missing_player(team_data, tmp_path):
+    lineup = {position: 100 + offset for offset, position in enumerate(POSITIONS)}
+    lineup['ST'] = 999
+    write_json(tmp_path / 'lineups' / 'Arsenal.json', {'lineup': lineup})
+
+    with pytest.raises(PlayerNotFoundError, match='999'):
+        EnrichedDomainDataLoader(team_data).load_team_data('Arsenal')
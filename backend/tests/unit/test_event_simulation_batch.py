@@ -0,0 +1,144 @@
+"""
+Unit Tests for Batch Event Simulation
+EPL Match Predictor v3.0
+
+Tests Cover:
+1. Batch result shapes and consistency
+2. Seed reproducibility
+3. Statistical agreement with per-match simulate_match
+4. Validator aggregation from batch results
+"""
+
+import pytest
+import sys
+import os
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from utils.rng import RNGProvider
+from simulation.v2.scenario import Scenario, ScenarioEvent, EventType
+from simulation.v2.scenario_guide import ScenarioGuide
+from simulation.v2.event_simulation_engine import (
+    EventBasedSimulationEngine,
+    BATCH_EVENT_TYPES,
+    create_match_parameters
+)
+from simulation.v2.multi_scenario_validator import MultiScenarioValidator
+
+
+@pytest.fixture
+def scenario():
+    return Scenario(
+        id="TEST_001",
+        name="Home wing dominance",
+        reasoning="test",
+        events=[
+            ScenarioEvent(minute_range=(10, 25), type=EventType.WING_BREAKTHROUGH, team="home", probability_boost=2.5),
+            ScenarioEvent(minute_range=(20, 40), type=EventType.GOAL, team="home", probability_boost=2.0),
+            ScenarioEvent(minute_range=(60, 90), type=EventType.CORNER, team="away", probability_boost=1.5),
+        ],
+        expected_probability=0.3
+    )
+
+
+@pytest.fixture
+def params():
+    return create_match_parameters(
+        {"attack_strength": 85, "defense_strength": 80, "midfield_strength": 82, "press_intensity": 85},
+        {"attack_strength": 70, "defense_strength": 72, "midfield_strength": 70},
+        "4-3-3",
+        "5-3-2"
+    )
+
+
+class TestBatchResult:
+    """Test batch result structure"""
+
+    def test_shapes(self, params, scenario):
+        """Test per-run arrays have n_runs rows"""
+        # Given
+        engine = EventBasedSimulationEngine()
+
+        # When
+        batch = engine.simulate_batch(params, ScenarioGuide(scenario), n_runs=200, seed=7)
+
+        # Then
+        assert batch.n_runs == 200
+        assert batch.home_goals.shape == (200,)
+        assert batch.away_goals.shape == (200,)
+        assert batch.narrative_adherence.shape == (200,)
+        assert batch.event_counts.shape == (200, len(BATCH_EVENT_TYPES))
+        assert batch.goal_timing.shape == (200, 3)
+
+    def test_goal_counts_consistent(self, params, scenario):
+        """Test goal events, timing buckets and scores agree"""
+        # Given
+        engine = EventBasedSimulationEngine()
+
+        # When
+        batch = engine.simulate_batch(params, ScenarioGuide(scenario), n_runs=500, seed=7)
+
+        # Then
+        total_goals = batch.home_goals + batch.away_goals
+        assert np.array_equal(batch.event_type_counts("goal"), total_goals)
+        assert np.array_equal(batch.goal_timing.sum(axis=1), total_goals)
+        assert sum(batch.outcome_counts().values()) == 500
+        assert sum(batch.score_counts().values()) == 500
+
+    def test_seed_reproducible(self, params, scenario):
+        """Test same seed gives identical results"""
+        # Given
+        engine = EventBasedSimulationEngine()
+        guide = ScenarioGuide(scenario)
+
+        # When
+        first = engine.simulate_batch(params, guide, n_runs=300, seed=42)
+        second = engine.simulate_batch(params, guide, n_runs=300, seed=42)
+
+        # Then
+        assert np.array_equal(first.home_goals, second.home_goals)
+        assert np.array_equal(first.narrative_adherence, second.narrative_adherence)
+
+
+class TestBatchMatchesScalar:
+    """Test batch engine reproduces simulate_match statistics"""
+
+    def test_statistics_agree(self, params, scenario):
+        """Test mean goals and adherence agree within Monte Carlo noise"""
+        # Given
+        engine = EventBasedSimulationEngine(RNGProvider(0))
+        guide = ScenarioGuide(scenario)
+
+        # When
+        results = [engine.simulate_match(params, guide) for _ in range(1500)]
+        batch = engine.simulate_batch(params, guide, n_runs=6000, seed=0)
+
+        # Then
+        home_goals = np.mean([r["final_score"]["home"] for r in results])
+        away_goals = np.mean([r["final_score"]["away"] for r in results])
+        adherence = np.mean([r["narrative_adherence"] for r in results])
+        assert abs(batch.home_goals.mean() - home_goals) < 0.15
+        assert abs(batch.away_goals.mean() - away_goals) < 0.1
+        assert abs(batch.narrative_adherence.mean() - adherence) < 0.03
+
+
+class TestValidatorBatchAggregation:
+    """Test MultiScenarioValidator aggregation from batch results"""
+
+    def test_aggregate_shape(self, params, scenario):
+        """Test batch aggregation produces the _aggregate_outcomes keys"""
+        # Given
+        validator = MultiScenarioValidator()
+
+        # When
+        stats = validator.validate_scenarios([scenario], params, n=300)[0]
+
+        # Then
+        assert stats["total_runs"] == 300
+        assert sum(stats["win_rate"].values()) == pytest.approx(1.0)
+        assert sum(stats["score_distribution"].values()) == pytest.approx(1.0)
+        assert set(stats["event_distribution"]["goal_timing"]) == {"0-30min", "30-60min", "60-90min", "total_goals"}
+        assert 0.0 <= stats["narrative_adherence"]["mean"] <= 1.0
@@ -0,0 +1,113 @@
+"""
+Feed Snapshots 테스트
+"""
+
+import fcntl
+
+import pytest
+
+from services import feed_snapshots
+from services.feed_snapshots import (
+    FeedSnapshotRefresher,
+    FileSnapshotStore,
+    build_fixture_rounds,
+    build_standings,
+    start_scheduled_refresh,
+)
+
+BOOTSTRAP = {
+    'teams': [
+        {'id': 1, 'name': 'Arsenal', 'short_name': 'ARS'},
+        {'id': 2, 'name': 'Chelsea', 'short_name': 'CHE'},
+        {'id': 3, 'name': 'Liverpool', 'short_name': 'LIV'},
+    ],
+    'events': [{'id': 7, 'is_current': True}, {'id': 8, 'is_next': True}],
+}
+
+FIXTURES = [
+    {'event': 7, 'finished': True, 'team_h': 1, 'team_a': 2, 'team_h_score': 2, 'team_a_score': 0},
+    {'event': 7, 'finished': True, 'team_h': 3, 'team_a': 1, 'team_h_score': 1, 'team_a_score': 1},
+    {'event': 8, 'finished': False, 'team_h': 2, 'team_a': 3, 'team_h_score': None, 'team_a_score': None},
+]
+
+
+def test_build_standings_orders_by_points_then_goal_difference():
+    standings = build_standings(BOOTSTRAP, FIXTURES)
+
+    assert [row['short_name'] for row in standings] == ['ARS', 'LIV', 'CHE']
+    arsenal = standings[0]
+    assert (arsenal['played'], arsenal['won'], arsenal['drawn'], arsenal['points']) == (2, 1, 1, 4)
+    assert arsenal['goal_difference'] == 2 and arsenal['position'] == 1
+    assert standings[2]['lost'] == 1
+
+
+def test_build_fixture_rounds_maps_upcoming_matches():
+    rounds = build_fixture_rounds(BOOTSTRAP, FIXTURES)
+
+    assert rounds == {'round_mapping': {'Chelsea_Liverpool': 8}, 'current_round': 8}
+
+
+def test_refresh_bumps_version_only_when_content_changes(tmp_path):
+    table = {'rows': [1, 2]}
+    refresher = FeedSnapshotRefresher(FileSnapshotStore(str(tmp_path)), builders={'table': lambda: table})
+
+    assert refresher.refresh('table').version == 1
+    assert refresher.refresh('table').version == 1
+
+    table = {'rows': [2, 1]}
+    snapshot = refresher.refresh('table')
+    assert snapshot.version == 2 and snapshot.data == {'rows': [2, 1]}
+
+    # 다른 프로세스(새 저장소 인스턴스)도 같은 스냅샷을 읽음
+    assert FileSnapshotStore(str(tmp_path)).get('table').version == 2
+
+
+def test_failed_build_keeps_previous_snapshot(tmp_path):
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) > 1:
+            raise RuntimeError('feed down')
+        return ['ok']
+
+    refresher = FeedSnapshotRefresher(FileSnapshotStore(str(tmp_path)), builders={'feed': flaky})
+
+    assert refresher.get('feed').data == ['ok']   # 첫 조회 시 생성
+    assert refresher.refresh_all() == {'feed': None}
+    assert refresher.get('feed').data == ['ok']
+    assert len(calls) == 2
+
+    # 방금 갱신된 스냅샷은 min_age 안에서 빌더를 다시 호출하지 않음
+    assert refresher.refresh_all(min_age=60) == {'feed': 1}
+    assert len(calls) == 2
+
+    with pytest.raises(KeyError):
+        refresher.get('unknown')
+
+
+def test_default_store_is_resolved_lazily(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(feed_snapshots, 'default_store',
+                        lambda: calls.append(1) or FileSnapshotStore(str(tmp_path)))
+
+    refresher = FeedSnapshotRefresher(builders={'table': lambda: [1]})
+    assert calls == []                                  # 생성만으로는 Redis에 접속하지 않음
+    assert refresher.get('table').data == [1]
+    assert calls == [1]
+
+
+def test_scheduled_refresh_runs_in_one_process_per_host(monkeypatch, tmp_path):
+    monkeypatch.setattr(feed_snapshots, '_refresh_lock_file', None)
+    lock_path = str(tmp_path / 'refresh.lock')
+    started = []
+
+    with open(lock_path, 'w') as other_process:         # 다른 워커가 잠금 보유
+        fcntl.flock(other_process, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        assert start_scheduled_refresh(lambda: started.append(1), lock_path) is False
+    assert started == []
+
+    assert start_scheduled_refresh(lambda: started.append(1), lock_path) is True
+    assert start_scheduled_refresh(lambda: started.append(1), lock_path) is True
+    assert started == [1]
+    feed_snapshots._refresh_lock_file.close()
@@ -0,0 +1,72 @@
+"""
+FPLSnapshot 테스트
+"""
+
+from services.fpl_snapshot import FPLSnapshot, FPLSnapshotCache, normalize_player_name
+
+
+def fpl_player(player_id, first, second, team, ict, web_name=None, **extra):
+    return {'id': player_id, 'first_name': first, 'second_name': second,
+            'web_name': web_name or second, 'team': team, 'ict_index': str(ict), **extra}
+
+
+def make_bootstrap(arsenal_count=18):
+    elements = [fpl_player(100 + i, 'Player', f'Gunner{i}', 1, ict=float(i)) for i in range(arsenal_count)]
+    elements += [
+        fpl_player(7, 'Bukayo', 'Saka', 1, ict=99.0, starts=6, minutes=540),
+        fpl_player(900, 'Cole', 'Palmer', 2, ict=50.0),
+    ]
+    return {
+        'elements': elements,
+        'teams': [{'id': 1, 'name': 'Arsenal'}, {'id': 2, 'name': 'Chelsea'}],
+        'events': [{'finished': True}] * 6 + [{'finished': False}],
+    }
+
+
+def make_squads(arsenal_count=18):
+    arsenal = [{'id': 100 + i, 'name': f'Player Gunner{i}'} for i in range(arsenal_count)]
+    arsenal.append({'id': 5007, 'name': 'Bukayo Saka'})    # ID가 달라도 이름으로 매칭
+    return {'Arsenal': arsenal, 'Chelsea': [{'id': 5900, 'name': 'Cole Palmer'}]}
+
+
+def test_team_and_name_indexes():
+    snapshot = FPLSnapshot(make_bootstrap(), make_squads())
+
+    assert snapshot.team_id('Arsenal') == 1 and snapshot.team_id('Everton') is None
+    assert snapshot.matches_played == 6
+    assert snapshot.find_player('bukayo saka!', team_id=1)['id'] == 7
+    assert snapshot.find_player('Saka')['id'] == 7
+    assert snapshot.find_player('Saka', team_id=2) is None
+    assert normalize_player_name('  Ødegaard  Martin ') == 'degaard martin'
+
+
+def test_squad_mapping_and_roles_are_cached():
+    squads = make_squads()
+    snapshot = FPLSnapshot(make_bootstrap(), squads)
+    saka = snapshot.elements_by_id[7]
+
+    assert snapshot.squad_player(saka, 'Arsenal')['id'] == 5007
+    assert snapshot.squad_player(saka, 'Liverpool') is None
+
+    roles = snapshot.player_roles('Arsenal')
+    assert roles[5007] == {'role': 'starter', 'ict_index': 99.0, 'rank': 1}
+    assert roles[117]['rank'] == 2 and roles[100]['role'] == 'substitute'
+    assert sum(1 for r in roles.values() if r['role'] == 'starter') == 15
+    assert snapshot.player_roles('Arsenal') is roles
+
+    # SQUAD_DATA 명단이 교체되면 다시 계산
+    squads['Arsenal'] = list(squads['Arsenal'][:-1])
+    assert 5007 not in snapshot.player_roles('Arsenal')
+
+
+def test_snapshot_cache_rebuilds_only_for_new_bootstrap():
+    current = {'bootstrap': None}
+    cache = FPLSnapshotCache(lambda: current['bootstrap'])
+    assert cache.get() is None          # 조회 실패는 캐시하지 않음
+
+    current['bootstrap'] = make_bootstrap()
+    snapshot = cache.get()
+    assert cache.get() is snapshot and snapshot.bootstrap is current['bootstrap']
+
+    current['bootstrap'] = make_bootstrap()     # 갱신된 응답
+    assert cache.get() is not snapshot
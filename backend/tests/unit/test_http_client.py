@@ -0,0 +1,123 @@
+"""
+HTTPClient 테스트 (로컬 스텁 서버 사용)
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from utils.http_client import HTTPClient
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """ETag를 지원하는 JSON 스텁 (server.body / server.delay로 응답 제어)"""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get('If-None-Match')))
+        time.sleep(server.delay)
+
+        if self.path.startswith('/missing'):
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        etag = f'"v{server.version}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        body = json.dumps(server.body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('X-Requests-Remaining', '42')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.requests, server.delay, server.version, server.body = [], 0.0, 1, {'teams': [1, 2]}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client():
+    client = HTTPClient(retries=0)
+    yield client
+    client.close()
+
+
+def test_ttl_hit_and_conditional_revalidation(stub, client):
+    url = f'{stub.url}/bootstrap-static/'
+
+    first = client.fetch(url, ttl=60)
+    assert first.data == {'teams': [1, 2]} and first.headers['x-requests-remaining'] == '42'
+    assert client.fetch(url, ttl=60).from_cache
+    assert len(stub.requests) == 1
+
+    # ttl=0: 매번 확인하지만 ETag가 같으면 304로 본문 재사용
+    again = client.fetch(url)
+    assert again.data is first.data
+    assert stub.requests[-1] == ('/bootstrap-static/', '"v1"')
+    assert client.stats['not_modified'] == 1
+
+    stub.version, stub.body = 2, {'teams': [3]}
+    assert client.get_json(url) == {'teams': [3]}
+
+
+def test_concurrent_requests_are_coalesced(stub, client):
+    stub.delay = 0.2
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.get_json(f'{stub.url}/fixtures/')))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(stub.requests) == 1
+    assert len(results) == 5 and all(result is results[0] for result in results)
+
+
+def test_stale_while_revalidate_and_stale_if_error(stub, client):
+    url = f'{stub.url}/fixtures/'
+    client.fetch(url, ttl=0.05, stale_ttl=60)
+    time.sleep(0.1)
+    stub.version, stub.body = 2, {'teams': [9]}
+
+    # 만료된 캐시를 즉시 반환하고 백그라운드에서 갱신
+    assert client.get_json(url, ttl=0.05, stale_ttl=60) == {'teams': [1, 2]}
+    deadline = time.time() + 2
+    while len(stub.requests) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    assert client.get_json(url, ttl=60) == {'teams': [9]}
+
+    # 서버가 죽어도 stale_ttl이 있으면 남은 캐시 사용
+    stub.shutdown()
+    stub.server_close()
+    assert client.get_json(url, ttl=0, stale_ttl=60) == {'teams': [9]}
+
+
+def test_error_without_cache_raises(stub, client):
+    with pytest.raises(requests.HTTPError):
+        client.fetch(f'{stub.url}/missing')
+    assert client.stats['errors'] == 1
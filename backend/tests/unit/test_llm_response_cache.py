@@ -0,0 +1,114 @@
+"""
+LLM 응답 캐시 테스트
+"""
+
+import pytest
+
+from ai.base_client import BaseAIClient
+from ai.response_cache import LLMResponseCache, cached_generate, get_response_cache, reset_response_cache
+
+
+class CountingClient(BaseAIClient):
+    """호출 횟수를 세는 AI client"""
+
+    def __init__(self, model='stub-1'):
+        self.model = model
+        self.calls = 0
+
+    @cached_generate
+    def generate(self, prompt, system_prompt=None, temperature=0.7, max_tokens=4096):
+        self.calls += 1
+        if prompt == 'fail':
+            return False, None, None, 'provider error'
+        usage = {'input_tokens': 10, 'output_tokens': 5, 'total_tokens': 15, 'cost_usd': 0.25, 'model': self.model}
+        return True, f'{self.model}:{prompt}:{self.calls}', usage, None
+
+    def simulate_match(self, home_team, away_team, data_context):
+        return False, None, None, 'not supported'
+
+    def get_model_info(self):
+        return {'provider': 'stub', 'model': self.model}
+
+    def health_check(self):
+        return True, None
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / 'llm_cache.db'
+    monkeypatch.setenv('LLM_CACHE_PATH', str(path))
+    monkeypatch.delenv('LLM_CACHE_ENABLED', raising=False)
+    reset_response_cache()
+    yield path
+    reset_response_cache()
+
+
+def test_identical_calls_skip_the_provider(cache_path):
+    client = CountingClient()
+
+    first = client.generate('Arsenal vs Chelsea', system_prompt='analyst', temperature=0.7)
+    second = client.generate('Arsenal vs Chelsea', 'analyst')          # 같은 인자 (기본값 포함)
+
+    assert client.calls == 1
+    assert second[1] == first[1]
+    assert first[2]['cache_hit'] is False and first[2]['cost_usd'] == 0.25
+    assert second[2]['cache_hit'] is True and second[2]['cost_usd'] == 0.0
+
+    # 다른 프롬프트/샘플링/모델은 별도 키
+    client.generate('Arsenal vs Chelsea', 'analyst', temperature=0.2)
+    client.generate('Arsenal vs Chelsea', 'coach')
+    CountingClient(model='stub-2').generate('Arsenal vs Chelsea', 'analyst')
+    assert client.calls == 3
+
+    # 새 프로세스(새 인스턴스)도 같은 파일에서 조회
+    reset_response_cache()
+    again = CountingClient()
+    assert again.generate('Arsenal vs Chelsea', 'analyst')[1] == first[1]
+    assert again.calls == 0
+    assert get_response_cache().stats.hits == 1
+
+
+def test_failures_and_bypass_are_not_cached(cache_path, monkeypatch):
+    client = CountingClient()
+
+    assert client.generate('fail')[0] is False
+    assert client.generate('fail')[0] is False
+    assert client.calls == 2
+
+    client.generate('ping', use_cache=False)
+    client.generate('ping', use_cache=False)
+    assert client.calls == 4
+
+    monkeypatch.setenv('LLM_CACHE_ENABLED', 'false')
+    client.generate('x')
+    client.generate('x')
+    assert client.calls == 6
+    assert not cache_path.exists() or len(LLMResponseCache(cache_path)) == 0
+
+
+def test_entries_expire_and_store_stays_bounded(tmp_path):
+    clock = FakeClock()
+    cache = LLMResponseCache(tmp_path / 'c.db', ttl_seconds=60, max_bytes=300, clock=clock)
+
+    cache.set('a', 'x' * 100)
+    clock.now += 1
+    cache.set('b', 'y' * 100)
+    clock.now += 1
+    assert cache.get('a').text == 'x' * 100     # a를 최근 사용으로 갱신
+    cache.set('c', 'z' * 150)                   # 350 > 300 → LRU(b) 제거
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.stats.evictions == 1
+
+    clock.now += 61
+    assert cache.get('a') is None
+    assert cache.stats.expired == 1 and len(cache) == 1
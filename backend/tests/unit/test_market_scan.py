@@ -0,0 +1,108 @@
+"""
+MarketScan 및 배당 분석 뷰 테스트
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from odds_collection.odds_aggregator import OddsAggregator
+from value_betting import ArbitrageFinder, ValueDetector
+from value_betting.market_scan import scan_markets
+from value_betting.utils import calculate_edge, get_best_odds, remove_overround
+
+BOOKMAKERS = ['pinnacle', 'betfair', 'bet365', 'williamhill', 'unibet', '1xbet', 'marathonbet']
+
+
+def random_matches(count, seed=11):
+    rng = random.Random(seed)
+    matches = []
+    for index in range(count):
+        bookmakers = {}
+        for name in rng.sample(BOOKMAKERS, rng.randint(1, len(BOOKMAKERS))):
+            outcomes = ['home', 'away', 'draw']
+            rng.shuffle(outcomes)
+            bookmakers[name] = {outcome: round(rng.uniform(1.4, 6.0), 2) for outcome in outcomes}
+        matches.append({'match_id': f'm{index}', 'home_team': f'H{index}', 'away_team': f'A{index}',
+                        'commence_time': None, 'bookmakers': bookmakers})
+    return matches
+
+
+def test_scan_matches_per_match_dict_calculations():
+    aggregator = OddsAggregator()
+    matches = random_matches(60)
+    analyses = aggregator.analyze_scan(aggregator.scan_markets(matches))
+
+    for match, analysis in zip(matches, analyses):
+        bookmakers = match['bookmakers']
+        assert list(analysis['overrounds']) == list(bookmakers)
+        for name, odds in bookmakers.items():
+            assert analysis['overrounds'][name] == pytest.approx(aggregator.calculate_overround(odds))
+        assert analysis['best_odds'] == {outcome: get_best_odds(bookmakers, outcome) for outcome in ('home', 'draw', 'away')}
+        assert analysis['consensus_probability'] == pytest.approx(aggregator.get_consensus_probability(bookmakers))
+        if 'pinnacle' in bookmakers:
+            assert analysis['pinnacle_probability'] == pytest.approx(remove_overround(bookmakers['pinnacle']))
+        else:
+            assert analysis['pinnacle_probability'] is None
+        assert analysis['odds_variance']['home'] == pytest.approx(
+            np.var([odds['home'] for odds in bookmakers.values()]) if len(bookmakers) > 1 else 0.0)
+
+
+def test_ties_pick_first_bookmaker_in_match_order():
+    scan = scan_markets([
+        {'bookmakers': {'a': {'home': 2.0, 'draw': 3.0, 'away': 4.0}, 'b': {'home': 2.0, 'draw': 3.0, 'away': 4.0}}},
+        {'bookmakers': {'b': {'home': 2.0, 'draw': 3.0, 'away': 4.0}, 'a': {'home': 2.0, 'draw': 3.0, 'away': 4.0}}},
+    ])
+
+    assert scan.tensor.bookmakers == ['a', 'b']
+    assert scan.best_column.tolist() == [[0, 0, 0], [1, 1, 1]]
+    assert scan.fairest.tolist() == [0, 1]
+    assert scan.columns_of(1) == [1, 0]
+
+
+def test_detect_in_scan_equals_per_match_detection():
+    aggregator = OddsAggregator()
+    detector = ValueDetector(min_edge=0.02, min_confidence=0.5)
+    matches = random_matches(60)
+    scan = aggregator.scan_markets(matches)
+
+    per_match = []
+    for match, analysis in zip(matches, aggregator.analyze_scan(scan)):
+        analysis.update(match_id=match['match_id'], bookmakers_raw=match['bookmakers'])
+        per_match.extend(detector.detect_value_bets(analysis))
+    batched = detector.detect_in_scan(scan)
+
+    assert len(batched) == len(per_match) > 0
+    for bet, expected in zip(batched, per_match):
+        assert (bet['match_id'], bet['outcome'], bet['bookmaker']) == \
+            (expected['match_id'], expected['outcome'], expected['bookmaker'])
+        assert bet['edge'] == pytest.approx(expected['edge'])
+        assert bet['edge'] * 100 == pytest.approx(calculate_edge(bet['estimated_probability'], bet['odds']))
+        assert bet['confidence'] == pytest.approx(expected['confidence'])
+        assert bet['bookmaker'] != 'pinnacle'
+
+
+def test_arbitrage_stakes_from_scan():
+    bookmakers = {
+        'bet365': {'home': 2.15, 'draw': 3.2, 'away': 3.9},
+        'williamhill': {'home': 2.0, 'draw': 3.8, 'away': 4.0},
+        'betfair': {'home': 2.05, 'draw': 3.5, 'away': 4.5},
+    }
+    finder = ArbitrageFinder(min_profit=0.005)
+    scan = scan_markets([{'match_id': 'x', 'home_team': 'H', 'away_team': 'A', 'bookmakers': bookmakers},
+                         {'match_id': 'y', 'home_team': 'H', 'away_team': 'A', 'bookmakers': {'bet365': bookmakers['bet365']}}])
+
+    arb_percentage = 1 / 2.15 + 1 / 3.8 + 1 / 4.5
+    assert scan.arb_percentage[0] == pytest.approx(arb_percentage)
+    assert scan.stakes[0] == pytest.approx([1 / 2.15 / arb_percentage, 1 / 3.8 / arb_percentage, 1 / 4.5 / arb_percentage])
+
+    [opportunity] = finder.find_in_scan(scan)
+    assert opportunity['match_id'] == 'x' and opportunity['risk_level'] == 'HIGH'
+    assert {outcome: info['bookmaker'] for outcome, info in opportunity['best_odds'].items()} == \
+        {'home': 'bet365', 'draw': 'williamhill', 'away': 'betfair'}
+    assert opportunity['stake_distribution'] == finder.calculate_arbitrage_from_raw_odds(bookmakers)['stake_distribution']
+
+    # OddsAggregator의 (북메이커, 배당률) 형식 best_odds도 처리
+    analysis = OddsAggregator().analyze_match_odds({'home_team': 'H', 'away_team': 'A', 'bookmakers': bookmakers})
+    assert finder.check_arbitrage(dict(analysis, match_id='x'))['profit_margin'] == pytest.approx(1 - arb_percentage)
@@ -0,0 +1,68 @@
+"""
+MatchPredictor 배치 경로 테스트
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from value_betting.match_predictor import MatchPredictor
+from value_betting.odds_tensor import build_odds_tensor
+
+BOOKMAKERS = ['pinnacle', 'betfair_ex_uk', 'smarkets', 'betclic', 'marathonbet', 'bet365', 'williamhill']
+
+
+def random_matches(count, seed=7):
+    rng = random.Random(seed)
+    matches = []
+    for index in range(count):
+        bookmakers = {}
+        for name in rng.sample(BOOKMAKERS, rng.randint(1, len(BOOKMAKERS))):
+            bookmakers[name] = {outcome: round(rng.uniform(1.2, 8.0), 2)
+                                for outcome in ('home', 'draw', 'away') if rng.random() < 0.9}
+        raw = []
+        if rng.random() < 0.5:
+            raw = [{'key': 'pinnacle', 'markets': [{'key': 'totals', 'outcomes': [
+                {'name': 'Over', 'price': rng.uniform(1.5, 2.5)},
+                {'name': 'Under', 'price': rng.uniform(1.5, 2.5)},
+            ]}]}]
+        matches.append({'id': index, 'home_team': f'H{index}', 'away_team': f'A{index}',
+                        'bookmakers': bookmakers, 'bookmakers_raw': raw})
+    return matches
+
+
+def test_odds_tensor_marks_missing_and_invalid_odds():
+    tensor = build_odds_tensor([
+        {'bookmakers': {'pinnacle': {'home': 2.0, 'draw': None}, 'bet365': 'n/a'}},
+        'not a match',
+        {'bookmakers': {'bet365': {'home': 1.5, 'draw': 4.0, 'away': 6.0}}},
+    ])
+
+    assert tensor.bookmakers == ['pinnacle', 'bet365']
+    assert tensor.listed.tolist() == [[True, True], [False, True]]
+    assert tensor.odds[0, 0, 0] == 2.0 and tensor.odds[0, 0, 1] == 0.0 and np.isnan(tensor.odds[0, 0, 2])
+    assert np.isnan(tensor.odds[0, 1]).all()
+    assert tensor.implied_probabilities()[1, 1].tolist() == pytest.approx([1 / 1.5, 0.25, 1 / 6])
+
+
+def test_predict_all_matches_equals_per_match_predictions():
+    predictor = MatchPredictor()
+    matches = random_matches(40)
+
+    assert predictor.predict_all_matches(matches) == [predictor.predict_match(match) for match in matches]
+
+
+def test_predict_batch_returns_columnar_arrays():
+    predictor = MatchPredictor()
+    batch = predictor.predict_batch(random_matches(25))
+
+    assert len(batch) == 25
+    assert batch.probabilities.shape == (25, 3) and batch.grids.shape == (25, 7, 7)
+    assert np.allclose(batch.probabilities.sum(axis=1), 1.0)
+    assert ((batch.confidence >= 0.5) & (batch.confidence <= 0.7)).all()
+    assert batch.uses_totals.sum() == np.count_nonzero(batch.tensor.totals_over > 0)
+
+    first = predictor.predict_match(batch.tensor.matches[0])['prediction']
+    assert batch.expected_goals[0].tolist() == [first['expected_goals']['home'], first['expected_goals']['away']]
+    assert predictor.predict_batch([]).probabilities.shape == (0, 3)
@@ -0,0 +1,213 @@
+"""
+Unit Tests for Monte Carlo Executor
+EPL Match Predictor v3.0
+
+Tests Cover:
+1. Chunk splitting
+2. Reproducibility across serial/thread/process modes
+3. Multi-task submission
+4. Adaptive (sequential) sampling
+"""
+
+import multiprocessing
+import pytest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from simulation.v2.scenario import Scenario, ScenarioEvent, EventType
+from simulation.v2.scenario_guide import ScenarioGuide
+from simulation.v2.event_simulation_engine import create_match_parameters
+from simulation.v2.parallel_executor import (
+    MonteCarloExecutor,
+    ExecutorConfig,
+    AdaptiveSamplingConfig,
+    outcome_ci_half_width
+)
+from simulation.v3.validation.monte_carlo_validator import MonteCarloValidator
+from utils.cancellation import CancellationToken, SimulationCancelled
+
+
+@pytest.fixture
+def guide():
+    return ScenarioGuide(Scenario(
+        id="TEST_001",
+        name="Early goal",
+        reasoning="test",
+        events=[ScenarioEvent(minute_range=(0, 20), type=EventType.GOAL, team="home", probability_boost=2.0)],
+        expected_probability=0.5
+    ))
+
+
+@pytest.fixture
+def params():
+    return create_match_parameters(
+        {"attack_strength": 80, "defense_strength": 78},
+        {"attack_strength": 76, "defense_strength": 75}
+    )
+
+
+class TestChunkSplitting:
+    """Test run splitting"""
+
+    def test_split_runs(self):
+        """Test chunk sizes cover all runs"""
+        executor = MonteCarloExecutor(ExecutorConfig(chunk_size=400))
+
+        assert executor._split_runs(1000) == [400, 400, 200]
+        assert executor._split_runs(800) == [400, 400]
+        assert executor._split_runs(10) == [10]
+
+    def test_invalid_mode(self):
+        """Test unknown mode is rejected"""
+        with pytest.raises(ValueError):
+            ExecutorConfig(mode="gpu")
+
+
+class TestExecutorConfigFromEnv:
+    """Test executor settings read from the environment"""
+
+    def test_reads_mode_and_workers(self, monkeypatch):
+        monkeypatch.setenv('SIMULATION_EXECUTOR_MODE', 'Process')
+        monkeypatch.setenv('SIMULATION_EXECUTOR_WORKERS', '3')
+        config = ExecutorConfig.from_env()
+        assert (config.mode, config.max_workers) == ('process', 3)
+
+        monkeypatch.delenv('SIMULATION_EXECUTOR_MODE')
+        monkeypatch.delenv('SIMULATION_EXECUTOR_WORKERS')
+        assert (ExecutorConfig.from_env().mode, ExecutorConfig.from_env().max_workers) == ('thread', None)
+
+    def test_process_mode_falls_back_to_threads_in_daemon_process(self, monkeypatch):
+        monkeypatch.setenv('SIMULATION_EXECUTOR_MODE', 'process')
+        monkeypatch.setattr(multiprocessing.current_process(), 'daemon', True, raising=False)
+        assert ExecutorConfig.from_env().mode == 'thread'
+
+
+class TestReproducibility:
+    """Test same master seed gives identical results in every mode"""
+
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    def test_parallel_matches_serial(self, params, guide, mode):
+        """Test parallel modes reproduce serial results bit-for-bit"""
+        # Given
+        serial = MonteCarloExecutor(ExecutorConfig(mode="serial", chunk_size=250))
+
+        # When
+        expected = serial.run(params, guide, 1000, seed=123)
+        with MonteCarloExecutor(ExecutorConfig(mode=mode, max_workers=2, chunk_size=250)) as parallel:
+            actual = parallel.run(params, guide, 1000, seed=123)
+
+        # Then
+        assert actual.n_runs == 1000
+        assert actual.score_histogram == expected.score_histogram
+        assert actual.event_type_counts == expected.event_type_counts
+        assert actual.adherence_mean == expected.adherence_mean
+        assert actual.adherence_m2 == expected.adherence_m2
+
+    def test_run_many_keeps_task_order(self, params, guide):
+        """Test run_many returns one merged result per task"""
+        # Given
+        executor = MonteCarloExecutor(ExecutorConfig(chunk_size=100))
+
+        # When
+        results = executor.run_many([(params, guide, 250, 1), (params, guide, 120, 2)])
+
+        # Then
+        assert [r.n_runs for r in results] == [250, 120]
+        assert results[1].score_histogram == executor.run(params, guide, 120, seed=2).score_histogram
+
+
+class TestAdaptiveSampling:
+    """Test sequential sampling with CI targets"""
+
+    def test_stops_at_target(self, params, guide):
+        """Test sampling stops once the CI half-width target is reached"""
+        # Given
+        executor = MonteCarloExecutor()
+        config = AdaptiveSamplingConfig(target_half_width=0.03, min_runs=200, max_runs=5000, chunk_runs=100)
+
+        # When
+        result = executor.run_adaptive([(params, guide, 7)], config)[0]
+
+        # Then
+        assert result.converged
+        assert result.ci_half_width <= 0.03
+        assert 200 <= result.accumulator.n_runs < 5000
+        assert result.accumulator.n_runs % 100 == 0
+
+    def test_respects_max_runs(self, params, guide):
+        """Test hard maximum caps unreachable targets"""
+        # Given
+        executor = MonteCarloExecutor()
+        config = AdaptiveSamplingConfig(target_half_width=0.001, min_runs=100, max_runs=450, chunk_runs=200)
+
+        # When
+        result = executor.run_adaptive([(params, guide, 7)], config)[0]
+
+        # Then
+        assert not result.converged
+        assert result.accumulator.n_runs == 450
+
+    def test_reproducible(self, params, guide):
+        """Test same seed gives same stopping point and results"""
+        # Given
+        executor = MonteCarloExecutor()
+        config = AdaptiveSamplingConfig(target_half_width=0.03, min_runs=100, chunk_runs=100)
+
+        # When
+        first = executor.run_adaptive([(params, guide, 11)], config)[0]
+        second = executor.run_adaptive([(params, guide, 11)], config)[0]
+
+        # Then
+        assert first.accumulator.n_runs == second.accumulator.n_runs
+        assert first.accumulator.score_histogram == second.accumulator.score_histogram
+
+    def test_ci_half_width_shrinks(self, params, guide):
+        """Test half-width decreases with more runs"""
+        executor = MonteCarloExecutor()
+
+        small = outcome_ci_half_width(executor.run(params, guide, 200, seed=1))
+        large = outcome_ci_half_width(executor.run(params, guide, 3200, seed=1))
+
+        assert large < small
+        assert large == pytest.approx(small / 4, rel=0.2)
+
+    def test_cancel_stops_before_next_round(self, params, guide, monkeypatch):
+        """Test a cancelled token stops adaptive sampling between chunk rounds"""
+        # Given
+        executor = MonteCarloExecutor()
+        config = AdaptiveSamplingConfig(target_half_width=0.001, min_runs=1000, max_runs=5000, chunk_runs=100)
+        token = CancellationToken()
+        rounds = []
+        run_many = executor.run_many
+
+        def run_then_cancel(tasks, cancel_token=None):
+            rounds.append(len(tasks))
+            result = run_many(tasks, cancel_token)
+            token.cancel("stop")
+            return result
+
+        monkeypatch.setattr(executor, 'run_many', run_then_cancel)
+
+        # When / Then
+        with pytest.raises(SimulationCancelled):
+            executor.run_adaptive([(params, guide, 7)], config, cancel_token=token)
+        assert rounds == [1]
+
+    def test_config_from_env(self, monkeypatch):
+        """Test adaptive sampling is off unless enabled in the environment"""
+        monkeypatch.delenv('SIMULATION_ADAPTIVE_SAMPLING', raising=False)
+        assert AdaptiveSamplingConfig.from_env() is None
+
+        monkeypatch.setenv('SIMULATION_ADAPTIVE_SAMPLING', 'true')
+        monkeypatch.setenv('SIMULATION_ADAPTIVE_TARGET', '0.03')
+        monkeypatch.setenv('SIMULATION_ADAPTIVE_MAX_RUNS', '4000')
+        config = AdaptiveSamplingConfig.from_env()
+        assert (config.target_half_width, config.min_runs, config.max_runs) == (0.03, 500, 4000)
+
+    def test_validator_rejects_adaptive_without_batch_engine(self):
+        """Test adaptive sampling is not silently ignored on the per-match path"""
+        with pytest.raises(ValueError, match="use_batch_engine"):
+            MonteCarloValidator(use_batch_engine=False, adaptive=AdaptiveSamplingConfig())
@@ -0,0 +1,211 @@
+"""
+V3 Pipeline Result Cache 테스트
+"""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from simulation.v3.pipeline import simulation_pipeline_v3 as pipeline_module
+from services.team_data_snapshot import TeamDataSnapshot
+from infrastructure.cache.tiered_cache import TieredCache
+from simulation.v3.pipeline import result_cache as result_cache_module
+from simulation.v3.pipeline.result_cache import PipelineResultCache, data_version, fingerprint
+
+
+class FakeTeam:
+    def __init__(self, name, rating=80.0):
+        self.name = name
+        self.rating = rating
+
+    def to_dict(self):
+        return {'name': self.name, 'lineup': {'ST': {'overall_rating': self.rating}}}
+
+
+class FakeScenario:
+    def __init__(self, scenario_id):
+        self.id = scenario_id
+        self.name = scenario_id
+        self.expected_probability = 0.5
+
+    def to_dict(self):
+        return {'id': self.id}
+
+
+class FakeRedisCache:
+    """RedisCache와 같은 get/set 인터페이스 (값을 그대로 보관)"""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key, deserializer='json'):
+        return self.store.get(key)
+
+    def set(self, key, value, ttl=None, serializer='json'):
+        self.store[key] = value
+        return True
+
+
+def test_fingerprint_ignores_dict_order():
+    assert fingerprint({'a': 1, 'b': 2}) == fingerprint({'b': 2, 'a': 1})
+    assert fingerprint({'a': 1}) != fingerprint({'a': 2})
+
+
+def test_ensemble_key_depends_on_team_inputs_and_data_version():
+    version = {'value': 'v1'}
+    cache = PipelineResultCache(version_func=lambda: version['value'])
+    home, away = FakeTeam('Arsenal'), FakeTeam('Tottenham')
+
+    key = cache.ensemble_key(home, away)
+    assert cache.ensemble_key(FakeTeam('Arsenal'), FakeTeam('Tottenham')) == key
+    assert cache.ensemble_key(away, home) != key
+    assert cache.ensemble_key(FakeTeam('Arsenal', rating=81.0), away) != key
+
+    version['value'] = 'v2'
+    assert cache.ensemble_key(home, away) != key
+
+
+def test_data_version_follows_team_data_snapshot(tmp_path):
+    team_dir = tmp_path / 'lineups'
+    team_dir.mkdir()
+    lineup = team_dir / 'Arsenal.json'
+    lineup.write_text('{"ST": 1}')
+    ratings_db = tmp_path / 'ratings.db'
+    ratings_db.write_bytes(b'v1')
+    snapshot = TeamDataSnapshot(str(tmp_path))
+
+    before = data_version(snapshot, [str(ratings_db)])
+    assert TeamDataSnapshot(str(tmp_path)).content_version() == snapshot.content_version()
+
+    lineup.write_text('{"ST": 22}')
+    os.utime(lineup, ns=(1, 1))
+    after_lineup = data_version(snapshot, [str(ratings_db)])
+    assert after_lineup != before
+    assert snapshot.version == 1                        # 같은 stat 확인에서 스냅샷도 갱신
+    assert snapshot.read_json(str(lineup)) == {'ST': 22}
+
+    ratings_db.write_bytes(b'v22')
+    assert data_version(snapshot, [str(ratings_db)]) != after_lineup
+
+
+def test_get_or_compute_returns_copies_and_fills_local_from_redis():
+    redis_cache = FakeRedisCache()
+    writer = PipelineResultCache(TieredCache('pipeline_v3', redis_cache=redis_cache), version_func=lambda: 'v')
+    compute = MagicMock(return_value={'home_win': 0.5})
+
+    value, hit = writer.get_or_compute('k', compute)
+    assert not hit
+    value['home_win'] = 0.0
+    assert writer.get_or_compute('k', compute) == ({'home_win': 0.5}, True)
+
+    reader = PipelineResultCache(TieredCache('pipeline_v3', redis_cache=redis_cache), version_func=lambda: 'v')
+    cached, hit = reader.get_or_compute('k', compute)
+
+    assert hit
+    assert cached == {'home_win': 0.5}
+    assert compute.call_count == 1
+    assert (reader.stats.remote_hits, reader.stats.misses) == (1, 0)
+    assert reader.get_or_compute('k', compute)[1] and reader.stats.local_hits == 1
+
+
+@pytest.fixture
+def stub_pipeline(monkeypatch):
+    """AI/시뮬레이션 없이 Phase별 호출 횟수만 확인하는 파이프라인"""
+    monkeypatch.setattr(pipeline_module, 'ModelEnsemble', MagicMock())
+    monkeypatch.setattr(pipeline_module, 'MathBasedScenarioGenerator', MagicMock())
+
+    def make(seed):
+        pipeline = pipeline_module.SimulationPipelineV3(
+            pipeline_module.PipelineConfig(seed=seed),
+            result_cache=PipelineResultCache(version_func=lambda: 'v')
+        )
+        pipeline.ensemble.calculate.return_value = {'ensemble': 'result'}
+        pipeline.scenario_generator.generate.return_value = SimpleNamespace(
+            scenarios=[FakeScenario('SYNTH_001')], scenario_count=1
+        )
+        pipeline._run_phase1_ensemble = MagicMock(return_value={'ensemble': 'result'})
+        pipeline._run_phase3_validation = MagicMock(return_value=SimpleNamespace(
+            final_probabilities={'home_win': 0.5, 'draw': 0.3, 'away_win': 0.2},
+            seed=seed
+        ))
+        return pipeline
+
+    return make
+
+
+def test_pipeline_reuses_ensemble_and_seeded_validation(stub_pipeline):
+    pipeline = stub_pipeline(seed=7)
+    home, away = FakeTeam('Arsenal'), FakeTeam('Tottenham')
+
+    first = pipeline.run(home, away)
+    second = pipeline.run(home, away)
+
+    assert first.cached_phases == []
+    assert second.cached_phases == ['ensemble', 'validation']
+    assert second.final_probabilities == first.final_probabilities
+    assert pipeline._run_phase1_ensemble.call_count == 1
+    assert pipeline._run_phase3_validation.call_count == 1
+
+
+def test_pipeline_does_not_cache_unseeded_validation(stub_pipeline):
+    pipeline = stub_pipeline(seed=None)
+    home, away = FakeTeam('Arsenal'), FakeTeam('Tottenham')
+
+    pipeline.run(home, away)
+    second = pipeline.run(home, away)
+
+    assert second.cached_phases == ['ensemble']
+    assert pipeline._run_phase3_validation.call_count == 2
+
+
+def test_pipelines_share_the_process_result_cache(stub_pipeline, monkeypatch):
+    monkeypatch.setattr(result_cache_module, '_result_cache', PipelineResultCache(version_func=lambda: 'v'))
+    config = pipeline_module.PipelineConfig(seed=1)
+
+    first = pipeline_module.SimulationPipelineV3(config)
+    second = pipeline_module.SimulationPipelineV3(config)
+
+    assert first.result_cache is second.result_cache is result_cache_module.get_pipeline_result_cache()
+
+
+def test_v3_job_runner_serves_repeat_fixtures_from_cache(monkeypatch):
+    from services import enriched_data_loader, simulation_job_runners
+    from simulation.v3 import pipeline as pipeline_package
+
+    shared = PipelineResultCache(version_func=lambda: 'v')
+    monkeypatch.setattr(pipeline_package, 'SimulationPipelineV3',
+                        lambda config: pipeline_module.SimulationPipelineV3(config, result_cache=shared))
+    monkeypatch.setattr(pipeline_module, 'ModelEnsemble', MagicMock())
+    monkeypatch.setattr(pipeline_module, 'MathBasedScenarioGenerator', MagicMock())
+    strengths = SimpleNamespace(derived_strengths=SimpleNamespace(attack_strength=80.0))
+    loader = MagicMock()
+    loader.return_value.load_match_data.side_effect = lambda home, away: (
+        SimpleNamespace(to_dict=FakeTeam(home).to_dict, **vars(strengths)),
+        SimpleNamespace(to_dict=FakeTeam(away).to_dict, **vars(strengths))
+    )
+    monkeypatch.setattr(enriched_data_loader, 'EnrichedDomainDataLoader', loader)
+
+    scenario = FakeScenario('SYNTH_001')
+    scenario.events = []
+    phase3 = MagicMock(return_value=SimpleNamespace(
+        final_probabilities={'home_win': 0.5, 'draw': 0.3, 'away_win': 0.2},
+        total_runs=3000, total_scenarios=1, scenario_results=[], seed=1
+    ))
+    monkeypatch.setattr(pipeline_module.SimulationPipelineV3, '_run_phase1_ensemble',
+                        MagicMock(return_value=SimpleNamespace(
+                            ensemble_probabilities={'home_win': 0.5, 'draw': 0.3, 'away_win': 0.2})))
+    monkeypatch.setattr(pipeline_module.SimulationPipelineV3, '_run_phase2_scenarios',
+                        MagicMock(return_value=SimpleNamespace(scenarios=[scenario], scenario_count=1)))
+    monkeypatch.setattr(pipeline_module.SimulationPipelineV3, '_run_phase3_validation', phase3)
+
+    events = []
+    payload = {'home_team': 'Arsenal', 'away_team': 'Chelsea'}
+    simulation_job_runners.run_v3_simulation(payload, events.append)
+    simulation_job_runners.run_v3_simulation(payload, events.append)
+
+    assert phase3.call_count == 1
+    cached = [event.data.get('cached') for event in events if event.data.get('stage') == 'phase3_complete']
+    assert cached == [False, True]
+    assert simulation_job_runners.fixture_seed('Arsenal', 'Chelsea') == simulation_job_runners.fixture_seed('Arsenal', 'Chelsea')
@@ -0,0 +1,108 @@
+"""
+Unit Tests for Poisson Score Grid
+EPL Match Predictor v3.0
+
+Tests Cover:
+1. PMF and score matrix agree with scipy.stats.poisson
+2. Outcome masks and normalization
+3. Arrays of λ pairs match per-pair calls
+"""
+
+import pytest
+import sys
+import os
+
+import numpy as np
+from scipy.stats import poisson
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from utils.poisson_grid import (
+    poisson_pmf_table,
+    score_matrix,
+    outcome_probabilities,
+    score_dict,
+    most_likely_scores
+)
+from value_betting.match_predictor import MatchPredictor
+
+
+class TestScoreMatrix:
+    """Test the closed-form grid against scipy"""
+
+    @pytest.mark.parametrize("lam", [0.1, 1.35, 4.0])
+    def test_pmf_matches_scipy(self, lam):
+        """Test recurrence PMF equals poisson.pmf"""
+        expected = poisson.pmf(np.arange(7), lam)
+        assert np.allclose(poisson_pmf_table(lam), expected, rtol=1e-12, atol=0)
+
+    def test_matrix_is_outer_product(self):
+        """Test every cell equals the product of the marginal PMFs"""
+        grid = score_matrix(1.6, 0.9)
+
+        assert grid.shape == (7, 7)
+        for home in range(7):
+            for away in range(7):
+                expected = poisson.pmf(home, 1.6) * poisson.pmf(away, 0.9)
+                assert grid[home, away] == pytest.approx(expected, rel=1e-12)
+
+
+class TestOutcomes:
+    """Test triangular-mask outcome sums"""
+
+    def test_masks_partition_the_grid(self):
+        """Test home/draw/away sum to the truncated grid mass"""
+        grid = score_matrix(1.5, 1.2)
+        outcomes = outcome_probabilities(grid)
+
+        assert float(sum(outcomes.values())) == pytest.approx(grid.sum(), rel=1e-12)
+        assert float(outcomes['draw']) == pytest.approx(np.trace(grid), rel=1e-12)
+        assert float(outcomes['home_win']) == pytest.approx(
+            sum(grid[h, a] for h in range(7) for a in range(7) if h > a), rel=1e-12
+        )
+
+    def test_symmetric_lambdas(self):
+        """Test equal λ gives equal home/away probabilities"""
+        outcomes = outcome_probabilities(score_matrix(1.3, 1.3), normalize=True)
+
+        assert float(outcomes['home_win']) == pytest.approx(float(outcomes['away_win']))
+        assert float(sum(outcomes.values())) == pytest.approx(1.0)
+
+    def test_most_likely_scores_order(self):
+        """Test top scores are sorted and consistent with score_dict"""
+        grid = score_matrix(2.1, 0.7)
+        scores = score_dict(grid)
+        top = most_likely_scores(grid, top_n=3)
+
+        assert [(h, a) for h, a, _ in top] == [
+            key for key, _ in sorted(scores.items(), key=lambda x: x[1], reverse=True)[:3]
+        ]
+
+
+class TestBatch:
+    """Test arrays of λ pairs in one call"""
+
+    def test_batch_matches_single_calls(self):
+        """Test a gameweek of λ pairs equals per-fixture grids"""
+        home = np.array([0.4, 1.5, 2.2, 3.1])
+        away = np.array([1.9, 1.2, 0.8, 0.3])
+
+        grids = score_matrix(home, away)
+        outcomes = outcome_probabilities(grids, normalize=True)
+
+        assert grids.shape == (4, 7, 7)
+        for index in range(4):
+            single = outcome_probabilities(score_matrix(home[index], away[index]), normalize=True)
+            for outcome in ('home_win', 'draw', 'away_win'):
+                assert outcomes[outcome][index] == pytest.approx(float(single[outcome]), rel=1e-12)
+
+    def test_match_predictor_batch(self):
+        """Test MatchPredictor batch output equals per-match output"""
+        batch = MatchPredictor.calculate_score_probabilities_batch([1.4, 2.0], [1.1, 0.6])
+        single = MatchPredictor.calculate_score_probabilities(2.0, 0.6)
+
+        assert len(batch) == 2
+        assert batch[1]['home_win'] == pytest.approx(single['home_win'])
+        assert batch[1]['scores'][(2, 0)] == pytest.approx(single['scores'][(2, 0)])
+        assert MatchPredictor.calculate_score_probabilities_batch([], []) == []
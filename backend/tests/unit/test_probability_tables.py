@@ -0,0 +1,117 @@
+"""
+Unit Tests for Precompiled Probability Tables
+EPL Match Predictor v3.0
+
+Tests Cover:
+1. Tables agree with EventProbabilityCalculator
+2. Scenario boosts land on the right minute/team
+3. Runtime score-state and fatigue multipliers
+"""
+
+import pytest
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from simulation.v2.scenario import Scenario, ScenarioEvent, EventType
+from simulation.v2.scenario_guide import ScenarioGuide
+from simulation.v2.event_simulation_engine import (
+    EventProbabilityCalculator,
+    MatchContext,
+    EPL_BASELINE,
+    create_match_parameters
+)
+from simulation.v2.probability_tables import (
+    compile_probability_tables,
+    score_state_factor,
+    fatigue_factors
+)
+
+
+@pytest.fixture
+def params():
+    return create_match_parameters(
+        {"attack_strength": 88, "defense_strength": 80, "press_intensity": 85},
+        {"attack_strength": 72, "defense_strength": 70, "press_intensity": 60},
+        "4-2-3-1",
+        "5-4-1"
+    )
+
+
+@pytest.fixture
+def guide():
+    return ScenarioGuide(Scenario(
+        id="TEST_001",
+        name="Away corners",
+        reasoning="test",
+        events=[
+            ScenarioEvent(minute_range=(30, 35), type=EventType.CORNER, team="away", probability_boost=2.0),
+            ScenarioEvent(minute_range=(50, 55), type=EventType.SHOT_ON_TARGET, team="home", probability_boost=1.5),
+        ],
+        expected_probability=0.5
+    ))
+
+
+def _context(minute, attacking_team, score=None):
+    defending_team = "away" if attacking_team == "home" else "home"
+    return MatchContext(
+        minute=minute,
+        score=score or {"home": 0, "away": 0},
+        possession={"home": 50, "away": 50},
+        stamina={"home": 100, "away": 100},
+        formation={"home": "4-2-3-1", "away": "5-4-1"},
+        attacking_team=attacking_team,
+        defending_team=defending_team
+    )
+
+
+class TestTablesMatchCalculator:
+    """Test tables reproduce the per-minute calculator"""
+
+    @pytest.mark.parametrize("minute", [0, 32, 52, 70])
+    @pytest.mark.parametrize("side,team", [(0, "home"), (1, "away")])
+    def test_level_score_even_possession(self, params, guide, minute, side, team, assert_near):
+        """Test table values equal calculate() at level score and 50% possession"""
+        # Given
+        tables = compile_probability_tables(params, guide, EPL_BASELINE)
+        calculator = EventProbabilityCalculator()
+
+        # When
+        probs = calculator.calculate(_context(minute, team), params, guide.get_boost_at(minute))
+
+        # Then
+        assert_near(tables.shot[minute, side], probs["shot_per_minute"], 1e-12)
+        assert_near(tables.on_target[minute, side], probs["shot_on_target_ratio"], 1e-12)
+        assert_near(tables.conversion[minute, side], probs["goal_conversion_on_target"], 1e-12)
+        assert_near(tables.corner[minute, side], probs["corner_per_minute"], 1e-12)
+        assert_near(tables.foul[minute, side], probs["foul_per_minute"], 1e-12)
+
+    def test_boost_only_for_boosted_team(self, params, guide):
+        """Test corner boost applies to away attacks only"""
+        tables = compile_probability_tables(params, guide, EPL_BASELINE)
+
+        assert tables.corner[32, 1] == pytest.approx(EPL_BASELINE["corner_per_minute"] * 2.0)
+        assert tables.corner[32, 0] == pytest.approx(EPL_BASELINE["corner_per_minute"])
+        assert tables.corner[36, 1] == pytest.approx(EPL_BASELINE["corner_per_minute"])
+
+
+class TestRuntimeMultipliers:
+    """Test score-state and fatigue multipliers"""
+
+    def test_score_state_scalar_and_array(self):
+        """Test scalar and vectorized score-state factors agree"""
+        import numpy as np
+
+        assert score_state_factor(-1) == 1.18
+        assert score_state_factor(0) == 1.0
+        assert score_state_factor(2) == 0.85
+        assert list(score_state_factor(np.array([-1, 0, 2]))) == [1.18, 1.0, 0.85]
+
+    def test_fatigue_after_70(self):
+        """Test fatigue applies only after minute 70"""
+        assert fatigue_factors(70, 60) is None
+        shot, on_target = fatigue_factors(80, 90)
+        assert shot == pytest.approx(1.025)
+        assert on_target == pytest.approx(0.985)
@@ -0,0 +1,117 @@
+"""
+Unit Tests for Seeded RNG Streams
+EPL Match Predictor v3.0
+
+Tests Cover:
+1. RNGProvider / UniformStream determinism
+2. Seeded engine and validators reproduce bit-identical results
+3. Kelly simulators accept seeds
+"""
+
+import pytest
+import sys
+import os
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from utils.rng import RNGProvider, UniformStream
+from simulation.v2.scenario import create_example_scenario
+from simulation.v2.scenario_guide import ScenarioGuide
+from simulation.v2.event_simulation_engine import EventBasedSimulationEngine, create_match_parameters
+from simulation.v2.multi_scenario_validator import MultiScenarioValidator
+from value_betting.kelly_criterion import KellyCriterion
+
+
+@pytest.fixture
+def params():
+    return create_match_parameters(
+        {"attack_strength": 84, "defense_strength": 78},
+        {"attack_strength": 77, "defense_strength": 75}
+    )
+
+
+class TestRNGProvider:
+    """Test seed handling and stream derivation"""
+
+    def test_same_seed_same_streams(self):
+        """Test two providers with one seed spawn identical generators in order"""
+        first, second = RNGProvider(42), RNGProvider(42)
+
+        for _ in range(3):
+            assert np.array_equal(first.generator().random(5), second.generator().random(5))
+
+    def test_generated_seed_is_recorded(self):
+        """Test an unseeded provider exposes a seed that recreates its streams"""
+        provider = RNGProvider()
+        replay = RNGProvider(provider.seed)
+
+        assert provider.seed < 2 ** 53
+        assert np.array_equal(provider.generator().random(5), replay.generator().random(5))
+
+    def test_uniform_stream_matches_generator(self):
+        """Test buffered draws equal direct Generator draws across block boundaries"""
+        stream = UniformStream(np.random.default_rng(7), block_size=4)
+        expected = np.random.default_rng(7).random(12)
+
+        assert [stream.random() for _ in range(10)] == expected[:10].tolist()
+
+
+class TestSeededSimulation:
+    """Test seeded simulation reproducibility"""
+
+    def test_simulate_match_reproducible(self, params):
+        """Test engines with the same seed replay the same matches"""
+        guide = ScenarioGuide(create_example_scenario())
+        first = EventBasedSimulationEngine(RNGProvider(5))
+        second = EventBasedSimulationEngine(RNGProvider(5))
+
+        for _ in range(20):
+            assert first.simulate_match(params, guide)["events"] == second.simulate_match(params, guide)["events"]
+
+    def test_unseeded_batch_uses_engine_provider(self, params):
+        """Test simulate_batch without a seed draws from the engine's provider"""
+        guide = ScenarioGuide(create_example_scenario())
+
+        first = EventBasedSimulationEngine(RNGProvider(9)).simulate_batch(params, guide, 200)
+        second = EventBasedSimulationEngine(RNGProvider(9)).simulate_batch(params, guide, 200)
+
+        assert np.array_equal(first.home_goals, second.home_goals)
+
+    @pytest.mark.parametrize("use_batch_engine", [True, False])
+    def test_validator_reproducible(self, params, use_batch_engine):
+        """Test MultiScenarioValidator returns identical statistics for one seed"""
+        scenarios = [create_example_scenario()]
+
+        first = MultiScenarioValidator(use_batch_engine=use_batch_engine).validate_scenarios(
+            scenarios, params, n=100, seed=11
+        )
+        second = MultiScenarioValidator(use_batch_engine=use_batch_engine).validate_scenarios(
+            scenarios, params, n=100, seed=11
+        )
+
+        assert first == second
+
+
+class TestSeededKelly:
+    """Test Kelly simulators with seeded generators"""
+
+    def test_compare_strategies_reproducible(self):
+        """Test compare_strategies is deterministic for one seed"""
+        kelly = KellyCriterion()
+
+        first = kelly.compare_strategies(0.55, 2.1, 1000, num_simulations=50, num_bets_per_sim=40, seed=3)
+        second = kelly.compare_strategies(0.55, 2.1, 1000, num_simulations=50, num_bets_per_sim=40, seed=3)
+
+        assert first == second
+
+    def test_simulate_growth_with_generator(self):
+        """Test simulate_kelly_growth replays with the same Generator seed"""
+        kelly = KellyCriterion()
+
+        first = kelly.simulate_kelly_growth(0.6, 2.0, 1000, 30, rng=np.random.default_rng(1))
+        second = kelly.simulate_kelly_growth(0.6, 2.0, 1000, 30, rng=np.random.default_rng(1))
+
+        assert first['bankroll_history'] == second['bankroll_history']
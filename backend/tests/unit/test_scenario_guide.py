@@ -0,0 +1,113 @@
+"""
+Unit Tests for ScenarioGuide
+EPL Match Predictor v3.0
+
+Tests Cover:
+1. Boost map overlap rules
+2. Array-backed boost multipliers
+3. Narrative adherence (single match and batch)
+"""
+
+import pytest
+import sys
+import os
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from simulation.v2.scenario import Scenario, ScenarioEvent, EventType
+from simulation.v2.scenario_guide import ScenarioGuide, EVENT_TYPE_INDEX
+
+
+def _guide(*events):
+    return ScenarioGuide(Scenario(id="TEST", name="test", reasoning="", events=list(events)))
+
+
+class TestBoostMap:
+    """Test per-minute boost map and array form"""
+
+    def test_overlap_keeps_first_unless_same_type_higher(self):
+        """Test overlapping boosts follow the first-event / higher-same-type rule"""
+        # Given
+        guide = _guide(
+            ScenarioEvent(minute_range=(10, 20), type=EventType.GOAL, team="home", probability_boost=1.5),
+            ScenarioEvent(minute_range=(15, 25), type=EventType.CORNER, team="away", probability_boost=2.0),
+            ScenarioEvent(minute_range=(18, 19), type=EventType.GOAL, team="away", probability_boost=2.5),
+        )
+
+        # Then
+        assert guide.get_boost_at(12)["multiplier"] == 1.5
+        assert guide.get_boost_at(16)["event_type"] == "goal"
+        assert guide.get_boost_at(18)["team"] == "away"
+        assert guide.get_boost_at(22)["event_type"] == "corner"
+        assert guide.get_boost_at(30) is None
+
+    def test_multipliers_match_boost_map(self):
+        """Test array form agrees with get_boost_at for every minute"""
+        # Given
+        guide = _guide(
+            ScenarioEvent(minute_range=(0, 30), type=EventType.WING_BREAKTHROUGH, team="home", probability_boost=2.0),
+            ScenarioEvent(minute_range=(25, 90), type=EventType.CORNER, team="away", probability_boost=1.4),
+        )
+
+        # Then
+        assert guide.boost_multipliers.shape == (2, len(EventType), 90)
+        for minute in range(90):
+            boost = guide.get_boost_at(minute)
+            expected = np.ones((2, len(EventType)))
+            if boost:
+                expected[0 if boost["team"] == "home" else 1, EVENT_TYPE_INDEX[boost["event_type"]]] = boost["multiplier"]
+            assert np.array_equal(guide.boost_multipliers[:, :, minute], expected)
+
+        assert guide.get_multipliers(EventType.CORNER).shape == (90, 2)
+
+
+class TestAdherence:
+    """Test narrative adherence"""
+
+    def test_single_match(self):
+        """Test adherence counts expected events matched by type/team/window"""
+        # Given
+        guide = _guide(
+            ScenarioEvent(minute_range=(10, 20), type=EventType.GOAL, team="home"),
+            ScenarioEvent(minute_range=(30, 40), type=EventType.CORNER, team="away"),
+        )
+        events = [
+            {"type": "goal", "team": "home", "minute": 15},
+            {"type": "corner", "team": "home", "minute": 35},
+        ]
+
+        # Then
+        assert guide.adherence(events) == 0.5
+        assert guide.adherence([]) == 0.0
+        assert _guide().adherence(events) == 1.0
+
+    def test_batch_matches_single(self):
+        """Test vectorized adherence equals the per-match computation"""
+        # Given
+        guide = _guide(
+            ScenarioEvent(minute_range=(10, 20), type=EventType.GOAL, team="home"),
+            ScenarioEvent(minute_range=(30, 89), type=EventType.CORNER, team="away"),
+            ScenarioEvent(minute_range=(0, 89), type=EventType.WING_BREAKTHROUGH, team="home"),
+        )
+        rng = np.random.default_rng(0)
+        types = np.where(
+            rng.random((50, 90)) < 0.2,
+            rng.choice([EVENT_TYPE_INDEX["goal"], EVENT_TYPE_INDEX["corner"]], size=(50, 90)),
+            -1
+        )
+        teams = rng.integers(0, 2, size=(50, 90))
+        names = {index: value for value, index in EVENT_TYPE_INDEX.items()}
+
+        # When
+        batch = guide.batch_adherence(types, teams)
+
+        # Then
+        for run in range(50):
+            events = [
+                {"type": names[types[run, m]], "team": ("home", "away")[teams[run, m]], "minute": m}
+                for m in range(90) if types[run, m] >= 0
+            ]
+            assert batch[run] == pytest.approx(guide.adherence(events))
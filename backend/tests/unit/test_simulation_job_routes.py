@@ -0,0 +1,86 @@
+"""
+시뮬레이션 Job API 접근 제어 테스트
+"""
+
+import pytest
+from flask import Flask, request
+
+from api.v1 import simulation_routes
+from middleware import auth_middleware
+from services.simulation_jobs import CANCELLED, QUEUED, SimulationJobStore
+
+
+class HeaderAuth:
+    """Authorization: Bearer <user_id> 를 그대로 사용자로 인정하는 테스트용 middleware"""
+
+    def verify_request(self):
+        user_id = request.headers.get('Authorization', '').replace('Bearer ', '')
+        if not user_id:
+            return False, None, 'Missing authorization token'
+        return True, {'user_id': user_id, 'tier': 'BASIC', 'email': f'{user_id}@example.com'}, None
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = SimulationJobStore(tmp_path / 'jobs.db')
+    monkeypatch.setattr(simulation_routes, 'get_job_store', lambda: store)
+    monkeypatch.setattr(auth_middleware, 'get_auth_middleware', lambda: HeaderAuth())
+    return store
+
+
+@pytest.fixture
+def client(store):
+    app = Flask(__name__)
+    app.register_blueprint(simulation_routes.simulation_bp)
+    return app.test_client()
+
+
+def as_user(user_id):
+    return {'Authorization': f'Bearer {user_id}'}
+
+
+def test_job_routes_are_limited_to_attached_users(store, client):
+    job, _ = store.submit('v3', {'home_team': 'Arsenal'}, 'fp', user_id='alice')
+    store.submit('v3', {'home_team': 'Arsenal'}, 'fp', user_id='bob')
+    url = f'/api/v1/simulation/jobs/{job.id}'
+
+    assert client.get(url).status_code == 401
+    assert client.get(url, headers=as_user('mallory')).status_code == 404
+    assert client.get(f'{url}/events', headers=as_user('mallory')).status_code == 404
+    assert client.delete(url, headers=as_user('mallory')).status_code == 404
+    assert client.get(url, headers=as_user('bob')).json['job']['id'] == job.id
+
+    response = client.delete(url, headers=as_user('alice'))
+    assert response.status_code == 200 and response.json['cancelled'] is False
+    assert store.get(job.id).status == QUEUED
+    assert client.get(url, headers=as_user('alice')).status_code == 404
+
+    response = client.delete(url, headers=as_user('bob'))
+    assert response.json['cancelled'] is True and store.get(job.id).status == CANCELLED
+
+
+def test_job_record_hides_submitting_user(store, client):
+    job, _ = store.submit('ai_simulation', {'home_team': 'Arsenal', 'user_id': 'alice', 'tier': 'PRO'},
+                          'fp', user_id='alice')
+    store.submit('ai_simulation', {}, 'fp', user_id='bob')
+
+    payload = client.get(f'/api/v1/simulation/jobs/{job.id}', headers=as_user('bob')).json['job']['payload']
+    assert payload == {'home_team': 'Arsenal'}
+
+
+def test_job_submission_requires_auth_and_is_rate_limited(store, client, monkeypatch):
+    checks = []
+
+    def check_limit(user_id, tier, endpoint):
+        checks.append((user_id, tier, endpoint))
+        return {'allowed': len(checks) == 1, 'remaining': 0, 'reset_at': 'later'}
+
+    monkeypatch.setattr(simulation_routes.rate_limiter, 'check_limit', check_limit)
+    body = {'kind': 'v3', 'home_team': 'Arsenal', 'away_team': 'Chelsea'}
+
+    assert client.post('/api/v1/simulation/jobs', json=body).status_code == 401
+    response = client.post('/api/v1/simulation/jobs', json=body, headers=as_user('alice'))
+    assert response.status_code == 202
+    assert store.is_attached(response.json['job']['id'], 'alice')
+    assert client.post('/api/v1/simulation/jobs', json=body, headers=as_user('alice')).status_code == 429
+    assert checks == [('alice', 'BASIC', 'simulation')] * 2
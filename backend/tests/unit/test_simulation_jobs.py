@@ -0,0 +1,152 @@
+"""
+시뮬레이션 Job 큐 (SQLite) / 워커 테스트
+"""
+
+import threading
+import time
+
+import pytest
+
+from services import simulation_job_worker
+from services.simulation_job_worker import JobWorkerPool, run_job
+from services.simulation_jobs import (
+    CANCELLED,
+    FAILED,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    SimulationJobStore,
+    job_fingerprint
+)
+from utils.cancellation import call_with_cancellation
+from utils.simulation_events import SimulationEvent
+
+
+def echo_runner(payload, emit, cancel_token):
+    """스폰된 워커 프로세스에서 import 경로로 불리는 테스트 러너"""
+    emit(SimulationEvent.info(f"running {payload['home_team']}", 'started'))
+    emit(SimulationEvent.completed({'score': payload['score']}, 0.0))
+    return {'score': payload['score']}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SimulationJobStore(tmp_path / 'jobs.db')
+
+
+def test_identical_inflight_requests_share_one_job(store):
+    first, created = store.submit('v3', {'home_team': 'Arsenal'}, 'fp-1')
+    second, joined_created = store.submit('v3', {'home_team': 'Arsenal'}, 'fp-1')
+    assert created and not joined_created
+    assert second.id == first.id and second.status == QUEUED
+
+    claimed = store.claim('w1')
+    assert claimed.id == first.id and claimed.status == RUNNING and claimed.attempts == 1
+    assert store.claim('w2') is None
+    assert store.submit('v3', {}, 'fp-1')[0].id == first.id       # 실행 중에도 합류
+
+    store.finish(first.id, SUCCEEDED, result={'home_win': 0.5})
+    third, created_again = store.submit('v3', {}, 'fp-1')          # 끝난 job에는 합류하지 않음
+    assert created_again and third.id != first.id
+    assert store.get(first.id).result == {'home_win': 0.5}
+    assert store.counts() == {SUCCEEDED: 1, QUEUED: 1}
+
+    assert job_fingerprint('v3', {'home_team': 'Arsenal'}) == job_fingerprint('v3', {'home_team': 'Arsenal'})
+    assert job_fingerprint('v3', {'home_team': 'Arsenal'}) != job_fingerprint('v2_enriched', {'home_team': 'Arsenal'})
+
+
+def test_cancel_only_detaches_until_last_attached_user_leaves(store):
+    job, _ = store.submit('v3', {'home_team': 'Arsenal'}, 'fp', user_id='alice')
+    store.submit('v3', {'home_team': 'Arsenal'}, 'fp', user_id='bob')
+    store.submit('v3', {'home_team': 'Arsenal'}, 'fp')                 # 익명 요청은 연결되지 않음
+    assert store.is_attached(job.id, 'alice') and store.is_attached(job.id, 'bob')
+    assert not store.is_attached(job.id, 'mallory')
+
+    assert store.release(job.id, 'mallory') == (None, False)
+    detached, cancelled = store.release(job.id, 'alice')
+    assert not cancelled and detached.status == QUEUED
+    assert not store.is_attached(job.id, 'alice')
+
+    last, cancelled = store.release(job.id, 'bob')
+    assert cancelled and last.status == CANCELLED
+    assert store.events(job.id)[-1].data['stage'] == 'cancelled'
+
+
+def test_follow_replays_log_and_resumes_after_last_event_id(store):
+    job, _ = store.submit('v3', {}, 'fp')
+    store.claim('w1')
+
+    def work():
+        for i in range(3):
+            time.sleep(0.05)
+            store.append_event(job.id, SimulationEvent.info(f'step {i}', 'progress'))
+        store.finish(job.id, SUCCEEDED, result={})
+
+    threading.Thread(target=work).start()
+    frames = list(store.follow(job.id, poll=0.01, heartbeat_seconds=0.02))
+    events = [frame for frame in frames if not frame.startswith('event: heartbeat')]
+    assert [frame.split('\n', 1)[0] for frame in events] == ['id: 1', 'id: 2', 'id: 3']
+    assert any(frame.startswith('event: heartbeat') for frame in frames)
+
+    resumed = list(store.follow(job.id, after_seq=2, poll=0.01))
+    assert len(resumed) == 1 and resumed[0].startswith('id: 3\n') and 'step 2' in resumed[0]
+
+
+def test_run_job_records_outcomes_and_honours_cancellation(store, monkeypatch):
+    monkeypatch.setattr(simulation_job_worker, 'HEARTBEAT_SECONDS', 0.05)
+
+    store.submit('ok', {'home_team': 'A', 'score': '2-1'}, 'fp-ok')
+    assert run_job(store, store.claim('w'), echo_runner) == SUCCEEDED
+
+    def broken(payload, emit, token):
+        raise ValueError('no lineup')
+
+    failed, _ = store.submit('broken', {}, 'fp-broken')
+    assert run_job(store, store.claim('w'), broken) == FAILED
+    assert store.get(failed.id).error == 'no lineup'
+    assert store.events(failed.id)[-1].data['stage'] == 'job_error'
+
+    def slow_ai(payload, emit, token):
+        emit(SimulationEvent.info('waiting on AI', 'phase2_started'))
+        call_with_cancellation(token, time.sleep, 30)
+
+    slow, _ = store.submit('slow', {}, 'fp-slow')
+    claimed = store.claim('w')
+    threading.Timer(0.1, store.request_cancel, args=(slow.id,)).start()
+    started = time.monotonic()
+    assert run_job(store, claimed, slow_ai) == CANCELLED
+    assert time.monotonic() - started < 1.0
+    assert store.events(slow.id)[-1].data['stage'] == 'cancelled'
+
+    queued, _ = store.submit('slow', {}, 'fp-queued')
+    assert store.request_cancel(queued.id).status == CANCELLED
+    assert store.claim('w') is None
+
+
+def test_stale_running_jobs_are_requeued_then_failed(store):
+    job, _ = store.submit('v3', {}, 'fp')
+    store.claim('lost-worker')
+    assert store.recover_stale(timeout=-1) == [job.id]
+    assert store.get(job.id).status == QUEUED
+
+    store.claim('lost-again')
+    store.recover_stale(timeout=-1, max_attempts=2)
+    assert store.get(job.id).status == FAILED
+    assert store.purge(older_than=-1) == 1
+    assert store.get(job.id) is None and store.events(job.id) == []
+
+
+def test_worker_pool_runs_jobs_in_spawned_processes(store):
+    pool = JobWorkerPool(store, num_workers=2,
+                         runners={'echo': 'tests.unit.test_simulation_jobs:echo_runner'})
+    jobs = [store.submit('echo', {'home_team': f'T{i}', 'score': f'{i}-0'}, f'fp-{i}')[0] for i in range(4)]
+    unknown, _ = store.submit('nope', {}, 'fp-unknown')
+    pool.start()
+    try:
+        finished = [store.wait(job.id, timeout=30, poll=0.05) for job in jobs]
+        assert [job.status for job in finished] == [SUCCEEDED] * 4
+        assert [job.result['score'] for job in finished] == ['0-0', '1-0', '2-0', '3-0']
+        assert store.wait(unknown.id, timeout=10, poll=0.05).status == FAILED
+        assert pool.alive == 2
+    finally:
+        pool.stop()
@@ -0,0 +1,122 @@
+"""
+asyncio SSE 시뮬레이션 스트림 / 협조적 취소 테스트
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from services.simulation_stream import SimulationStreamManager, StreamLimits
+from simulation.v2.event_simulation_engine import create_match_parameters
+from simulation.v2.parallel_executor import ExecutorConfig, MonteCarloExecutor
+from simulation.v2.scenario import Scenario
+from simulation.v2.scenario_guide import ScenarioGuide
+from utils.cancellation import CancellationToken, SimulationCancelled, call_with_cancellation
+from utils.simulation_events import SimulationEvent
+
+
+async def collect(stream, limit=None):
+    frames = []
+    async for frame in stream:
+        frames.append(frame)
+        if limit and len(frames) >= limit:
+            await stream.aclose()
+            break
+    return frames
+
+
+def event_types(frames):
+    return [frame.split('\n', 1)[0].removeprefix('event: ') for frame in frames]
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_stream_forwards_events_with_heartbeats_and_limits():
+    manager = SimulationStreamManager(StreamLimits(max_concurrent=1, heartbeat_seconds=0.05))
+
+    def work(emit, token):
+        emit(SimulationEvent.info('loading'))
+        time.sleep(0.2)                                   # AI 호출 대기
+        emit(SimulationEvent.completed({'success': True}, 0.2))
+
+    async def main():
+        first = manager.stream(work)
+        started = asyncio.ensure_future(collect(first))
+        await asyncio.sleep(0.05)
+        rejected = await collect(manager.stream(work))    # 슬롯 1개 사용 중
+        return await started, rejected
+
+    frames, rejected = asyncio.run(main())
+    types = event_types(frames)
+    assert types[0] == 'info' and types[-1] == 'completed'
+    assert 'heartbeat' in types
+    assert event_types(rejected) == ['error'] and 'stream_limit' in rejected[0]
+    assert wait_until(lambda: manager.active == 0)
+    manager.shutdown()
+
+
+def test_abandoned_stream_cancels_worker_within_a_second():
+    manager = SimulationStreamManager(StreamLimits(channel_size=2, heartbeat_seconds=5))
+    emitted = []
+    finished = threading.Event()
+
+    def slow_llm_call():
+        time.sleep(30)
+
+    def work(emit, token):
+        try:
+            for i in range(100):
+                emit(SimulationEvent.info(f'event {i}'))
+                emitted.append(i)
+            call_with_cancellation(token, slow_llm_call)
+        finally:
+            finished.set()
+
+    async def main():
+        stream = manager.stream(work)
+        frames = [await stream.__anext__()]
+        await asyncio.sleep(0.3)
+        backlog = len(emitted)                            # 채널이 가득 차면 워커가 멈춤
+        frames += await collect(stream, limit=1)          # 두 번째 이벤트 후 연결 종료
+        return frames, backlog
+
+    frames, backlog = asyncio.run(main())
+    assert len(frames) == 2
+    assert backlog <= 4
+
+    closed = time.monotonic()
+    assert finished.wait(1.5)
+    assert time.monotonic() - closed < 1.0
+    assert wait_until(lambda: manager.active == 0)
+    assert len(emitted) < 100
+    manager.shutdown()
+
+
+def test_call_with_cancellation_and_executor_checkpoints():
+    token = CancellationToken()
+    assert call_with_cancellation(token, lambda x: x * 2, 21) == 42
+
+    threading.Timer(0.1, token.cancel, args=("client disconnected",)).start()
+    started = time.monotonic()
+    with pytest.raises(SimulationCancelled, match="client disconnected"):
+        call_with_cancellation(token, time.sleep, 30)
+    assert time.monotonic() - started < 1.0
+
+    params = create_match_parameters({"attack_strength": 80, "defense_strength": 78},
+                                     {"attack_strength": 76, "defense_strength": 75})
+    guide = ScenarioGuide(Scenario(id="T", name="t", reasoning="", events=[], expected_probability=1.0))
+    for mode in ("serial", "thread"):
+        executor = MonteCarloExecutor(ExecutorConfig(mode=mode, max_workers=2, chunk_size=50))
+        with pytest.raises(SimulationCancelled):
+            executor.run_many([(params, guide, 500, 1)], cancel_token=token)
+        assert executor.run_many([(params, guide, 100, 1)])[0].n_runs == 100
+        executor.shutdown()
@@ -0,0 +1,117 @@
+"""
+SimulationPipeline 추측 실행(pipelined) 테스트
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from simulation.v2 import simulation_pipeline as pipeline_module
+from simulation.v2.event_simulation_engine import create_match_parameters
+from simulation.v2.scenario import EventType, Scenario, ScenarioEvent
+from simulation.v2.simulation_pipeline import PipelineConfig, SimulationPipeline
+from simulation.v2.speculative import SpeculativeValidator
+from utils.cancellation import CancellationToken, SimulationCancelled
+
+
+class StubGenerator:
+    def generate_scenarios(self, match_context, **kwargs):
+        return True, [
+            Scenario(id=f"SYNTH_00{i}", name=f"S{i}", reasoning="test", expected_probability=0.5,
+                     events=[ScenarioEvent(minute_range=(0, 30), type=EventType.GOAL, team=team, probability_boost=1.5)])
+            for i, team in enumerate(("home", "away"), 1)
+        ], None
+
+
+class StubAnalyzer:
+    """1회차: 조정 / 2회차: 조정 없음 / 3회차: 수렴"""
+
+    def analyze_and_adjust(self, scenarios, validation_results, iteration):
+        issues = []
+        if iteration == 1:
+            issues = [{'scenario_id': 'SYNTH_001',
+                       'adjustment': {'parameter': 'events[0].probability_boost', 'proposed_value': 2.5}}]
+        return True, {
+            'analysis': {'issues': issues},
+            'convergence': {'converged': iteration >= 3, 'confidence': 0.9 if iteration >= 3 else 0.4}
+        }, None
+
+
+def run_pipeline(monkeypatch, pipelined, baseline=False):
+    monkeypatch.setattr(pipeline_module, 'get_scenario_generator', StubGenerator)
+    monkeypatch.setattr(pipeline_module, 'get_analyzer', StubAnalyzer)
+    pipeline = SimulationPipeline(PipelineConfig(initial_runs=40, final_runs=200, seed=7,
+                                                 pipelined=pipelined, baseline=baseline))
+    monkeypatch.setattr(pipeline, '_build_ai_final_report', lambda *args: (False, None, 'offline'))
+
+    params = create_match_parameters({"attack_strength": 80, "defense_strength": 78},
+                                     {"attack_strength": 76, "defense_strength": 75})
+    success, output, error = pipeline.run({'home_team': 'H', 'away_team': 'A'}, params)
+    assert success, error
+    return output
+
+
+def test_pipelined_run_matches_sequential_run(monkeypatch):
+    sequential = run_pipeline(monkeypatch, pipelined=False)
+    pipelined = run_pipeline(monkeypatch, pipelined=True)
+
+    assert len(pipelined['history']) == len(sequential['history']) == 3
+    assert pipelined['final_results'] == sequential['final_results']
+    assert [h['validation_results'] for h in pipelined['history']] == \
+        [h['validation_results'] for h in sequential['history']]
+    assert pipelined['scenarios'] == sequential['scenarios']
+
+    # 1회차 조정 후 추측은 버려지고, 조정 없는 2회차 후 3회차/최종 검증은 재사용
+    stats = pipelined['metadata']['speculation']
+    assert stats['used'] == 2 and stats['discarded'] >= 2
+    assert sequential['metadata']['speculation'] == {'submitted': 0, 'used': 0, 'discarded': 0}
+    assert pipelined['baseline_results'] is None           # 기준선은 opt-in
+
+    with_baseline = run_pipeline(monkeypatch, pipelined=True, baseline=True)
+    assert with_baseline['final_results'] == sequential['final_results']
+    assert with_baseline['metadata']['speculation']['used'] == 3
+    assert with_baseline['baseline_results']['scenario_id'] == 'BASELINE'
+    assert sum(with_baseline['baseline_results']['win_rate'].values()) == pytest.approx(1.0)
+
+
+class EndlessValidator:
+    """취소될 때까지 chunk를 도는 검증기 (종료 시각 기록)"""
+
+    def __init__(self):
+        self.exited = threading.Event()
+
+    def validate_scenarios(self, scenarios, base_params, n, seed, cancel_token=None):
+        try:
+            while True:
+                cancel_token.raise_if_cancelled()
+                time.sleep(0.01)
+        finally:
+            self.exited.set()
+
+
+def test_discarded_speculation_stops_running_work():
+    params = create_match_parameters({"attack_strength": 80, "defense_strength": 78},
+                                     {"attack_strength": 76, "defense_strength": 75})
+    seed = np.random.SeedSequence(1)
+
+    validator = EndlessValidator()
+    pipeline_token = CancellationToken()
+    speculative = SpeculativeValidator(validator, cancel_token=pipeline_token)
+    speculative.submit('final', [], params, 3000, seed)
+    time.sleep(0.05)
+    speculative.close()
+    assert validator.exited.wait(1.0)                   # close 후에도 CPU를 쓰지 않음
+    assert not pipeline_token.cancelled                 # 자식 취소는 파이프라인에 영향 없음
+
+    pipeline_token = CancellationToken()
+    validator = EndlessValidator()
+    speculative = SpeculativeValidator(validator, cancel_token=pipeline_token)
+    speculative.submit('final', [], params, 3000, seed)
+    pipeline_token.cancel("client disconnected")        # 파이프라인 취소는 추측 작업에 전파
+    assert validator.exited.wait(1.0)
+    with pytest.raises(SimulationCancelled, match="client disconnected"):
+        speculative._pending['final'].future.result()
+    speculative.close()
+    assert pipeline_token.child().cancelled
@@ -0,0 +1,73 @@
+"""
+SquadStore 테스트
+"""
+
+import json
+
+from data.squad_data import SQUAD_DATA, SquadStore, normalize_name, save_squad_data
+
+SQUADS = {
+    'Arsenal': [
+        {'id': 1, 'name': 'Martin Ødegaard', 'position': 'MF'},
+        {'id': 2, 'name': 'Bukayo Saka', 'position': 'FW'},
+    ],
+    'Manchester City': [
+        {'id': 3, 'name': 'Joško Gvardiol', 'position': 'DF'},
+        {'id': 2, 'name': 'Duplicate Saka', 'position': 'FW'},
+    ],
+}
+
+
+def write_squads(path, squads):
+    path.write_text(json.dumps({'season': '2025-26', 'teams': squads}), encoding='utf-8')
+
+
+def test_lazy_load_and_mapping_interface(tmp_path):
+    path = tmp_path / 'squad_data.json'
+    store = SquadStore(str(path))
+
+    # 생성만으로는 파일을 읽지 않음
+    write_squads(path, SQUADS)
+
+    assert list(store) == ['Arsenal', 'Manchester City']
+    assert 'Arsenal' in store and 'Chelsea' not in store
+    assert store['Arsenal'][1]['name'] == 'Bukayo Saka'
+    assert store.get('Chelsea', []) == []
+    assert store.metadata == {'season': '2025-26'}
+
+
+def test_player_and_name_indexes(tmp_path):
+    path = tmp_path / 'squad_data.json'
+    write_squads(path, SQUADS)
+    store = SquadStore(str(path))
+
+    assert store.get_player(3)['name'] == 'Joško Gvardiol'
+    assert store.team_of(3) == 'Manchester City'
+    # 중복 ID는 먼저 나온 팀
+    assert store.get_player(2)['name'] == 'Bukayo Saka' and store.team_of(2) == 'Arsenal'
+    assert store.get_player(999) is None
+
+    assert [p['id'] for p in store.find_by_name('josko  GVARDIOL')] == [3]
+    assert store.find_by_name('Joško Gvardiol', team_name='Arsenal') == []
+    assert normalize_name(' Bukayo   SAKA ') == 'bukayo saka'
+
+
+def test_save_squad_data_reloads_store(tmp_path):
+    path = tmp_path / 'squad_data.json'
+    write_squads(path, SQUADS)
+    store = SquadStore(str(path))
+    assert len(store) == 2
+
+    save_squad_data({'Chelsea': [{'id': 9, 'name': 'Cole Palmer'}]}, source='test', path=str(path))
+    store.reload()
+
+    assert list(store) == ['Chelsea']
+    assert store.get_player(9)['name'] == 'Cole Palmer'
+    assert store.metadata['source'] == 'test'
+
+
+def test_bundled_squad_data_matches_team_lists():
+    for team_name, players in SQUAD_DATA.items():
+        for player in players:
+            assert SQUAD_DATA.get_player(player['id']) is not None
+    assert len(SQUAD_DATA) == 20
@@ -0,0 +1,114 @@
+"""
+Unit Tests for Streaming Aggregation
+EPL Match Predictor v3.0
+
+Tests Cover:
+1. Per-run updates match list-based statistics
+2. Batch chunks and merges match a single pass
+"""
+
+import pytest
+import sys
+import os
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from utils.rng import RNGProvider
+from simulation.v2.scenario import Scenario, ScenarioEvent, EventType
+from simulation.v2.scenario_guide import ScenarioGuide
+from simulation.v2.event_simulation_engine import (
+    EventBasedSimulationEngine,
+    BatchSimulationResult,
+    create_match_parameters
+)
+from simulation.v2.streaming_aggregator import SimulationAccumulator
+
+
+@pytest.fixture
+def guide():
+    return ScenarioGuide(Scenario(
+        id="TEST_001",
+        name="Second-half push",
+        reasoning="test",
+        events=[
+            ScenarioEvent(minute_range=(46, 89), type=EventType.SHOT_ON_TARGET, team="away", probability_boost=2.0),
+            ScenarioEvent(minute_range=(0, 89), type=EventType.GOAL, team="home", probability_boost=1.2),
+        ],
+        expected_probability=0.5
+    ))
+
+
+@pytest.fixture
+def params():
+    return create_match_parameters(
+        {"attack_strength": 82, "defense_strength": 77},
+        {"attack_strength": 79, "defense_strength": 74}
+    )
+
+
+class TestPerRunUpdates:
+    """Test add_result against list-based statistics"""
+
+    def test_matches_numpy_statistics(self, params, guide, assert_near):
+        """Test online moments equal numpy over the retained results"""
+        # Given
+        engine = EventBasedSimulationEngine(RNGProvider(3))
+        results = [engine.simulate_match(params, guide) for _ in range(300)]
+
+        # When
+        accumulator = SimulationAccumulator(["shot_on_target", "goal"])
+        for result in results:
+            accumulator.add_result(result)
+
+        # Then
+        home = np.array([r["final_score"]["home"] for r in results])
+        away = np.array([r["final_score"]["away"] for r in results])
+        adherence = np.array([r["narrative_adherence"] for r in results])
+
+        assert accumulator.n_runs == 300
+        assert accumulator.outcomes["home_win"] == int(np.sum(home > away))
+        assert_near(accumulator.avg_score()["home"], home.mean(), 1e-9)
+        assert_near(accumulator.score_variance()["away"], away.var(), 1e-9)
+        assert_near(accumulator.adherence_mean, adherence.mean(), 1e-9)
+        assert_near(accumulator.adherence_std(), adherence.std(), 1e-9)
+        assert accumulator.adherence_max == adherence.max()
+        assert sum(accumulator.goal_timing) == int((home + away).sum())
+        assert sum(accumulator.score_histogram.values()) == 300
+
+
+class TestBatchAndMerge:
+    """Test chunked accumulation equals a single pass"""
+
+    def test_chunks_merge_to_whole(self, params, guide, assert_near):
+        """Test merging per-chunk accumulators equals accumulating the concatenated batch"""
+        # Given
+        engine = EventBasedSimulationEngine()
+        chunks = [engine.simulate_batch(params, guide, 250, seed=seed) for seed in range(4)]
+        expected_types = ["shot_on_target", "goal"]
+
+        # When
+        merged = SimulationAccumulator(expected_types)
+        for chunk in chunks:
+            merged.merge(SimulationAccumulator.from_batch(chunk, expected_types))
+        whole = SimulationAccumulator.from_batch(BatchSimulationResult.merge(chunks), expected_types)
+
+        # Then
+        assert merged.n_runs == whole.n_runs == 1000
+        assert merged.outcomes == whole.outcomes
+        assert merged.score_histogram == whole.score_histogram
+        assert merged.goal_timing == whole.goal_timing
+        assert merged.event_type_counts == whole.event_type_counts
+        assert merged.expected_event_runs == whole.expected_event_runs
+        assert_near(merged.adherence_mean, whole.adherence_mean, 1e-12)
+        assert_near(merged.adherence_std(), whole.adherence_std(), 1e-12)
+
+    def test_empty_merge_is_noop(self):
+        """Test merging an empty accumulator changes nothing"""
+        accumulator = SimulationAccumulator()
+        accumulator.merge(SimulationAccumulator())
+
+        assert accumulator.n_runs == 0
+        assert accumulator.adherence_std() == 0.0
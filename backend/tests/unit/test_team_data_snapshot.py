@@ -0,0 +1,109 @@
+"""
+TeamDataSnapshot 테스트
+"""
+
+import json
+import os
+
+import pytest
+
+from ai.enriched_data_models import FormationTactics
+from services.team_data_snapshot import TeamDataSnapshot
+
+TACTICS = {
+    'name': '공격형 4-3-3',
+    'style': '공격적',
+    'buildup': '짧은 패스',
+    'pressing': '전방 압박',
+    'space_utilization': '측면',
+    'strengths': ['측면 공격'],
+    'weaknesses': ['뒷공간']
+}
+
+
+def write_json(path, data, mtime_ns=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_get_returns_copy_and_reuses_parse(tmp_path, monkeypatch):
+    write_json(tmp_path / 'lineups' / 'Arsenal.json', {'lineup': {'GK': 1}})
+    snapshot = TeamDataSnapshot(str(tmp_path))
+
+    first = snapshot.get('lineups', 'Arsenal')
+    first['lineup']['GK'] = 99
+
+    opened = []
+    monkeypatch.setattr('builtins.open', lambda *args, **kwargs: opened.append(args) or None)
+    assert snapshot.get('lineups', 'Arsenal') == {'lineup': {'GK': 1}}
+    assert opened == []
+    assert snapshot.get('lineups', 'Chelsea') is None
+
+
+def test_changed_file_is_reparsed_and_bumps_version(tmp_path):
+    path = tmp_path / 'formations' / 'Arsenal.json'
+    write_json(path, {'formation': '4-3-3'}, mtime_ns=1_000_000_000)
+    snapshot = TeamDataSnapshot(str(tmp_path))
+
+    assert snapshot.get('formations', 'Arsenal')['formation'] == '4-3-3'
+    assert snapshot.version == 0
+
+    write_json(path, {'formation': '4-4-2'}, mtime_ns=2_000_000_000)
+    assert snapshot.get('formations', 'Arsenal')['formation'] == '4-4-2'
+    assert snapshot.version == 1
+
+    path.unlink()
+    assert snapshot.get('formations', 'Arsenal') is None
+    assert snapshot.version == 2
+
+
+def test_invalidate_forces_reload_with_same_stamp(tmp_path):
+    path = tmp_path / 'team_strength' / 'Arsenal.json'
+    write_json(path, {'comment': 'aaaa'}, mtime_ns=1_000_000_000)
+    snapshot = TeamDataSnapshot(str(tmp_path))
+    snapshot.get('team_strength', 'Arsenal')
+
+    # 같은 크기, 같은 mtime으로 덮어쓰면 stat으로는 변경을 알 수 없음
+    write_json(path, {'comment': 'bbbb'}, mtime_ns=1_000_000_000)
+    assert snapshot.get('team_strength', 'Arsenal')['comment'] == 'aaaa'
+
+    snapshot.invalidate(str(path))
+    assert snapshot.get('team_strength', 'Arsenal')['comment'] == 'bbbb'
+    assert snapshot.version == 1
+
+
+def test_formation_tactics_parsed_into_typed_objects(tmp_path):
+    write_json(tmp_path / 'formation_tactics.json', {
+        'formation_tactics': {'4-3-3': TACTICS, 'broken': {'name': 'x'}}
+    })
+    snapshot = TeamDataSnapshot(str(tmp_path))
+
+    tactics = snapshot.formation_tactics('4-3-3')
+    assert isinstance(tactics, FormationTactics)
+    assert tactics.formation == '4-3-3' and tactics.strengths == ['측면 공격']
+    assert snapshot.formation_tactics('4-3-3') is tactics
+    assert snapshot.formation_tactics('broken') is None
+    assert snapshot.read_json(str(tmp_path / 'formation_tactics.json'))['formation_tactics']['4-3-3'] == TACTICS
+
+
+def test_warm_parses_all_team_files(tmp_path):
+    for kind in ('formations', 'lineups', 'team_strength'):
+        for team in ('Arsenal', 'Chelsea'):
+            write_json(tmp_path / kind / f'{team}.json', {'team_name': team})
+    write_json(tmp_path / 'formation_tactics.json', {'formation_tactics': {'4-3-3': TACTICS}})
+
+    assert TeamDataSnapshot(str(tmp_path)).warm() == 7
+
+
+def test_frozen_read_is_shared_and_read_only(tmp_path):
+    write_json(tmp_path / 'lineups' / 'Arsenal.json', {'lineup': {'GK': 1}, 'bench': [2, 3]})
+    snapshot = TeamDataSnapshot(str(tmp_path))
+
+    frozen = snapshot.get_frozen('lineups', 'Arsenal')
+    assert snapshot.get_frozen('lineups', 'Arsenal') is frozen
+    assert frozen['lineup'] == {'GK': 1} and frozen['bench'] == (2, 3)
+    with pytest.raises(TypeError):
+        frozen['lineup']['GK'] = 99
+    assert snapshot.get('lineups', 'Arsenal') == {'lineup': {'GK': 1}, 'bench': [2, 3]}
@@ -0,0 +1,194 @@
+"""
+TieredCache 테스트
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from flask import Flask, jsonify, request
+
+from infrastructure.cache import codec
+from infrastructure.cache.tiered_cache import TieredCache
+from infrastructure.cache.view_cache import cached_view
+
+
+class FakeRedisCache:
+    """RedisCache와 같은 get/set/delete 인터페이스 (msgpack codec으로 직렬화)"""
+
+    def __init__(self, fail_writes=False):
+        self.store = {}
+        self.fail_writes = fail_writes
+        self.gets = 0
+
+    def get(self, key, deserializer='json'):
+        self.gets += 1
+        payload = self.store.get(key)
+        return None if payload is None else codec.decode(payload)
+
+    def set(self, key, value, ttl=None, serializer='json'):
+        if self.fail_writes:
+            return False
+        self.store[key] = codec.encode(value)
+        return True
+
+    def delete(self, key):
+        self.store.pop(key, None)
+        return True
+
+    def delete_pattern(self, pattern):
+        keys = [key for key in self.store if key.startswith(pattern.rstrip('*'))]
+        for key in keys:
+            del self.store[key]
+        return len(keys)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_codec_round_trips_plain_and_rich_values():
+    plain = {'id': 7, 'scores': {1: 0.5}, 'raw': b'\x00\x01', 'tags': ['a'], 'none': None}
+    assert codec.decode(codec.encode(plain)) == plain
+
+    rich = {'at': datetime(2025, 1, 1, 12, 0)}
+    assert codec.decode(codec.encode(rich)) == rich
+
+    with pytest.raises(ValueError):
+        codec.decode(b'x123')
+
+
+def test_local_tier_expires_and_stays_bounded():
+    clock = FakeClock()
+    cache = TieredCache('t', ttl=10, max_entries=2, clock=clock)
+
+    cache.set(cache.key('a'), 1)
+    cache.set(cache.key('b'), 2)
+    cache.get(cache.key('a'))
+    cache.set(cache.key('c'), 3)
+    assert cache.get(cache.key('b')) is None          # LRU 제거
+    assert cache.get(cache.key('a')) == 1
+
+    clock.now += 11
+    assert cache.get(cache.key('a')) is None          # TTL 만료
+    assert len(cache.local) == 1
+    assert cache.stats.local_hits == 2 and cache.stats.misses == 2
+
+
+def test_redis_tier_shared_between_processes_and_promoted_locally():
+    redis_cache = FakeRedisCache()
+    writer = TieredCache('t', redis_cache=redis_cache, ttl=600)
+    reader = TieredCache('t', redis_cache=redis_cache, ttl=600)
+    key = writer.key('match', 12)
+
+    writer.set(key, {'home': 'Arsenal', 'probs': [0.5, 0.3, 0.2]})
+
+    assert reader.get(key) == {'home': 'Arsenal', 'probs': [0.5, 0.3, 0.2]}
+    assert reader.get(key) == {'home': 'Arsenal', 'probs': [0.5, 0.3, 0.2]}
+    assert redis_cache.gets == 1                      # 두 번째는 로컬 계층
+    assert reader.stats.remote_hits == 1 and reader.stats.local_hits == 1
+    assert reader.local_ttl == 60
+
+    reader.clear()
+    assert writer.get(key) == {'home': 'Arsenal', 'probs': [0.5, 0.3, 0.2]}  # writer 로컬 계층은 남음
+    assert redis_cache.store == {}
+
+
+def test_failed_redis_write_bypasses_remote_tier_for_a_while():
+    clock = FakeClock()
+    redis_cache = FakeRedisCache(fail_writes=True)
+    cache = TieredCache('t', redis_cache=redis_cache, remote_retry_after=30, clock=clock)
+
+    cache.set(cache.key('a'), 1)
+    assert cache.get(cache.key('missing')) is None
+    assert redis_cache.gets == 0 and cache.stats.remote_errors == 1
+
+    clock.now += 31
+    assert cache.get(cache.key('missing')) is None
+    assert redis_cache.gets == 1
+
+
+def test_get_or_set_runs_one_computation_for_concurrent_misses():
+    cache = TieredCache('t', ttl=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return {'value': 42}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_set('k', compute))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{'value': 42}] * 8
+    assert cache.stats.computes == 1
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_set('boom', lambda: (_ for _ in ()).throw(RuntimeError('x')))
+    assert cache.get('boom') is None
+
+
+def test_cached_view_stores_only_successful_responses():
+    app = Flask(__name__)
+    cache = TieredCache('views', ttl=60)
+    renders = []
+
+    @app.route('/items')
+    @cached_view(cache, ttl=60, query_string=True)
+    def items():
+        renders.append(request.args.get('page'))
+        if request.args.get('page') == 'bad':
+            return jsonify({'error': 'bad'}), 400
+        return jsonify({'page': request.args.get('page')})
+
+    client = app.test_client()
+    assert client.get('/items?page=1').get_json() == {'page': '1'}
+    response = client.get('/items?page=1')
+    assert response.get_json() == {'page': '1'} and response.mimetype == 'application/json'
+    assert client.get('/items?page=2').get_json() == {'page': '2'}
+    assert client.get('/items?page=bad').status_code == 400
+    assert client.get('/items?page=bad').status_code == 400
+    assert renders == ['1', '2', 'bad', 'bad']
+
+
+def test_cached_view_waiters_do_not_share_uncacheable_responses():
+    app = Flask(__name__)
+    cache = TieredCache('views', ttl=60)
+    release = threading.Event()
+    renders = []
+
+    @app.route('/flaky')
+    @cached_view(cache)
+    def flaky():
+        renders.append(threading.get_ident())
+        if len(renders) == 1:
+            release.wait(2)                             # 나머지 요청이 이 렌더를 기다리게 함
+        return jsonify({'error': 'upstream down'}), 500
+
+    responses = []
+
+    def call():
+        with app.test_request_context('/flaky'):
+            responses.append(app.view_functions['flaky']())
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert [response.status_code for response in responses] == [500] * 4
+    assert len({id(response) for response in responses}) == 4
+    assert len(renders) == 4 and cache.stats.coalesced == 3
@@ -0,0 +1,124 @@
+"""
+협조적 취소 (Cooperative Cancellation)
+장시간 시뮬레이션을 중간에 멈추기 위한 토큰과 체크포인트
+
+스레드는 외부에서 강제로 멈출 수 없으므로, 작업 쪽이 chunk/AI 호출 경계에서
+토큰을 확인하고 SimulationCancelled를 던져 스스로 빠져나온다.
+
+- CancellationToken: 취소 신호 (스레드 간 공유, threading.Event 기반)
+- call_with_cancellation: 블로킹 호출(LLM 요청 등)을 별도 스레드에서 실행하고,
+  취소되면 결과를 기다리지 않고 즉시 SimulationCancelled를 던진다
+  (진행 중인 요청은 백그라운드에서 끝나고 결과는 버려짐)
+"""
+
+import threading
+import weakref
+from concurrent.futures import Future, wait
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+# 취소 확인 주기 (초)
+POLL_INTERVAL = 0.2
+
+
+class SimulationCancelled(Exception):
+    """취소된 작업이 체크포인트에서 던지는 예외"""
+
+
+class CancellationToken:
+    """
+    취소 신호
+
+    Usage:
+        token = CancellationToken()
+        # 작업 스레드
+        for chunk in chunks:
+            token.raise_if_cancelled()
+            ...
+        # 다른 스레드
+        token.cancel("client disconnected")
+
+    child()로 만든 토큰은 부모가 취소되면 함께 취소되고, 자식만 따로 취소할 수도 있다
+    (버려진 추측 실행 등 일부 작업만 중단).
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._children = weakref.WeakSet()
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """취소 (처음 사유만 기록, 자식 토큰도 취소)"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            children = list(self._children)
+        for child in children:
+            child.cancel(reason)
+
+    def child(self) -> 'CancellationToken':
+        """이 토큰이 취소되면 함께 취소되는 자식 토큰 (자식 취소는 부모에 영향 없음)"""
+        child = CancellationToken()
+        with self._lock:
+            if not self._event.is_set():
+                self._children.add(child)
+                return child
+        child.cancel(self.reason)
+        return child
+
+    def raise_if_cancelled(self) -> None:
+        """체크포인트: 취소됐으면 SimulationCancelled"""
+        if self._event.is_set():
+            raise SimulationCancelled(self.reason)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """취소될 때까지 최대 timeout초 대기 (취소됐으면 True)"""
+        return self._event.wait(timeout)
+
+
+def checkpoint(token: Optional[CancellationToken]) -> None:
+    """token이 있으면 취소 여부 확인 (None이면 아무것도 하지 않음)"""
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def call_with_cancellation(
+    token: Optional[CancellationToken],
+    fn: Callable[..., T],
+    *args,
+    **kwargs
+) -> T:
+    """
+    fn(*args, **kwargs) 결과 (취소되면 POLL_INTERVAL 안에 SimulationCancelled)
+
+    token이 None이면 현재 스레드에서 바로 호출한다.
+    """
+    if token is None:
+        return fn(*args, **kwargs)
+    token.raise_if_cancelled()
+
+    future: Future = Future()
+
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, name='cancellable-call', daemon=True).start()
+
+    while True:
+        done, _ = wait([future], timeout=POLL_INTERVAL)
+        if done:
+            return future.result()
+        token.raise_if_cancelled()
@@ -0,0 +1,300 @@
+"""
+HTTP Client
+외부 피드(FPL, The Odds API, API-Football 등) 공용 HTTP 클라이언트
+
+- 연결 풀 / keep-alive: 프로세스 전체가 requests.Session 하나를 공유
+- 요청 병합: 같은 URL을 동시에 요청하면 한 번만 가져오고 결과를 나눠 씀
+- 조건부 요청: 저장된 ETag / Last-Modified로 If-None-Match / If-Modified-Since를
+  보내고, 304면 캐시된 본문을 재사용
+- stale-while-revalidate: ttl이 지났어도 stale_ttl 안이면 캐시를 바로 반환하고
+  백그라운드에서 갱신 (갱신이 실패하면 남아 있는 캐시를 계속 사용)
+
+Flask(동기) 핸들러와 서비스에서 쓰므로 스레드 기반으로 동작한다.
+FPL_API_URL 환경변수로 FPL 호스트를 바꿀 수 있어 테스트에서는 로컬 스텁 서버를 쓴다.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+FPL_API_URL = os.getenv('FPL_API_URL', 'https://fantasy.premierleague.com/api').rstrip('/')
+
+# FPL 피드 캐시 (초): ttl 동안은 그대로, 이후 stale_ttl 동안은 백그라운드 갱신
+FPL_CACHE_TTL = int(os.getenv('FPL_CACHE_TTL', '600'))
+FPL_STALE_TTL = int(os.getenv('FPL_STALE_TTL', '3000'))
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_HEADERS = {'User-Agent': 'EPL-Predictor/1.0', 'Accept-Encoding': 'gzip, deflate'}
+
+
+@dataclass
+class HTTPResponse:
+    """캐시 가능한 응답 (data는 공유 객체이므로 수정하지 않는다)"""
+    url: str
+    status_code: int
+    data: Any                           # as_json이면 파싱된 JSON, 아니면 bytes
+    headers: CaseInsensitiveDict = field(default_factory=CaseInsensitiveDict)
+    fetched_at: float = 0.0             # time.monotonic()
+    from_cache: bool = False
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get('ETag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get('Last-Modified')
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+class HTTPClient:
+    """
+    풀링 + 요청 병합 + 조건부 요청 + stale-while-revalidate HTTP GET 클라이언트
+
+    Usage:
+        client = get_http_client()
+        data = client.get_json(url, ttl=600, stale_ttl=3000)
+        response = client.fetch(url, params={...}, headers={...})  # 헤더/상태 필요할 때
+    """
+
+    def __init__(self,
+                 session: Optional[requests.Session] = None,
+                 pool_maxsize: int = 20,
+                 retries: int = 2,
+                 max_entries: int = 256,
+                 timeout: float = DEFAULT_TIMEOUT):
+        """
+        Args:
+            session: 사용할 세션 (기본: 풀/재시도 설정된 새 세션)
+            pool_maxsize: 호스트별 최대 keep-alive 연결 수
+            retries: 연결 오류 / 502·503·504 재시도 횟수
+            max_entries: 캐시할 응답 수 (LRU)
+            timeout: 기본 요청 타임아웃 (초)
+        """
+        self.session = session or self._build_session(pool_maxsize, retries)
+        self.max_entries = max_entries
+        self.timeout = timeout
+
+        self._entries: 'OrderedDict[Tuple, HTTPResponse]' = OrderedDict()
+        self._inflight: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.stats = {'hits': 0, 'stale_hits': 0, 'fetches': 0, 'not_modified': 0,
+                      'coalesced': 0, 'errors': 0}
+
+    @staticmethod
+    def _build_session(pool_maxsize: int, retries: int) -> requests.Session:
+        session = requests.Session()
+        retry = Retry(total=retries, backoff_factor=0.3,
+                      status_forcelist=(502, 503, 504), allowed_methods=frozenset(['GET']))
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(DEFAULT_HEADERS)
+        return session
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get_json(self, url: str, **kwargs) -> Any:
+        """fetch(...).data (파싱된 JSON)"""
+        return self.fetch(url, **kwargs).data
+
+    def fetch(self,
+              url: str,
+              params: Optional[Dict] = None,
+              headers: Optional[Dict[str, str]] = None,
+              ttl: float = 0,
+              stale_ttl: float = 0,
+              timeout: Optional[float] = None,
+              as_json: bool = True) -> HTTPResponse:
+        """
+        GET 요청 (캐시/병합/조건부 요청 적용)
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터 (캐시 키에 포함)
+            headers: 추가 헤더 (캐시 키에 포함되지 않음)
+            ttl: 이 시간(초) 동안은 요청 없이 캐시 반환
+            stale_ttl: ttl 이후 이 시간 동안은 캐시 반환 + 백그라운드 갱신,
+                0보다 크면 요청 실패 시에도 남아 있는 캐시 반환
+            timeout: 요청 타임아웃 (기본: 클라이언트 설정)
+            as_json: True면 JSON 파싱, False면 bytes
+
+        Raises:
+            requests.RequestException: 요청 실패 / 2xx·304 외 응답 (사용할 캐시가 없을 때)
+        """
+        key = self._key(url, params, as_json)
+        request = (url, params, headers, timeout, as_json)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = entry.age
+            if age < ttl:
+                self.stats['hits'] += 1
+                return replace(entry, from_cache=True)
+            if age < ttl + stale_ttl:
+                self.stats['stale_hits'] += 1
+                self._revalidate_in_background(key, request)
+                return replace(entry, from_cache=True)
+
+        try:
+            return self._fetch_coalesced(key, request)
+        except requests.RequestException as e:
+            self.stats['errors'] += 1
+            entry = self._entries.get(key)
+            if entry is not None and stale_ttl > 0:
+                logger.warning(f"HTTP GET {url} failed, serving cached response ({entry.age:.0f}s old): {e}")
+                return replace(entry, from_cache=True)
+            raise
+
+    # ------------------------------------------------------------------
+    # 관리
+    # ------------------------------------------------------------------
+
+    def invalidate(self, url: Optional[str] = None):
+        """URL(또는 전체) 캐시 제거 (조건부 요청용 ETag도 함께 제거)"""
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == url]:
+                    del self._entries[key]
+
+    def close(self):
+        """백그라운드 갱신 중단, 연결 풀 정리"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.session.close()
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(url: str, params: Optional[Dict], as_json: bool) -> Tuple:
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return (url, query, as_json)
+
+    def _fetch_coalesced(self, key: Tuple, request: Tuple) -> HTTPResponse:
+        """같은 키의 요청이 진행 중이면 그 결과를 기다리고, 아니면 직접 요청"""
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            self.stats['coalesced'] += 1
+            return future.result()
+
+        try:
+            response = self._request(key, *request)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _request(self, key: Tuple, url: str, params: Optional[Dict], headers: Optional[Dict[str, str]],
+                 timeout: Optional[float], as_json: bool) -> HTTPResponse:
+        cached = self._entries.get(key)
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                request_headers['If-Modified-Since'] = cached.last_modified
+
+        response = self.session.get(url, params=params, headers=request_headers,
+                                    timeout=timeout or self.timeout)
+
+        if response.status_code == 304 and cached is not None:
+            self.stats['not_modified'] += 1
+            headers = CaseInsensitiveDict(cached.headers)
+            headers.update(response.headers)
+            result = replace(cached, headers=headers, fetched_at=time.monotonic(), from_cache=False)
+        else:
+            response.raise_for_status()
+            self.stats['fetches'] += 1
+            result = HTTPResponse(
+                url=response.url,
+                status_code=response.status_code,
+                data=response.json() if as_json else response.content,
+                headers=CaseInsensitiveDict(response.headers),
+                fetched_at=time.monotonic()
+            )
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def _revalidate_in_background(self, key: Tuple, request: Tuple):
+        if key in self._inflight:
+            return
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='http-revalidate')
+        self._executor.submit(self._revalidate, key, request)
+
+    def _revalidate(self, key: Tuple, request: Tuple):
+        try:
+            self._fetch_coalesced(key, request)
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.warning(f"Background refresh of {request[0]} failed: {e}")
+
+
+# 전역 인스턴스
+_client_instance = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """프로세스 공유 HTTPClient"""
+    global _client_instance
+    if _client_instance is None:
+        with _client_lock:
+            if _client_instance is None:
+                _client_instance = HTTPClient()
+    return _client_instance
+
+
+def get_fpl_json(path: str) -> Any:
+    """
+    FPL API JSON (bootstrap-static, fixtures 등)
+
+    같은 프로세스의 모든 호출자가 하나의 캐시를 공유한다.
+
+    Args:
+        path: FPL_API_URL 기준 경로 (예: "bootstrap-static/")
+    """
+    return get_http_client().get_json(f"{FPL_API_URL}/{path.lstrip('/')}",
+                                      ttl=FPL_CACHE_TTL, stale_ttl=FPL_STALE_TTL)
@@ -0,0 +1,114 @@
+"""
+Poisson 스코어 그리드 유틸리티
+독립 Poisson 득점 모델의 스코어 확률 행렬 (벡터화)
+
+P(home_goals = h, away_goals = a) = Poisson(h | λ_home) × Poisson(a | λ_away)
+
+λ 쌍 하나 또는 λ 쌍 배열(한 라운드 전체, 캘리브레이션용 수천 쌍)을
+한 번의 호출로 계산한다. PMF는 점화식 p(k) = p(k-1) × λ / k로 구하고,
+스코어 행렬은 두 PMF 벡터의 외적, 승/무/패 확률은 삼각 마스크 합이다.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+DEFAULT_MAX_GOALS = 6
+
+
+def poisson_pmf_table(lambdas, max_goals: int = DEFAULT_MAX_GOALS) -> np.ndarray:
+    """
+    0..max_goals 골의 Poisson PMF
+
+    Args:
+        lambdas: λ (스칼라 또는 배열)
+        max_goals: 최대 골 수
+
+    Returns:
+        (..., max_goals + 1) 배열
+    """
+    lambdas = np.asarray(lambdas, dtype=float)
+    goals = np.arange(1, max_goals + 1)
+
+    # p(0) = e^-λ, p(k) = p(k-1) × λ / k
+    ratios = lambdas[..., None] / goals
+    pmf = np.empty(lambdas.shape + (max_goals + 1,))
+    pmf[..., 0] = np.exp(-lambdas)
+    pmf[..., 1:] = pmf[..., :1] * np.cumprod(ratios, axis=-1)
+    return pmf
+
+
+def score_matrix(home_lambda, away_lambda, max_goals: int = DEFAULT_MAX_GOALS) -> np.ndarray:
+    """
+    스코어 확률 행렬
+
+    Args:
+        home_lambda: 홈팀 예상 득점 (스칼라 또는 배열)
+        away_lambda: 원정팀 예상 득점 (home_lambda와 broadcast 가능한 shape)
+        max_goals: 최대 골 수
+
+    Returns:
+        (..., max_goals + 1, max_goals + 1) 배열 [..., home_goals, away_goals]
+    """
+    home_lambda, away_lambda = np.broadcast_arrays(
+        np.asarray(home_lambda, dtype=float),
+        np.asarray(away_lambda, dtype=float)
+    )
+    home_pmf = poisson_pmf_table(home_lambda, max_goals)
+    away_pmf = poisson_pmf_table(away_lambda, max_goals)
+    return home_pmf[..., :, None] * away_pmf[..., None, :]
+
+
+def outcome_probabilities(matrix: np.ndarray, normalize: bool = False) -> Dict[str, np.ndarray]:
+    """
+    스코어 행렬 → 승/무/패 확률
+
+    Args:
+        matrix: score_matrix 결과 (..., G, G)
+        normalize: True면 세 확률의 합이 1이 되도록 정규화
+            (max_goals 밖으로 잘린 확률 질량을 재분배)
+
+    Returns:
+        {'home_win', 'draw', 'away_win'} (입력의 batch shape, 스칼라 입력이면 0-d 배열)
+    """
+    size = matrix.shape[-1]
+    home_mask = np.tril(np.ones((size, size), dtype=bool), k=-1)  # h > a
+    away_mask = home_mask.T                                       # h < a
+
+    home_win = np.sum(matrix * home_mask, axis=(-2, -1))
+    draw = np.trace(matrix, axis1=-2, axis2=-1)
+    away_win = np.sum(matrix * away_mask, axis=(-2, -1))
+
+    if normalize:
+        total = home_win + draw + away_win
+        total = np.where(total > 0, total, 1.0)
+        home_win, draw, away_win = home_win / total, draw / total, away_win / total
+
+    return {'home_win': home_win, 'draw': draw, 'away_win': away_win}
+
+
+def score_dict(matrix: np.ndarray) -> Dict[Tuple[int, int], float]:
+    """
+    단일 스코어 행렬 → {(home_goals, away_goals): probability}
+    """
+    rows = matrix.tolist()
+    return {
+        (home, away): prob
+        for home, row in enumerate(rows)
+        for away, prob in enumerate(row)
+    }
+
+
+def most_likely_scores(matrix: np.ndarray, top_n: int = 5) -> List[Tuple[int, int, float]]:
+    """
+    단일 스코어 행렬에서 확률이 높은 스코어 top_n개
+
+    Returns:
+        [(home_goals, away_goals, probability), ...] 확률 내림차순
+    """
+    flat = matrix.ravel()
+    # 안정 정렬 (동률이면 행렬 순서 유지, 기존 sorted(dict.items()) 결과와 동일)
+    order = np.argsort(-flat, kind='stable')[:top_n]
+    size = matrix.shape[1]
+    return [(int(index // size), int(index % size), float(flat[index])) for index in order]
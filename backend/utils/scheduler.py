@@ -3,10 +3,14 @@
 - 매일 02:00 KST: 경기 결과 업데이트
 - 매일 02:10 KST: 리그 순위표 업데이트
 - 매주 월요일 03:00 KST: 선수 로스터 업데이트
+- FEED_REFRESH_MINUTES분마다: 순위표/라운드 매핑/리더보드 스냅샷 갱신
 """
 
+from datetime import datetime
+
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 import logging
 import sys
 import os
@@ -81,6 +85,39 @@ class MatchUpdateScheduler:
         except Exception as e:
             logger.error(f"❌ Roster update failed: {e}")
 
+    def refresh_feed_snapshots_job(self):
+        """FPL 피드 스냅샷 갱신 작업 (순위표, 라운드 매핑, 리더보드 등)"""
+        try:
+            from services.feed_snapshots import REFRESH_INTERVAL_MINUTES, get_feed_snapshots
+
+            # 다른 워커가 주기의 절반 안에 이미 갱신했으면 건너뜀
+            versions = get_feed_snapshots().refresh_all(min_age=REFRESH_INTERVAL_MINUTES * 30)
+            logger.info(f"📦 Feed snapshots refreshed: {versions}")
+
+        except Exception as e:
+            logger.error(f"❌ Feed snapshot refresh failed: {e}")
+
+    def _add_feed_refresh_job(self):
+        from services.feed_snapshots import REFRESH_INTERVAL_MINUTES
+
+        self.scheduler.add_job(
+            self.refresh_feed_snapshots_job,
+            IntervalTrigger(minutes=REFRESH_INTERVAL_MINUTES),
+            id='feed_snapshot_refresh',
+            name='Feed Snapshot Refresh',
+            next_run_time=datetime.now(self.scheduler.timezone),  # 시작 즉시 1회
+            coalesce=True,
+            max_instances=1,
+            replace_existing=True
+        )
+
+    def start_feed_refresh(self):
+        """피드 스냅샷 갱신 작업만 시작 (API 서버 프로세스용)"""
+        self._add_feed_refresh_job()
+        if not self.scheduler.running:
+            self.scheduler.start()
+        logger.info("📅 Feed snapshot refresh scheduled")
+
     def start(self):
         """스케줄러 시작"""
         # 1. 매일 오전 2시: 경기 결과 업데이트 (EPL 경기 종료 후)
@@ -110,6 +147,9 @@ class MatchUpdateScheduler:
             replace_existing=True
         )
 
+        # 4. 주기적: 피드 스냅샷 갱신 (시작 즉시 1회)
+        self._add_feed_refresh_job()
+
         # 테스트용: 서버 시작 1분 후 1회 실행 (선택사항)
         # from datetime import datetime, timedelta
         # self.scheduler.add_job(
@@ -120,11 +160,13 @@ class MatchUpdateScheduler:
         #     name='Startup Test Update'
         # )
 
-        self.scheduler.start()
-        logger.info("📅 Scheduler started with 3 jobs:")
+        if not self.scheduler.running:
+            self.scheduler.start()
+        logger.info("📅 Scheduler started with 4 jobs:")
         logger.info("  - Daily match updates: 02:00 KST")
         logger.info("  - Daily standings updates: 02:10 KST")
         logger.info("  - Weekly roster updates: Monday 03:00 KST")
+        logger.info("  - Feed snapshot refresh: every few minutes")
 
     def stop(self):
         """스케줄러 중지"""
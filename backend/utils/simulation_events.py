@@ -16,6 +16,7 @@ class SimulationEventType:
     STARTED = "started"
     COMPLETED = "completed"
     ERROR = "error"
+    HEARTBEAT = "heartbeat"
 
     # 데이터 로딩
     LOADING_HOME_TEAM = "loading_home_team"
@@ -292,6 +293,17 @@ class SimulationEvent:
             }
         )
 
+    @staticmethod
+    def heartbeat(elapsed: float) -> 'SimulationEvent':
+        """연결 유지 (긴 AI 호출 중 프록시/브라우저 타임아웃 방지)"""
+        return SimulationEvent(
+            event_type=SimulationEventType.HEARTBEAT,
+            data={
+                'message': 'Connection keepalive',
+                'elapsed': round(elapsed, 1)
+            }
+        )
+
     @staticmethod
     def info(message: str, stage: str = 'info', data: Dict = None, **kwargs) -> 'SimulationEvent':
         """일반 정보 메시지"""
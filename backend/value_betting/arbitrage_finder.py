@@ -16,11 +16,11 @@ from typing import Dict, List, Optional, Tuple
 import logging
 from datetime import datetime
 
-from .utils import (
-    decimal_to_probability,
-    get_best_odds
-)
+import numpy as np
+
 from .exceptions import NoArbitrageOpportunityError
+from .market_scan import MarketScan, scan_markets
+from .odds_tensor import OUTCOMES
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +74,34 @@ class ArbitrageFinder:
         logger.info(f"Found {len(opportunities)} arbitrage opportunities")
         return opportunities
     
+    def find_in_scan(self, scan: MarketScan) -> List[Dict]:
+        """
+        MarketScan의 모든 경기에서 arbitrage 기회 탐색 (경기 순서)
+        
+        최고 배당률, arbitrage percentage, 베팅 비율은 스캔에서 이미 계산되어
+        있으므로 기준을 넘는 경기만 dict로 만든다.
+        """
+        # NaN(최고 배당률이 없는 결과)은 비교에서 모두 제외됨
+        arb_percentage = scan.arb_percentage
+        hits = np.flatnonzero((arb_percentage < 1.0) & (1.0 - arb_percentage >= self.min_profit))
+        
+        opportunities = []
+        for m in hits:
+            match = scan.tensor.matches[m]
+            opportunity = self._scan_opportunity(scan, m)
+            opportunities.append({
+                'match_id': match.get('match_id'),
+                'home_team': match['home_team'],
+                'away_team': match['away_team'],
+                **opportunity,
+                'urgency': self._assess_urgency(opportunity['profit_margin']),
+                'risk_level': self._assess_risk(opportunity['best_odds']),
+                'detected_at': datetime.now()
+            })
+        
+        logger.info(f"Found {len(opportunities)} arbitrage opportunities")
+        return opportunities
+    
     def check_arbitrage(self, match_analysis: Dict) -> Optional[Dict]:
         """
         단일 경기의 arbitrage 기회 확인
@@ -94,6 +122,7 @@ class ArbitrageFinder:
                     'away': {'bookmaker': 'betfair', 'odds': 4.5}
                 }
             }
+            best_odds는 OddsAggregator.analyze_match_odds의 (북메이커, 배당률) 형식도 허용
         
         Returns:
             Dict or None: Arbitrage 정보
@@ -103,6 +132,11 @@ class ArbitrageFinder:
         if not best_odds or len(best_odds) != 3:
             return None
         
+        best_odds = {
+            outcome: info if isinstance(info, dict) else {'bookmaker': info[0], 'odds': info[1]}
+            for outcome, info in best_odds.items()
+        }
+        
         # 각 결과의 최고 배당률
         home_odds = best_odds.get('home', {}).get('odds')
         draw_odds = best_odds.get('draw', {}).get('odds')
@@ -186,9 +220,29 @@ class ArbitrageFinder:
         """
         arb_percentage = 1.0 - profit_margin
         
-        stake_home = (total_stake * (1 / home_odds)) / arb_percentage
-        stake_draw = (total_stake * (1 / draw_odds)) / arb_percentage
-        stake_away = (total_stake * (1 / away_odds)) / arb_percentage
+        fractions = [
+            (1 / home_odds) / arb_percentage,
+            (1 / draw_odds) / arb_percentage,
+            (1 / away_odds) / arb_percentage
+        ]
+        return self._stake_distribution(fractions, total_stake)
+    
+    def _stake_distribution(
+        self,
+        fractions,
+        total_stake: float = 100.0
+    ) -> Dict[str, float]:
+        """
+        결과별 베팅 비율 → 베팅 금액 요약
+        
+        Args:
+            fractions: [home, draw, away] 총 베팅액 대비 비율 (MarketScan.stakes 행)
+            total_stake: 총 베팅 금액 (기본 100)
+        
+        Returns:
+            Dict: {'home': 45.2, 'draw': 28.1, 'away': 22.4, 'total_invested': 95.7, ...}
+        """
+        stake_home, stake_draw, stake_away = (total_stake * float(f) for f in fractions)
         
         total_invested = stake_home + stake_draw + stake_away
         guaranteed_return = total_stake
@@ -272,38 +326,28 @@ class ArbitrageFinder:
         Returns:
             Dict or None: Arbitrage 정보
         """
-        # 각 결과의 최고 배당률 찾기
-        best_home_bookie, best_home_odds = get_best_odds(bookmakers_odds, 'home')
-        best_draw_bookie, best_draw_odds = get_best_odds(bookmakers_odds, 'draw')
-        best_away_bookie, best_away_odds = get_best_odds(bookmakers_odds, 'away')
-        
-        if not all([best_home_odds, best_draw_odds, best_away_odds]):
-            return None
-        
-        # Arbitrage percentage
-        arb_percentage = (
-            (1 / best_home_odds) +
-            (1 / best_draw_odds) +
-            (1 / best_away_odds)
-        )
-        
-        if arb_percentage >= 1.0:
+        scan = scan_markets([{'bookmakers': bookmakers_odds}])
+        if not len(scan):
             return None
         
-        profit_margin = 1.0 - arb_percentage
-        
-        if profit_margin < self.min_profit:
+        arb_percentage = scan.arb_percentage[0]
+        if not (arb_percentage < 1.0 and 1.0 - arb_percentage >= self.min_profit):
             return None
         
+        return self._scan_opportunity(scan, 0)
+    
+    def _scan_opportunity(self, scan: MarketScan, m: int) -> Dict:
+        """MarketScan 경기 m의 arbitrage 정보 (최고 배당률, 수익률, 베팅 금액)"""
+        arb_percentage = float(scan.arb_percentage[m])
         return {
             'arb_percentage': arb_percentage,
-            'profit_margin': profit_margin,
+            'profit_margin': 1.0 - arb_percentage,
             'best_odds': {
-                'home': {'bookmaker': best_home_bookie, 'odds': best_home_odds},
-                'draw': {'bookmaker': best_draw_bookie, 'odds': best_draw_odds},
-                'away': {'bookmaker': best_away_bookie, 'odds': best_away_odds}
+                outcome: {
+                    'bookmaker': scan.tensor.bookmakers[scan.best_column[m, o]],
+                    'odds': float(scan.best_odds[m, o])
+                }
+                for o, outcome in enumerate(OUTCOMES)
             },
-            'stake_distribution': self._calculate_stakes(
-                best_home_odds, best_draw_odds, best_away_odds, profit_margin
-            )
+            'stake_distribution': self._stake_distribution(scan.stakes[m])
         }
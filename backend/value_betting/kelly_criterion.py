@@ -29,6 +29,9 @@ from typing import Dict, List, Optional, Tuple
 import logging
 from datetime import datetime
 
+import numpy as np
+
+from utils.rng import RNGProvider
 from .exceptions import InvalidBankrollError, InvalidProbabilityError
 
 logger = logging.getLogger(__name__)
@@ -289,7 +292,8 @@ class KellyCriterion:
         win_probability: float,
         decimal_odds: float,
         initial_bankroll: float,
-        num_bets: int = 100
+        num_bets: int = 100,
+        rng: Optional[np.random.Generator] = None
     ) -> Dict:
         """
         Kelly 전략 시뮬레이션
@@ -299,11 +303,14 @@ class KellyCriterion:
             decimal_odds: 배당률
             initial_bankroll: 초기 자금
             num_bets: 시뮬레이션 베팅 횟수
+            rng: 난수 Generator (None이면 비결정적)
         
         Returns:
             Dict: 시뮬레이션 결과
         """
-        import random
+        if rng is None:
+            rng = RNGProvider().generator()
+        draws = rng.random(num_bets).tolist()
         
         kelly_percent = self.calculate_kelly(win_probability, decimal_odds)
         
@@ -313,11 +320,11 @@ class KellyCriterion:
         wins = 0
         losses = 0
         
-        for _ in range(num_bets):
+        for draw in draws:
             bet_amount = bankroll * kelly_percent
             
             # 승/패 시뮬레이션
-            if random.random() < win_probability:
+            if draw < win_probability:
                 # 승리
                 profit = bet_amount * (decimal_odds - 1)
                 bankroll += profit
@@ -353,7 +360,8 @@ class KellyCriterion:
         decimal_odds: float,
         bankroll: float,
         num_simulations: int = 1000,
-        num_bets_per_sim: int = 100
+        num_bets_per_sim: int = 100,
+        seed: Optional[int] = None
     ) -> Dict:
         """
         다양한 Kelly 전략 비교
@@ -364,10 +372,12 @@ class KellyCriterion:
             bankroll: 초기 자금
             num_simulations: 시뮬레이션 횟수
             num_bets_per_sim: 각 시뮬레이션의 베팅 횟수
+            seed: master seed (전략마다 독립 스트림 파생, None이면 비결정적)
         
         Returns:
             Dict: 전략별 평균 결과
         """
+        rng = RNGProvider(seed)
         strategies = {
             'Full Kelly': 1.0,
             'Half Kelly': 0.5,
@@ -382,16 +392,17 @@ class KellyCriterion:
                 calculator = KellyCriterion(fraction=fraction, max_bet=self.max_bet)
             
             final_bankrolls = []
+            strategy_rng = rng.generator()
             
             for _ in range(num_simulations):
                 if fraction is not None:
                     sim_result = calculator.simulate_kelly_growth(
-                        win_probability, decimal_odds, bankroll, num_bets_per_sim
+                        win_probability, decimal_odds, bankroll, num_bets_per_sim, strategy_rng
                     )
                 else:
                     # Fixed 5% 전략
                     sim_result = self._simulate_fixed_percent(
-                        win_probability, decimal_odds, bankroll, num_bets_per_sim, 0.05
+                        win_probability, decimal_odds, bankroll, num_bets_per_sim, 0.05, strategy_rng
                     )
                 
                 final_bankrolls.append(sim_result['final_bankroll'])
@@ -414,19 +425,22 @@ class KellyCriterion:
         decimal_odds: float,
         initial_bankroll: float,
         num_bets: int,
-        fixed_percent: float
+        fixed_percent: float,
+        rng: Optional[np.random.Generator] = None
     ) -> Dict:
         """고정 비율 전략 시뮬레이션 (비교용)"""
-        import random
+        if rng is None:
+            rng = RNGProvider().generator()
+        draws = rng.random(num_bets).tolist()
         
         bankroll = initial_bankroll
         wins = 0
         losses = 0
         
-        for _ in range(num_bets):
+        for draw in draws:
             bet_amount = bankroll * fixed_percent
             
-            if random.random() < win_probability:
+            if draw < win_probability:
                 profit = bet_amount * (decimal_odds - 1)
                 bankroll += profit
                 wins += 1
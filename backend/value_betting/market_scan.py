@@ -0,0 +1,164 @@
+"""
+Market Scan
+전체 경기 × 북메이커 배당 시장 지표를 OddsTensor 한 번으로 계산
+
+/api/value-bets, /api/dashboard는 경기마다 OddsAggregator.analyze_match_odds와
+ValueDetector.detect_value_bets를 호출하고, ArbitrageFinder는 같은 배당률 dict를
+다시 순회했다. MarketScan은 갱신마다 텐서를 한 번 만들고 마진, 결과별 최고 배당률,
+합의 확률, 분산, 아비트라지 마진과 베팅 비율을 배열 연산으로 한 번에 계산한다.
+세 클래스는 이 결과를 기존 dict 형식으로 보여주는 뷰다.
+
+동률 처리(최저 마진, 최고 배당률)는 기존 dict 순회와 같게 경기 dict에서 먼저 나온
+북메이커를 고른다.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .odds_tensor import OUTCOMES, OddsTensor, build_odds_tensor, masked_mean
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MarketScan:
+    """
+    배당 시장 스캔 결과 (경기 축 M, 북메이커 축 B, 결과 축 3)
+
+    확률 배열에서 NaN은 해당 북메이커/결과가 없음을 뜻한다.
+    """
+    tensor: OddsTensor
+    fair: np.ndarray            # (M, B, 3) 마진 제거 확률 (제공된 결과끼리 정규화)
+    complete: np.ndarray        # (M, B) 세 결과 모두 유효한 배당률
+    overround: np.ndarray       # (M, B) 마진 (불완전한 배당률은 0, 음수는 0)
+    fairest: np.ndarray         # (M,) 최저 마진 북메이커 열 (없으면 -1)
+    best_odds: np.ndarray       # (M, 3) 결과별 최고 배당률 (없으면 0)
+    best_column: np.ndarray     # (M, 3) 최고 배당률 북메이커 열 (없으면 -1)
+    consensus: np.ndarray       # (M, 3) 신뢰도 가중 합의 확률
+    offered_counts: np.ndarray  # (M, 3) 결과별 배당률을 제공한 북메이커 수
+    variance: np.ndarray        # (M, 3) 북메이커 간 배당률 분산 (2개 미만이면 0)
+    arb_percentage: np.ndarray  # (M,) Σ 1/최고 배당률 (최고 배당률이 하나라도 없으면 NaN)
+    stakes: np.ndarray          # (M, 3) 총 베팅액 대비 결과별 아비트라지 베팅 비율
+
+    def __len__(self) -> int:
+        return len(self.tensor)
+
+    @property
+    def num_bookmakers(self) -> np.ndarray:
+        """(M,) 경기별 북메이커 수"""
+        return self.tensor.listed.sum(axis=1)
+
+    def columns_of(self, m: int) -> List[int]:
+        """경기 m의 북메이커 열 (경기 dict 순서)"""
+        columns = np.flatnonzero(self.tensor.listed[m])
+        return columns[np.argsort(self.tensor.order[m, columns])].tolist()
+
+    def bookmaker_probabilities(self, bookmaker: str) -> np.ndarray:
+        """(M, 3) 특정 북메이커의 마진 제거 확률 (북메이커가 없으면 NaN)"""
+        column = self.tensor.columns.get(bookmaker)
+        if column is None:
+            return np.full((len(self), len(OUTCOMES)), np.nan)
+        return self.fair[:, column]
+
+    def has_bookmaker(self, bookmaker: str) -> np.ndarray:
+        """(M,) 경기에 해당 북메이커가 있는지"""
+        column = self.tensor.columns.get(bookmaker)
+        if column is None:
+            return np.zeros(len(self), dtype=bool)
+        return self.tensor.listed[:, column]
+
+
+def scan_markets(matches: Union[Sequence[Dict], OddsTensor],
+                 trust_scores: Optional[Dict[str, float]] = None) -> MarketScan:
+    """
+    경기 리스트(또는 OddsTensor) → MarketScan
+
+    Args:
+        matches: parse_odds_data 형식 경기 리스트 또는 build_odds_tensor 결과
+        trust_scores: 북메이커별 합의 확률 가중치 ('default' 키는 나머지 북메이커)
+            None이면 단순 평균
+    """
+    tensor = matches if isinstance(matches, OddsTensor) else build_odds_tensor(matches)
+    odds = tensor.odds
+    offered = ~np.isnan(odds)
+    valid = odds > 0
+
+    # 마진 제거 확률: 제공된 결과끼리 정규화 (remove_overround와 같음)
+    implied = tensor.implied_probabilities()
+    usable = offered.any(axis=2) & ~(offered & ~valid).any(axis=2)
+    totals = np.where(offered, implied, 0.0).sum(axis=2)
+    fair = np.full_like(odds, np.nan)
+    np.divide(implied, totals[..., None], out=fair, where=usable[..., None] & offered)
+
+    # 마진: 세 결과 모두 있는 북메이커만 (calculate_overround와 같음)
+    complete = valid.all(axis=2)
+    implied_sum = implied[..., 0] + implied[..., 1] + implied[..., 2]
+    overround = np.where(complete, np.maximum(implied_sum - 1.0, 0.0), 0.0)
+
+    fairest = _first_by_order(np.where(tensor.listed, -overround, -np.inf), tensor.listed, tensor.order)
+
+    # 결과별 최고 배당률
+    by_outcome = np.moveaxis(odds, 2, 1)                        # (M, 3, B)
+    eligible = np.moveaxis(valid, 2, 1)
+    best_column = _first_by_order(np.where(eligible, by_outcome, -np.inf), eligible, tensor.order[:, None, :])
+    best_odds = np.take_along_axis(by_outcome, np.maximum(best_column, 0)[..., None], axis=2)[..., 0]
+    best_odds = np.where(best_column >= 0, best_odds, 0.0)
+
+    # 신뢰도 가중 합의 확률
+    trust = _trust_weights(tensor.bookmakers, trust_scores)
+    weights = np.where(complete, trust, 0.0)
+    total_weight = weights.sum(axis=1)
+    weighted = np.where(complete[..., None], fair, 0.0) * weights[..., None]
+    consensus = np.zeros((len(tensor), len(OUTCOMES)))
+    np.divide(weighted.sum(axis=1), total_weight[:, None], out=consensus, where=total_weight[:, None] > 0)
+
+    # 북메이커 간 배당률 분산
+    offered_counts = offered.sum(axis=1)
+    mean_odds = masked_mean(odds, offered, axis=1)
+    variance = masked_mean((odds - mean_odds[:, None, :]) ** 2, offered, axis=1, default=0.0)
+    variance = np.where(offered_counts >= 2, variance, 0.0)
+
+    # 아비트라지: Σ 1/최고 배당률 < 1이면 모든 결과에 나눠 걸어 수익 확정
+    has_best = (best_column >= 0).all(axis=1)
+    inverse = np.zeros_like(best_odds)
+    np.divide(1.0, best_odds, out=inverse, where=best_odds > 0)
+    arb_percentage = np.where(has_best, inverse[:, 0] + inverse[:, 1] + inverse[:, 2], np.nan)
+    stakes = inverse / np.where(has_best, arb_percentage, 1.0)[:, None]
+    stakes[~has_best] = np.nan
+
+    return MarketScan(
+        tensor=tensor,
+        fair=fair,
+        complete=complete,
+        overround=overround,
+        fairest=fairest,
+        best_odds=best_odds,
+        best_column=best_column,
+        consensus=consensus,
+        offered_counts=offered_counts,
+        variance=variance,
+        arb_percentage=arb_percentage,
+        stakes=stakes
+    )
+
+
+def _first_by_order(values: np.ndarray, eligible: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """
+    마지막 축에서 값이 최대인 열 (동률이면 경기 dict에서 먼저 나온 열, 후보가 없으면 -1)
+    """
+    target = values.max(axis=-1, initial=-np.inf, where=eligible)
+    hits = eligible & (values == target[..., None])
+    ranks = np.where(hits, order, np.iinfo(order.dtype).max)
+    columns = ranks.argmin(axis=-1) if ranks.shape[-1] else np.zeros(ranks.shape[:-1], dtype=int)
+    return np.where(hits.any(axis=-1), columns, -1)
+
+
+def _trust_weights(bookmakers: List[str], trust_scores: Optional[Dict[str, float]]) -> np.ndarray:
+    """(B,) 북메이커별 가중치"""
+    if not trust_scores:
+        return np.ones(len(bookmakers))
+    default = trust_scores.get('default', 1.0)
+    return np.array([trust_scores.get(name, default) for name in bookmakers], dtype=float)
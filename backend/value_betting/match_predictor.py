@@ -4,10 +4,13 @@ Match Predictor
 """
 
 import logging
+from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
-from scipy.stats import poisson
 import numpy as np
 
+from utils.poisson_grid import score_matrix, outcome_probabilities, score_dict
+from value_betting.odds_tensor import OUTCOMES, OddsTensor, build_odds_tensor, masked_mean
+
 logger = logging.getLogger(__name__)
 
 # Sharp 북메이커 리스트 (가장 정확한 배당률 제공)
@@ -21,6 +24,48 @@ SHARP_BOOKMAKERS = {
     'marathonbet',        # Sharp 북메이커
 }
 
+# Sharp 북메이커가 이보다 적으면 전체 북메이커 사용
+MIN_SHARP_BOOKMAKERS = 3
+
+# predict_batch 신뢰도 구간 (calculate_confidence와 동일)
+BASE_CONFIDENCE = 0.60
+CLARITY_THRESHOLDS = (0.30, 0.20, 0.15, 0.10, 0.05)
+CLARITY_BONUSES = (0.05, 0.03, 0.02, 0.0, -0.03, -0.07)
+BOOKMAKER_THRESHOLDS = (20, 15, 10, 5)
+BOOKMAKER_BONUSES = (0.03, 0.02, 0.01, 0.0, -0.03)
+TOTALS_BONUS = 0.02
+
+
+@dataclass
+class PredictionBatch:
+    """
+    여러 경기의 예측 결과 (열 기반, predict_batch 반환값)
+
+    모든 배열의 첫 축은 tensor.matches 순서의 경기다. 확률은 0-1 범위.
+    """
+    tensor: OddsTensor
+    raw_average: np.ndarray         # (M, 3) 선택된 북메이커 암시 확률 평균
+    probabilities: np.ndarray       # (M, 3) 마진 제거된 합의 확률
+    uses_sharp: np.ndarray          # (M,) bool: Sharp 북메이커만 사용
+    total_goals: np.ndarray         # (M,) totals 기반 총 득점 (없으면 NaN)
+    expected_goals: np.ndarray      # (M, 2) 홈/원정 λ
+    grids: np.ndarray               # (M, G, G) 스코어 확률
+    poisson: np.ndarray             # (M, 3) Poisson 홈승/무/원정승
+    outcome: np.ndarray             # (M,) OUTCOMES 인덱스
+    confidence: np.ndarray          # (M,)
+    clarity_bonus: np.ndarray       # (M,)
+    quality_bonus: np.ndarray       # (M,)
+    clarity_gap: np.ndarray         # (M,)
+    num_bookmakers: np.ndarray      # (M,) int
+    top_scores: np.ndarray          # (M, top_n) 확률 내림차순 스코어 셀 인덱스 (h * G + a)
+
+    @property
+    def uses_totals(self) -> np.ndarray:
+        return ~np.isnan(self.total_goals)
+
+    def __len__(self) -> int:
+        return len(self.tensor)
+
 
 class MatchPredictor:
     """
@@ -88,7 +133,6 @@ class MatchPredictor:
         }
 
         # 2. Sharp 북메이커가 너무 적으면 (3개 미만) 전체 사용
-        MIN_SHARP_BOOKMAKERS = 3
         if len(sharp_bookmakers) < MIN_SHARP_BOOKMAKERS:
             logger.warning(
                 f"Only {len(sharp_bookmakers)} Sharp bookmakers available "
@@ -310,35 +354,52 @@ class MatchPredictor:
                 'away_win': probability
             }
         """
-        score_matrix = {}
-        home_win_prob = 0.0
-        draw_prob = 0.0
-        away_win_prob = 0.0
-
-        for home_goals in range(max_goals + 1):
-            for away_goals in range(max_goals + 1):
-                # Poisson 확률 계산
-                prob = (
-                    poisson.pmf(home_goals, home_lambda) *
-                    poisson.pmf(away_goals, away_lambda)
-                )
-                score_matrix[(home_goals, away_goals)] = prob
-
-                # 승/무/패 집계
-                if home_goals > away_goals:
-                    home_win_prob += prob
-                elif home_goals == away_goals:
-                    draw_prob += prob
-                else:
-                    away_win_prob += prob
+        grid = score_matrix(home_lambda, away_lambda, max_goals)
+        outcomes = outcome_probabilities(grid)
 
         return {
-            'scores': score_matrix,
-            'home_win': home_win_prob,
-            'draw': draw_prob,
-            'away_win': away_win_prob
+            'scores': score_dict(grid),
+            'home_win': float(outcomes['home_win']),
+            'draw': float(outcomes['draw']),
+            'away_win': float(outcomes['away_win'])
+        }
+
+    @staticmethod
+    def calculate_score_probabilities_batch(
+        home_lambdas: List[float],
+        away_lambdas: List[float],
+        max_goals: int = 6
+    ) -> List[Dict[str, Dict[Tuple[int, int], float]]]:
+        """
+        여러 경기의 스코어 확률을 한 번에 계산 (calculate_score_probabilities의 배열 버전)
+
+        Args:
+            home_lambdas: 경기별 홈팀 예상 득점
+            away_lambdas: 경기별 원정팀 예상 득점
+            max_goals: 최대 득점 수 (기본 6골)
+
+        Returns:
+            경기 순서대로 calculate_score_probabilities와 같은 형식의 딕셔너리 리스트
+        """
+        if len(home_lambdas) == 0:
+            return []
+
+        grids = score_matrix(home_lambdas, away_lambdas, max_goals)
+        outcomes = {
+            outcome: probs.tolist()
+            for outcome, probs in outcome_probabilities(grids).items()
         }
 
+        return [
+            {
+                'scores': score_dict(grid),
+                'home_win': outcomes['home_win'][index],
+                'draw': outcomes['draw'][index],
+                'away_win': outcomes['away_win'][index]
+            }
+            for index, grid in enumerate(grids)
+        ]
+
     def get_most_likely_score(
         self,
         score_probs: Dict[Tuple[int, int], float],
@@ -406,7 +467,7 @@ class MatchPredictor:
         # 1. 기본 신뢰도: 배당률 기반 예측의 역사적 정확도
         #    연구 결과: Sharp 북메이커 평균 정확도는 약 60% (전체 평균 57%)
         #    우리 시스템은 Sharp 북메이커만 사용하므로 더 높은 정확도를 가짐
-        base_confidence = 0.60
+        base_confidence = BASE_CONFIDENCE
 
         # 2. 예측 명확성 조정
         #    1위와 2위의 차이가 클수록 해당 경기의 예측 정확도가 약간 높음
@@ -500,8 +561,21 @@ class MatchPredictor:
                 }
             }
         """
-        home_team = match_data.get('home_team', 'Unknown')
-        away_team = match_data.get('away_team', 'Unknown')
+        prepared = self._prepare_match(match_data)
+
+        # 4. Poisson으로 스코어 확률 계산
+        poisson_result = self.calculate_score_probabilities(*prepared['expected_goals'])
+
+        return self._build_prediction(match_data, prepared, poisson_result)
+
+    def _prepare_match(self, match_data: Dict) -> Dict:
+        """
+        Poisson 계산 전 단계 (합의 확률, 총 득점, 예상 득점)
+
+        Returns:
+            {'consensus_probs', 'consensus_details', 'total_goals',
+             'uses_totals', 'expected_goals': (home, away)}
+        """
         bookmakers = match_data.get('bookmakers', {})
         bookmakers_raw = match_data.get('bookmakers_raw', [])
 
@@ -519,30 +593,54 @@ class MatchPredictor:
             logger.info(f"Using totals odds: {totals_odds} → Expected total goals: {total_goals}")
 
         # 3. 예상 득점 계산 (totals 기반 또는 경험 공식)
-        home_goals, away_goals = self.probabilities_to_expected_goals(
+        expected_goals = self.probabilities_to_expected_goals(
             consensus_probs,
             total_goals
         )
 
-        # 4. Poisson으로 스코어 확률 계산
-        poisson_result = self.calculate_score_probabilities(home_goals, away_goals)
+        return {
+            'consensus_probs': consensus_probs,
+            'consensus_details': consensus_details,
+            'total_goals': total_goals,
+            'uses_totals': uses_totals,
+            'expected_goals': expected_goals
+        }
+
+    def _build_prediction(self, match_data: Dict, prepared: Dict, poisson_result: Dict,
+                          confidence_data: Optional[Dict] = None,
+                          most_likely_scores: Optional[List[Dict]] = None) -> Dict:
+        """
+        Poisson 결과와 합쳐 predict_match 응답 생성
+
+        Args:
+            confidence_data / most_likely_scores: 배치 경로에서 미리 계산한 값
+                (없으면 여기서 계산)
+        """
+        consensus_probs = prepared['consensus_probs']
+        consensus_details = prepared['consensus_details']
+        total_goals = prepared['total_goals']
+        uses_totals = prepared['uses_totals']
+        home_goals, away_goals = prepared['expected_goals']
+        bookmakers = match_data.get('bookmakers', {})
 
         # 5. 가장 가능성 높은 스코어
-        most_likely_scores = self.get_most_likely_score(poisson_result['scores'])
+        if most_likely_scores is None:
+            most_likely_scores = self.get_most_likely_score(poisson_result['scores'])
 
         # 6. 최종 예측 결과
         predicted_outcome = max(consensus_probs, key=consensus_probs.get)
 
         # 7. 개선된 신뢰도 계산
-        confidence_data = self.calculate_confidence(
-            probabilities=consensus_probs,
-            num_bookmakers=len(bookmakers),
-            uses_totals=uses_totals
-        )
+        if confidence_data is None:
+            confidence_data = self.calculate_confidence(
+                probabilities=consensus_probs,
+                num_bookmakers=len(bookmakers),
+                uses_totals=uses_totals
+            )
 
         return {
-            'home_team': home_team,
-            'away_team': away_team,
+            'home_team': match_data.get('home_team', 'Unknown'),
+            'away_team': match_data.get('away_team', 'Unknown'),
             'commence_time': match_data.get('commence_time'),
             'match_id': match_data.get('id'),
             'prediction': {
@@ -589,29 +687,179 @@ class MatchPredictor:
         """
         모든 경기 예측
 
+        predict_batch로 전체 경기를 배열 연산으로 계산한 뒤
+        경기별로 predict_match와 같은 형식의 응답을 만든다.
+
         Args:
             matches: 경기 리스트
 
         Returns:
             예측 결과 리스트
         """
-        predictions = []
+        batch = self.predict_batch(matches)
 
-        for match in matches:
+        predictions = []
+        for index, match in enumerate(batch.tensor.matches):
             try:
-                # 데이터 유효성 검사
-                if not isinstance(match, dict):
-                    logger.error(f"Invalid match data type: {type(match)}, value: {match}")
-                    continue
-
-                prediction = self.predict_match(match)
-                predictions.append(prediction)
+                predictions.append(self._batch_row_prediction(batch, index))
             except Exception as e:
-                import traceback
-                match_id = match.get('id') if isinstance(match, dict) else 'Unknown'
-                logger.error(f"Error predicting match {match_id}: {str(e)}")
-                logger.error(f"Traceback: {traceback.format_exc()}")
+                self._log_prediction_error(match, e)
                 continue
 
         logger.info(f"Predicted {len(predictions)} matches")
         return predictions
+
+    def predict_batch(self, matches, max_goals: int = 6, top_n: int = 5) -> PredictionBatch:
+        """
+        여러 경기 배치 예측 (한 라운드 또는 여러 시즌 과거 배당률 백필용)
+
+        경기 × 북메이커 × 결과 배열에서 마진 제거, Sharp 합의 확률, totals 기반 λ,
+        Poisson 스코어 그리드, 신뢰도를 경기 루프 없이 계산한다.
+        결과는 predict_match와 같은 계산이다 (반올림 방식만 NumPy).
+
+        Args:
+            matches: 경기 리스트 또는 build_odds_tensor 결과
+            max_goals: 스코어 그리드 최대 골 수
+            top_n: top_scores에 담을 스코어 수
+
+        Returns:
+            PredictionBatch
+        """
+        tensor = matches if isinstance(matches, OddsTensor) else build_odds_tensor(matches)
+        num_matches = len(tensor)
+
+        # 1. 북메이커 선택: Sharp가 MIN_SHARP_BOOKMAKERS개 이상이면 Sharp만, 아니면 전체
+        sharp_columns = tensor.mask(SHARP_BOOKMAKERS)
+        sharp_listed = tensor.listed & sharp_columns
+        uses_sharp = sharp_listed.sum(axis=1) >= MIN_SHARP_BOOKMAKERS
+        selected = np.where(uses_sharp[:, None], sharp_listed, tensor.listed)
+
+        # 2. 암시 확률 평균 → 마진 제거
+        raw_average = masked_mean(tensor.implied_probabilities(), selected[:, :, None], axis=1, default=0.33)
+        raw_total = raw_average.sum(axis=1, keepdims=True)
+        probabilities = np.divide(raw_average, raw_total, out=raw_average.copy(), where=raw_total != 0)
+
+        # 3. totals 배당률 → 총 득점 기댓값
+        over = np.divide(1.0, tensor.totals_over, out=np.zeros(num_matches), where=tensor.totals_over > 0)
+        under = np.divide(1.0, tensor.totals_under, out=np.zeros(num_matches), where=tensor.totals_under > 0)
+        over_total = over + under
+        over = np.divide(over, over_total, out=over, where=over_total > 0)
+        total_goals = np.round(np.clip(2.5 + (over - 0.5) * 0.8, 1.5, 4.5), 2)
+        total_goals[np.isnan(tensor.totals_over)] = np.nan
+
+        # 4. 예상 득점 (totals가 없으면 무승부 확률 경험식)
+        home_prob, draw_prob, away_prob = probabilities.T
+        fallback_total = -np.log(np.maximum(draw_prob, 0.01))
+        goals = np.where(np.isnan(total_goals), fallback_total, total_goals)
+        home_ratio = 0.5 + (home_prob - away_prob) * 0.3
+        expected_goals = np.round(np.clip(np.stack([goals * home_ratio, goals * (1 - home_ratio)], axis=1), 0.3, 4.0), 2)
+
+        # 5. Poisson 스코어 그리드
+        grids = score_matrix(expected_goals[:, 0], expected_goals[:, 1], max_goals)
+        outcomes = outcome_probabilities(grids)
+        poisson = np.stack([outcomes['home_win'], outcomes['draw'], outcomes['away_win']], axis=-1).reshape(num_matches, 3)
+        top_scores = np.argsort(-grids.reshape(num_matches, grids[0].size if num_matches else 0), axis=1, kind='stable')[:, :top_n]
+
+        # 6. 신뢰도 (calculate_confidence와 같은 구간)
+        ordered = -np.sort(-probabilities, axis=1)
+        clarity_gap = ordered[:, 0] - ordered[:, 1]
+        clarity_bonus = np.select([clarity_gap >= t for t in CLARITY_THRESHOLDS],
+                                  CLARITY_BONUSES[:-1], CLARITY_BONUSES[-1])
+        num_bookmakers = np.array([len(match.get('bookmakers', {})) for match in tensor.matches], dtype=int)
+        quality_bonus = np.select([num_bookmakers >= t for t in BOOKMAKER_THRESHOLDS],
+                                  BOOKMAKER_BONUSES[:-1], BOOKMAKER_BONUSES[-1])
+        quality_bonus = quality_bonus + np.where(np.isnan(total_goals), 0.0, TOTALS_BONUS)
+        confidence = np.clip(BASE_CONFIDENCE + clarity_bonus + quality_bonus, 0.50, 0.70)
+
+        return PredictionBatch(
+            tensor=tensor,
+            raw_average=raw_average,
+            probabilities=probabilities,
+            uses_sharp=uses_sharp,
+            total_goals=total_goals,
+            expected_goals=expected_goals,
+            grids=grids,
+            poisson=poisson,
+            outcome=np.argmax(probabilities, axis=1),
+            confidence=confidence,
+            clarity_bonus=clarity_bonus,
+            quality_bonus=quality_bonus,
+            clarity_gap=clarity_gap,
+            num_bookmakers=num_bookmakers,
+            top_scores=top_scores
+        )
+
+    def _batch_row_prediction(self, batch: PredictionBatch, index: int) -> Dict:
+        """PredictionBatch의 한 경기 → predict_match 형식 응답"""
+        match = batch.tensor.matches[index]
+        consensus_probs = dict(zip(OUTCOMES, batch.probabilities[index].tolist()))
+        raw_average = batch.raw_average[index].tolist()
+        total_goals = None if np.isnan(batch.total_goals[index]) else float(batch.total_goals[index])
+        home_goals, away_goals = batch.expected_goals[index].tolist()
+
+        bookmaker_details = self._consensus_bookmaker_details(batch, index)
+        prepared = {
+            'consensus_probs': consensus_probs,
+            'consensus_details': {
+                'bookmakers': bookmaker_details,
+                'raw_average': {k: round(v * 100, 2) for k, v in zip(OUTCOMES, raw_average)},
+                'margin_removed': {k: round(v * 100, 2) for k, v in consensus_probs.items()},
+                'num_bookmakers': len(bookmaker_details)
+            },
+            'total_goals': total_goals,
+            'uses_totals': total_goals is not None,
+            'expected_goals': (home_goals, away_goals)
+        }
+        poisson_result = dict(zip(('home_win', 'draw', 'away_win'), batch.poisson[index].tolist()))
+
+        grid = batch.grids[index]
+        size = grid.shape[1]
+        most_likely_scores = []
+        for cell in batch.top_scores[index].tolist():
+            home, away = divmod(cell, size)
+            most_likely_scores.append({
+                'score': f"{home}-{away}",
+                'home_goals': home,
+                'away_goals': away,
+                'probability': round(float(grid[home, away]) * 100, 1)
+            })
+
+        confidence_data = {
+            'confidence': float(batch.confidence[index]),
+            'base': BASE_CONFIDENCE,
+            'clarity_bonus': float(batch.clarity_bonus[index]),
+            'quality_bonus': float(batch.quality_bonus[index]),
+            'clarity_gap': float(batch.clarity_gap[index])
+        }
+
+        return self._build_prediction(match, prepared, poisson_result,
+                                      confidence_data=confidence_data,
+                                      most_likely_scores=most_likely_scores)
+
+    @staticmethod
+    def _consensus_bookmaker_details(batch: PredictionBatch, index: int) -> List[Dict]:
+        """합의 계산에 쓰인 북메이커별 배당률/확률 (경기 dict 순서)"""
+        tensor = batch.tensor
+        columns = tensor.columns
+        sharp_only = bool(batch.uses_sharp[index])
+
+        details = []
+        for name in tensor.matches[index].get('bookmakers', {}):
+            if sharp_only and name not in SHARP_BOOKMAKERS:
+                continue
+            info = {'name': name}
+            for outcome, odd in zip(OUTCOMES, tensor.odds[index, columns[name]].tolist()):
+                if np.isnan(odd):
+                    continue
+                info[f'{outcome}_odds'] = round(odd, 2)
+                info[f'{outcome}_prob'] = round((1.0 / odd if odd > 0 else 0.0) * 100, 2)
+            if len(info) > 1:
+                details.append(info)
+        return details
+
+    @staticmethod
+    def _log_prediction_error(match, error: Exception):
+        import traceback
+        match_id = match.get('id') if isinstance(match, dict) else 'Unknown'
+        logger.error(f"Error predicting match {match_id}: {str(error)}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
@@ -0,0 +1,170 @@
+"""
+Odds Tensor
+여러 경기의 북메이커 배당률을 열 기반 NumPy 배열로 변환
+
+경기별 dict-of-dict 구조({'pinnacle': {'home': 1.75, ...}, ...})를 한 번만 순회해
+(경기 × 북메이커 × 결과) 배열로 만든다. 이후 마진 제거, 합의 확률, 최고 배당률
+등은 배열 연산으로 전체 경기를 한 번에 계산한다 (한 라운드 또는 여러 시즌 백필).
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+OUTCOMES = ('home', 'draw', 'away')
+
+
+@dataclass
+class OddsTensor:
+    """
+    경기 × 북메이커 × 결과 배당률
+
+    odds[m, b, o]:
+        NaN - 북메이커 b가 경기 m의 결과 o 배당률을 제공하지 않음
+        0.0 - 값은 있지만 유효하지 않음 (None, 0 이하)
+    """
+    matches: List[Dict]                 # 변환된 경기 원본 (입력 순서, 잘못된 경기 제외)
+    bookmakers: List[str]               # 북메이커 축 (처음 등장한 순서)
+    odds: np.ndarray                    # (M, B, 3) decimal odds
+    listed: np.ndarray                  # (M, B) bool: 경기의 bookmakers dict에 키가 있음
+    order: np.ndarray                   # (M, B) int: 경기 bookmakers dict 안의 순서 (없으면 -1)
+    totals_over: np.ndarray             # (M,) Over 배당률 평균 (없으면 NaN)
+    totals_under: np.ndarray            # (M,) Under 배당률 평균 (없으면 NaN)
+
+    @property
+    def columns(self) -> Dict[str, int]:
+        """북메이커 → 축 인덱스"""
+        return {name: index for index, name in enumerate(self.bookmakers)}
+
+    def __len__(self) -> int:
+        return len(self.matches)
+
+    def implied_probabilities(self) -> np.ndarray:
+        """
+        암시 확률 1/odds (M, B, 3)
+
+        제공되지 않은 배당률은 NaN, 유효하지 않은 배당률은 0
+        """
+        probs = np.zeros_like(self.odds)
+        np.divide(1.0, self.odds, out=probs, where=self.odds > 0)
+        probs[np.isnan(self.odds)] = np.nan
+        return probs
+
+    def mask(self, bookmakers: Sequence[str]) -> np.ndarray:
+        """북메이커 축에서 bookmakers에 속하는 열 (B,) bool"""
+        wanted = set(bookmakers)
+        return np.array([name in wanted for name in self.bookmakers], dtype=bool)
+
+
+def build_odds_tensor(matches: Sequence[Dict]) -> OddsTensor:
+    """
+    경기 리스트 → OddsTensor
+
+    Args:
+        matches: parse_odds_data 형식 경기 리스트
+            ('bookmakers': {북메이커: {'home', 'draw', 'away'}},
+             'bookmakers_raw': The Odds API 원본 리스트 (totals 추출용, 선택))
+
+    dict가 아닌 경기나 숫자로 변환할 수 없는 배당률이 있는 경기는 로그를 남기고 제외한다.
+    """
+    columns: Dict[str, int] = {}
+    kept: List[Dict] = []
+    rows: List[Dict[int, List[float]]] = []
+    totals: List[tuple] = []
+
+    for match in matches:
+        if not isinstance(match, dict):
+            logger.error(f"Invalid match data type: {type(match)}, value: {match}")
+            continue
+        try:
+            row = {}
+            for bookmaker, odds_data in match.get('bookmakers', {}).items():
+                column = columns.setdefault(bookmaker, len(columns))
+                row[column] = _outcome_odds(odds_data)
+            totals.append(_totals_means(match.get('bookmakers_raw', [])))
+        except (TypeError, ValueError, AttributeError) as e:
+            logger.error(f"Error reading odds for match {match.get('id')}: {e}")
+            continue
+        kept.append(match)
+        rows.append(row)
+
+    odds = np.full((len(kept), len(columns), len(OUTCOMES)), np.nan)
+    listed = np.zeros((len(kept), len(columns)), dtype=bool)
+    order = np.full((len(kept), len(columns)), -1, dtype=int)
+    for m, row in enumerate(rows):
+        for position, (column, values) in enumerate(row.items()):
+            odds[m, column] = values
+            listed[m, column] = True
+            order[m, column] = position
+
+    totals_array = np.array(totals, dtype=float).reshape(len(kept), 2)
+    return OddsTensor(
+        matches=kept,
+        bookmakers=list(columns),
+        odds=odds,
+        listed=listed,
+        order=order,
+        totals_over=totals_array[:, 0],
+        totals_under=totals_array[:, 1]
+    )
+
+
+def _outcome_odds(odds_data) -> List[float]:
+    """{'home': 1.8, ...} → [home, draw, away] (키 없음 NaN, None/0 이하 0.0)"""
+    if not isinstance(odds_data, dict):
+        return [np.nan] * len(OUTCOMES)
+
+    values = []
+    for outcome in OUTCOMES:
+        if outcome not in odds_data:
+            values.append(np.nan)
+            continue
+        value = odds_data[outcome]
+        value = float(value) if value else 0.0
+        values.append(value if value > 0 else 0.0)
+    return values
+
+
+def _totals_means(bookmakers_raw) -> tuple:
+    """원본 API 북메이커 리스트의 totals 마켓 Over/Under 평균 (없으면 NaN)"""
+    over_sum = under_sum = 0.0
+    over_count = under_count = 0
+
+    if isinstance(bookmakers_raw, list):
+        for bookmaker in bookmakers_raw:
+            for market in bookmaker.get('markets', []):
+                if market.get('key') != 'totals':
+                    continue
+                for outcome in market.get('outcomes', []):
+                    if outcome.get('name') == 'Over':
+                        over_sum += outcome.get('price', 0)
+                        over_count += 1
+                    elif outcome.get('name') == 'Under':
+                        under_sum += outcome.get('price', 0)
+                        under_count += 1
+
+    if over_count and under_count:
+        return over_sum / over_count, under_sum / under_count
+    return np.nan, np.nan
+
+
+def masked_mean(values: np.ndarray, mask: np.ndarray, axis: int, default: Optional[float] = None) -> np.ndarray:
+    """
+    mask가 True이고 NaN이 아닌 값들의 평균
+
+    Args:
+        values: 배열
+        mask: values와 broadcast 가능한 bool 배열
+        axis: 평균 축
+        default: 값이 하나도 없을 때 (None이면 NaN)
+    """
+    selected = mask & ~np.isnan(values)
+    counts = selected.sum(axis=axis)
+    sums = np.where(selected, values, 0.0).sum(axis=axis)
+    fill = np.nan if default is None else default
+    return np.divide(sums, counts, out=np.full(sums.shape, fill), where=counts > 0)
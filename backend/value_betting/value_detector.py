@@ -11,15 +11,11 @@ from typing import Dict, List, Optional, Tuple
 import logging
 from datetime import datetime
 
-from .utils import (
-    decimal_to_probability,
-    remove_overround,
-    calculate_edge,
-    get_best_odds,
-    calculate_implied_probability_from_multiple_bookies,
-    validate_probabilities
-)
+import numpy as np
+
 from .exceptions import InsufficientOddsDataError, InvalidProbabilityError
+from .market_scan import MarketScan, scan_markets
+from .odds_tensor import OUTCOMES
 
 logger = logging.getLogger(__name__)
 
@@ -104,16 +100,17 @@ class ValueDetector:
                 }
             ]
         """
-        value_bets = []
-        
         # 필수 필드 확인
         required_fields = ['match_id', 'home_team', 'away_team', 'bookmakers_raw']
         for field in required_fields:
             if field not in match_analysis:
                 logger.warning(f"Missing field: {field}")
-                return value_bets
+                return []
         
         bookmakers = match_analysis['bookmakers_raw']
+        scan = scan_markets([{'bookmakers': bookmakers}])
+        if not len(scan):
+            return []
         
         # Pinnacle 배당률 확인 (기준점)
         if self.sharp_bookmaker not in bookmakers:
@@ -122,87 +119,115 @@ class ValueDetector:
                 f"Available: {list(bookmakers.keys())}"
             )
             # Pinnacle이 없으면 consensus를 사용
-            reference_probs = match_analysis.get('consensus_probability')
-            if not reference_probs:
+            consensus = match_analysis.get('consensus_probability')
+            if not consensus:
                 logger.error("No reference probabilities available")
-                return value_bets
+                return []
+            reference = np.array([[consensus.get(outcome, np.nan) for outcome in OUTCOMES]], dtype=float)
         else:
             # Pinnacle에서 진짜 확률 추정
-            pinnacle_odds = bookmakers[self.sharp_bookmaker]
-            reference_probs = remove_overround(pinnacle_odds)
+            reference = scan.bookmaker_probabilities(self.sharp_bookmaker)
+        
+        return self._scan_value_bets(scan, reference, [match_analysis])
+    
+    def detect_in_scan(self, scan: MarketScan) -> List[Dict]:
+        """
+        MarketScan의 모든 경기에서 Value Bet 탐지 (경기 순서)
+        
+        기준 확률은 Pinnacle 마진 제거 확률, Pinnacle이 없는 경기는 합의 확률.
+        경기 정보(match_id, 팀, 시작 시각)는 스캔한 경기 dict에서 가져온다.
+        """
+        has_sharp = scan.has_bookmaker(self.sharp_bookmaker)
+        reference = np.where(
+            has_sharp[:, None],
+            scan.bookmaker_probabilities(self.sharp_bookmaker),
+            scan.consensus
+        )
+        return self._scan_value_bets(scan, reference, scan.tensor.matches)
+    
+    def _scan_value_bets(
+        self,
+        scan: MarketScan,
+        reference: np.ndarray,
+        matches: List[Dict]
+    ) -> List[Dict]:
+        """
+        (경기 × 북메이커 × 결과) 전체의 edge와 신뢰도를 한 번에 계산해 Value Bet 추출
+        
+        Args:
+            scan: MarketScan
+            reference: (M, 3) 기준 확률 (NaN인 결과는 건너뜀)
+            matches: 경기 정보 dict (scan 경기 순서)
+        
+        Returns:
+            List[Dict]: 경기 → 결과 → 북메이커(경기 dict 순서) 순 Value Bet
+        """
+        odds = scan.tensor.odds
+        
+        # Edge (%) = (추정 확률 × 배당률 - 1) × 100
+        edge = (reference[:, None, :] * odds - 1) * 100
+        candidates = edge >= self.min_edge * 100  # min_edge는 0.02 → 2%
+        
+        # Pinnacle 자체는 제외 (기준점이므로)
+        sharp = scan.tensor.columns.get(self.sharp_bookmaker)
+        if sharp is not None:
+            candidates[:, sharp, :] = False
+        
+        confidence = self._calculate_confidence(scan, edge / 100)
+        hits = candidates & (confidence >= self.min_confidence)
+        
+        m_idx, b_idx, o_idx = np.nonzero(hits)
+        ordering = np.lexsort((scan.tensor.order[m_idx, b_idx], o_idx, m_idx))
+        m_idx, b_idx, o_idx = m_idx[ordering], b_idx[ordering], o_idx[ordering]
+        
+        rows = zip(
+            m_idx.tolist(), b_idx.tolist(), o_idx.tolist(),
+            odds[m_idx, b_idx, o_idx].tolist(),
+            (edge[m_idx, b_idx, o_idx] / 100).tolist(),  # 0.05 = 5%
+            confidence[m_idx, b_idx, o_idx].tolist(),
+            reference[m_idx, o_idx].tolist()
+        )
+        detected_at = datetime.now()
+        log_bets = logger.isEnabledFor(logging.INFO)
         
-        # 각 결과(home/draw/away)에 대해 Value 탐지
-        for outcome in ['home', 'draw', 'away']:
-            if outcome not in reference_probs:
-                continue
+        value_bets = []
+        for m, b, o, bet_odds, bet_edge, bet_confidence, estimated_prob in rows:
+            match = matches[m]
+            outcome = OUTCOMES[o]
+            bookmaker = scan.tensor.bookmakers[b]
             
-            estimated_prob = reference_probs[outcome]
+            # Value Bet 발견!
+            value_bets.append({
+                'match_id': match.get('match_id'),
+                'home_team': match['home_team'],
+                'away_team': match['away_team'],
+                'outcome': outcome,
+                'bookmaker': bookmaker,
+                'odds': bet_odds,
+                'edge': bet_edge,
+                'confidence': bet_confidence,
+                'estimated_probability': estimated_prob,
+                'recommendation': self._get_recommendation(bet_edge, bet_confidence),
+                'commence_time': match.get('commence_time'),
+                'detected_at': detected_at
+            })
             
-            # 모든 북메이커의 배당률 확인
-            for bookmaker, odds_dict in bookmakers.items():
-                if outcome not in odds_dict:
-                    continue
-                
-                # Pinnacle 자체는 제외 (기준점이므로)
-                if bookmaker == self.sharp_bookmaker:
-                    continue
-                
-                odds = odds_dict[outcome]
-                
-                # Edge 계산
-                edge = calculate_edge(estimated_prob, odds)
-                
-                # Edge가 임계값 이상인가?
-                if edge < self.min_edge * 100:  # min_edge는 0.02 → 2%
-                    continue
-                
-                # 신뢰도 계산
-                confidence = self._calculate_confidence(
-                    estimated_prob,
-                    odds,
-                    bookmakers,
-                    outcome
-                )
-                
-                # 신뢰도가 임계값 이상인가?
-                if confidence < self.min_confidence:
-                    continue
-                
-                # Value Bet 발견!
-                value_bet = {
-                    'match_id': match_analysis['match_id'],
-                    'home_team': match_analysis['home_team'],
-                    'away_team': match_analysis['away_team'],
-                    'outcome': outcome,
-                    'bookmaker': bookmaker,
-                    'odds': odds,
-                    'edge': edge / 100,  # 0.05 = 5%
-                    'confidence': confidence,
-                    'estimated_probability': estimated_prob,
-                    'recommendation': self._get_recommendation(edge / 100, confidence),
-                    'commence_time': match_analysis.get('commence_time'),
-                    'detected_at': datetime.now()
-                }
-                
-                value_bets.append(value_bet)
-                
+            if log_bets:
                 logger.info(
-                    f"Value Bet: {match_analysis['home_team']} vs {match_analysis['away_team']} | "
-                    f"{outcome} @ {bookmaker} ({odds:.2f}) | "
-                    f"Edge: {edge:.1f}% | Confidence: {confidence:.1%}"
+                    f"Value Bet: {match['home_team']} vs {match['away_team']} | "
+                    f"{outcome} @ {bookmaker} ({bet_odds:.2f}) | "
+                    f"Edge: {bet_edge:.1%} | Confidence: {bet_confidence:.1%}"
                 )
         
         return value_bets
     
     def _calculate_confidence(
         self,
-        estimated_prob: float,
-        offered_odds: float,
-        all_bookmakers: Dict[str, Dict[str, float]],
-        outcome: str
-    ) -> float:
+        scan: MarketScan,
+        edge: np.ndarray
+    ) -> np.ndarray:
         """
-        신뢰도 계산
+        신뢰도 계산 (경기 × 북메이커 × 결과)
         
         고려 사항:
         1. Edge의 크기 (클수록 신뢰도 상승)
@@ -210,43 +235,33 @@ class ValueDetector:
         3. 배당률 분산 (일관성 있을수록 신뢰도 상승)
         
         Args:
-            estimated_prob: 추정 확률
-            offered_odds: 제공된 배당률
-            all_bookmakers: 모든 북메이커 배당률
-            outcome: 결과 ('home', 'draw', 'away')
+            scan: MarketScan
+            edge: (M, B, 3) Edge (0.05 = 5%)
         
         Returns:
-            float: 신뢰도 (0~1)
+            np.ndarray: (M, B, 3) 신뢰도 (0~1)
         """
         # 1. Edge 기반 신뢰도 (0~0.4)
-        edge = calculate_edge(estimated_prob, offered_odds) / 100
-        edge_confidence = min(edge * 8, 0.4)  # 5% edge → 0.4
+        edge_confidence = np.minimum(edge * 8, 0.4)  # 5% edge → 0.4
         
         # 2. 북메이커 수 기반 (0~0.3)
-        num_bookies = len(all_bookmakers)
-        bookie_confidence = min(num_bookies / 10, 0.3)  # 10개 이상 → 0.3
-        
-        # 3. 배당률 일관성 (0~0.3)
-        odds_list = []
-        for bookie, odds_dict in all_bookmakers.items():
-            if outcome in odds_dict:
-                odds_list.append(odds_dict[outcome])
-        
-        if len(odds_list) > 1:
-            # 표준편차가 작을수록 일관성 높음
-            mean_odds = sum(odds_list) / len(odds_list)
-            variance = sum((x - mean_odds) ** 2 for x in odds_list) / len(odds_list)
-            std_dev = variance ** 0.5
-            
-            # 표준편차가 0.5 이하면 일관성 높음
-            consistency_confidence = max(0.3 - std_dev * 0.6, 0)
-        else:
-            consistency_confidence = 0.15  # 기본값
+        bookie_confidence = np.minimum(scan.num_bookmakers / 10, 0.3)  # 10개 이상 → 0.3
+        
+        # 3. 배당률 일관성 (0~0.3): 표준편차가 작을수록 일관성 높음
+        consistency_confidence = np.where(
+            scan.offered_counts > 1,
+            np.maximum(0.3 - np.sqrt(scan.variance) * 0.6, 0),
+            0.15  # 기본값
+        )
         
         # 총 신뢰도
-        total_confidence = edge_confidence + bookie_confidence + consistency_confidence
+        total_confidence = (
+            edge_confidence
+            + bookie_confidence[:, None, None]
+            + consistency_confidence[:, None, :]
+        )
         
-        return min(total_confidence, 1.0)
+        return np.minimum(total_confidence, 1.0)
     
     def _get_recommendation(self, edge: float, confidence: float) -> str:
         """
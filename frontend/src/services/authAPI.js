@@ -55,9 +55,27 @@ export const simulationAPI = {
       const errorData = await res.json().catch(() => ({}));
       throw new Error(errorData.error || 'Simulation failed');
     }
+    if (res.status === 202) {
+      // Simulation runs as a background job: poll until it finishes
+      const { job } = await res.json();
+      return this.waitForJob(job.id, token);
+    }
     return res.json();
   },
 
+  async waitForJob(jobId, token, intervalMs = 2000) {
+    for (;;) {
+      const res = await fetch(`${API_BASE}/v1/simulation/jobs/${jobId}`, {
+        headers: { 'Authorization': `Bearer ${token}` }
+      });
+      if (!res.ok) throw new Error('Simulation failed');
+      const { job } = await res.json();
+      if (job.status === 'succeeded') return { success: true, result: job.result };
+      if (job.status === 'failed' || job.status === 'cancelled') throw new Error(job.error || 'Simulation failed');
+      await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    }
+  },
+
   async aiPredict(homeTeam, awayTeam, userEvaluation, sharpOdds = null, recentForm = null) {
     const body = {
       home_team: homeTeam,